@@ -6,7 +6,9 @@
 # it under the terms of the GNU General Public License version 2 as
 # published by the Free Software Foundation.
 
+import os
 import sys
+import time
 import logging
 from . import version, config, option, output, extractor, job, util, exception
 
@@ -221,6 +223,7 @@ def main():
                 else:
                     modules.append(extractor._modules_internal())
 
+            extractor._index_enabled = False
             if len(modules) > 1:
                 import itertools
                 extractor._module_iter = itertools.chain(*modules)
@@ -238,7 +241,7 @@ def main():
             fmt = ("{}{}\nCategory: {} - Subcategory: {}"
                    "\nExample : {}\n\n").format
 
-            extractors = extractor.extractors()
+            extractors = extractor.registry()
             if args.list_extractors:
                 fltr = util.build_extractor_filter(
                     args.list_extractors, negate=False)
@@ -332,37 +335,47 @@ def main():
                 common.CATEGORY_MAP = catmap
 
             # process input URLs
-            retval = 0
-            for url in input_manager:
-                try:
-                    log.debug("Starting %s for '%s'", jobtype.__name__, url)
-
-                    if isinstance(url, ExtendedUrl):
-                        for opts in url.gconfig:
-                            config.set(*opts)
-                        with config.apply(url.lconfig):
-                            status = jobtype(url.value).run()
-                    else:
-                        status = jobtype(url).run()
+            try:
+                if (jobs := config.get((), "jobs")) and jobs > 1:
+                    return process_parallel(
+                        jobtype, input_manager, jobs,
+                        config.get((), "jobs-per-site", 1))
 
-                    if status:
-                        retval |= status
+                retval = 0
+                for url in input_manager:
+                    try:
+                        log.debug("Starting %s for '%s'",
+                                  jobtype.__name__, url)
+
+                        if isinstance(url, ExtendedUrl):
+                            for opts in url.gconfig:
+                                config.set(*opts)
+                            with config.apply(url.lconfig):
+                                status = jobtype(url.value).run()
+                        else:
+                            status = jobtype(url).run()
+
+                        if status:
+                            retval |= status
+                            input_manager.error()
+                        else:
+                            input_manager.success()
+
+                    except exception.RestartExtraction:
+                        log.debug("Restarting '%s'", url)
+                        continue
+                    except exception.ControlException:
+                        pass
+                    except exception.NoExtractorError:
+                        log.error("Unsupported URL '%s'", url)
+                        retval |= 64
                         input_manager.error()
-                    else:
-                        input_manager.success()
-
-                except exception.RestartExtraction:
-                    log.debug("Restarting '%s'", url)
-                    continue
-                except exception.ControlException:
-                    pass
-                except exception.NoExtractorError:
-                    log.error("Unsupported URL '%s'", url)
-                    retval |= 64
-                    input_manager.error()
-
-                input_manager.next()
-            return retval
+
+                    input_manager.next()
+                return retval
+            finally:
+                # write pending input file updates
+                input_manager.close()
         return 0
 
     except KeyboardInterrupt:
@@ -376,6 +389,106 @@ def main():
     return 1
 
 
+def process_parallel(jobtype, input_manager, jobs, jobs_per_site=1):
+    """Process input URLs with up to 'jobs' jobs running in parallel
+
+    URLs with attached options modify the global config
+    and get processed on their own
+    after all previously started jobs have finished.
+    """
+    import threading
+    import collections
+    from queue import Queue
+
+    log = logging.getLogger("gallery-dl")
+    results = Queue()
+    pending = collections.deque()
+    active = collections.Counter()
+    jobs_per_site = max(jobs_per_site, 1)
+    retval = 0
+
+    def run(url, djob=None):
+        while True:
+            try:
+                if djob is None:
+                    log.debug("Starting %s for '%s'", jobtype.__name__, url)
+                    djob = jobtype(url)
+                return djob.run()
+            except exception.RestartExtraction:
+                log.debug("Restarting '%s'", url)
+                djob = None
+            except exception.ControlException:
+                return None
+            except exception.NoExtractorError:
+                log.error("Unsupported URL '%s'", url)
+                return 64
+
+    def run_thread(url, djob, current, site):
+        try:
+            status = run(url, djob)
+        except Exception as exc:
+            log.error("%s: %s", exc.__class__.__name__, exc)
+            log.debug("", exc_info=exc)
+            status = 1
+        results.put((current, site, status))
+
+    def done(current, status):
+        nonlocal retval
+        if status:
+            retval |= status
+            input_manager.error(current)
+        elif status is not None:
+            input_manager.success(current)
+
+    def start():
+        for entry in pending:
+            if sum(active.values()) >= jobs:
+                break
+            if active[entry[3]] < jobs_per_site:
+                pending.remove(entry)
+                active[entry[3]] += 1
+                threading.Thread(
+                    target=run_thread, args=entry, daemon=True).start()
+                return True
+        return False
+
+    def wait(limit):
+        while True:
+            while start():
+                pass
+            if sum(active.values()) <= limit and len(pending) < jobs * 4:
+                return
+            current, site, status = results.get()
+            active[site] -= 1
+            done(current, status)
+
+    for url in input_manager:
+        current = input_manager.current()
+        input_manager.next()
+
+        if isinstance(url, ExtendedUrl):
+            wait(0)
+            for opts in url.gconfig:
+                config.set(*opts)
+            with config.apply(url.lconfig):
+                done(current, run(url.value))
+            continue
+
+        try:
+            log.debug("Starting %s for '%s'", jobtype.__name__, url)
+            djob = jobtype(url)
+        except exception.NoExtractorError:
+            log.error("Unsupported URL '%s'", url)
+            done(current, 64)
+            continue
+
+        pending.append((url, djob, current, djob.extractor.category))
+        wait(jobs - 1)
+
+    wait(0)
+    return retval
+
+
 class InputManager():
 
     def __init__(self):
@@ -429,26 +542,35 @@ class InputManager():
                 lines = sys.stdin.readlines()
             except Exception:
                 raise exception.InputFileError("stdin is not readable")
-            path = None
-        else:
-            try:
-                with open(path, encoding="utf-8") as fp:
-                    lines = fp.readlines()
-            except Exception as exc:
-                raise exception.InputFileError(str(exc))
+            return self._parse(lines, None, None)
 
-            if self.files:
-                self.files[path] = lines
-            else:
-                self.files = {path: lines}
+        try:
+            fp = open(path, encoding="utf-8")
+        except Exception as exc:
+            raise exception.InputFileError(str(exc))
 
+        with fp:
             if action == "c":
                 action = self._action_comment
             elif action == "d":
                 action = self._action_delete
             else:
-                action = None
+                # stream lines directly from 'fp'
+                return self._parse(fp, path, None)
+
+            try:
+                lines = fp.readlines()
+            except Exception as exc:
+                raise exception.InputFileError(str(exc))
+
+        journal = InputJournal(path, lines, action, self.log)
+        if self.files:
+            self.files[path] = journal
+        else:
+            self.files = {path: journal}
+        self._parse(lines, path, action)
 
+    def _parse(self, lines, path, action):
         gconf = []
         lconf = []
         indicies = []
@@ -509,6 +631,12 @@ class InputManager():
                 else:
                     append(url)
 
+    def close(self):
+        """Apply all pending updates to their input files"""
+        if self.files:
+            for journal in self.files.values():
+                journal.close()
+
     def progress(self, pformat=True):
         if pformat is True:
             pformat = "[{current}/{total}] {url}\n"
@@ -519,34 +647,35 @@ class InputManager():
     def next(self):
         self._index += 1
 
-    def success(self):
-        if self._item:
-            self._rewrite()
+    def current(self):
+        """Return the state of the current URL for success() and error()"""
+        return (self._url, self._item)
+
+    def success(self, current=None):
+        item = self._item if current is None else current[1]
+        if item:
+            self._rewrite(item)
+
+    def error(self, current=None):
+        if current is None:
+            current = (self._url, self._item)
+        url, item = current
 
-    def error(self):
         if self.err:
-            if self._item:
-                url, path, action, indicies = self._item
-                lines = self.files[path]
+            if item:
+                url, path, action, indicies = item
+                lines = self.files[path].lines
                 out = "".join(lines[i] for i in indicies)
                 if out and out[-1] == "\n":
                     out = out[:-1]
-                self._rewrite()
+                self._rewrite(item)
             else:
-                out = str(self._url)
+                out = str(url)
             self.err.info(out)
 
-    def _rewrite(self):
-        url, path, action, indicies = self._item
-        lines = self.files[path]
-        action(lines, indicies)
-        try:
-            with open(path, "w", encoding="utf-8") as fp:
-                fp.writelines(lines)
-        except Exception as exc:
-            self.log.warning(
-                "Unable to update '%s' (%s: %s)",
-                path, exc.__class__.__name__, exc)
+    def _rewrite(self, item):
+        url, path, action, indicies = item
+        self.files[path].add(indicies)
 
     def _action_comment(self, lines, indicies):
         for i in indicies:
@@ -582,6 +711,123 @@ class InputManager():
         return url
 
 
+class InputJournal():
+    """Append-only record of processed lines of an input file
+
+    Updates get applied to the input file itself only periodically
+    and at exit, by rewriting it as a whole.
+    A journal left behind by an interrupted run
+    gets replayed the next time its input file is loaded.
+    """
+    COMPACT_ENTRIES = 1000
+    COMPACT_INTERVAL = 60.0
+
+    def __init__(self, path, lines, action, log):
+        self.path = path
+        self.path_journal = path + ".journal"
+        self.lines = lines
+        self.action = action
+        self.log = log
+        self.fp = None
+        self.entries = 0
+        self.compact_time = 0.0
+        self.positions = None
+        self._replay()
+
+    def add(self, indicies):
+        """Record 'indicies' as processed"""
+        self.action(self.lines, indicies)
+        try:
+            if self.fp is None:
+                self._open()
+            if (positions := self.positions) is not None:
+                indicies = [positions[i] for i in indicies]
+            self.fp.write(" ".join(map(str, indicies)) + "\n")
+            self.fp.flush()
+        except Exception as exc:
+            self._warning(self.path_journal, exc)
+            return self.compact()
+
+        self.entries += 1
+        if self.entries >= self.COMPACT_ENTRIES or \
+                time.monotonic() >= self.compact_time:
+            self.compact()
+
+    def compact(self):
+        """Write all recorded updates to the input file"""
+        path = self.path
+        path_temp = path + ".tmp"
+        try:
+            with open(path_temp, "w", encoding="utf-8") as fp:
+                fp.writelines(self.lines)
+            os.replace(path_temp, path)
+        except Exception as exc:
+            util.remove_file(path_temp)
+            return self._warning(path, exc)
+
+        # a journal whose header does not match its input file
+        # gets ignored, so a crash right here loses nothing
+        self._close()
+        util.remove_file(self.path_journal)
+        self.entries = 0
+
+        # map line indices to their position in the updated file
+        positions = []
+        pos = 0
+        for line in self.lines:
+            positions.append(pos)
+            if line:
+                pos += 1
+        self.positions = positions
+
+    def close(self):
+        if self.fp is not None:
+            self.compact()
+
+    def _open(self):
+        self.fp = fp = open(self.path_journal, "w", encoding="utf-8")
+        fp.write(self._header() + "\n")
+        self.compact_time = time.monotonic() + self.COMPACT_INTERVAL
+
+    def _close(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+
+    def _header(self):
+        stat = os.stat(self.path)
+        return f"{stat.st_size} {stat.st_mtime_ns}"
+
+    def _replay(self):
+        try:
+            with open(self.path_journal, encoding="utf-8") as fp:
+                header = fp.readline().rstrip("\n")
+                entries = [
+                    [int(i) for i in line.split()]
+                    for line in fp
+                    if line.endswith("\n")  # skip incomplete entries
+                ]
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            return self._warning(self.path_journal, exc)
+
+        if header != self._header():
+            # input file was changed after this journal was created
+            util.remove_file(self.path_journal)
+            return
+
+        self.log.info("Applying %d journal entries to '%s'",
+                      len(entries), self.path)
+        for indicies in entries:
+            self.action(self.lines, indicies)
+        self.compact()
+
+    def _warning(self, path, exc):
+        self.log.warning("Unable to update '%s' (%s: %s)",
+                         path, exc.__class__.__name__, exc)
+
+
 class ExtendedUrl():
     """URL with attached config key-value pairs"""
     __slots__ = ("value", "gconfig", "lconfig")
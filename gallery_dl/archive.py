@@ -9,20 +9,33 @@
 """Download Archives"""
 
 import os
+import time
 import logging
-from . import util, formatter
+import threading
+from . import util, formatter, text
 
 log = logging.getLogger("archive")
+_connections = {}
+_connections_lock = threading.Lock()
+_blooms = {}
 
 
-def connect(path, prefix, format,
-            table=None, mode=None, pragma=None, kwdict=None, cache_key=None):
+def connect(path, prefix, format, table=None, mode=None, pragma=None,
+            kwdict=None, cache_key=None, bloom=None):
     keygen = formatter.parse(prefix + format).format_map
 
+    args = ()
+    if mode and mode.startswith("buffer"):
+        mode, _, args = mode.partition(":")
+        size, _, interval = args.partition(":")
+        args = (text.parse_int(size, 100), text.parse_float(interval, 10.0))
+
     if isinstance(path, str) and path.startswith(
             ("postgres://", "postgresql://")):
         if mode == "memory":
             cls = DownloadArchivePostgresqlMemory
+        elif mode == "buffer":
+            cls = DownloadArchivePostgresqlBuffer
         else:
             cls = DownloadArchivePostgresql
     else:
@@ -31,19 +44,79 @@ def connect(path, prefix, format,
             path = formatter.parse(path).format_map(kwdict)
         if mode == "memory":
             cls = DownloadArchiveMemory
+        elif mode == "buffer":
+            cls = DownloadArchiveBuffer
         else:
             cls = DownloadArchive
 
     if kwdict is not None and table:
         table = formatter.parse(table).format_map(kwdict)
 
-    return cls(path, keygen, table, pragma, cache_key)
+    archive = cls(path, keygen, table, pragma, cache_key, *args)
+    if not bloom:
+        return archive
+
+    if isinstance(bloom, str):
+        bloom = util.expand_path(bloom)
+    elif issubclass(cls, DownloadArchive):
+        if path == ":memory:":
+            bloom = None
+        else:
+            bloom = f"{path}.{table}.bloom" if table else f"{path}.bloom"
+    else:
+        bloom = None
+    return DownloadArchiveBloom(archive, bloom)
 
 
 def sanitize(name):
     return f'''"{name.replace('"', '_')}"'''
 
 
+def acquire(key, connect):
+    """Return the SharedConnection for 'key'
+
+    Call 'connect()' to open a new one if there is none
+    and increment its reference count otherwise.
+    """
+    with _connections_lock:
+        if (shared := _connections.get(key)) is None:
+            _connections[key] = shared = SharedConnection(key, connect())
+        else:
+            shared.refs += 1
+        return shared
+
+
+class SharedConnection():
+    """Reference-counted database connection used by several archives"""
+    __slots__ = ("key", "connection", "refs", "tables", "lock")
+
+    def __init__(self, key, connection):
+        self.key = key
+        self.connection = connection
+        self.refs = 1
+        self.tables = set()
+        # held for each statement and transaction,
+        # since these are not isolated between users of a connection
+        self.lock = threading.RLock()
+
+    def create_table(self, table, create):
+        """Call 'create()' if 'table' has not been created yet"""
+        with self.lock:
+            if table not in self.tables:
+                create()
+                self.tables.add(table)
+
+    def release(self):
+        """Decrement reference count and close connection when unused"""
+        with _connections_lock:
+            self.refs -= 1
+            if self.refs > 0:
+                return
+            if _connections.get(self.key) is self:
+                del _connections[self.key]
+        self.connection.close()
+
+
 class DownloadArchive():
     _sqlite3 = None
 
@@ -51,19 +124,18 @@ class DownloadArchive():
         if self._sqlite3 is None:
             DownloadArchive._sqlite3 = __import__("sqlite3")
 
-        try:
-            con = self._sqlite3.connect(
-                path, timeout=60, check_same_thread=False)
-        except self._sqlite3.OperationalError:
-            os.makedirs(os.path.dirname(path))
-            con = self._sqlite3.connect(
-                path, timeout=60, check_same_thread=False)
-        con.isolation_level = None
+        if path == ":memory:":
+            shared = SharedConnection(None, self._connect(path))
+        else:
+            shared = acquire(
+                ("sqlite", os.path.abspath(path)),
+                lambda: self._connect(path))
 
         self.keygen = keygen
-        self.connection = con
-        self.close = con.close
+        self.shared = shared
+        self.connection = con = shared.connection
         self.cursor = cursor = con.cursor()
+        self.prefetched = {}
         self._cache_key = cache_key or "_archive_key"
 
         table = "archive" if table is None else sanitize(table)
@@ -72,14 +144,39 @@ class DownloadArchive():
             f"FROM {table} "
             f"WHERE entry=? "
             f"LIMIT 1")
+        self._stmt_select_many = (
+            f"SELECT entry "
+            f"FROM {table} "
+            f"WHERE entry IN ")
+        self._stmt_entries = f"SELECT entry FROM {table}"
+        self._stmt_count = f"SELECT COUNT(*) FROM {table}"
         self._stmt_insert = (
             f"INSERT OR IGNORE INTO {table} "
             f"(entry) VALUES (?)")
 
-        if pragma:
-            for stmt in pragma:
-                cursor.execute(f"PRAGMA {stmt}")
+        try:
+            if pragma:
+                with shared.lock:
+                    for stmt in pragma:
+                        cursor.execute(f"PRAGMA {stmt}")
+            shared.create_table(table, lambda: self._create_table(table))
+        except BaseException:
+            shared.release()
+            raise
+
+    def _connect(self, path):
+        try:
+            con = self._sqlite3.connect(
+                path, timeout=60, check_same_thread=False)
+        except self._sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = self._sqlite3.connect(
+                path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+        return con
 
+    def _create_table(self, table):
+        cursor = self.cursor
         try:
             cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} "
                            f"(entry TEXT PRIMARY KEY) WITHOUT ROWID")
@@ -91,17 +188,91 @@ class DownloadArchive():
     def add(self, kwdict):
         """Add item described by 'kwdict' to archive"""
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
-        self.cursor.execute(self._stmt_insert, (key,))
+        self.prefetched.pop(key, None)
+        with self.shared.lock:
+            self.cursor.execute(self._stmt_insert, (key,))
 
     def check(self, kwdict):
         """Return True if the item described by 'kwdict' exists in archive"""
         key = kwdict[self._cache_key] = self.keygen(kwdict)
-        self.cursor.execute(self._stmt_select, (key,))
-        return self.cursor.fetchone()
+        if key in self.prefetched:
+            return self.prefetched.pop(key)
+        with self.shared.lock:
+            self.cursor.execute(self._stmt_select, (key,))
+            return self.cursor.fetchone()
+
+    def check_many(self, kwdicts):
+        """Check all items in 'kwdicts' with as few queries as possible
+
+        Return a list of results in the same order as 'kwdicts'
+        and remember them for subsequent check() calls.
+        """
+        keys = []
+        for kwdict in kwdicts:
+            keys.append(self.keygen(kwdict))
+            kwdict[self._cache_key] = keys[-1]
+
+        found = set()
+        cursor = self.cursor
+        with self.shared.lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i+500]
+                found.update(row[0] for row in cursor.execute(
+                    f"{self._stmt_select_many}({','.join('?' * len(chunk))})",
+                    chunk))
+
+        results = [key in found for key in keys]
+        self.prefetched = dict(zip(keys, results))
+        return results
 
     def finalize(self):
         pass
 
+    def flush(self):
+        """Write all pending entries"""
+
+    def close(self):
+        """Release the underlying database connection"""
+        if self.shared is not None:
+            self.shared.release()
+            self.shared = None
+
+    def count(self):
+        """Return the number of entries in archive"""
+        with self.shared.lock:
+            return self.connection.execute(self._stmt_count).fetchone()[0]
+
+    def version(self):
+        """Return a value that changes with each commit by other connections
+
+        Return None if the database does not provide one.
+        """
+        with self.shared.lock:
+            return self.connection.execute(
+                "PRAGMA data_version").fetchone()[0]
+
+    def entries(self):
+        """Yield all entries in archive"""
+        with self.shared.lock:
+            for row in self.connection.execute(self._stmt_entries):
+                yield row[0]
+
+    def _insert_many(self, keys):
+        """Write all 'keys' to archive in a single transaction"""
+        cursor = self.cursor
+        with self.shared.lock, self.connection:
+            try:
+                cursor.execute("BEGIN")
+            except self._sqlite3.OperationalError:
+                pass
+
+            stmt = self._stmt_insert
+            if len(keys) < 100:
+                for key in keys:
+                    cursor.execute(stmt, (key,))
+            else:
+                cursor.executemany(stmt, ((key,) for key in keys))
+
 
 class DownloadArchiveMemory(DownloadArchive):
 
@@ -111,34 +282,69 @@ class DownloadArchiveMemory(DownloadArchive):
         self.keys = set()
 
     def add(self, kwdict):
-        self.keys.add(
-            kwdict.get(self._cache_key) or
-            self.keygen(kwdict))
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self.prefetched.pop(key, None)
+        self.keys.add(key)
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
         if key in self.keys:
             return True
-        self.cursor.execute(self._stmt_select, (key,))
-        return self.cursor.fetchone()
+        if key in self.prefetched:
+            return self.prefetched.pop(key)
+        with self.shared.lock:
+            self.cursor.execute(self._stmt_select, (key,))
+            return self.cursor.fetchone()
+
+    def check_many(self, kwdicts):
+        results = DownloadArchive.check_many(self, kwdicts)
+        keys = self.keys
+        return [
+            result or kwdict[self._cache_key] in keys
+            for result, kwdict in zip(results, kwdicts)
+        ]
 
     def finalize(self):
-        if not self.keys:
-            return
+        if self.keys:
+            self._insert_many(self.keys)
 
-        cursor = self.cursor
-        with self.connection:
-            try:
-                cursor.execute("BEGIN")
-            except self._sqlite3.OperationalError:
-                pass
 
-            stmt = self._stmt_insert
-            if len(self.keys) < 100:
-                for key in self.keys:
-                    cursor.execute(stmt, (key,))
-            else:
-                cursor.executemany(stmt, ((key,) for key in self.keys))
+class DownloadArchiveBufferMixin():
+    """Write added entries in batches
+
+    Flush them after collecting 'size' entries,
+    'interval' seconds after the last flush, and on close().
+    """
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None,
+                 size=100, interval=10.0):
+        super().__init__(path, keygen, table, pragma, cache_key)
+        self.size = size
+        self.interval = interval
+        self.flush_time = time.monotonic() + interval
+
+    def add(self, kwdict):
+        super().add(kwdict)
+        if len(self.keys) >= self.size or \
+                time.monotonic() >= self.flush_time:
+            self.finalize()
+
+    def finalize(self):
+        super().finalize()
+        self.keys.clear()
+        self.flush_time = time.monotonic() + self.interval
+
+    flush = finalize
+
+    def close(self):
+        try:
+            self.finalize()
+        finally:
+            super().close()
+
+
+class DownloadArchiveBuffer(DownloadArchiveBufferMixin, DownloadArchiveMemory):
+    pass
 
 
 class DownloadArchivePostgresql():
@@ -148,10 +354,12 @@ class DownloadArchivePostgresql():
         if self._psycopg is None:
             DownloadArchivePostgresql._psycopg = __import__("psycopg")
 
-        self.connection = con = self._psycopg.connect(uri)
-        self.cursor = cursor = con.cursor()
-        self.close = con.close
+        self.shared = shared = acquire(
+            ("postgresql", uri), lambda: self._psycopg.connect(uri))
+        self.connection = con = shared.connection
+        self.cursor = con.cursor()
         self.keygen = keygen
+        self.prefetched = {}
         self._cache_key = cache_key or "_archive_key"
 
         table = "archive" if table is None else sanitize(table)
@@ -160,14 +368,28 @@ class DownloadArchivePostgresql():
             f"FROM {table} "
             f"WHERE entry=%s "
             f"LIMIT 1")
+        self._stmt_select_many = (
+            f"SELECT entry "
+            f"FROM {table} "
+            f"WHERE entry = ANY(%s)")
+        self._stmt_entries = f"SELECT entry FROM {table}"
+        self._stmt_count = f"SELECT COUNT(*) FROM {table}"
         self._stmt_insert = (
             f"INSERT INTO {table} (entry) "
             f"VALUES (%s) "
             f"ON CONFLICT DO NOTHING")
 
         try:
-            cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} "
-                           f"(entry TEXT PRIMARY KEY)")
+            shared.create_table(table, lambda: self._create_table(table))
+        except BaseException:
+            shared.release()
+            raise
+
+    def _create_table(self, table):
+        con = self.connection
+        try:
+            self.cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                                f"(entry TEXT PRIMARY KEY)")
             con.commit()
         except Exception as exc:
             log.error("%s: %s when creating '%s' table: %s",
@@ -177,28 +399,80 @@ class DownloadArchivePostgresql():
 
     def add(self, kwdict):
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
-        try:
-            self.cursor.execute(self._stmt_insert, (key,))
-            self.connection.commit()
-        except Exception as exc:
-            log.error("%s: %s when writing entry: %s",
-                      self.connection, exc.__class__.__name__, exc)
-            self.connection.rollback()
+        self.prefetched.pop(key, None)
+        with self.shared.lock:
+            try:
+                self.cursor.execute(self._stmt_insert, (key,))
+                self.connection.commit()
+            except Exception as exc:
+                log.error("%s: %s when writing entry: %s",
+                          self.connection, exc.__class__.__name__, exc)
+                self.connection.rollback()
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
-        try:
-            self.cursor.execute(self._stmt_select, (key,))
-            return self.cursor.fetchone()
-        except Exception as exc:
-            log.error("%s: %s when checking entry: %s",
-                      self.connection, exc.__class__.__name__, exc)
-            self.connection.rollback()
-            return False
+        if key in self.prefetched:
+            return self.prefetched.pop(key)
+        with self.shared.lock:
+            try:
+                self.cursor.execute(self._stmt_select, (key,))
+                return self.cursor.fetchone()
+            except Exception as exc:
+                log.error("%s: %s when checking entry: %s",
+                          self.connection, exc.__class__.__name__, exc)
+                self.connection.rollback()
+                return False
+
+    def check_many(self, kwdicts):
+        keys = []
+        for kwdict in kwdicts:
+            keys.append(self.keygen(kwdict))
+            kwdict[self._cache_key] = keys[-1]
+
+        with self.shared.lock:
+            try:
+                self.cursor.execute(self._stmt_select_many, (keys,))
+                found = {row[0] for row in self.cursor}
+            except Exception as exc:
+                log.error("%s: %s when checking entries: %s",
+                          self.connection, exc.__class__.__name__, exc)
+                self.connection.rollback()
+                self.prefetched = {}
+                return [False] * len(keys)
+
+        results = [key in found for key in keys]
+        self.prefetched = dict(zip(keys, results))
+        return results
 
     def finalize(self):
         pass
 
+    def flush(self):
+        pass
+
+    close = DownloadArchive.close
+
+    def count(self):
+        with self.shared.lock:
+            self.cursor.execute(self._stmt_count)
+            count = self.cursor.fetchone()[0]
+            self.connection.commit()
+        return count
+
+    def version(self):
+        return None
+
+    def entries(self):
+        # use a server-side cursor to avoid loading all rows at once;
+        # hold the lock for its whole lifetime,
+        # since another user's commit would invalidate it
+        with self.shared.lock:
+            with self.connection.cursor("gallery_dl_entries") as cursor:
+                cursor.execute(self._stmt_entries)
+                for row in cursor:
+                    yield row[0]
+            self.connection.commit()
+
 
 class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
 
@@ -208,32 +482,303 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
         self.keys = set()
 
     def add(self, kwdict):
-        self.keys.add(
-            kwdict.get(self._cache_key) or
-            self.keygen(kwdict))
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self.prefetched.pop(key, None)
+        self.keys.add(key)
 
     def check(self, kwdict):
         key = kwdict[self._cache_key] = self.keygen(kwdict)
         if key in self.keys:
             return True
-        try:
-            self.cursor.execute(self._stmt_select, (key,))
-            return self.cursor.fetchone()
-        except Exception as exc:
-            log.error("%s: %s when checking entry: %s",
-                      self.connection, exc.__class__.__name__, exc)
-            self.connection.rollback()
-            return False
+        if key in self.prefetched:
+            return self.prefetched.pop(key)
+        with self.shared.lock:
+            try:
+                self.cursor.execute(self._stmt_select, (key,))
+                return self.cursor.fetchone()
+            except Exception as exc:
+                log.error("%s: %s when checking entry: %s",
+                          self.connection, exc.__class__.__name__, exc)
+                self.connection.rollback()
+                return False
+
+    def check_many(self, kwdicts):
+        results = DownloadArchivePostgresql.check_many(self, kwdicts)
+        keys = self.keys
+        return [
+            result or kwdict[self._cache_key] in keys
+            for result, kwdict in zip(results, kwdicts)
+        ]
 
     def finalize(self):
         if not self.keys:
             return
+        with self.shared.lock:
+            try:
+                self.cursor.executemany(
+                    self._stmt_insert,
+                    ((key,) for key in self.keys))
+                self.connection.commit()
+            except Exception as exc:
+                log.error("%s: %s when writing entries: %s",
+                          self.connection, exc.__class__.__name__, exc)
+                self.connection.rollback()
+
+
+class DownloadArchivePostgresqlBuffer(DownloadArchiveBufferMixin,
+                                      DownloadArchivePostgresqlMemory):
+    pass
+
+
+class SharedBloom():
+    """Bloom filter state shared by all archives using the same table
+
+    'count' is the number of archive entries the filter was built for
+    and 'added' the number of new entries added to both since then.
+    """
+    __slots__ = ("bloom", "count", "added", "missed", "modified", "valid",
+                 "version", "signature", "refs", "lock")
+
+    def __init__(self):
+        self.bloom = self.version = self.signature = None
+        self.count = self.added = self.refs = 0
+        self.missed = set()
+        self.modified = self.valid = False
+        self.lock = threading.Lock()
+
+
+class DownloadArchiveBloom():
+    """Bloom filter in front of a download archive
+
+    Answers most checks for new entries
+    without having to query the underlying database.
+    """
+    error_rate = 0.01
+
+    def __init__(self, archive, path=None):
+        self.archive = archive
+        self.path = path
+        self.keygen = archive.keygen
+        self._cache_key = archive._cache_key
+
+        # keep filters of shared connections for the whole process,
+        # so later jobs can use them without counting all entries again
+        if (key := archive.shared.key) is not None:
+            self._database = key[1] if key[0] == "sqlite" else None
+            key = (key, archive._stmt_entries, path)
+        else:
+            self._database = None
+        with _connections_lock:
+            if key is None or (state := _blooms.get(key)) is None:
+                state = SharedBloom()
+                if key is not None:
+                    _blooms[key] = state
+            first = not state.refs
+            state.refs += 1
+        self.state = state
+
+        with state.lock:
+            if not state.valid or \
+                    first and state.signature != self._signature():
+                self._validate(state)
+                state.valid = True
+
+    def __getattr__(self, name):
+        return getattr(self.archive, name)
+
+    @property
+    def bloom(self):
+        return self.state.bloom
+
+    @property
+    def modified(self):
+        return self.state.modified
+
+    def add(self, kwdict):
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        kwdict[self._cache_key] = key
+        self.archive.add(kwdict)
+
+        state = self.state
+        with state.lock:
+            # keys not in the filter are guaranteed to be new entries,
+            # as are false positives found by check()
+            if key not in state.bloom:
+                state.bloom.add(key)
+            elif key in state.missed:
+                state.missed.discard(key)
+            else:
+                return
+            state.added += 1
+            state.modified = True
+
+    def check(self, kwdict):
+        key = kwdict[self._cache_key] = self.keygen(kwdict)
+        if key not in self.state.bloom:
+            return False
+        if result := self.archive.check(kwdict):
+            return result
+        self.state.missed.add(key)
+        return result
+
+    def check_many(self, kwdicts):
+        bloom = self.state.bloom
+        results = []
+        candidates = []
+
+        for kwdict in kwdicts:
+            key = kwdict[self._cache_key] = self.keygen(kwdict)
+            if key in bloom:
+                results.append(None)
+                candidates.append(kwdict)
+            else:
+                results.append(False)
+
+        if candidates:
+            found = self.archive.check_many(candidates)
+            self.state.missed.update(
+                kwdict[self._cache_key]
+                for kwdict, result in zip(candidates, found)
+                if not result)
+            found = iter(found)
+            results = [
+                next(found) if result is None else result
+                for result in results
+            ]
+        return results
+
+    def close(self):
+        archive = self.archive
+        state = self.state
+        with _connections_lock:
+            state.refs -= 1
+            last = not state.refs
+
+        try:
+            archive.flush()
+            if last:
+                with state.lock:
+                    last = not state.refs and self._commit(state)
+        except BaseException:
+            state.valid = False
+            raise
+        finally:
+            archive.close()
+
+        if last:
+            # remember the database file's state after closing it
+            # to detect modifications by other processes
+            signature = self._signature()
+            with state.lock:
+                if not state.refs:
+                    state.signature = signature
+
+    def _commit(self, state):
+        """Store the filter of a state no longer in use
+
+        Return False if it had to be discarded.
+        """
+        if state.version is not None and \
+                state.version != self.archive.version():
+            # archive got modified by another process
+            log.debug("Discarding Bloom filter '%s'", self.path)
+            state.valid = False
+            if self.path:
+                util.remove_file(self.path)
+            return False
+
+        if state.modified:
+            state.count += state.added
+            state.added = 0
+            if self.path:
+                self._store(state.count)
+            state.modified = False
+        state.missed.clear()
+        return True
+
+    def _signature(self):
+        """Return modification time and size of the archive's files"""
+        if self._database is None:
+            return None
+        signature = []
+        for path in (self._database, self._database + "-wal"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                # ignore WAL files without pending changes
+                signature.append(
+                    (stat.st_mtime_ns, stat.st_size) if stat.st_size else None)
+        return signature
+
+    def _validate(self, state):
+        """Make sure 'state' has a filter for all current archive entries"""
+        count = self.archive.count()
+        state.version = self.archive.version()
+        state.missed.clear()
+        if state.bloom is not None and count == state.count + state.added:
+            return
+
+        state.count = count
+        state.added = 0
+        if (bloom := self._load(count)) is None:
+            state.bloom = self._build(count)
+            state.modified = True
+        else:
+            state.bloom = bloom
+            state.modified = False
+
+    def _load(self, count):
+        if not self.path:
+            return None
+
         try:
-            self.cursor.executemany(
-                self._stmt_insert,
-                ((key,) for key in self.keys))
-            self.connection.commit()
+            with open(self.path, "rb") as fp:
+                info = util.json_loads(fp.readline().decode())
+                if info["count"] != count or \
+                        info["count"] > info["capacity"]:
+                    log.debug("Rebuilding outdated Bloom filter '%s'",
+                              self.path)
+                    return None
+                bloom = util.BloomFilter(
+                    info["capacity"], info["error_rate"],
+                    bytearray(fp.read()))
+        except FileNotFoundError:
+            return None
         except Exception as exc:
-            log.error("%s: %s when writing entries: %s",
-                      self.connection, exc.__class__.__name__, exc)
-            self.connection.rollback()
+            log.warning("Failed to load Bloom filter '%s' (%s: %s)",
+                        self.path, exc.__class__.__name__, exc)
+            return None
+
+        if len(bloom.bits) * 8 != bloom.size:
+            return None
+        return bloom
+
+    def _build(self, count):
+        log.debug("Building Bloom filter for %s archive entries", count)
+        bloom = util.BloomFilter(
+            max(count * 2, 1 << 16), self.error_rate)
+        add = bloom.add
+        for entry in self.archive.entries():
+            add(entry)
+        return bloom
+
+    def _store(self, count):
+        bloom = self.state.bloom
+        info = {
+            "count"     : count,
+            "capacity"  : bloom.capacity,
+            "error_rate": self.error_rate,
+        }
+
+        path_tmp = self.path + ".tmp"
+        try:
+            with open(path_tmp, "wb") as fp:
+                fp.write(util.json_dumps(info).encode())
+                fp.write(b"\n")
+                fp.write(bloom.bits)
+            os.replace(path_tmp, self.path)
+        except OSError as exc:
+            log.warning("Failed to write Bloom filter '%s' (%s: %s)",
+                        self.path, exc.__class__.__name__, exc)
@@ -9,10 +9,12 @@
 """Downloader module for http:// and https:// URLs"""
 
 import time
+import queue
+import threading
 import mimetypes
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from .common import DownloaderBase
-from .. import text, util, output, exception
+from .. import text, util, output, exception, ratelimit
 from ssl import SSLError
 FLAGS = util.FLAGS
 
@@ -40,6 +42,8 @@ class HttpDownloader(DownloaderBase):
         self.verify = self.config("verify", extractor._verify)
         self.mtime = self.config("mtime", True)
         self.rate = self.config("rate")
+        self.segments = self.config("segments", 1)
+        self.write_buffer = self.config("write-buffer", 0)
         interval_429 = self.config("sleep-429")
 
         if not self.config("consume-content", False):
@@ -80,6 +84,17 @@ class HttpDownloader(DownloaderBase):
             else:
                 self.log.warning("Invalid rate limit (%r)", self.rate)
                 self.rate = False
+        if self.segments and self.segments > 1:
+            segment_size = self.config("segment-size", "10M")
+            if isinstance(segment_size, str):
+                segment_size = text.parse_bytes(segment_size)
+            if segment_size is None or segment_size < 0:
+                self.log.warning(
+                    "Invalid segment size (%r)", self.config("segment-size"))
+                segment_size = 10485760
+            self.segment_size = segment_size
+        else:
+            self.segments = False
         if self.progress is not None:
             self.receive = self._receive_rate
             if self.progress < 0.0:
@@ -88,6 +103,8 @@ class HttpDownloader(DownloaderBase):
             self.interval_429 = extractor._interval_429
         else:
             self.interval_429 = util.build_duration_func(interval_429)
+        self.adaptive_429 = self.config(
+            "sleep-429-adaptive", extractor._adaptive_429)
 
     def download(self, url, pathfmt):
         try:
@@ -103,7 +120,7 @@ class HttpDownloader(DownloaderBase):
                 util.remove_file(pathfmt.temppath)
 
     def _download_impl(self, url, pathfmt):
-        response = None
+        response = retry_after = None
         tries = code = 0
         msg = ""
 
@@ -128,8 +145,11 @@ class HttpDownloader(DownloaderBase):
                     return False
 
                 if code == 429 and self.interval_429:
-                    s = self.interval_429()
-                    time.sleep(s if s > tries else tries)
+                    s = retry_after or self.interval_429()
+                    s = s if s > tries else tries
+                    if self.adaptive_429:
+                        ratelimit.bucket(ratelimit.host(url)).backoff(s)
+                    time.sleep(s)
                 else:
                     time.sleep(tries)
                 code = 0
@@ -137,6 +157,11 @@ class HttpDownloader(DownloaderBase):
             tries += 1
             file_header = None
 
+            # wait for rate limits of this host
+            bucket = ratelimit.bucket(ratelimit.host(url))
+            if (s := bucket.acquire()) > 0.0:
+                time.sleep(s)
+
             # collect HTTP headers
             headers = {"Accept": "*/*"}
             #   file-specific headers
@@ -179,15 +204,19 @@ class HttpDownloader(DownloaderBase):
             # check response
             code = response.status_code
             if code == 200 or code in expected_status:  # OK
+                bucket.success()
                 offset = 0
                 size = response.headers.get("Content-Length")
             elif code == 206:  # Partial Content
+                bucket.success()
                 offset = file_size
                 size = response.headers["Content-Range"].rpartition("/")[2]
             elif code == 416 and file_size:  # Requested Range Not Satisfiable
                 break
             else:
                 msg = f"'{code} {response.reason}' for '{url}'"
+                if code == 429 and self.adaptive_429:
+                    retry_after = ratelimit.retry_after(response)
 
                 challenge = util.detect_challenge(response)
                 if challenge is not None:
@@ -279,6 +308,11 @@ class HttpDownloader(DownloaderBase):
                     pathfmt.part_enable(self.partdir)
                 metadata = False
 
+            if self.segments and code == 200:
+                segments = self._segment_bounds(response, size)
+            else:
+                segments = None
+
             content = response.iter_content(self.chunk_size)
 
             validate_sig = kwdict.get("_http_signature")
@@ -307,6 +341,23 @@ class HttpDownloader(DownloaderBase):
                     response.close()
                     return True
 
+            # check for already stored content
+            if not offset and size and (duplicate := kwdict.get(
+                    "_http_duplicate")) is not None:
+                head_size, duplicate = duplicate
+                if not segments or head_size < segments[0][1]:
+                    file_header = file_header or b""
+                    try:
+                        while len(file_header) < head_size and \
+                                (data := next(content, None)):
+                            file_header += data
+                    except (RequestException, SSLError) as exc:
+                        msg = str(exc)
+                        continue
+                    if duplicate(pathfmt, size, file_header):
+                        response.close()
+                        return True
+
             # set open mode
             if not offset:
                 mode = "w+b"
@@ -322,6 +373,8 @@ class HttpDownloader(DownloaderBase):
                 if fp is None:
                     # '.part' file no longer exists
                     break
+                if segments and not fp.seekable():
+                    segments = None
                 if file_header:
                     fp.write(file_header)
                     offset += len(file_header)
@@ -333,7 +386,14 @@ class HttpDownloader(DownloaderBase):
 
                 self.out.start(pathfmt.path)
                 try:
-                    self.receive(fp, content, size, offset)
+                    if segments:
+                        self._receive_segmented(
+                            fp, segments, url, headers,
+                            response, content, offset)
+                    elif self.write_buffer:
+                        self._receive_buffered(fp, content, size, offset)
+                    else:
+                        self.receive(fp, content, size, offset)
                 except (RequestException, SSLError) as exc:
                     msg = str(exc)
                     output.stderr_write("\n")
@@ -420,6 +480,178 @@ class HttpDownloader(DownloaderBase):
                 if time_expected > time_elapsed:
                     time.sleep(time_expected - time_elapsed)
 
+    def _receive_buffered(self, fp, content, bytes_total, bytes_start):
+        """Receive data while writing it to 'fp' in a separate thread"""
+        writer = HttpWriter(fp, self.write_buffer)
+        try:
+            self.receive(writer, content, bytes_total, bytes_start)
+        except BaseException:
+            # do not replace the original exception with a write error
+            writer.close(False)
+            raise
+        writer.close()
+
+    def _segment_bounds(self, response, size):
+        """Split the file of 'response' into byte ranges"""
+        if not size or response.headers.get("Accept-Ranges") != "bytes" or \
+                response.headers.get("Content-Encoding", "identity") != \
+                "identity":
+            return None
+
+        num = size // self.segment_size if self.segment_size else size
+        if num > self.segments:
+            num = self.segments
+        if num < 2:
+            return None
+
+        length = -(-size // num)
+        return [
+            (start, min(start + length, size))
+            for start in range(0, size, length)
+        ]
+
+    def _receive_segmented(self, fp, bounds, url, headers,
+                           response, content, offset):
+        """Download all byte ranges in 'bounds' concurrently"""
+        bytes_total = bounds[-1][1]
+        fp.truncate(bytes_total)
+        fp.flush()
+
+        segments = [HttpSegment(start, end) for start, end in bounds]
+        segments[0].written = offset
+        stop = threading.Event()
+        rate = self.rate() / len(segments) if self.rate else None
+        path = fp.name
+
+        threads = [
+            threading.Thread(
+                target=self._download_segment,
+                args=(segment, url, headers, path, rate, stop,
+                      content if not index else None),
+                daemon=True,
+            )
+            for index, segment in enumerate(segments)
+        ]
+        self.log.debug("Downloading %d segments", len(threads))
+
+        progress = self.progress
+        time_start = time.monotonic()
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+
+                    if FLAGS.DOWNLOAD is not None:
+                        FLAGS.process("DOWNLOAD")
+
+                    time_elapsed = time.monotonic() - time_start
+                    if progress is not None and time_elapsed > progress:
+                        bytes_downloaded = sum(
+                            s.written for s in segments) - offset
+                        self.out.progress(
+                            bytes_total,
+                            offset + bytes_downloaded,
+                            int(bytes_downloaded / time_elapsed),
+                        )
+        finally:
+            stop.set()
+            for thread in threads:
+                if thread.is_alive():
+                    thread.join()
+            response.close()
+
+            # keep only the contiguous part at the start of the file
+            # to be able to resume it later
+            position = 0
+            for segment in segments:
+                position = segment.start + segment.written
+                if position < segment.end:
+                    fp.truncate(position)
+                    break
+            fp.seek(position)
+
+        if position < bytes_total:
+            for segment in segments:
+                if segment.error:
+                    raise RequestException(segment.error)
+            raise RequestException("Incomplete segmented download")
+
+    def _download_segment(self, segment, url, headers, path, rate, stop,
+                          content=None):
+        """Download a single byte range"""
+        headers = headers.copy()
+        tries = 0
+
+        while True:
+            start = segment.start + segment.written
+            try:
+                if content is None:
+                    headers["Range"] = f"bytes={start}-{segment.end-1}"
+                    response = self.session.request(
+                        "GET", url,
+                        stream=True,
+                        headers=headers,
+                        timeout=self.timeout,
+                        proxies=self.proxies,
+                        verify=self.verify,
+                    )
+                    if response.status_code != 206 or not response.headers.get(
+                            "Content-Range", "").startswith(f"bytes {start}-"):
+                        response.close()
+                        segment.error = (
+                            f"Invalid response for byte range {start}-"
+                            f"{segment.end-1} ('{response.status_code} "
+                            f"{response.reason}')")
+                        return
+                    content = response.iter_content(self.chunk_size)
+                else:
+                    response = None
+
+                with open(path, "r+b") as fp:
+                    fp.seek(start)
+                    self._receive_segment(fp, content, segment, rate, stop)
+                if response is not None:
+                    response.close()
+                return
+            except (RequestException, SSLError, OSError) as exc:
+                content = None
+                tries += 1
+                if tries > self.retries or stop.is_set():
+                    segment.error = str(exc)
+                    return
+                self.log.debug("Segment %d-%d: %s (%s/%s)",
+                               segment.start, segment.end-1, exc,
+                               tries, self.retries+1)
+                time.sleep(tries)
+
+    def _receive_segment(self, fp, content, segment, rate, stop):
+        write = fp.write
+        remaining = segment.end - segment.start - segment.written
+
+        bytes_downloaded = 0
+        time_start = time.monotonic()
+
+        for data in content:
+            if stop.is_set():
+                return
+            if len(data) >= remaining:
+                write(data[:remaining])
+                segment.written += remaining
+                return
+            write(data)
+            size = len(data)
+            segment.written += size
+            remaining -= size
+
+            if rate is not None:
+                bytes_downloaded += size
+                time_elapsed = time.monotonic() - time_start
+                time_expected = bytes_downloaded / rate
+                if time_expected > time_elapsed:
+                    time.sleep(time_expected - time_elapsed)
+
     def _find_extension(self, response):
         """Get filename extension from MIME type"""
         mtype = response.headers.get("Content-Type", "image/jpeg")
@@ -451,6 +683,58 @@ class HttpDownloader(DownloaderBase):
         return False
 
 
+class HttpWriter():
+    """Write chunks of data to a file object in a background thread
+
+    Queues the chunks it receives as they are (write-behind only).
+    Reading into reusable buffers would not avoid any allocations,
+    since urllib3's readinto() copies the result of a regular read().
+    """
+
+    def __init__(self, fp, size):
+        self.fp = fp
+        self.queue = queue.Queue(size)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, data):
+        if self.error is not None:
+            raise self.error
+        self.queue.put(data)
+
+    def close(self, check=True):
+        """Wait until all queued data has been written
+
+        Raise the first write error when 'check' is enabled.
+        """
+        self.queue.put(None)
+        self.thread.join()
+        if check and self.error is not None:
+            raise self.error
+
+    def _run(self):
+        write = self.fp.write
+        get = self.queue.get
+        while (data := get()) is not None:
+            if self.error is None:
+                try:
+                    write(data)
+                except Exception as exc:
+                    self.error = exc
+
+
+class HttpSegment():
+    """Byte range of a segmented download"""
+    __slots__ = ("start", "end", "written", "error")
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        self.written = 0
+        self.error = None
+
+
 MIME_TYPES = {
     "image/jpeg"    : "jpg",
     "image/jpg"     : "jpg",
@@ -9,9 +9,10 @@
 """Downloader module for URLs requiring youtube-dl support"""
 
 from .common import DownloaderBase
-from .. import ytdl, text
+from .. import ytdl, text, ratelimit
 from xml.etree import ElementTree
 from http.cookiejar import Cookie
+import time
 import os
 
 
@@ -23,6 +24,9 @@ class YoutubeDLDownloader(DownloaderBase):
 
         extractor = job.extractor
         self.retries = self.config("retries", extractor._retries)
+        self.interval_429 = extractor._interval_429
+        self.adaptive_429 = self.config(
+            "sleep-429-adaptive", extractor._adaptive_429)
         self.ytdl_opts = {
             "retries": self.retries+1 if self.retries >= 0 else float("inf"),
             "socket_timeout": self.config("timeout", extractor._timeout),
@@ -41,6 +45,13 @@ class YoutubeDLDownloader(DownloaderBase):
         kwdict = pathfmt.kwdict
         tries = 0
 
+        # wait for rate limits of this host
+        bucket = ratelimit.bucket(ratelimit.host(
+            url[5:] if url.startswith("ytdl:") else url))
+        if (seconds := bucket.acquire()) > 0.0:
+            self.log.debug("Sleeping %.2f seconds (rate limit)", seconds)
+            time.sleep(seconds)
+
         kwdict["_mtime_http"] = None
         if ytdl_instance := kwdict.pop("_ytdl_instance", None):
             # 'ytdl' extractor
@@ -115,6 +126,7 @@ class YoutubeDLDownloader(DownloaderBase):
                     return False
                 if tries > self.retries:
                     return False
+                self._handle_429(bucket, msg)
 
         if extra := kwdict.get("_ytdl_extra"):
             info_dict.update(extra)
@@ -150,8 +162,18 @@ class YoutubeDLDownloader(DownloaderBase):
                 return False
             if tries > self.retries:
                 return False
+            self._handle_429(bucket, msg)
         return True
 
+    def _handle_429(self, bucket, msg):
+        if "HTTP Error 429" in msg and \
+                self.adaptive_429 and self.interval_429:
+            seconds = self.interval_429()
+            bucket.backoff(seconds)
+            self.log.info("Waiting %.2f seconds (429 Too Many Requests)",
+                          seconds)
+            time.sleep(seconds)
+
     def _extract_url(self, ytdl, url):
         return ytdl.extract_info(url, download=False)
 
@@ -7,6 +7,7 @@
 # published by the Free Software Foundation.
 
 import sys
+from .. import config
 from ..text import re_compile
 
 modules = [
@@ -264,6 +265,9 @@ modules = [
 
 def find(url):
     """Find a suitable extractor for the given URL"""
+    if _index_enabled and (index := _index_data or _index_init()):
+        return _index_find(url, index)
+
     for cls in _list_classes():
         if match := cls.pattern.match(url):
             return cls(match)
@@ -275,16 +279,14 @@ def add(cls):
     if isinstance(cls.pattern, str):
         cls.pattern = re_compile(cls.pattern)
     _cache.append(cls)
+    _extra.append(cls)
     return cls
 
 
 def add_module(module):
     """Add all extractors in 'module' to the list of available extractors"""
-    if classes := _get_classes(module):
-        if isinstance(classes[0].pattern, str):
-            for cls in classes:
-                cls.pattern = re_compile(cls.pattern)
-        _cache.extend(classes)
+    classes = _add_module(module)
+    _extra.extend(classes)
     return classes
 
 
@@ -296,6 +298,21 @@ def extractors():
     )
 
 
+def registry():
+    """Return information about all available extractor classes
+
+    Uses the generated registry when possible
+    and does not import any extractor modules in that case.
+    """
+    if _extra or not _index_enabled or not (
+            index := _index_data or _index_init()):
+        return extractors()
+    return sorted(
+        map(ExtractorInfo, index[2]),
+        key=lambda x: x.__name__
+    )
+
+
 # --------------------------------------------------------------------
 # internals
 
@@ -305,7 +322,7 @@ def _list_classes():
     yield from _cache
 
     for module in _module_iter:
-        yield from add_module(module)
+        yield from _add_module(module)
 
     globals()["_list_classes"] = lambda : _cache
 
@@ -328,6 +345,16 @@ def _modules_path(path, files):
         del sys.path[0]
 
 
+def _add_module(module):
+    if classes := _get_classes(module):
+        for cls in classes:
+            # classes might have already been compiled individually
+            if isinstance(cls.pattern, str):
+                cls.pattern = re_compile(cls.pattern)
+        _cache.extend(classes)
+    return classes
+
+
 def _get_classes(module):
     """Return a list of all extractor classes in a module"""
     return [
@@ -337,5 +364,113 @@ def _get_classes(module):
     ]
 
 
+# --------------------------------------------------------------------
+# extractor registry
+
+class ExtractorInfo():
+    """Registry entry describing an extractor class"""
+
+    def __init__(self, row):
+        (self.module, self.__name__, self.category, self.subcategory,
+         self.basecategory, self.pattern, self.example, self.__doc__) = row
+
+
+def _index_init():
+    """Load the generated registry for the current set of modules"""
+    global _index_enabled, _index_data
+
+    from . import _index
+    if tuple(modules) != _index.MODULES:
+        _index_enabled = False
+        return None
+
+    # patterns of classes with user-defined instances are only known
+    # after importing their module, and they can match any domain
+    fallback = set(_index.FALLBACK)
+    sources = [row[5] for row in _index.CLASSES]
+    for basecategory, indices in _index.BASECATEGORIES.items():
+        if instances := config.get(("extractor",), basecategory):
+            if any(isinstance(info, dict) and "root" in info
+                   for info in instances.values()):
+                fallback.update(indices)
+                for idx in indices:
+                    sources[idx] = None
+
+    num = len(sources)
+    _index_data = (_index.DOMAINS, fallback, _index.CLASSES,
+                   sources, [None] * num, [None] * num)
+    return _index_data
+
+
+def _index_find(url, index):
+    """Find a suitable extractor for 'url' using the registry"""
+    if not isinstance(url, str):
+        raise TypeError(
+            f"expected string, got '{url.__class__.__name__}'")
+
+    for cls in _extra:
+        if match := cls.pattern.match(url):
+            return cls(match)
+
+    patterns = index[4]
+    for idx in _index_candidates(url, index):
+        pattern = patterns[idx] or _index_pattern(index, idx)
+        if pattern.match(url):
+            cls = _index_load(index, idx)
+            if match := cls.pattern.match(url):
+                return cls(match)
+    return None
+
+
+def _index_candidates(url, index):
+    """Return indices of all classes whose pattern might match 'url'"""
+    domains = index[0]
+    indices = index[1].copy()
+    for name in _index_names(url):
+        while name:
+            if name in domains:
+                indices.update(domains[name])
+            name = name.partition(".")[2]
+    return sorted(indices)
+
+
+def _index_pattern(index, idx):
+    """Return the compiled pattern of the extractor class at 'idx'"""
+    if (source := index[3][idx]) is None:
+        # pattern depends on config settings
+        pattern = _index_load(index, idx).pattern
+    else:
+        pattern = re_compile(source)
+    index[4][idx] = pattern
+    return pattern
+
+
+def _index_load(index, idx):
+    """Import the extractor class at 'idx'"""
+    if cls := index[5][idx]:
+        return cls
+
+    module_name, class_name = index[2][idx][:2]
+    module = __import__(module_name, globals(), None, None, 1)
+    cls = getattr(module, class_name)
+    if isinstance(cls.pattern, str):
+        cls.pattern = re_compile(cls.pattern)
+    index[5][idx] = cls
+    return cls
+
+
+def _index_names(url):
+    """Return the host names and other authority components of 'url'"""
+    url = url.lower()
+    if match := _index_scheme(url):
+        url = url[match.end():]
+    return _index_split(url.partition("/")[0])
+
+
 _cache = []
+_extra = []
 _module_iter = _modules_internal()
+_index_enabled = True
+_index_data = None
+_index_scheme = re_compile(r"[a-z][a-z0-9+.-]*://").match
+_index_split = re_compile(r"[@:?#]").split
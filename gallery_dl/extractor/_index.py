@@ -0,0 +1,9837 @@
+# -*- coding: utf-8 -*-
+
+# This file is generated by scripts/extractor_index.py - do not edit
+
+"""Registry of extractor classes and their index by domain name"""
+
+MODULES = (
+    '2ch',
+    '2chan',
+    '2chen',
+    '35photo',
+    '3dbooru',
+    '4chan',
+    '4archive',
+    '4chanarchives',
+    '500px',
+    '8chan',
+    '8muses',
+    'adultempire',
+    'agnph',
+    'ahottie',
+    'ao3',
+    'arcalive',
+    'architizer',
+    'arena',
+    'artstation',
+    'aryion',
+    'audiochan',
+    'batoto',
+    'bbc',
+    'behance',
+    'bellazon',
+    'bilibili',
+    'blogger',
+    'bluesky',
+    'boosty',
+    'booth',
+    'bunkr',
+    'catbox',
+    'cfake',
+    'chevereto',
+    'cien',
+    'civitai',
+    'comedywildlifephoto',
+    'comick',
+    'comicvine',
+    'cyberdrop',
+    'cyberfile',
+    'danbooru',
+    'dandadan',
+    'dankefuerslesen',
+    'desktopography',
+    'deviantart',
+    'discord',
+    'dynastyscans',
+    'e621',
+    'eporner',
+    'erome',
+    'everia',
+    'exhentai',
+    'facebook',
+    'fanbox',
+    'fansly',
+    'fantia',
+    'fapello',
+    'fapachi',
+    'fikfap',
+    'fitnakedgirls',
+    'flickr',
+    'furaffinity',
+    'furry34',
+    'fuskator',
+    'gelbooru',
+    'gelbooru_v01',
+    'gelbooru_v02',
+    'girlsreleased',
+    'girlswithmuscle',
+    'gofile',
+    'hatenablog',
+    'hdoujin',
+    'hentai2read',
+    'hentaicosplays',
+    'hentaifoundry',
+    'hentaihand',
+    'hentaihere',
+    'hentainexus',
+    'hiperdex',
+    'hitomi',
+    'hotleak',
+    'imagebam',
+    'imagechest',
+    'imagefap',
+    'imgbb',
+    'imgbox',
+    'imgpile',
+    'imgth',
+    'imgur',
+    'imhentai',
+    'inkbunny',
+    'instagram',
+    'issuu',
+    'itaku',
+    'itchio',
+    'iwara',
+    'jschan',
+    'kabeuchi',
+    'keenspot',
+    'kemono',
+    'khinsider',
+    'komikcast',
+    'koofr',
+    'leakgallery',
+    'lensdump',
+    'lexica',
+    'lightroom',
+    'livedoor',
+    'lofter',
+    'luscious',
+    'lynxchan',
+    'madokami',
+    'mangadex',
+    'mangafire',
+    'mangafox',
+    'mangahere',
+    'manganelo',
+    'mangapark',
+    'mangaread',
+    'mangareader',
+    'mangataro',
+    'mangoxo',
+    'misskey',
+    'motherless',
+    'myhentaigallery',
+    'myportfolio',
+    'naverblog',
+    'naverchzzk',
+    'naverwebtoon',
+    'nekohouse',
+    'newgrounds',
+    'nhentai',
+    'nijie',
+    'nitter',
+    'nozomi',
+    'nsfwalbum',
+    'nudostar',
+    'okporn',
+    'paheal',
+    'patreon',
+    'pexels',
+    'philomena',
+    'photovogue',
+    'picarto',
+    'picazor',
+    'pictoa',
+    'piczel',
+    'pillowfort',
+    'pinterest',
+    'pixeldrain',
+    'pixiv',
+    'pixnet',
+    'plurk',
+    'poipiku',
+    'poringa',
+    'pornhub',
+    'pornpics',
+    'pornstarstube',
+    'postmill',
+    'rawkuma',
+    'reactor',
+    'readcomiconline',
+    'realbooru',
+    'reddit',
+    'redgifs',
+    'rule34us',
+    'rule34vault',
+    'rule34xyz',
+    's3ndpics',
+    'saint',
+    'sankaku',
+    'sankakucomplex',
+    'schalenetwork',
+    'scrolller',
+    'seiga',
+    'senmanga',
+    'sexcom',
+    'shimmie2',
+    'simplyhentai',
+    'sizebooru',
+    'skeb',
+    'slickpic',
+    'slideshare',
+    'smugmug',
+    'soundgasm',
+    'speakerdeck',
+    'steamgriddb',
+    'subscribestar',
+    'sxypix',
+    'szurubooru',
+    'tapas',
+    'tcbscans',
+    'telegraph',
+    'tenor',
+    'thehentaiworld',
+    'tiktok',
+    'tmohentai',
+    'toyhouse',
+    'tsumino',
+    'tumblr',
+    'tumblrgallery',
+    'tungsten',
+    'twibooru',
+    'twitter',
+    'urlgalleries',
+    'unsplash',
+    'uploadir',
+    'urlshortener',
+    'vanillarock',
+    'vichan',
+    'vipergirls',
+    'vk',
+    'vsco',
+    'wallhaven',
+    'wallpapercave',
+    'warosu',
+    'weasyl',
+    'webmshare',
+    'webtoons',
+    'weebcentral',
+    'weebdex',
+    'weibo',
+    'whyp',
+    'wikiart',
+    'wikifeet',
+    'wikimedia',
+    'xasiat',
+    'xenforo',
+    'xfolio',
+    'xhamster',
+    'xvideos',
+    'yiffverse',
+    'yourlesbians',
+    'zerochan',
+    'booru',
+    'moebooru',
+    'foolfuuka',
+    'foolslide',
+    'mastodon',
+    'shopify',
+    'lolisafe',
+    'imagehosts',
+    'directlink',
+    'recursive',
+    'oauth',
+    'noop',
+    'ytdl',
+    'generic',
+)
+
+# module, name, category, subcategory, basecategory, pattern, example, doc
+CLASSES = (
+    (  # 0
+        '2ch',
+        '_2chThreadExtractor',
+        '2ch',
+        'thread',
+        '',
+        '(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/res/(\\d+)',
+        'https://2ch.org/a/res/12345.html',
+        'Extractor for 2ch threads',
+    ),
+    (  # 1
+        '2ch',
+        '_2chBoardExtractor',
+        '2ch',
+        'board',
+        '',
+        '(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/?$',
+        'https://2ch.org/a/',
+        'Extractor for 2ch boards',
+    ),
+    (  # 2
+        '2chan',
+        '_2chanThreadExtractor',
+        '2chan',
+        'thread',
+        '',
+        '(?:https?://)?([\\w-]+)\\.2chan\\.net/([^/?#]+)/res/(\\d+)',
+        'https://dec.2chan.net/12/res/12345.htm',
+        'Extractor for 2chan threads',
+    ),
+    (  # 3
+        '2chen',
+        '_2chenThreadExtractor',
+        '',
+        'thread',
+        '2chen',
+        '(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2chen\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)/(\\d+)',
+        'https://sturdychan.help/a/12345/',
+        'Extractor for 2chen threads',
+    ),
+    (  # 4
+        '2chen',
+        '_2chenBoardExtractor',
+        '',
+        'board',
+        '2chen',
+        '(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2chen\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)(?:/catalog|/?$)',
+        'https://sturdychan.help/a/',
+        'Extractor for 2chen boards',
+    ),
+    (  # 5
+        '35photo',
+        '_35photoUserExtractor',
+        '35photo',
+        'user',
+        '',
+        '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/(?!photo_|genre_|tags/|rating/)([^/?#]+)',
+        'https://35photo.pro/USER',
+        'Extractor for all images of a user on 35photo.pro',
+    ),
+    (  # 6
+        '35photo',
+        '_35photoTagExtractor',
+        '35photo',
+        'tag',
+        '',
+        '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/tags/([^/?#]+)',
+        'https://35photo.pro/tags/TAG/',
+        'Extractor for all photos from a tag listing',
+    ),
+    (  # 7
+        '35photo',
+        '_35photoGenreExtractor',
+        '35photo',
+        'genre',
+        '',
+        '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/genre_(\\d+)(/new/)?',
+        'https://35photo.pro/genre_12345/',
+        'Extractor for images of a specific genre on 35photo.pro',
+    ),
+    (  # 8
+        '35photo',
+        '_35photoImageExtractor',
+        '35photo',
+        'image',
+        '',
+        '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/photo_(\\d+)',
+        'https://35photo.pro/photo_12345/',
+        'Extractor for individual images from 35photo.pro',
+    ),
+    (  # 9
+        '3dbooru',
+        '_3dbooruTagExtractor',
+        '3dbooru',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?behoimi\\.org/post(?:/(?:index)?)?\\?tags=(?P<tags>[^&#]+)',
+        'http://behoimi.org/post?tags=TAG',
+        'Extractor for images from behoimi.org based on search-tags',
+    ),
+    (  # 10
+        '3dbooru',
+        '_3dbooruPoolExtractor',
+        '3dbooru',
+        'pool',
+        'booru',
+        '(?:https?://)?(?:www\\.)?behoimi\\.org/pool/show/(?P<pool>\\d+)',
+        'http://behoimi.org/pool/show/12345',
+        'Extractor for image-pools from behoimi.org',
+    ),
+    (  # 11
+        '3dbooru',
+        '_3dbooruPostExtractor',
+        '3dbooru',
+        'post',
+        'booru',
+        '(?:https?://)?(?:www\\.)?behoimi\\.org/post/show/(?P<post>\\d+)',
+        'http://behoimi.org/post/show/12345',
+        'Extractor for single images from behoimi.org',
+    ),
+    (  # 12
+        '3dbooru',
+        '_3dbooruPopularExtractor',
+        '3dbooru',
+        'popular',
+        'booru',
+        '(?:https?://)?(?:www\\.)?behoimi\\.org/post/popular_(?P<scale>by_(?:day|week|month)|recent)(?:\\?(?P<query>[^#]*))?',
+        'http://behoimi.org/post/popular_by_month',
+        'Extractor for popular images from behoimi.org',
+    ),
+    (  # 13
+        '4chan',
+        '_4chanThreadExtractor',
+        '4chan',
+        'thread',
+        '',
+        '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/]+)/thread/(\\d+)',
+        'https://boards.4channel.org/a/thread/12345/',
+        'Extractor for 4chan threads',
+    ),
+    (  # 14
+        '4chan',
+        '_4chanBoardExtractor',
+        '4chan',
+        'board',
+        '',
+        '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/?#]+)/\\d*$',
+        'https://boards.4channel.org/a/',
+        'Extractor for 4chan boards',
+    ),
+    (  # 15
+        '4archive',
+        '_4archiveThreadExtractor',
+        '4archive',
+        'thread',
+        '',
+        '(?:https?://)?4archive\\.org/board/([^/?#]+)/thread/(\\d+)',
+        'https://4archive.org/board/a/thread/12345/',
+        'Extractor for 4archive threads',
+    ),
+    (  # 16
+        '4archive',
+        '_4archiveBoardExtractor',
+        '4archive',
+        'board',
+        '',
+        '(?:https?://)?4archive\\.org/board/([^/?#]+)(?:/(\\d+))?/?$',
+        'https://4archive.org/board/a/',
+        'Extractor for 4archive boards',
+    ),
+    (  # 17
+        '4chanarchives',
+        '_4chanarchivesThreadExtractor',
+        '4chanarchives',
+        'thread',
+        '',
+        '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)/thread/(\\d+)',
+        'https://4chanarchives.com/board/a/thread/12345/',
+        'Extractor for threads on 4chanarchives.com',
+    ),
+    (  # 18
+        '4chanarchives',
+        '_4chanarchivesBoardExtractor',
+        '4chanarchives',
+        'board',
+        '',
+        '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)(?:/(\\d+))?/?$',
+        'https://4chanarchives.com/board/a/',
+        'Extractor for boards on 4chanarchives.com',
+    ),
+    (  # 19
+        '500px',
+        '_500pxUserExtractor',
+        '500px',
+        'user',
+        '',
+        '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/|liked)(?:p/)?([^/?#]+)/?(?:$|[?#])',
+        'https://500px.com/USER',
+        "Extractor for photos from a user's photostream on 500px.com",
+    ),
+    (  # 20
+        '500px',
+        '_500pxGalleryExtractor',
+        '500px',
+        'gallery',
+        '',
+        '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/)(?:p/)?([^/?#]+)/galleries/([^/?#]+)',
+        'https://500px.com/USER/galleries/GALLERY',
+        'Extractor for photo galleries on 500px.com',
+    ),
+    (  # 21
+        '500px',
+        '_500pxFavoriteExtractor',
+        '500px',
+        'favorite',
+        '',
+        '(?:https?://)?(?:web\\.)?500px\\.com/liked/?$',
+        'https://500px.com/liked',
+        'Extractor for favorite 500px photos',
+    ),
+    (  # 22
+        '500px',
+        '_500pxImageExtractor',
+        '500px',
+        'image',
+        '',
+        '(?:https?://)?(?:web\\.)?500px\\.com/photo/(\\d+)',
+        'https://500px.com/photo/12345/TITLE',
+        'Extractor for individual images from 500px.com',
+    ),
+    (  # 23
+        '8chan',
+        '_8chanThreadExtractor',
+        '8chan',
+        'thread',
+        '',
+        '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:res|last)/(\\d+)',
+        'https://8chan.moe/a/res/12345.html',
+        'Extractor for 8chan threads',
+    ),
+    (  # 24
+        '8chan',
+        '_8chanBoardExtractor',
+        '8chan',
+        'board',
+        '',
+        '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:(\\d+)\\.html)?$',
+        'https://8chan.moe/a/',
+        'Extractor for 8chan boards',
+    ),
+    (  # 25
+        '8muses',
+        '_8musesAlbumExtractor',
+        '8muses',
+        'album',
+        '',
+        '(?:https?://)?(?:comics\\.|www\\.)?8muses\\.com(/comics/album/[^?#]+)(\\?[^#]+)?',
+        'https://comics.8muses.com/comics/album/PATH/TITLE',
+        'Extractor for image albums on comics.8muses.com',
+    ),
+    (  # 26
+        'adultempire',
+        'AdultempireGalleryExtractor',
+        'adultempire',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?adult(?:dvd)?empire\\.com(/(\\d+)/gallery\\.html)',
+        'https://www.adultempire.com/12345/gallery.html',
+        'Extractor for image galleries from www.adultempire.com',
+    ),
+    (  # 27
+        'agnph',
+        'AgnphTagExtractor',
+        'agnph',
+        'tag',
+        'booru',
+        '(?:https?://)?agn\\.ph/gallery/post/(?:\\?([^#]+))?$',
+        'https://agn.ph/gallery/post/?search=TAG',
+        None,
+    ),
+    (  # 28
+        'agnph',
+        'AgnphPostExtractor',
+        'agnph',
+        'post',
+        'booru',
+        '(?:https?://)?agn\\.ph/gallery/post/show/(\\d+)',
+        'https://agn.ph/gallery/post/show/12345/',
+        None,
+    ),
+    (  # 29
+        'ahottie',
+        'AhottieGalleryExtractor',
+        'ahottie',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?ahottie\\.top(/albums/(\\w+))',
+        'https://ahottie.top/albums/1234567890',
+        None,
+    ),
+    (  # 30
+        'ahottie',
+        'AhottieTagExtractor',
+        'ahottie',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?ahottie\\.top/tags/([^/?#]+)',
+        'https://ahottie.top/tags/TAG',
+        None,
+    ),
+    (  # 31
+        'ahottie',
+        'AhottieSearchExtractor',
+        'ahottie',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?ahottie\\.top/search/?\\?([^#]+)',
+        'https://ahottie.top/search?kw=QUERY',
+        None,
+    ),
+    (  # 32
+        'ao3',
+        'Ao3WorkExtractor',
+        'ao3',
+        'work',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/works/(\\d+)',
+        'https://archiveofourown.org/works/12345',
+        'Extractor for an AO3 work',
+    ),
+    (  # 33
+        'ao3',
+        'Ao3SeriesExtractor',
+        'ao3',
+        'series',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/series/(\\d+))',
+        'https://archiveofourown.org/series/12345',
+        'Extractor for AO3 works of a series',
+    ),
+    (  # 34
+        'ao3',
+        'Ao3TagExtractor',
+        'ao3',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/tags/([^/?#]+)/works(?:/?\\?.+)?)',
+        'https://archiveofourown.org/tags/TAG/works',
+        'Extractor for AO3 works by tag',
+    ),
+    (  # 35
+        'ao3',
+        'Ao3SearchExtractor',
+        'ao3',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/works/search/?\\?.+)',
+        'https://archiveofourown.org/works/search?work_search[query]=air',
+        'Extractor for AO3 search results',
+    ),
+    (  # 36
+        'ao3',
+        'Ao3UserExtractor',
+        'ao3',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/users/([^/?#]+(?:/pseuds/[^/?#]+)?)(?:/profile)?/?(?:$|\\?|#)',
+        'https://archiveofourown.org/users/USER',
+        'Extractor for an AO3 user profile',
+    ),
+    (  # 37
+        'ao3',
+        'Ao3UserWorksExtractor',
+        'ao3',
+        'user-works',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?works(?:/?\\?.+)?)',
+        'https://archiveofourown.org/users/USER/works',
+        'Extractor for works of an AO3 user',
+    ),
+    (  # 38
+        'ao3',
+        'Ao3UserSeriesExtractor',
+        'ao3',
+        'user-series',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?series(?:/?\\?.+)?)',
+        'https://archiveofourown.org/users/USER/series',
+        'Extractor for series of an AO3 user',
+    ),
+    (  # 39
+        'ao3',
+        'Ao3UserBookmarkExtractor',
+        'ao3',
+        'user-bookmark',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?bookmarks(?:/?\\?.+)?)',
+        'https://archiveofourown.org/users/USER/bookmarks',
+        'Extractor for bookmarked works of an AO3 user',
+    ),
+    (  # 40
+        'ao3',
+        'Ao3SubscriptionsExtractor',
+        'ao3',
+        'subscriptions',
+        '',
+        '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/subscriptions(?:/?\\?.+)?)',
+        'https://archiveofourown.org/users/USER/subscriptions',
+        "Extractor for your AO3 account's subscriptions",
+    ),
+    (  # 41
+        'arcalive',
+        'ArcalivePostExtractor',
+        'arcalive',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?arca\\.live/b/(?:\\w+)/(\\d+)',
+        'https://arca.live/b/breaking/123456789',
+        'Extractor for an arca.live post',
+    ),
+    (  # 42
+        'arcalive',
+        'ArcaliveBoardExtractor',
+        'arcalive',
+        'board',
+        '',
+        '(?:https?://)?(?:www\\.)?arca\\.live/b/([^/?#]+)/?(?:\\?([^#]+))?$',
+        'https://arca.live/b/breaking',
+        "Extractor for an arca.live board's posts",
+    ),
+    (  # 43
+        'arcalive',
+        'ArcaliveUserExtractor',
+        'arcalive',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?arca\\.live/u/@([^/?#]+)/?(?:\\?([^#]+))?$',
+        'https://arca.live/u/@USER',
+        "Extractor for an arca.live users's posts",
+    ),
+    (  # 44
+        'architizer',
+        'ArchitizerProjectExtractor',
+        'architizer',
+        'project',
+        '',
+        '(?:https?://)?architizer\\.com/projects/([^/?#]+)',
+        'https://architizer.com/projects/NAME/',
+        'Extractor for project pages on architizer.com',
+    ),
+    (  # 45
+        'architizer',
+        'ArchitizerFirmExtractor',
+        'architizer',
+        'firm',
+        '',
+        '(?:https?://)?architizer\\.com/firms/([^/?#]+)',
+        'https://architizer.com/firms/NAME/',
+        'Extractor for all projects of a firm',
+    ),
+    (  # 46
+        'arena',
+        'ArenaChannelExtractor',
+        'arena',
+        'channel',
+        '',
+        '(?:https?://)?(?:www\\.)?are\\.na/[^/?#]+/([^/?#]+)',
+        'https://are.na/evan-collins-1522646491/cassette-futurism',
+        'Extractor for are.na channels',
+    ),
+    (  # 47
+        'artstation',
+        'ArtstationUserExtractor',
+        'artstation',
+        'user',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)(?:/albums/all)?|((?!www)[\\w-]+)\\.artstation\\.com(?:/projects)?)/?$',
+        'https://www.artstation.com/USER',
+        'Extractor for all projects of an artstation user',
+    ),
+    (  # 48
+        'artstation',
+        'ArtstationAlbumExtractor',
+        'artstation',
+        'album',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)|((?!www)[\\w-]+)\\.artstation\\.com)/albums/(\\d+)',
+        'https://www.artstation.com/USER/albums/12345',
+        'Extractor for all projects in an artstation album',
+    ),
+    (  # 49
+        'artstation',
+        'ArtstationLikesExtractor',
+        'artstation',
+        'likes',
+        '',
+        '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/likes',
+        'https://www.artstation.com/USER/likes',
+        'Extractor for liked projects of an artstation user',
+    ),
+    (  # 50
+        'artstation',
+        'ArtstationCollectionExtractor',
+        'artstation',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/(\\d+)',
+        'https://www.artstation.com/USER/collections/12345',
+        'Extractor for an artstation collection',
+    ),
+    (  # 51
+        'artstation',
+        'ArtstationCollectionsExtractor',
+        'artstation',
+        'collections',
+        '',
+        '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/?$',
+        'https://www.artstation.com/USER/collections',
+        "Extractor for an artstation user's collections",
+    ),
+    (  # 52
+        'artstation',
+        'ArtstationChallengeExtractor',
+        'artstation',
+        'challenge',
+        '',
+        '(?:https?://)?(?:www\\.)?artstation\\.com/contests/[^/?#]+/challenges/(\\d+)/?(?:\\?sorting=([a-z]+))?',
+        'https://www.artstation.com/contests/NAME/challenges/12345',
+        'Extractor for submissions of artstation challenges',
+    ),
+    (  # 53
+        'artstation',
+        'ArtstationSearchExtractor',
+        'artstation',
+        'search',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?artstation\\.com/search/?\\?([^#]+)',
+        'https://www.artstation.com/search?query=QUERY',
+        'Extractor for artstation search results',
+    ),
+    (  # 54
+        'artstation',
+        'ArtstationArtworkExtractor',
+        'artstation',
+        'artwork',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?artstation\\.com/artwork/?\\?([^#]+)',
+        'https://www.artstation.com/artwork?sorting=SORT',
+        "Extractor for projects on artstation's artwork page",
+    ),
+    (  # 55
+        'artstation',
+        'ArtstationImageExtractor',
+        'artstation',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:[\\w-]+\\.)?artstation\\.com/(?:artwork|projects|search)|artstn\\.co/p)/(\\w+)',
+        'https://www.artstation.com/artwork/abcde',
+        'Extractor for images from a single artstation project',
+    ),
+    (  # 56
+        'artstation',
+        'ArtstationFollowingExtractor',
+        'artstation',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/following',
+        'https://www.artstation.com/USER/following',
+        "Extractor for a user's followed users",
+    ),
+    (  # 57
+        'aryion',
+        'AryionGalleryExtractor',
+        'aryion',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/(?:gallery/|user/|latest.php\\?name=)([^/?#]+)',
+        'https://aryion.com/g4/gallery/USER',
+        "Extractor for a user's gallery on eka's portal",
+    ),
+    (  # 58
+        'aryion',
+        'AryionFavoriteExtractor',
+        'aryion',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/favorites/([^/?#]+)(?:/([^?#]+))?',
+        'https://aryion.com/g4/favorites/USER',
+        "Extractor for a user's favorites gallery",
+    ),
+    (  # 59
+        'aryion',
+        'AryionWatchExtractor',
+        'aryion',
+        'watch',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/messagepage\\.php()',
+        'https://aryion.com/g4/messagepage.php',
+        'Extractor for your watched users and tags',
+    ),
+    (  # 60
+        'aryion',
+        'AryionTagExtractor',
+        'aryion',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/tags\\.php\\?([^#]+)',
+        'https://aryion.com/g4/tags.php?tag=TAG',
+        "Extractor for tag searches on eka's portal",
+    ),
+    (  # 61
+        'aryion',
+        'AryionSearchExtractor',
+        'aryion',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/search\\.php\\?([^#]+)',
+        'https://aryion.com/g4/search.php?q=TEXT&tags=TAGS&user=USER',
+        "Extractor for searches on eka's portal",
+    ),
+    (  # 62
+        'aryion',
+        'AryionPostExtractor',
+        'aryion',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?aryion\\.com/g4/view/(\\d+)',
+        'https://aryion.com/g4/view/12345',
+        "Extractor for individual posts on eka's portal",
+    ),
+    (  # 63
+        'audiochan',
+        'AudiochanAudioExtractor',
+        'audiochan',
+        'audio',
+        '',
+        '(?:https?://)?(?:www\\.)?audiochan\\.com/a/([^/?#]+)',
+        'https://audiochan.com/a/SLUG',
+        None,
+    ),
+    (  # 64
+        'audiochan',
+        'AudiochanUserExtractor',
+        'audiochan',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?audiochan\\.com/u/([^/?#]+)',
+        'https://audiochan.com/u/USER',
+        None,
+    ),
+    (  # 65
+        'audiochan',
+        'AudiochanCollectionExtractor',
+        'audiochan',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?audiochan\\.com/c/([^/?#]+)',
+        'https://audiochan.com/c/SLUG',
+        None,
+    ),
+    (  # 66
+        'audiochan',
+        'AudiochanSearchExtractor',
+        'audiochan',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?audiochan\\.com/search/?\\?([^#]+)',
+        'https://audiochan.com/search?q=QUERY',
+        None,
+    ),
+    (  # 67
+        'batoto',
+        'BatotoChapterExtractor',
+        'batoto',
+        'chapter',
+        '',
+        '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/[^/?#]+|chapter)/(\\d+)',
+        'https://xbato.org/title/12345-MANGA/54321',
+        'Extractor for batoto manga chapters',
+    ),
+    (  # 68
+        'batoto',
+        'BatotoMangaExtractor',
+        'batoto',
+        'manga',
+        '',
+        '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/(\\d+)[^/?#]*|series/(\\d+)(?:/[^/?#]*)?)/?$',
+        'https://xbato.org/title/12345-MANGA/',
+        'Extractor for batoto manga',
+    ),
+    (  # 69
+        'bbc',
+        'BbcGalleryExtractor',
+        'bbc',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+(?!/galleries)(?:/[^/?#]+)?)$',
+        'https://www.bbc.co.uk/programmes/PATH',
+        'Extractor for a programme gallery on bbc.co.uk',
+    ),
+    (  # 70
+        'bbc',
+        'BbcProgrammeExtractor',
+        'bbc',
+        'programme',
+        '',
+        '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+/galleries)(?:/?\\?page=(\\d+))?',
+        'https://www.bbc.co.uk/programmes/ID/galleries',
+        'Extractor for all galleries of a bbc programme',
+    ),
+    (  # 71
+        'behance',
+        'BehanceGalleryExtractor',
+        'behance',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?behance\\.net/gallery/(\\d+)',
+        'https://www.behance.net/gallery/12345/TITLE',
+        'Extractor for image galleries from www.behance.net',
+    ),
+    (  # 72
+        'behance',
+        'BehanceUserExtractor',
+        'behance',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?behance\\.net/([^/?#]+)/?$',
+        'https://www.behance.net/USER',
+        "Extractor for a user's galleries from www.behance.net",
+    ),
+    (  # 73
+        'behance',
+        'BehanceCollectionExtractor',
+        'behance',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?behance\\.net/collection/(\\d+)',
+        'https://www.behance.net/collection/12345/TITLE',
+        "Extractor for a collection's galleries from www.behance.net",
+    ),
+    (  # 74
+        'bellazon',
+        'BellazonPostExtractor',
+        'bellazon',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[^/?#]+(?:/page/\\d+)?)/?#(?:findC|c)omment-(\\d+)',
+        'https://www.bellazon.com/main/topic/123-SLUG/#findComment-12345',
+        None,
+    ),
+    (  # 75
+        'bellazon',
+        'BellazonThreadExtractor',
+        'bellazon',
+        'thread',
+        '',
+        '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[^/?#]+)(?:/page/(\\d+))?',
+        'https://www.bellazon.com/main/topic/123-SLUG/',
+        None,
+    ),
+    (  # 76
+        'bellazon',
+        'BellazonForumExtractor',
+        'bellazon',
+        'forum',
+        '',
+        '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/forum/\\d+-[^/?#]+)(?:/page/(\\d+))?',
+        'https://www.bellazon.com/main/forum/123-SLUG/',
+        None,
+    ),
+    (  # 77
+        'bilibili',
+        'BilibiliArticleExtractor',
+        'bilibili',
+        'article',
+        '',
+        '(?:https?://)?(?:t\\.bilibili\\.com|(?:www\\.)?bilibili.com/opus)/(\\d+)',
+        'https://www.bilibili.com/opus/12345',
+        'Extractor for a bilibili article',
+    ),
+    (  # 78
+        'bilibili',
+        'BilibiliUserArticlesExtractor',
+        'bilibili',
+        'user-articles',
+        '',
+        '(?:https?://)?space\\.bilibili\\.com/(\\d+)/(?:article|upload/opus)',
+        'https://space.bilibili.com/12345/article',
+        "Extractor for a bilibili user's articles",
+    ),
+    (  # 79
+        'bilibili',
+        'BilibiliUserArticlesFavoriteExtractor',
+        'bilibili',
+        'user-articles-favorite',
+        '',
+        '(?:https?://)?space\\.bilibili\\.com/(\\d+)/favlist\\?fid=opus',
+        'https://space.bilibili.com/12345/favlist?fid=opus',
+        None,
+    ),
+    (  # 80
+        'blogger',
+        'BloggerPostExtractor',
+        '',
+        'post',
+        'blogger',
+        '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))(/\\d\\d\\d\\d/\\d\\d/[^/?#]+\\.html)',
+        'https://BLOG.blogspot.com/1970/01/TITLE.html',
+        'Extractor for a single blog post',
+    ),
+    (  # 81
+        'blogger',
+        'BloggerBlogExtractor',
+        '',
+        'blog',
+        'blogger',
+        '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/?$',
+        'https://BLOG.blogspot.com/',
+        'Extractor for an entire Blogger blog',
+    ),
+    (  # 82
+        'blogger',
+        'BloggerSearchExtractor',
+        '',
+        'search',
+        'blogger',
+        '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/?\\?q=([^&#]+)',
+        'https://BLOG.blogspot.com/search?q=QUERY',
+        'Extractor for Blogger search resuls',
+    ),
+    (  # 83
+        'blogger',
+        'BloggerLabelExtractor',
+        '',
+        'label',
+        'blogger',
+        '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/label/([^/?#]+)',
+        'https://BLOG.blogspot.com/search/label/LABEL',
+        'Extractor for Blogger posts by label',
+    ),
+    (  # 84
+        'bluesky',
+        'BlueskyUserExtractor',
+        'bluesky',
+        'user',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)$',
+        'https://bsky.app/profile/HANDLE',
+        None,
+    ),
+    (  # 85
+        'bluesky',
+        'BlueskyPostsExtractor',
+        'bluesky',
+        'posts',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/posts',
+        'https://bsky.app/profile/HANDLE/posts',
+        None,
+    ),
+    (  # 86
+        'bluesky',
+        'BlueskyRepliesExtractor',
+        'bluesky',
+        'replies',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/replies',
+        'https://bsky.app/profile/HANDLE/replies',
+        None,
+    ),
+    (  # 87
+        'bluesky',
+        'BlueskyMediaExtractor',
+        'bluesky',
+        'media',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/media',
+        'https://bsky.app/profile/HANDLE/media',
+        None,
+    ),
+    (  # 88
+        'bluesky',
+        'BlueskyVideoExtractor',
+        'bluesky',
+        'video',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/video',
+        'https://bsky.app/profile/HANDLE/video',
+        None,
+    ),
+    (  # 89
+        'bluesky',
+        'BlueskyLikesExtractor',
+        'bluesky',
+        'likes',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/likes',
+        'https://bsky.app/profile/HANDLE/likes',
+        None,
+    ),
+    (  # 90
+        'bluesky',
+        'BlueskyFeedExtractor',
+        'bluesky',
+        'feed',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/feed/([^/?#]+)',
+        'https://bsky.app/profile/HANDLE/feed/NAME',
+        None,
+    ),
+    (  # 91
+        'bluesky',
+        'BlueskyListExtractor',
+        'bluesky',
+        'list',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/lists/([^/?#]+)',
+        'https://bsky.app/profile/HANDLE/lists/ID',
+        None,
+    ),
+    (  # 92
+        'bluesky',
+        'BlueskyFollowingExtractor',
+        'bluesky',
+        'following',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/follows',
+        'https://bsky.app/profile/HANDLE/follows',
+        None,
+    ),
+    (  # 93
+        'bluesky',
+        'BlueskyPostExtractor',
+        'bluesky',
+        'post',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/post/([^/?#]+)',
+        'https://bsky.app/profile/HANDLE/post/ID',
+        None,
+    ),
+    (  # 94
+        'bluesky',
+        'BlueskyInfoExtractor',
+        'bluesky',
+        'info',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/info',
+        'https://bsky.app/profile/HANDLE/info',
+        None,
+    ),
+    (  # 95
+        'bluesky',
+        'BlueskyAvatarExtractor',
+        'bluesky',
+        'avatar',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/avatar',
+        'https://bsky.app/profile/HANDLE/avatar',
+        None,
+    ),
+    (  # 96
+        'bluesky',
+        'BlueskyBackgroundExtractor',
+        'bluesky',
+        'background',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/ba(?:nner|ckground)',
+        'https://bsky.app/profile/HANDLE/banner',
+        None,
+    ),
+    (  # 97
+        'bluesky',
+        'BlueskySearchExtractor',
+        'bluesky',
+        'search',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/search(?:/|\\?q=)(.+)',
+        'https://bsky.app/search?q=QUERY',
+        None,
+    ),
+    (  # 98
+        'bluesky',
+        'BlueskyHashtagExtractor',
+        'bluesky',
+        'hashtag',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/hashtag/([^/?#]+)(?:/(top|latest))?',
+        'https://bsky.app/hashtag/NAME',
+        None,
+    ),
+    (  # 99
+        'bluesky',
+        'BlueskyBookmarkExtractor',
+        'bluesky',
+        'bookmark',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/saved',
+        'https://bsky.app/saved',
+        None,
+    ),
+    (  # 100
+        'boosty',
+        'BoostyUserExtractor',
+        'boosty',
+        'user',
+        '',
+        '(?:https?://)?boosty\\.to/([^/?#]+)(?:\\?([^#]+))?$',
+        'https://boosty.to/USER',
+        'Extractor for boosty.to user profiles',
+    ),
+    (  # 101
+        'boosty',
+        'BoostyMediaExtractor',
+        'boosty',
+        'media',
+        '',
+        '(?:https?://)?boosty\\.to/([^/?#]+)/media/([^/?#]+)(?:\\?([^#]+))?',
+        'https://boosty.to/USER/media/all',
+        'Extractor for boosty.to user media',
+    ),
+    (  # 102
+        'boosty',
+        'BoostyFeedExtractor',
+        'boosty',
+        'feed',
+        '',
+        '(?:https?://)?boosty\\.to/(?:\\?([^#]+))?(?:$|#)',
+        'https://boosty.to/',
+        'Extractor for your boosty.to subscription feed',
+    ),
+    (  # 103
+        'boosty',
+        'BoostyPostExtractor',
+        'boosty',
+        'post',
+        '',
+        '(?:https?://)?boosty\\.to/([^/?#]+)/posts/([0-9a-f-]+)',
+        'https://boosty.to/USER/posts/01234567-89ab-cdef-0123-456789abcd',
+        'Extractor for boosty.to posts',
+    ),
+    (  # 104
+        'boosty',
+        'BoostyFollowingExtractor',
+        'boosty',
+        'following',
+        '',
+        '(?:https?://)?boosty\\.to/app/settings/subscriptions',
+        'https://boosty.to/app/settings/subscriptions',
+        'Extractor for your boosty.to subscribed users',
+    ),
+    (  # 105
+        'boosty',
+        'BoostyDirectMessagesExtractor',
+        'boosty',
+        'direct-messages',
+        '',
+        '(?:https?://)?boosty\\.to/app/messages/?\\?dialogId=(\\d+)',
+        'https://boosty.to/app/messages?dialogId=12345',
+        'Extractor for boosty.to direct messages',
+    ),
+    (  # 106
+        'booth',
+        'BoothItemExtractor',
+        'booth',
+        'item',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?booth\\.pm/(?:\\w\\w/)?items/(\\d+)',
+        'https://booth.pm/items/12345',
+        None,
+    ),
+    (  # 107
+        'booth',
+        'BoothShopExtractor',
+        'booth',
+        'shop',
+        '',
+        '(?:https?://)?([\\w-]+\\.)booth\\.pm/(?:\\w\\w/)?(?:items)?',
+        'https://SHOP.booth.pm/',
+        None,
+    ),
+    (  # 108
+        'bunkr',
+        'BunkrAlbumExtractor',
+        'bunkr',
+        'album',
+        'lolisafe',
+        None,
+        'https://bunkr.si/a/ID',
+        'Extractor for bunkr.si albums',
+    ),
+    (  # 109
+        'bunkr',
+        'BunkrMediaExtractor',
+        'bunkr',
+        'media',
+        'lolisafe',
+        None,
+        'https://bunkr.si/f/FILENAME',
+        'Extractor for bunkr.si media links',
+    ),
+    (  # 110
+        'catbox',
+        'CatboxAlbumExtractor',
+        'catbox',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?catbox\\.moe(/c/[^/?#]+)',
+        'https://catbox.moe/c/ID',
+        'Extractor for catbox albums',
+    ),
+    (  # 111
+        'catbox',
+        'CatboxFileExtractor',
+        'catbox',
+        'file',
+        '',
+        '(?:https?://)?(?:files|litter|de)\\.catbox\\.moe/([^/?#]+)',
+        'https://files.catbox.moe/NAME.EXT',
+        'Extractor for catbox files',
+    ),
+    (  # 112
+        'cfake',
+        'CfakeCelebrityExtractor',
+        'cfake',
+        'celebrity',
+        '',
+        '(?:https?://)?(?:www\\.)?cfake\\.com/images/(celebrity)/([^/?#]+)/(\\d+)()(?:/p(\\d+))?',
+        'https://cfake.com/images/celebrity/NAME/123',
+        'Extractor for celebrity image galleries from cfake.com',
+    ),
+    (  # 113
+        'cfake',
+        'CfakeCategoryExtractor',
+        'cfake',
+        'category',
+        '',
+        '(?:https?://)?(?:www\\.)?cfake\\.com/images/(categories)/([^/?#]+)/(\\d+)()(?:/p(\\d+))?',
+        'https://cfake.com/images/categories/NAME/123',
+        'Extractor for category image galleries from cfake.com',
+    ),
+    (  # 114
+        'cfake',
+        'CfakeCreatedExtractor',
+        'cfake',
+        'created',
+        '',
+        '(?:https?://)?(?:www\\.)?cfake\\.com/images/(created)/([^/?#]+)/(\\d+)/(\\d+)(?:/p(\\d+))?',
+        'https://cfake.com/images/created/NAME/12345/123',
+        "Extractor for 'created' image galleries from cfake.com",
+    ),
+    (  # 115
+        'cfake',
+        'CfakeCountryExtractor',
+        'cfake',
+        'country',
+        '',
+        '(?:https?://)?(?:www\\.)?cfake\\.com/images/(country)/([^/?#]+)/(\\d+)/(\\d+)(?:/p(\\d+))?',
+        'https://cfake.com/images/country/NAME/12345/123',
+        'Extractor for country image galleries from cfake.com',
+    ),
+    (  # 116
+        'chevereto',
+        'CheveretoImageExtractor',
+        '',
+        'image',
+        'chevereto',
+        '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/im(?:g|age)/[^/?#]+)',
+        'https://jpg7.cr/img/TITLE.ID',
+        'Extractor for chevereto images',
+    ),
+    (  # 117
+        'chevereto',
+        'CheveretoVideoExtractor',
+        '',
+        'video',
+        'chevereto',
+        '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/video/[^/?#]+)',
+        'https://imagepond.net/video/TITLE.ID',
+        'Extractor for chevereto videos',
+    ),
+    (  # 118
+        'chevereto',
+        'CheveretoAlbumExtractor',
+        '',
+        'album',
+        'chevereto',
+        '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/a(?:lbum)?/[^/?#]+(?:/sub)?)',
+        'https://jpg7.cr/album/TITLE.ID',
+        'Extractor for chevereto albums',
+    ),
+    (  # 119
+        'chevereto',
+        'CheveretoCategoryExtractor',
+        '',
+        'category',
+        'chevereto',
+        '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/category/[^/?#]+)',
+        'https://imglike.com/category/TITLE',
+        'Extractor for chevereto galleries',
+    ),
+    (  # 120
+        'chevereto',
+        'CheveretoUserExtractor',
+        '',
+        'user',
+        'chevereto',
+        '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/[^/?#]+(?:/albums)?)',
+        'https://jpg7.cr/USER',
+        'Extractor for chevereto users',
+    ),
+    (  # 121
+        'cien',
+        'CienArticleExtractor',
+        'cien',
+        'article',
+        '',
+        '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)/article/(\\d+)',
+        'https://ci-en.net/creator/123/article/12345',
+        None,
+    ),
+    (  # 122
+        'cien',
+        'CienCreatorExtractor',
+        'cien',
+        'creator',
+        '',
+        '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)(?:/article(?:\\?([^#]+))?)?/?$',
+        'https://ci-en.net/creator/123',
+        None,
+    ),
+    (  # 123
+        'cien',
+        'CienRecentExtractor',
+        'cien',
+        'recent',
+        '',
+        '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/recent(?:\\?([^#]+))?',
+        'https://ci-en.net/mypage/recent',
+        None,
+    ),
+    (  # 124
+        'cien',
+        'CienFollowingExtractor',
+        'cien',
+        'following',
+        '',
+        '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/subscription(/following)?',
+        'https://ci-en.net/mypage/subscription',
+        None,
+    ),
+    (  # 125
+        'civitai',
+        'CivitaiModelExtractor',
+        'civitai',
+        'model',
+        '',
+        '(?:https?://)?civitai\\.com/models/(\\d+)(?:/?\\?modelVersionId=(\\d+))?',
+        'https://civitai.com/models/12345/TITLE',
+        None,
+    ),
+    (  # 126
+        'civitai',
+        'CivitaiImageExtractor',
+        'civitai',
+        'image',
+        '',
+        '(?:https?://)?civitai\\.com/images/(\\d+)',
+        'https://civitai.com/images/12345',
+        None,
+    ),
+    (  # 127
+        'civitai',
+        'CivitaiCollectionExtractor',
+        'civitai',
+        'collection',
+        '',
+        '(?:https?://)?civitai\\.com/collections/(\\d+)',
+        'https://civitai.com/collections/12345',
+        None,
+    ),
+    (  # 128
+        'civitai',
+        'CivitaiPostExtractor',
+        'civitai',
+        'post',
+        '',
+        '(?:https?://)?civitai\\.com/posts/(\\d+)',
+        'https://civitai.com/posts/12345',
+        None,
+    ),
+    (  # 129
+        'civitai',
+        'CivitaiTagExtractor',
+        'civitai',
+        'tag',
+        '',
+        '(?:https?://)?civitai\\.com/tag/([^/?&#]+)',
+        'https://civitai.com/tag/TAG',
+        None,
+    ),
+    (  # 130
+        'civitai',
+        'CivitaiSearchModelsExtractor',
+        'civitai',
+        'search-models',
+        '',
+        '(?:https?://)?civitai\\.com/search/models\\?([^#]+)',
+        'https://civitai.com/search/models?query=QUERY',
+        None,
+    ),
+    (  # 131
+        'civitai',
+        'CivitaiSearchImagesExtractor',
+        'civitai',
+        'search-images',
+        '',
+        '(?:https?://)?civitai\\.com/search/images\\?([^#]+)',
+        'https://civitai.com/search/images?query=QUERY',
+        None,
+    ),
+    (  # 132
+        'civitai',
+        'CivitaiModelsExtractor',
+        'civitai',
+        'models',
+        '',
+        '(?:https?://)?civitai\\.com/models(?:/?\\?([^#]+))?(?:$|#)',
+        'https://civitai.com/models',
+        None,
+    ),
+    (  # 133
+        'civitai',
+        'CivitaiImagesExtractor',
+        'civitai',
+        'images',
+        '',
+        '(?:https?://)?civitai\\.com/images(?:/?\\?([^#]+))?(?:$|#)',
+        'https://civitai.com/images',
+        None,
+    ),
+    (  # 134
+        'civitai',
+        'CivitaiVideosExtractor',
+        'civitai',
+        'videos',
+        '',
+        '(?:https?://)?civitai\\.com/videos(?:/?\\?([^#]+))?(?:$|#)',
+        'https://civitai.com/videos',
+        None,
+    ),
+    (  # 135
+        'civitai',
+        'CivitaiPostsExtractor',
+        'civitai',
+        'posts',
+        '',
+        '(?:https?://)?civitai\\.com/posts(?:/?\\?([^#]+))?(?:$|#)',
+        'https://civitai.com/posts',
+        None,
+    ),
+    (  # 136
+        'civitai',
+        'CivitaiUserExtractor',
+        'civitai',
+        'user',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/?(?:$|\\?|#)',
+        'https://civitai.com/user/USER',
+        None,
+    ),
+    (  # 137
+        'civitai',
+        'CivitaiUserModelsExtractor',
+        'civitai',
+        'user-models',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/models/?(?:\\?([^#]+))?',
+        'https://civitai.com/user/USER/models',
+        None,
+    ),
+    (  # 138
+        'civitai',
+        'CivitaiUserPostsExtractor',
+        'civitai',
+        'user-posts',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/posts/?(?:\\?([^#]+))?',
+        'https://civitai.com/user/USER/posts',
+        None,
+    ),
+    (  # 139
+        'civitai',
+        'CivitaiUserImagesExtractor',
+        'civitai',
+        'user-images',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/images/?(?:\\?([^#]+))?',
+        'https://civitai.com/user/USER/images',
+        None,
+    ),
+    (  # 140
+        'civitai',
+        'CivitaiUserVideosExtractor',
+        'civitai',
+        'user-videos',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/videos/?(?:\\?([^#]+))?',
+        'https://civitai.com/user/USER/videos',
+        None,
+    ),
+    (  # 141
+        'civitai',
+        'CivitaiUserCollectionsExtractor',
+        'civitai',
+        'user-collections',
+        '',
+        '(?:https?://)?civitai\\.com/user/([^/?#]+)/collections/?(?:\\?([^#]+))?',
+        'https://civitai.com/user/USER/collections',
+        None,
+    ),
+    (  # 142
+        'civitai',
+        'CivitaiGeneratedExtractor',
+        'civitai',
+        'generated',
+        '',
+        '(?:https?://)?civitai\\.com/generate',
+        'https://civitai.com/generate',
+        'Extractor for your generated files feed',
+    ),
+    (  # 143
+        'comedywildlifephoto',
+        'ComedywildlifephotoGalleryExtractor',
+        'comedywildlifephoto',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?comedywildlifephoto\\.com(/gallery/[^/?#]+/[^/?#]+\\.php)',
+        'https://www.comedywildlifephoto.com/gallery/SECTION/TITLE.php',
+        'Extractor for comedywildlifephoto galleries',
+    ),
+    (  # 144
+        'comick',
+        'ComickCoversExtractor',
+        'comick',
+        'covers',
+        '',
+        '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/cover',
+        'https://comick.io/comic/MANGA/cover',
+        'Extractor for comick.io manga covers',
+    ),
+    (  # 145
+        'comick',
+        'ComickChapterExtractor',
+        'comick',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/(\\w+(?:-(?:chapter|volume)-[^/?#]+)?)',
+        'https://comick.io/comic/MANGA/ID-chapter-123-en',
+        'Extractor for comick.io manga chapters',
+    ),
+    (  # 146
+        'comick',
+        'ComickMangaExtractor',
+        'comick',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/?(?:\\?([^#]+))?',
+        'https://comick.io/comic/MANGA',
+        'Extractor for comick.io manga',
+    ),
+    (  # 147
+        'comicvine',
+        'ComicvineTagExtractor',
+        'comicvine',
+        'tag',
+        '',
+        '(?:https?://)?comicvine\\.gamespot\\.com(/([^/?#]+)/(\\d+-\\d+)/images/.*)',
+        'https://comicvine.gamespot.com/TAG/123-45/images/',
+        'Extractor for a gallery on comicvine.gamespot.com',
+    ),
+    (  # 148
+        'cyberdrop',
+        'CyberdropAlbumExtractor',
+        'cyberdrop',
+        'album',
+        'lolisafe',
+        '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/a/([^/?#]+)',
+        'https://cyberdrop.cr/a/ID',
+        'Extractor for cyberdrop albums',
+    ),
+    (  # 149
+        'cyberdrop',
+        'CyberdropMediaExtractor',
+        'cyberdrop',
+        'media',
+        'lolisafe',
+        '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/f/([^/?#]+)',
+        'https://cyberdrop.cr/f/ID',
+        'Extractor for cyberdrop media links',
+    ),
+    (  # 150
+        'cyberfile',
+        'CyberfileFolderExtractor',
+        'cyberfile',
+        'folder',
+        '',
+        '(?:https?://)?(?:www\\.)?cyberfile\\.me/folder/([0-9a-f]+)',
+        'https://cyberfile.me/folder/0123456789abcdef/NAME',
+        None,
+    ),
+    (  # 151
+        'cyberfile',
+        'CyberfileSharedExtractor',
+        'cyberfile',
+        'shared',
+        '',
+        '(?:https?://)?(?:www\\.)?cyberfile\\.me/shared/([a-zA-Z0-9]+)',
+        'https://cyberfile.me/shared/AbCdEfGhIjK',
+        None,
+    ),
+    (  # 152
+        'cyberfile',
+        'CyberfileFileExtractor',
+        'cyberfile',
+        'file',
+        '',
+        '(?:https?://)?(?:www\\.)?cyberfile\\.me/([a-zA-Z0-9]+)',
+        'https://cyberfile.me/AbCdE',
+        None,
+    ),
+    (  # 153
+        'danbooru',
+        'DanbooruTagExtractor',
+        '',
+        'tag',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/posts\\?(?:[^&#]*&)*tags=([^&#]*)',
+        'https://danbooru.donmai.us/posts?tags=TAG',
+        'Extractor for danbooru posts from tag searches',
+    ),
+    (  # 154
+        'danbooru',
+        'DanbooruRandomExtractor',
+        '',
+        'random',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/posts/random(?:\\?(?:[^&#]*&)*tags=([^&#]*))?',
+        'https://danbooru.donmai.us/posts/random?tags=TAG',
+        'Extractor for a random danbooru post',
+    ),
+    (  # 155
+        'danbooru',
+        'DanbooruPoolExtractor',
+        '',
+        'pool',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/pool(?:s|/show)/(\\d+)',
+        'https://danbooru.donmai.us/pools/12345',
+        'Extractor for Danbooru pools',
+    ),
+    (  # 156
+        'danbooru',
+        'DanbooruFavgroupExtractor',
+        '',
+        'favgroup',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/favorite_group(?:s|/show)/(\\d+)',
+        'https://danbooru.donmai.us/favorite_groups/12345',
+        'Extractor for Danbooru favorite groups',
+    ),
+    (  # 157
+        'danbooru',
+        'DanbooruPostExtractor',
+        '',
+        'post',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/post(?:s|/show)/(\\d+)',
+        'https://danbooru.donmai.us/posts/12345',
+        'Extractor for single danbooru posts',
+    ),
+    (  # 158
+        'danbooru',
+        'DanbooruMediaassetExtractor',
+        '',
+        'media-asset',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/media_assets/(\\d+)',
+        'https://danbooru.donmai.us/media_assets/12345',
+        'Extractor for a danbooru media asset',
+    ),
+    (  # 159
+        'danbooru',
+        'DanbooruPopularExtractor',
+        '',
+        'popular',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/(?:explore/posts/)?popular(?:\\?([^#]*))?',
+        'https://danbooru.donmai.us/explore/posts/popular',
+        'Extractor for popular images from danbooru',
+    ),
+    (  # 160
+        'danbooru',
+        'DanbooruArtistExtractor',
+        '',
+        'artist',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/(\\d+)',
+        'https://danbooru.donmai.us/artists/12345',
+        'Extractor for danbooru artists',
+    ),
+    (  # 161
+        'danbooru',
+        'DanbooruArtistSearchExtractor',
+        '',
+        'artist-search',
+        'Danbooru',
+        '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/?\\?([^#]+)',
+        'https://danbooru.donmai.us/artists?QUERY',
+        'Extractor for danbooru artist searches',
+    ),
+    (  # 162
+        'dandadan',
+        'DandadanChapterExtractor',
+        'dandadan',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?dandadan\\.net(/manga/dandadan-chapter-([^/?#]+)/?)',
+        'https://dandadan.net/manga/dandadan-chapter-123/',
+        'Extractor for dandadan manga chapters',
+    ),
+    (  # 163
+        'dandadan',
+        'DandadanMangaExtractor',
+        'dandadan',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?dandadan\\.net(/)',
+        'https://dandadan.net/',
+        'Extractor for dandadan manga',
+    ),
+    (  # 164
+        'dankefuerslesen',
+        'DankefuerslesenChapterExtractor',
+        'dankefuerslesen',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?danke\\.moe/read(?:er)?/(?:manga|series)/([\\w-]+)/([\\w-]+)',
+        'https://danke.moe/read/manga/TITLE/123/1/',
+        'Extractor for Danke fürs Lesen manga chapters',
+    ),
+    (  # 165
+        'dankefuerslesen',
+        'DankefuerslesenMangaExtractor',
+        'dankefuerslesen',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?danke\\.moe/read(?:er)?/(?:manga|series)/([\\w-]+)',
+        'https://danke.moe/read/manga/TITLE/',
+        'Extractor for Danke fürs Lesen manga',
+    ),
+    (  # 166
+        'desktopography',
+        'DesktopographySiteExtractor',
+        'desktopography',
+        'site',
+        '',
+        '(?:https?://)?desktopography\\.net/$',
+        'https://desktopography.net/',
+        'Extractor for all desktopography exhibitions ',
+    ),
+    (  # 167
+        'desktopography',
+        'DesktopographyExhibitionExtractor',
+        'desktopography',
+        'exhibition',
+        '',
+        '(?:https?://)?desktopography\\.net/exhibition-([^/?#]+)/',
+        'https://desktopography.net/exhibition-2020/',
+        'Extractor for a yearly desktopography exhibition',
+    ),
+    (  # 168
+        'desktopography',
+        'DesktopographyEntryExtractor',
+        'desktopography',
+        'entry',
+        '',
+        '(?:https?://)?desktopography\\.net/portfolios/([\\w-]+)',
+        'https://desktopography.net/portfolios/NAME/',
+        'Extractor for all resolutions of a desktopography wallpaper',
+    ),
+    (  # 169
+        'deviantart',
+        'DeviantartUserExtractor',
+        'deviantart',
+        'user',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/?$',
+        'https://www.deviantart.com/USER',
+        "Extractor for an artist's user profile",
+    ),
+    (  # 170
+        'deviantart',
+        'DeviantartGalleryExtractor',
+        'deviantart',
+        'gallery',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery(?:/all|/recommended-for-you)?/?(\\?(?!q=).*)?$',
+        'https://www.deviantart.com/USER/gallery/',
+        "Extractor for all deviations from an artist's gallery",
+    ),
+    (  # 171
+        'deviantart',
+        'DeviantartAvatarExtractor',
+        'deviantart',
+        'avatar',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/avatar',
+        'https://www.deviantart.com/USER/avatar/',
+        "Extractor for an artist's avatar",
+    ),
+    (  # 172
+        'deviantart',
+        'DeviantartBackgroundExtractor',
+        'deviantart',
+        'background',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/ba(?:nner|ckground)',
+        'https://www.deviantart.com/USER/banner/',
+        "Extractor for an artist's banner",
+    ),
+    (  # 173
+        'deviantart',
+        'DeviantartFolderExtractor',
+        'deviantart',
+        'folder',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/([^/?#]+)/([^/?#]+)',
+        'https://www.deviantart.com/USER/gallery/12345/TITLE',
+        "Extractor for deviations inside an artist's gallery folder",
+    ),
+    (  # 174
+        'deviantart',
+        'DeviantartStashExtractor',
+        'deviantart',
+        'stash',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?deviantart\\.com/stash|sta\\.s(h))/([a-z0-9]+)',
+        'https://www.deviantart.com/stash/abcde',
+        'Extractor for sta.sh-ed deviations',
+    ),
+    (  # 175
+        'deviantart',
+        'DeviantartFavoriteExtractor',
+        'deviantart',
+        'favorite',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites(?:/all|/?\\?catpath=)?/?$',
+        'https://www.deviantart.com/USER/favourites/',
+        "Extractor for an artist's favorites",
+    ),
+    (  # 176
+        'deviantart',
+        'DeviantartCollectionExtractor',
+        'deviantart',
+        'collection',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites/([^/?#]+)/([^/?#]+)',
+        'https://www.deviantart.com/USER/favourites/12345/TITLE',
+        'Extractor for a single favorite collection',
+    ),
+    (  # 177
+        'deviantart',
+        'DeviantartJournalExtractor',
+        'deviantart',
+        'journal',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:posts(?:/journals)?|journal)/?(?:\\?.*)?$',
+        'https://www.deviantart.com/USER/posts/journals/',
+        "Extractor for an artist's journals",
+    ),
+    (  # 178
+        'deviantart',
+        'DeviantartStatusExtractor',
+        'deviantart',
+        'status',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/posts/statuses',
+        'https://www.deviantart.com/USER/posts/statuses/',
+        "Extractor for an artist's status updates",
+    ),
+    (  # 179
+        'deviantart',
+        'DeviantartTagExtractor',
+        'deviantart',
+        'tag',
+        '',
+        '(?:https?://)?www\\.deviantart\\.com/tag/([^/?#]+)',
+        'https://www.deviantart.com/tag/TAG',
+        'Extractor for deviations from tag searches',
+    ),
+    (  # 180
+        'deviantart',
+        'DeviantartWatchExtractor',
+        'deviantart',
+        'watch',
+        '',
+        '(?:https?://)?(?:www\\.)?deviantart\\.com/(?:watch/deviations|notifications/watch)()()',
+        'https://www.deviantart.com/watch/deviations',
+        'Extractor for Deviations from watched users',
+    ),
+    (  # 181
+        'deviantart',
+        'DeviantartWatchPostsExtractor',
+        'deviantart',
+        'watch-posts',
+        '',
+        '(?:https?://)?(?:www\\.)?deviantart\\.com/watch/posts()()',
+        'https://www.deviantart.com/watch/posts',
+        'Extractor for Posts from watched users',
+    ),
+    (  # 182
+        'deviantart',
+        'DeviantartDeviationExtractor',
+        'deviantart',
+        'deviation',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(art|journal)/(?:[^/?#]+-)?(\\d+)|(?:https?://)?(?:www\\.)?(?:fx)?deviantart\\.com/(?:view/|deviation/|view(?:-full)?\\.php/*\\?(?:[^#]+&)?id=)(\\d+)|(?:https?://)?fav\\.me/d([0-9a-z]+)',
+        'https://www.deviantart.com/UsER/art/TITLE-12345',
+        'Extractor for single deviations',
+    ),
+    (  # 183
+        'deviantart',
+        'DeviantartScrapsExtractor',
+        'deviantart',
+        'scraps',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/(?:\\?catpath=)?scraps\\b',
+        'https://www.deviantart.com/USER/gallery/scraps',
+        "Extractor for an artist's scraps",
+    ),
+    (  # 184
+        'deviantart',
+        'DeviantartSearchExtractor',
+        'deviantart',
+        'search',
+        '',
+        '(?:https?://)?www\\.deviantart\\.com/search(?:/deviations)?/?\\?([^#]+)',
+        'https://www.deviantart.com/search?q=QUERY',
+        'Extractor for deviantart search results',
+    ),
+    (  # 185
+        'deviantart',
+        'DeviantartGallerySearchExtractor',
+        'deviantart',
+        'gallery-search',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/?\\?(q=[^#]+)',
+        'https://www.deviantart.com/USER/gallery?q=QUERY',
+        'Extractor for deviantart gallery searches',
+    ),
+    (  # 186
+        'deviantart',
+        'DeviantartFollowingExtractor',
+        'deviantart',
+        'following',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:about#)?watching',
+        'https://www.deviantart.com/USER/about#watching',
+        "Extractor for user's watched users",
+    ),
+    (  # 187
+        'discord',
+        'DiscordChannelExtractor',
+        'discord',
+        'channel',
+        '',
+        '(?:https?://)?discord\\.com/channels/(\\d+)/(?:\\d+/threads/)?(\\d+)/?$',
+        'https://discord.com/channels/1234567890/9876543210',
+        None,
+    ),
+    (  # 188
+        'discord',
+        'DiscordMessageExtractor',
+        'discord',
+        'message',
+        '',
+        '(?:https?://)?discord\\.com/channels/(\\d+)/(\\d+)/(\\d+)/?$',
+        'https://discord.com/channels/1234567890/9876543210/2468013579',
+        None,
+    ),
+    (  # 189
+        'discord',
+        'DiscordServerAssetsExtractor',
+        'discord',
+        'server-assets',
+        '',
+        '(?:https?://)?discord\\.com/channels/(\\d+)/(?:assets?|files)(?:/([\\w-]+))?/?$',
+        'https://discord.com/channels/1234567890/assets',
+        None,
+    ),
+    (  # 190
+        'discord',
+        'DiscordServerExtractor',
+        'discord',
+        'server',
+        '',
+        '(?:https?://)?discord\\.com/channels/(\\d+)/?$',
+        'https://discord.com/channels/1234567890',
+        None,
+    ),
+    (  # 191
+        'discord',
+        'DiscordDirectMessagesExtractor',
+        'discord',
+        'direct-messages',
+        '',
+        '(?:https?://)?discord\\.com/channels/@me/(\\d+)/?$',
+        'https://discord.com/channels/@me/1234567890',
+        None,
+    ),
+    (  # 192
+        'discord',
+        'DiscordDirectMessageExtractor',
+        'discord',
+        'direct-message',
+        '',
+        '(?:https?://)?discord\\.com/channels/@me/(\\d+)/(\\d+)/?$',
+        'https://discord.com/channels/@me/1234567890/9876543210',
+        None,
+    ),
+    (  # 193
+        'dynastyscans',
+        'DynastyscansChapterExtractor',
+        'dynastyscans',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/chapters/[^/?#]+)',
+        'https://dynasty-scans.com/chapters/NAME',
+        'Extractor for manga-chapters from dynasty-scans.com',
+    ),
+    (  # 194
+        'dynastyscans',
+        'DynastyscansMangaExtractor',
+        'dynastyscans',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/series/[^/?#]+)',
+        'https://dynasty-scans.com/series/NAME',
+        None,
+    ),
+    (  # 195
+        'dynastyscans',
+        'DynastyscansSearchExtractor',
+        'dynastyscans',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/?(?:\\?([^#]+))?$',
+        'https://dynasty-scans.com/images?QUERY',
+        'Extrator for image search results on dynasty-scans.com',
+    ),
+    (  # 196
+        'dynastyscans',
+        'DynastyscansImageExtractor',
+        'dynastyscans',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/(\\d+)',
+        'https://dynasty-scans.com/images/12345',
+        'Extractor for individual images on dynasty-scans.com',
+    ),
+    (  # 197
+        'dynastyscans',
+        'DynastyscansAnthologyExtractor',
+        'dynastyscans',
+        'anthology',
+        '',
+        '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/anthologies/([^/?#]+)',
+        'https://dynasty-scans.com/anthologies/TITLE',
+        'Extractor for dynasty-scans anthologies',
+    ),
+    (  # 198
+        'e621',
+        'E621TagExtractor',
+        '',
+        'tag',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/posts?(?:\\?[^#]*?tags=|/index/\\d+/)([^&#]*)',
+        'https://e621.net/posts?tags=TAG',
+        'Extractor for e621 posts from tag searches',
+    ),
+    (  # 199
+        'e621',
+        'E621PoolExtractor',
+        '',
+        'pool',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/pool(?:s|/show)/(\\d+)',
+        'https://e621.net/pools/12345',
+        'Extractor for e621 pools',
+    ),
+    (  # 200
+        'e621',
+        'E621PostExtractor',
+        '',
+        'post',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/post(?:s|/show)/(\\d+)',
+        'https://e621.net/posts/12345',
+        'Extractor for single e621 posts',
+    ),
+    (  # 201
+        'e621',
+        'E621PopularExtractor',
+        '',
+        'popular',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/explore/posts/popular(?:\\?([^#]*))?',
+        'https://e621.net/explore/posts/popular',
+        'Extractor for popular images from e621',
+    ),
+    (  # 202
+        'e621',
+        'E621ArtistExtractor',
+        '',
+        'artist',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/artists/(\\d+)',
+        'https://e621.net/artists/12345',
+        'Extractor for e621 artists',
+    ),
+    (  # 203
+        'e621',
+        'E621ArtistSearchExtractor',
+        '',
+        'artist-search',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/artists/?\\?([^#]+)',
+        'https://e621.net/artists?QUERY',
+        'Extractor for e621 artist searches',
+    ),
+    (  # 204
+        'e621',
+        'E621FavoriteExtractor',
+        '',
+        'favorite',
+        'E621',
+        '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/favorites(?:\\?([^#]*))?',
+        'https://e621.net/favorites',
+        'Extractor for e621 favorites',
+    ),
+    (  # 205
+        'e621',
+        'E621FrontendExtractor',
+        'e621',
+        'frontend',
+        'E621',
+        '(?:https?://)?e621\\.(?:cc/\\?tags|anthro\\.fr/\\?q)=([^&#]*)',
+        'https://e621.cc/?tags=TAG',
+        'Extractor for alternative e621 frontends',
+    ),
+    (  # 206
+        'eporner',
+        'EpornerGalleryExtractor',
+        'eporner',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?eporner\\.com/gallery/(\\w+)(?:/([\\w-]+))?',
+        'https://www.eporner.com/gallery/GID/SLUG/',
+        'Extractor for image galleries from eporner.com',
+    ),
+    (  # 207
+        'erome',
+        'EromeAlbumExtractor',
+        'erome',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?erome\\.com/a/(\\w+)',
+        'https://www.erome.com/a/ID',
+        'Extractor for albums on erome.com',
+    ),
+    (  # 208
+        'erome',
+        'EromeUserExtractor',
+        'erome',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?erome\\.com/(?!a/|search\\?)([^/?#]+)(?:/?\\?([^#]+))?',
+        'https://www.erome.com/USER',
+        None,
+    ),
+    (  # 209
+        'erome',
+        'EromeSearchExtractor',
+        'erome',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?erome\\.com/search/?\\?(q=[^#]+)',
+        'https://www.erome.com/search?q=QUERY',
+        None,
+    ),
+    (  # 210
+        'everia',
+        'EveriaPostExtractor',
+        'everia',
+        'post',
+        '',
+        '(?:https?://)?everia\\.club(/\\d{4}/\\d{2}/\\d{2}/[^/?#]+)',
+        'https://everia.club/0000/00/00/TITLE',
+        None,
+    ),
+    (  # 211
+        'everia',
+        'EveriaTagExtractor',
+        'everia',
+        'tag',
+        '',
+        '(?:https?://)?everia\\.club(/tag/[^/?#]+)',
+        'https://everia.club/tag/TAG',
+        None,
+    ),
+    (  # 212
+        'everia',
+        'EveriaCategoryExtractor',
+        'everia',
+        'category',
+        '',
+        '(?:https?://)?everia\\.club(/category/[^/?#]+)',
+        'https://everia.club/category/CATEGORY',
+        None,
+    ),
+    (  # 213
+        'everia',
+        'EveriaDateExtractor',
+        'everia',
+        'date',
+        '',
+        '(?:https?://)?everia\\.club(/\\d{4}(?:/\\d{2})?(?:/\\d{2})?)(?:/page/\\d+)?/?$',
+        'https://everia.club/0000/00/00',
+        None,
+    ),
+    (  # 214
+        'everia',
+        'EveriaSearchExtractor',
+        'everia',
+        'search',
+        '',
+        '(?:https?://)?everia\\.club/(?:page/\\d+/)?\\?s=([^&#]+)',
+        'https://everia.club/?s=SEARCH',
+        None,
+    ),
+    (  # 215
+        'exhentai',
+        'ExhentaiGalleryExtractor',
+        'exhentai',
+        'gallery',
+        '',
+        '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org(?:/g/(\\d+)/([\\da-f]{10})|/s/([\\da-f]{10})/(\\d+)-(\\d+))',
+        'https://e-hentai.org/g/12345/67890abcde/',
+        'Extractor for image galleries from exhentai.org',
+    ),
+    (  # 216
+        'exhentai',
+        'ExhentaiSearchExtractor',
+        'exhentai',
+        'search',
+        '',
+        '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/(?:\\?([^#]*)|tag/([^/?#]+))',
+        'https://e-hentai.org/?f_search=QUERY',
+        'Extractor for exhentai search results',
+    ),
+    (  # 217
+        'exhentai',
+        'ExhentaiFavoriteExtractor',
+        'exhentai',
+        'favorite',
+        '',
+        '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/favorites\\.php(?:\\?([^#]*)())?',
+        'https://e-hentai.org/favorites.php',
+        'Extractor for favorited exhentai galleries',
+    ),
+    (  # 218
+        'facebook',
+        'FacebookPhotoExtractor',
+        'facebook',
+        'photo',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/photos/[^/?#]+/|photo(?:.php)?/?\\?(?:[^&#]+&)*fbid=)([^/?&#]+)[^/?#]*(?<!&setextract)$',
+        'https://www.facebook.com/photo/?fbid=PHOTO_ID',
+        'Base class for Facebook Photo extractors',
+    ),
+    (  # 219
+        'facebook',
+        'FacebookSetExtractor',
+        'facebook',
+        'set',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:(?:media/set|photo)/?\\?(?:[^&#]+&)*set=([^&#]+)[^/?#]*(?<!&setextract)$|([^/?#]+/posts/[^/?#]+)|photo/\\?(?:[^&#]+&)*fbid=([^/?&#]+)&set=([^/?&#]+)&setextract)',
+        'https://www.facebook.com/media/set/?set=SET_ID',
+        'Base class for Facebook Set extractors',
+    ),
+    (  # 220
+        'facebook',
+        'FacebookVideoExtractor',
+        'facebook',
+        'video',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/videos/|watch/?\\?v=)([^/?&#]+)',
+        'https://www.facebook.com/watch/?v=VIDEO_ID',
+        'Base class for Facebook Video extractors',
+    ),
+    (  # 221
+        'facebook',
+        'FacebookInfoExtractor',
+        'facebook',
+        'info',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/info',
+        'https://www.facebook.com/USERNAME/info',
+        'Extractor for Facebook Profile data',
+    ),
+    (  # 222
+        'facebook',
+        'FacebookAlbumsExtractor',
+        'facebook',
+        'albums',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos_albums(?:/([^/?#]+))?',
+        'https://www.facebook.com/USERNAME/photos_albums',
+        'Extractor for Facebook Profile albums',
+    ),
+    (  # 223
+        'facebook',
+        'FacebookPhotosExtractor',
+        'facebook',
+        'photos',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos(?:_by)?',
+        'https://www.facebook.com/USERNAME/photos',
+        'Extractor for Facebook Profile Photos',
+    ),
+    (  # 224
+        'facebook',
+        'FacebookAvatarExtractor',
+        'facebook',
+        'avatar',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/avatar',
+        'https://www.facebook.com/USERNAME/avatar',
+        'Extractor for Facebook Profile Avatars',
+    ),
+    (  # 225
+        'facebook',
+        'FacebookUserExtractor',
+        'facebook',
+        'user',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/?(?:$|\\?|#)',
+        'https://www.facebook.com/USERNAME',
+        'Extractor for Facebook Profiles',
+    ),
+    (  # 226
+        'fanbox',
+        'FanboxCreatorExtractor',
+        'fanbox',
+        'creator',
+        '',
+        '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))(?:/posts)?/?$',
+        'https://USER.fanbox.cc/',
+        "Extractor for a Fanbox creator's works",
+    ),
+    (  # 227
+        'fanbox',
+        'FanboxPostExtractor',
+        'fanbox',
+        'post',
+        '',
+        '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))/posts/(\\d+)',
+        'https://USER.fanbox.cc/posts/12345',
+        'Extractor for media from a single Fanbox post',
+    ),
+    (  # 228
+        'fanbox',
+        'FanboxHomeExtractor',
+        'fanbox',
+        'home',
+        '',
+        '(?:https?://)?(?:www\\.)?fanbox\\.cc/?$',
+        'https://fanbox.cc/',
+        'Extractor for your Fanbox home feed',
+    ),
+    (  # 229
+        'fanbox',
+        'FanboxSupportingExtractor',
+        'fanbox',
+        'supporting',
+        '',
+        '(?:https?://)?(?:www\\.)?fanbox\\.cc/home/supporting',
+        'https://fanbox.cc/home/supporting',
+        'Extractor for your supported Fanbox users feed',
+    ),
+    (  # 230
+        'fanbox',
+        'FanboxRedirectExtractor',
+        'fanbox',
+        'redirect',
+        '',
+        '(?:https?://)?(?:www\\.)?pixiv\\.net/fanbox/creator/(\\d+)',
+        'https://www.pixiv.net/fanbox/creator/12345',
+        'Extractor for pixiv redirects to fanbox.cc',
+    ),
+    (  # 231
+        'fansly',
+        'FanslyPostExtractor',
+        'fansly',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/post/(\\d+)',
+        'https://fansly.com/post/1234567890',
+        None,
+    ),
+    (  # 232
+        'fansly',
+        'FanslyHomeExtractor',
+        'fansly',
+        'home',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/home(?:/(?:subscribed()|list/(\\d+)))?',
+        'https://fansly.com/home',
+        None,
+    ),
+    (  # 233
+        'fansly',
+        'FanslyListExtractor',
+        'fansly',
+        'list',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/lists/(\\d+)',
+        'https://fansly.com/lists/1234567890',
+        None,
+    ),
+    (  # 234
+        'fansly',
+        'FanslyListsExtractor',
+        'fansly',
+        'lists',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/lists',
+        'https://fansly.com/lists',
+        None,
+    ),
+    (  # 235
+        'fansly',
+        'FanslyCreatorPostsExtractor',
+        'fansly',
+        'creator-posts',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/posts(?:/wall/(\\d+))?',
+        'https://fansly.com/CREATOR/posts',
+        None,
+    ),
+    (  # 236
+        'fansly',
+        'FanslyCreatorMediaExtractor',
+        'fansly',
+        'creator-media',
+        '',
+        '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/media(?:/wall/(\\d+))?',
+        'https://fansly.com/CREATOR/media',
+        None,
+    ),
+    (  # 237
+        'fantia',
+        'FantiaCreatorExtractor',
+        'fantia',
+        'creator',
+        '',
+        '(?:https?://)?(?:www\\.)?fantia\\.jp/fanclubs/(\\d+)',
+        'https://fantia.jp/fanclubs/12345',
+        "Extractor for a Fantia creator's works",
+    ),
+    (  # 238
+        'fantia',
+        'FantiaPostExtractor',
+        'fantia',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?fantia\\.jp/posts/(\\d+)',
+        'https://fantia.jp/posts/12345',
+        'Extractor for media from a single Fantia post',
+    ),
+    (  # 239
+        'fapello',
+        'FapelloPostExtractor',
+        'fapello',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/|popular_videos/)([^/?#]+)/(\\d+)',
+        'https://fapello.com/MODEL/12345/',
+        'Extractor for individual posts on fapello.com',
+    ),
+    (  # 240
+        'fapello',
+        'FapelloModelExtractor',
+        'fapello',
+        'model',
+        '',
+        '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!top-(?:likes|followers)|popular_videos|videos|trending|search/?$)([^/?#]+)/?$',
+        'https://fapello.com/model/',
+        'Extractor for all posts from a fapello model',
+    ),
+    (  # 241
+        'fapello',
+        'FapelloPathExtractor',
+        'fapello',
+        'path',
+        '',
+        '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/?$)(top-(?:likes|followers)|videos|trending|popular_videos/[^/?#]+)/?$',
+        'https://fapello.com/trending/',
+        'Extractor for models and posts from fapello.com paths',
+    ),
+    (  # 242
+        'fapachi',
+        'FapachiPostExtractor',
+        'fapachi',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search/)([^/?#]+)/media/(\\d+)',
+        'https://fapachi.com/MODEL/media/12345',
+        'Extractor for individual posts on fapachi.com',
+    ),
+    (  # 243
+        'fapachi',
+        'FapachiUserExtractor',
+        'fapachi',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search(?:/|$))([^/?#]+)(?:/page/(\\d+))?$',
+        'https://fapachi.com/MODEL',
+        'Extractor for all posts from a fapachi user',
+    ),
+    (  # 244
+        'fikfap',
+        'FikfapPostExtractor',
+        'fikfap',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?fikfap\\.com/user/(\\w+)/post/(\\d+)',
+        'https://fikfap.com/user/USER/post/12345',
+        None,
+    ),
+    (  # 245
+        'fikfap',
+        'FikfapUserExtractor',
+        'fikfap',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?fikfap\\.com/user/(\\w+)',
+        'https://fikfap.com/user/USER',
+        None,
+    ),
+    (  # 246
+        'fitnakedgirls',
+        'FitnakedgirlsGalleryExtractor',
+        'fitnakedgirls',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/([\\w-]+)/?$',
+        'https://fitnakedgirls.com/photos/gallery/MODEL-nude/',
+        'Extractor for fitnakedgirls galleries',
+    ),
+    (  # 247
+        'fitnakedgirls',
+        'FitnakedgirlsCategoryExtractor',
+        'fitnakedgirls',
+        'category',
+        '',
+        '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/category/([\\w-]+)',
+        'https://fitnakedgirls.com/photos/gallery/category/CATEGORY/',
+        'Extractor for fitnakedgirls category pages',
+    ),
+    (  # 248
+        'fitnakedgirls',
+        'FitnakedgirlsTagExtractor',
+        'fitnakedgirls',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/tag/([\\w-]+)',
+        'https://fitnakedgirls.com/photos/gallery/tag/TAG/',
+        'Extractor for fitnakedgirls tag pages',
+    ),
+    (  # 249
+        'fitnakedgirls',
+        'FitnakedgirlsVideoExtractor',
+        'fitnakedgirls',
+        'video',
+        '',
+        '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/videos/(\\d+)/(\\d+)/([\\w-]+)',
+        'https://fitnakedgirls.com/videos/2025/08/VIDEO-TITLE/',
+        'Extractor for fitnakedgirls video posts',
+    ),
+    (  # 250
+        'fitnakedgirls',
+        'FitnakedgirlsBlogExtractor',
+        'fitnakedgirls',
+        'blog',
+        '',
+        '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/fitblog/([\\w-]+)',
+        'https://fitnakedgirls.com/fitblog/MODEL-NAME/',
+        'Extractor for fitnakedgirls blog posts',
+    ),
+    (  # 251
+        'flickr',
+        'FlickrImageExtractor',
+        'flickr',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/[^/?#]+/|[\\w-]+\\.static\\.?flickr\\.com/(?:\\d+/)+)(\\d+)|flic\\.kr/p/([A-Za-z1-9]+))',
+        'https://www.flickr.com/photos/USER/12345',
+        'Extractor for individual images from flickr.com',
+    ),
+    (  # 252
+        'flickr',
+        'FlickrAlbumExtractor',
+        'flickr',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/(?:album|set)s(?:/(\\d+))?',
+        'https://www.flickr.com/photos/USER/albums/12345',
+        'Extractor for photo albums from flickr.com',
+    ),
+    (  # 253
+        'flickr',
+        'FlickrGalleryExtractor',
+        'flickr',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/galleries/(\\d+)',
+        'https://www.flickr.com/photos/USER/galleries/12345/',
+        'Extractor for photo galleries from flickr.com',
+    ),
+    (  # 254
+        'flickr',
+        'FlickrGroupExtractor',
+        'flickr',
+        'group',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/groups/([^/?#]+)',
+        'https://www.flickr.com/groups/NAME/',
+        'Extractor for group pools from flickr.com',
+    ),
+    (  # 255
+        'flickr',
+        'FlickrUserExtractor',
+        'flickr',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/?$',
+        'https://www.flickr.com/photos/USER/',
+        'Extractor for the photostream of a flickr user',
+    ),
+    (  # 256
+        'flickr',
+        'FlickrFavoriteExtractor',
+        'flickr',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/favorites',
+        'https://www.flickr.com/photos/USER/favorites',
+        'Extractor for favorite photos of a flickr user',
+    ),
+    (  # 257
+        'flickr',
+        'FlickrSearchExtractor',
+        'flickr',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/search/?\\?([^#]+)',
+        'https://flickr.com/search/?text=QUERY',
+        'Extractor for flickr photos based on search results',
+    ),
+    (  # 258
+        'furaffinity',
+        'FuraffinityGalleryExtractor',
+        'furaffinity',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)(?:$|/(?!folder/))',
+        'https://www.furaffinity.net/gallery/USER/',
+        "Extractor for a furaffinity user's gallery",
+    ),
+    (  # 259
+        'furaffinity',
+        'FuraffinityFolderExtractor',
+        'furaffinity',
+        'folder',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)/folder/(\\d+)(?:/([^/?#]+))?',
+        'https://www.furaffinity.net/gallery/USER/folder/12345/FOLDER',
+        'Extractor for a FurAffinity folder',
+    ),
+    (  # 260
+        'furaffinity',
+        'FuraffinityScrapsExtractor',
+        'furaffinity',
+        'scraps',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/scraps/([^/?#]+)',
+        'https://www.furaffinity.net/scraps/USER/',
+        "Extractor for a furaffinity user's scraps",
+    ),
+    (  # 261
+        'furaffinity',
+        'FuraffinityFavoriteExtractor',
+        'furaffinity',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/favorites/([^/?#]+)',
+        'https://www.furaffinity.net/favorites/USER/',
+        "Extractor for a furaffinity user's favorites",
+    ),
+    (  # 262
+        'furaffinity',
+        'FuraffinitySearchExtractor',
+        'furaffinity',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/search(?:/([^/?#]+))?/?[?&]([^#]+)',
+        'https://www.furaffinity.net/search/?q=QUERY',
+        'Extractor for furaffinity search results',
+    ),
+    (  # 263
+        'furaffinity',
+        'FuraffinityPostExtractor',
+        'furaffinity',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/(?:view|full)/(\\d+)',
+        'https://www.furaffinity.net/view/12345/',
+        'Extractor for individual posts on furaffinity',
+    ),
+    (  # 264
+        'furaffinity',
+        'FuraffinityUserExtractor',
+        'furaffinity',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/user/([^/?#]+)',
+        'https://www.furaffinity.net/user/USER/',
+        'Extractor for furaffinity user profiles',
+    ),
+    (  # 265
+        'furaffinity',
+        'FuraffinityFollowingExtractor',
+        'furaffinity',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/watchlist/by/([^/?#]+)',
+        'https://www.furaffinity.net/watchlist/by/USER/',
+        "Extractor for a furaffinity user's watched users",
+    ),
+    (  # 266
+        'furaffinity',
+        'FuraffinitySubmissionsExtractor',
+        'furaffinity',
+        'submissions',
+        '',
+        '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net(/msg/submissions(?:/[^/?#]+)?)',
+        'https://www.furaffinity.net/msg/submissions',
+        'Extractor for new furaffinity submissions',
+    ),
+    (  # 267
+        'furry34',
+        'Furry34PostExtractor',
+        'furry34',
+        'post',
+        'booru',
+        '(?:https?://)?(?:www\\.)?furry34\\.com/post/(\\d+)',
+        'https://furry34.com/post/12345',
+        None,
+    ),
+    (  # 268
+        'furry34',
+        'Furry34PlaylistExtractor',
+        'furry34',
+        'playlist',
+        'booru',
+        '(?:https?://)?(?:www\\.)?furry34\\.com/playlists/view/(\\d+)',
+        'https://furry34.com/playlists/view/12345',
+        None,
+    ),
+    (  # 269
+        'furry34',
+        'Furry34TagExtractor',
+        'furry34',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?furry34\\.com/(?:([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)',
+        'https://furry34.com/TAG',
+        None,
+    ),
+    (  # 270
+        'fuskator',
+        'FuskatorGalleryExtractor',
+        'fuskator',
+        'gallery',
+        '',
+        '(?:https?://)?fuskator\\.com/(?:thumbs|expanded)/([^/?#]+)',
+        'https://fuskator.com/thumbs/ID/',
+        'Extractor for image galleries on fuskator.com',
+    ),
+    (  # 271
+        'fuskator',
+        'FuskatorSearchExtractor',
+        'fuskator',
+        'search',
+        '',
+        '(?:https?://)?fuskator\\.com(/(?:search|page)/.+)',
+        'https://fuskator.com/search/TAG/',
+        'Extractor for search results on fuskator.com',
+    ),
+    (  # 272
+        'gelbooru',
+        'GelbooruTagExtractor',
+        'gelbooru',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=post&s=list&tags=([^&#]*)',
+        'https://gelbooru.com/index.php?page=post&s=list&tags=TAG',
+        'Extractor for images from gelbooru.com based on search-tags',
+    ),
+    (  # 273
+        'gelbooru',
+        'GelbooruPoolExtractor',
+        'gelbooru',
+        'pool',
+        'booru',
+        '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=pool&s=show&id=(\\d+)',
+        'https://gelbooru.com/index.php?page=pool&s=show&id=12345',
+        'Extractor for gelbooru pools',
+    ),
+    (  # 274
+        'gelbooru',
+        'GelbooruFavoriteExtractor',
+        'gelbooru',
+        'favorite',
+        'booru',
+        '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=favorites&s=view&id=(\\d+)',
+        'https://gelbooru.com/index.php?page=favorites&s=view&id=12345',
+        'Extractor for gelbooru favorites',
+    ),
+    (  # 275
+        'gelbooru',
+        'GelbooruPostExtractor',
+        'gelbooru',
+        'post',
+        'booru',
+        '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?(?=(?:[^#]+&)?page=post(?:&|#|$))(?=(?:[^#]+&)?s=view(?:&|#|$))(?:[^#]+&)?id=(\\d+)',
+        'https://gelbooru.com/index.php?page=post&s=view&id=12345',
+        'Extractor for single images from gelbooru.com',
+    ),
+    (  # 276
+        'gelbooru',
+        'GelbooruRedirectExtractor',
+        'gelbooru',
+        'redirect',
+        'booru',
+        '(?:https?://)?(?:www\\.)?gelbooru\\.com/redirect\\.php\\?s=([^&#]+)',
+        'https://gelbooru.com/redirect.php?s=BASE64',
+        None,
+    ),
+    (  # 277
+        'gelbooru_v01',
+        'GelbooruV01TagExtractor',
+        '',
+        'tag',
+        'gelbooru_v01',
+        '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=list&tags=([^&#]+)',
+        'https://allgirl.booru.org/index.php?page=post&s=list&tags=TAG',
+        None,
+    ),
+    (  # 278
+        'gelbooru_v01',
+        'GelbooruV01FavoriteExtractor',
+        '',
+        'favorite',
+        'gelbooru_v01',
+        '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=favorites&s=view&id=(\\d+)',
+        'https://allgirl.booru.org/index.php?page=favorites&s=view&id=1',
+        None,
+    ),
+    (  # 279
+        'gelbooru_v01',
+        'GelbooruV01PostExtractor',
+        '',
+        'post',
+        'gelbooru_v01',
+        '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=view&id=(\\d+)',
+        'https://allgirl.booru.org/index.php?page=post&s=view&id=12345',
+        None,
+    ),
+    (  # 280
+        'gelbooru_v02',
+        'GelbooruV02TagExtractor',
+        '',
+        'tag',
+        'gelbooru_v02',
+        '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=list&tags=([^&#]*)',
+        'https://safebooru.org/index.php?page=post&s=list&tags=TAG',
+        None,
+    ),
+    (  # 281
+        'gelbooru_v02',
+        'GelbooruV02PoolExtractor',
+        '',
+        'pool',
+        'gelbooru_v02',
+        '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=pool&s=show&id=(\\d+)',
+        'https://safebooru.org/index.php?page=pool&s=show&id=12345',
+        None,
+    ),
+    (  # 282
+        'gelbooru_v02',
+        'GelbooruV02FavoriteExtractor',
+        '',
+        'favorite',
+        'gelbooru_v02',
+        '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=favorites&s=view&id=(\\d+)',
+        'https://safebooru.org/index.php?page=favorites&s=view&id=12345',
+        None,
+    ),
+    (  # 283
+        'gelbooru_v02',
+        'GelbooruV02PostExtractor',
+        '',
+        'post',
+        'gelbooru_v02',
+        '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=view&id=(\\d+)',
+        'https://safebooru.org/index.php?page=post&s=view&id=12345',
+        None,
+    ),
+    (  # 284
+        'girlsreleased',
+        'GirlsreleasedSetExtractor',
+        'girlsreleased',
+        'set',
+        '',
+        '(?:https?://)?(?:www\\.)?girlsreleased\\.com/set/(\\d+)',
+        'https://girlsreleased.com/set/12345',
+        'Extractor for girlsreleased galleries',
+    ),
+    (  # 285
+        'girlsreleased',
+        'GirlsreleasedModelExtractor',
+        'girlsreleased',
+        'model',
+        '',
+        '(?:https?://)?(?:www\\.)?girlsreleased\\.com/model/(\\d+(?:/.+)?)',
+        'https://girlsreleased.com/model/12345/MODEL',
+        'Extractor for girlsreleased models',
+    ),
+    (  # 286
+        'girlsreleased',
+        'GirlsreleasedSiteExtractor',
+        'girlsreleased',
+        'site',
+        '',
+        '(?:https?://)?(?:www\\.)?girlsreleased\\.com/site/([^/?#]+(?:/model/\\d+/?.*)?)',
+        'https://girlsreleased.com/site/SITE',
+        'Extractor for girlsreleased sites',
+    ),
+    (  # 287
+        'girlswithmuscle',
+        'GirlswithmusclePostExtractor',
+        'girlswithmuscle',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/(\\d+)',
+        'https://www.girlswithmuscle.com/12345/',
+        'Extractor for individual posts on girlswithmuscle.com',
+    ),
+    (  # 288
+        'girlswithmuscle',
+        'GirlswithmuscleSearchExtractor',
+        'girlswithmuscle',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/images/(.*)',
+        'https://www.girlswithmuscle.com/images/?name=MODEL',
+        'Extractor for search results on girlswithmuscle.com',
+    ),
+    (  # 289
+        'gofile',
+        'GofileFolderExtractor',
+        'gofile',
+        'folder',
+        '',
+        '(?:https?://)?(?:www\\.)?gofile\\.io/d/([^/?#]+)',
+        'https://gofile.io/d/ID',
+        None,
+    ),
+    (  # 290
+        'hatenablog',
+        'HatenablogEntryExtractor',
+        'hatenablog',
+        'entry',
+        '',
+        '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))/entry/([^?#]+)(?:\\?([^#]*))?(?:#.*)?$',
+        'https://BLOG.hatenablog.com/entry/PATH',
+        'Extractor for a single entry URL',
+    ),
+    (  # 291
+        'hatenablog',
+        'HatenablogHomeExtractor',
+        'hatenablog',
+        'home',
+        '',
+        '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/?)(?:\\?([^#]*))?(?:#.*)?$',
+        'https://BLOG.hatenablog.com',
+        "Extractor for a blog's home page",
+    ),
+    (  # 292
+        'hatenablog',
+        'HatenablogArchiveExtractor',
+        'hatenablog',
+        'archive',
+        '',
+        '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/archive(?:/\\d+(?:/\\d+(?:/\\d+)?)?|/category/[^?#]+)?)(?:\\?([^#]*))?(?:#.*)?$',
+        'https://BLOG.hatenablog.com/archive/2024',
+        "Extractor for a blog's archive page",
+    ),
+    (  # 293
+        'hatenablog',
+        'HatenablogSearchExtractor',
+        'hatenablog',
+        'search',
+        '',
+        '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/search)(?:\\?([^#]*))?(?:#.*)?$',
+        'https://BLOG.hatenablog.com/search?q=QUERY',
+        "Extractor for a blog's search results",
+    ),
+    (  # 294
+        'hdoujin',
+        'HdoujinGalleryExtractor',
+        'hdoujin',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:g|reader)/(\\d+)/(\\w+)',
+        'https://hdoujin.org/g/12345/67890abcdef/',
+        None,
+    ),
+    (  # 295
+        'hdoujin',
+        'HdoujinSearchExtractor',
+        'hdoujin',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$',
+        'https://hdoujin.org/browse?s=QUERY',
+        None,
+    ),
+    (  # 296
+        'hdoujin',
+        'HdoujinFavoriteExtractor',
+        'hdoujin',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/favorites(?:\\?([^#]*))?',
+        'https://hdoujin.org/favorites',
+        None,
+    ),
+    (  # 297
+        'hentai2read',
+        'Hentai2readChapterExtractor',
+        'hentai2read',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+/([^/?#]+))',
+        'https://hentai2read.com/TITLE/1/',
+        'Extractor for a single manga chapter from hentai2read.com',
+    ),
+    (  # 298
+        'hentai2read',
+        'Hentai2readMangaExtractor',
+        'hentai2read',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+)/?$',
+        'https://hentai2read.com/TITLE/',
+        'Extractor for hmanga from hentai2read.com',
+    ),
+    (  # 299
+        'hentaicosplays',
+        'HentaicosplaysGalleryExtractor',
+        '',
+        'gallery',
+        'hentaicosplays',
+        '(?:hentaicosplays:(https?://[^/?#]+)|(?:https?://)?(?:(?:\\w\\w\\.)?hentai-cosplays?(?:-xxx)?\\.com()|(?:\\w\\w\\.)?hentai-img(?:-xxx)?\\.com()|(?:\\w\\w\\.)?porn-images?(?:-xxx)?\\.com()))/(?:image|story)/([\\w-]+)',
+        'https://hentai-cosplay-xxx.com/image/TITLE/',
+        'Extractor for image galleries from\n    hentai-cosplay-xxx.com, hentai-img-xxx.com, and porn-image.com',
+    ),
+    (  # 300
+        'hentaifoundry',
+        'HentaifoundryUserExtractor',
+        'hentaifoundry',
+        'user',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/profile',
+        'https://www.hentai-foundry.com/user/USER/profile',
+        'Extractor for a hentaifoundry user profile',
+    ),
+    (  # 301
+        'hentaifoundry',
+        'HentaifoundryPicturesExtractor',
+        'hentaifoundry',
+        'pictures',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)(?:/page/(\\d+))?/?$',
+        'https://www.hentai-foundry.com/pictures/user/USER',
+        'Extractor for all pictures of a hentaifoundry user',
+    ),
+    (  # 302
+        'hentaifoundry',
+        'HentaifoundryScrapsExtractor',
+        'hentaifoundry',
+        'scraps',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)/scraps',
+        'https://www.hentai-foundry.com/pictures/user/USER/scraps',
+        'Extractor for scraps of a hentaifoundry user',
+    ),
+    (  # 303
+        'hentaifoundry',
+        'HentaifoundryFavoriteExtractor',
+        'hentaifoundry',
+        'favorite',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/faves/pictures',
+        'https://www.hentai-foundry.com/user/USER/faves/pictures',
+        'Extractor for favorite images of a hentaifoundry user',
+    ),
+    (  # 304
+        'hentaifoundry',
+        'HentaifoundryTagExtractor',
+        'hentaifoundry',
+        'tag',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/tagged/([^/?#]+)',
+        'https://www.hentai-foundry.com/pictures/tagged/TAG',
+        'Extractor for tag searches on hentaifoundry.com',
+    ),
+    (  # 305
+        'hentaifoundry',
+        'HentaifoundryRecentExtractor',
+        'hentaifoundry',
+        'recent',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/recent/(\\d\\d\\d\\d-\\d\\d-\\d\\d)',
+        'https://www.hentai-foundry.com/pictures/recent/1970-01-01',
+        "Extractor for 'Recent Pictures' on hentaifoundry.com",
+    ),
+    (  # 306
+        'hentaifoundry',
+        'HentaifoundryPopularExtractor',
+        'hentaifoundry',
+        'popular',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/popular()',
+        'https://www.hentai-foundry.com/pictures/popular',
+        'Extractor for popular images on hentaifoundry.com',
+    ),
+    (  # 307
+        'hentaifoundry',
+        'HentaifoundryImageExtractor',
+        'hentaifoundry',
+        'image',
+        '',
+        '(https?://)?(?:www\\.|pictures\\.)?hentai-foundry\\.com/(?:pictures/user|[^/?#])/([^/?#]+)/(\\d+)',
+        'https://www.hentai-foundry.com/pictures/user/USER/12345/TITLE',
+        'Extractor for a single image from hentaifoundry.com',
+    ),
+    (  # 308
+        'hentaifoundry',
+        'HentaifoundryStoriesExtractor',
+        'hentaifoundry',
+        'stories',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)(?:/page/(\\d+))?/?$',
+        'https://www.hentai-foundry.com/stories/user/USER',
+        'Extractor for stories of a hentaifoundry user',
+    ),
+    (  # 309
+        'hentaifoundry',
+        'HentaifoundryStoryExtractor',
+        'hentaifoundry',
+        'story',
+        '',
+        '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)/(\\d+)',
+        'https://www.hentai-foundry.com/stories/user/USER/12345/TITLE',
+        'Extractor for a hentaifoundry story',
+    ),
+    (  # 310
+        'hentaihand',
+        'HentaihandGalleryExtractor',
+        'hentaihand',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/comic/([\\w-]+)',
+        'https://hentaihand.com/en/comic/TITLE',
+        'Extractor for image galleries on hentaihand.com',
+    ),
+    (  # 311
+        'hentaihand',
+        'HentaihandTagExtractor',
+        'hentaihand',
+        'tag',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/(parody|character|tag|artist|group|language|category|relationship)/([^/?#]+)',
+        'https://hentaihand.com/en/tag/TAG',
+        'Extractor for tag searches on hentaihand.com',
+    ),
+    (  # 312
+        'hentaihere',
+        'HentaihereChapterExtractor',
+        'hentaihere',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?hentaihere\\.com/m/S(\\d+)/([^/?#]+)',
+        'https://hentaihere.com/m/S12345/1/1/',
+        'Extractor for a single manga chapter from hentaihere.com',
+    ),
+    (  # 313
+        'hentaihere',
+        'HentaihereMangaExtractor',
+        'hentaihere',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?hentaihere\\.com(/m/S\\d+)/?$',
+        'https://hentaihere.com/m/S12345',
+        'Extractor for hmanga from hentaihere.com',
+    ),
+    (  # 314
+        'hentainexus',
+        'HentainexusGalleryExtractor',
+        'hentainexus',
+        'gallery',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com/(?:view|read)/(\\d+)',
+        'https://hentainexus.com/view/12345',
+        'Extractor for hentainexus galleries',
+    ),
+    (  # 315
+        'hentainexus',
+        'HentainexusSearchExtractor',
+        'hentainexus',
+        'search',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com(?:/page/\\d+)?/?(?:\\?(q=[^/?#]+))?$',
+        'https://hentainexus.com/?q=QUERY',
+        'Extractor for hentainexus search results',
+    ),
+    (  # 316
+        'hiperdex',
+        'HiperdexChapterExtractor',
+        'hiperdex',
+        'chapter',
+        '',
+        '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+)/([^/?#]+))',
+        'https://hiperdex.com/manga/MANGA/CHAPTER/',
+        'Extractor for hiperdex manga chapters',
+    ),
+    (  # 317
+        'hiperdex',
+        'HiperdexMangaExtractor',
+        'hiperdex',
+        'manga',
+        '',
+        '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+))/?$',
+        'https://hiperdex.com/manga/MANGA/',
+        'Extractor for hiperdex manga',
+    ),
+    (  # 318
+        'hiperdex',
+        'HiperdexArtistExtractor',
+        'hiperdex',
+        'artist',
+        '',
+        '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/manga-a(?:rtist|uthor)/(?:[^/?#]+))',
+        'https://hiperdex.com/manga-artist/NAME/',
+        "Extractor for an artists's manga on hiperdex",
+    ),
+    (  # 319
+        'hitomi',
+        'HitomiGalleryExtractor',
+        'hitomi',
+        'gallery',
+        '',
+        '(?:https?://)?hitomi\\.la/(?:manga|doujinshi|cg|gamecg|imageset|galleries|reader)/(?:[^/?#]+-)?(\\d+)',
+        'https://hitomi.la/manga/TITLE-867789.html',
+        'Extractor for hitomi.la galleries',
+    ),
+    (  # 320
+        'hitomi',
+        'HitomiTagExtractor',
+        'hitomi',
+        'tag',
+        '',
+        '(?:https?://)?hitomi\\.la/(tag|artist|group|series|type|character)/([^/?#]+)\\.html',
+        'https://hitomi.la/tag/TAG-LANG.html',
+        'Extractor for galleries from tag searches on hitomi.la',
+    ),
+    (  # 321
+        'hitomi',
+        'HitomiIndexExtractor',
+        'hitomi',
+        'index',
+        '',
+        '(?:https?://)?hitomi\\.la/(\\w+)-(\\w+)\\.html',
+        'https://hitomi.la/index-LANG.html',
+        'Extractor for galleries from index searches on hitomi.la',
+    ),
+    (  # 322
+        'hitomi',
+        'HitomiSearchExtractor',
+        'hitomi',
+        'search',
+        '',
+        '(?:https?://)?hitomi\\.la/search\\.html\\?([^#]+)',
+        'https://hitomi.la/search.html?QUERY',
+        'Extractor for galleries from multiple tag searches on hitomi.la',
+    ),
+    (  # 323
+        'hotleak',
+        'HotleakPostExtractor',
+        'hotleak',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/]+)/(photo|video)/(\\d+)',
+        'https://hotleak.vip/MODEL/photo/12345',
+        'Extractor for individual posts on hotleak',
+    ),
+    (  # 324
+        'hotleak',
+        'HotleakCreatorExtractor',
+        'hotleak',
+        'creator',
+        '',
+        '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/?#]+)/?$',
+        'https://hotleak.vip/MODEL',
+        'Extractor for all posts from a hotleak creator',
+    ),
+    (  # 325
+        'hotleak',
+        'HotleakCategoryExtractor',
+        'hotleak',
+        'category',
+        '',
+        '(?:https?://)?(?:www\\.)?hotleak\\.vip/(hot|creators|videos|photos)(?:/?\\?([^#]+))?',
+        'https://hotleak.vip/photos',
+        'Extractor for hotleak categories',
+    ),
+    (  # 326
+        'hotleak',
+        'HotleakSearchExtractor',
+        'hotleak',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?hotleak\\.vip/search(?:/?\\?([^#]+))',
+        'https://hotleak.vip/search?search=QUERY',
+        'Extractor for hotleak search results',
+    ),
+    (  # 327
+        'imagebam',
+        'ImagebamGalleryExtractor',
+        'imagebam',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?imagebam\\.com(/(?:gallery/|view/G)[a-zA-Z0-9]+)',
+        'https://www.imagebam.com/view/GID',
+        'Extractor for imagebam galleries',
+    ),
+    (  # 328
+        'imagebam',
+        'ImagebamImageExtractor',
+        'imagebam',
+        'image',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?imagebam\\.com(/(?:image/|view/M|(?:[0-9a-f]{2}/){3})[a-zA-Z0-9]+)',
+        'https://www.imagebam.com/view/MID',
+        'Extractor for single imagebam images',
+    ),
+    (  # 329
+        'imagechest',
+        'ImagechestGalleryExtractor',
+        'imagechest',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?imgchest\\.com/p/([A-Za-z0-9]{11})',
+        'https://imgchest.com/p/abcdefghijk',
+        'Extractor for image galleries from imgchest.com',
+    ),
+    (  # 330
+        'imagechest',
+        'ImagechestUserExtractor',
+        'imagechest',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?imgchest\\.com/u/([^/?#]+)',
+        'https://imgchest.com/u/USER',
+        'Extractor for imgchest.com user profiles',
+    ),
+    (  # 331
+        'imagefap',
+        'ImagefapGalleryExtractor',
+        'imagefap',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:gallery\\.php\\?gid=|gallery/|pictures/)(\\d+)',
+        'https://www.imagefap.com/gallery/12345',
+        'Extractor for image galleries from imagefap.com',
+    ),
+    (  # 332
+        'imagefap',
+        'ImagefapImageExtractor',
+        'imagefap',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/photo/(\\d+)',
+        'https://www.imagefap.com/photo/12345',
+        'Extractor for single images from imagefap.com',
+    ),
+    (  # 333
+        'imagefap',
+        'ImagefapFolderExtractor',
+        'imagefap',
+        'folder',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:organizer/|(?:usergallery\\.php\\?user(id)?=([^&#]+)&|profile/([^/?#]+)/galleries\\?)folderid=)(\\d+|-1)',
+        'https://www.imagefap.com/organizer/12345',
+        'Extractor for imagefap user folders',
+    ),
+    (  # 334
+        'imagefap',
+        'ImagefapUserExtractor',
+        'imagefap',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:profile(?:\\.php\\?user=|/)([^/?#]+)(?:/galleries)?|usergallery\\.php\\?userid=(\\d+))(?:$|#)',
+        'https://www.imagefap.com/profile/USER',
+        'Extractor for an imagefap user profile',
+    ),
+    (  # 335
+        'imgbb',
+        'ImgbbAlbumExtractor',
+        'imgbb',
+        'album',
+        '',
+        '(?:https?://)?ibb\\.co/album/([^/?#]+)/?(?:\\?([^#]+))?',
+        'https://ibb.co/album/ID',
+        'Extractor for imgbb albums',
+    ),
+    (  # 336
+        'imgbb',
+        'ImgbbImageExtractor',
+        'imgbb',
+        'image',
+        '',
+        '(?:https?://)?ibb\\.co/([^/?#]+)',
+        'https://ibb.co/ID',
+        None,
+    ),
+    (  # 337
+        'imgbb',
+        'ImgbbUserExtractor',
+        'imgbb',
+        'user',
+        '',
+        '(?:https?://)?([\\w-]+)\\.imgbb\\.com/?(?:\\?([^#]+))?',
+        'https://USER.imgbb.com',
+        'Extractor for imgbb user profiles',
+    ),
+    (  # 338
+        'imgbox',
+        'ImgboxGalleryExtractor',
+        'imgbox',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?imgbox\\.com/g/([A-Za-z0-9]{10})',
+        'https://imgbox.com/g/12345abcde',
+        'Extractor for image galleries from imgbox.com',
+    ),
+    (  # 339
+        'imgbox',
+        'ImgboxImageExtractor',
+        'imgbox',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:www\\.|i\\.)?imgbox\\.com|images\\d+\\.imgbox\\.com/[0-9a-f]{2}/[0-9a-f]{2})/([A-Za-z0-9]{8})',
+        'https://imgbox.com/1234abcd',
+        'Extractor for single images from imgbox.com',
+    ),
+    (  # 340
+        'imgpile',
+        'ImgpilePostExtractor',
+        'imgpile',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?imgpile\\.com/p/(\\w+)',
+        'https://imgpile.com/p/AbCdEfG',
+        None,
+    ),
+    (  # 341
+        'imgpile',
+        'ImgpileUserExtractor',
+        'imgpile',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?imgpile\\.com/u/([^/?#]+)',
+        'https://imgpile.com/u/USER',
+        None,
+    ),
+    (  # 342
+        'imgth',
+        'ImgthGalleryExtractor',
+        'imgth',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?imgth\\.com/gallery/(\\d+)',
+        'https://imgth.com/gallery/123/TITLE',
+        'Extractor for image galleries from imgth.com',
+    ),
+    (  # 343
+        'imgur',
+        'ImgurImageExtractor',
+        'imgur',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?!gallery|search)(?:r/\\w+/)?(?:[^/?#]+-)?(\\w{7}|\\w{5})[sbtmlh]?',
+        'https://imgur.com/abcdefg',
+        'Extractor for individual images on imgur.com',
+    ),
+    (  # 344
+        'imgur',
+        'ImgurAlbumExtractor',
+        'imgur',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/a/(?:[^/?#]+-)?(\\w{7}|\\w{5})',
+        'https://imgur.com/a/abcde',
+        'Extractor for imgur albums',
+    ),
+    (  # 345
+        'imgur',
+        'ImgurGalleryExtractor',
+        'imgur',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?:gallery|t/\\w+)/(?:[^/?#]+-)?(\\w{7}|\\w{5})',
+        'https://imgur.com/gallery/abcde',
+        'Extractor for imgur galleries',
+    ),
+    (  # 346
+        'imgur',
+        'ImgurUserExtractor',
+        'imgur',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/(?!me(?:/|$|\\?|#))([^/?#]+)(?:/posts|/submitted)?/?$',
+        'https://imgur.com/user/USER',
+        'Extractor for all images posted by a user',
+    ),
+    (  # 347
+        'imgur',
+        'ImgurFavoriteExtractor',
+        'imgur',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/?$',
+        'https://imgur.com/user/USER/favorites',
+        "Extractor for a user's favorites",
+    ),
+    (  # 348
+        'imgur',
+        'ImgurFavoriteFolderExtractor',
+        'imgur',
+        'favorite-folder',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/folder/(\\d+)',
+        'https://imgur.com/user/USER/favorites/folder/12345/TITLE',
+        "Extractor for a user's favorites folder",
+    ),
+    (  # 349
+        'imgur',
+        'ImgurMeExtractor',
+        'imgur',
+        'me',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/me(?:/posts)?(/hidden)?',
+        'https://imgur.com/user/me',
+        'Extractor for your personal uploads',
+    ),
+    (  # 350
+        'imgur',
+        'ImgurSubredditExtractor',
+        'imgur',
+        'subreddit',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/r/([^/?#]+)/?$',
+        'https://imgur.com/r/SUBREDDIT',
+        "Extractor for a subreddits's imgur links",
+    ),
+    (  # 351
+        'imgur',
+        'ImgurTagExtractor',
+        'imgur',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/t/([^/?#]+)$',
+        'https://imgur.com/t/TAG',
+        'Extractor for imgur tag searches',
+    ),
+    (  # 352
+        'imgur',
+        'ImgurSearchExtractor',
+        'imgur',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/search(?:/[^?#]+)?/?\\?q=([^&#]+)',
+        'https://imgur.com/search?q=UERY',
+        'Extractor for imgur search results',
+    ),
+    (  # 353
+        'imhentai',
+        'ImhentaiGalleryExtractor',
+        '',
+        'gallery',
+        'IMHentai',
+        '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))/(?:gallery|view)/(\\d+)',
+        'https://imhentai.xxx/gallery/12345/',
+        'Extractor for imhentai galleries',
+    ),
+    (  # 354
+        'imhentai',
+        'ImhentaiTagExtractor',
+        '',
+        'tag',
+        'IMHentai',
+        '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))(/(?:artist|category|character|group|language|parody|tag)/([^/?#]+))',
+        'https://imhentai.xxx/tag/TAG/',
+        'Extractor for imhentai tag searches',
+    ),
+    (  # 355
+        'imhentai',
+        'ImhentaiSearchExtractor',
+        '',
+        'search',
+        'IMHentai',
+        '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))(/(?:advanced-)?search/?\\?[^#]+|/[^/?#]+/?)',
+        'https://imhentai.xxx/search/?key=QUERY',
+        'Extractor for imhentai search results',
+    ),
+    (  # 356
+        'inkbunny',
+        'InkbunnyUserExtractor',
+        'inkbunny',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?!s/)(gallery/|scraps/)?(\\w+)(?:$|[/?#])',
+        'https://inkbunny.net/USER',
+        'Extractor for inkbunny user profiles',
+    ),
+    (  # 357
+        'inkbunny',
+        'InkbunnyPoolExtractor',
+        'inkbunny',
+        'pool',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:poolview_process\\.php\\?pool_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=pool(?:&[^#]+)?))',
+        'https://inkbunny.net/poolview_process.php?pool_id=12345',
+        'Extractor for inkbunny pools',
+    ),
+    (  # 358
+        'inkbunny',
+        'InkbunnyFavoriteExtractor',
+        'inkbunny',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:userfavorites_process\\.php\\?favs_user_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=userfavs(?:&[^#]+)?))',
+        'https://inkbunny.net/userfavorites_process.php?favs_user_id=12345',
+        'Extractor for inkbunny user favorites',
+    ),
+    (  # 359
+        'inkbunny',
+        'InkbunnyUnreadExtractor',
+        'inkbunny',
+        'unread',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=unreadsubs(?:&[^#]+)?)',
+        'https://inkbunny.net/submissionsviewall.php?text=&mode=unreadsubs&type=',
+        'Extractor for unread inkbunny submissions',
+    ),
+    (  # 360
+        'inkbunny',
+        'InkbunnySearchExtractor',
+        'inkbunny',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=search(?:&[^#]+)?)',
+        'https://inkbunny.net/submissionsviewall.php?text=TAG&mode=search&type=',
+        'Extractor for inkbunny search results',
+    ),
+    (  # 361
+        'inkbunny',
+        'InkbunnyFollowingExtractor',
+        'inkbunny',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:watchlist_process\\.php\\?mode=watching&user_id=(\\d+)|usersviewall\\.php\\?((?:[^#]+&)?mode=watching(?:&[^#]+)?))',
+        'https://inkbunny.net/watchlist_process.php?mode=watching&user_id=12345',
+        'Extractor for inkbunny user watches',
+    ),
+    (  # 362
+        'inkbunny',
+        'InkbunnyPostExtractor',
+        'inkbunny',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?inkbunny\\.net/s/(\\d+)',
+        'https://inkbunny.net/s/12345',
+        'Extractor for individual Inkbunny posts',
+    ),
+    (  # 363
+        'instagram',
+        'InstagramPostExtractor',
+        'instagram',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?:share()(?:/(?:p|tv|reels?()))?|(?:[^/?#]+/)?(?:p|tv|reels?()))/([^/?#]+)',
+        'https://www.instagram.com/p/abcdefg/',
+        'Extractor for an Instagram post',
+    ),
+    (  # 364
+        'instagram',
+        'InstagramUserExtractor',
+        'instagram',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/?(?:$|[?#])',
+        'https://www.instagram.com/USER/',
+        'Extractor for an Instagram user profile',
+    ),
+    (  # 365
+        'instagram',
+        'InstagramPostsExtractor',
+        'instagram',
+        'posts',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/posts',
+        'https://www.instagram.com/USER/posts/',
+        "Extractor for an Instagram user's posts",
+    ),
+    (  # 366
+        'instagram',
+        'InstagramReelsExtractor',
+        'instagram',
+        'reels',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/reels',
+        'https://www.instagram.com/USER/reels/',
+        "Extractor for an Instagram user's reels",
+    ),
+    (  # 367
+        'instagram',
+        'InstagramTaggedExtractor',
+        'instagram',
+        'tagged',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/tagged',
+        'https://www.instagram.com/USER/tagged/',
+        "Extractor for an Instagram user's tagged posts",
+    ),
+    (  # 368
+        'instagram',
+        'InstagramGuideExtractor',
+        'instagram',
+        'guide',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/guide/[^/?#]+/(\\d+)',
+        'https://www.instagram.com/USER/guide/NAME/12345',
+        'Extractor for an Instagram guide',
+    ),
+    (  # 369
+        'instagram',
+        'InstagramSavedExtractor',
+        'instagram',
+        'saved',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved(?:/all-posts)?/?$',
+        'https://www.instagram.com/USER/saved/',
+        "Extractor for an Instagram user's saved media",
+    ),
+    (  # 370
+        'instagram',
+        'InstagramCollectionExtractor',
+        'instagram',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved/([^/?#]+)/([^/?#]+)',
+        'https://www.instagram.com/USER/saved/COLLECTION/12345',
+        'Extractor for Instagram collection',
+    ),
+    (  # 371
+        'instagram',
+        'InstagramStoriesTrayExtractor',
+        'instagram',
+        'stories-tray',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/stories/me/?$()',
+        'https://www.instagram.com/stories/me/',
+        "Extractor for your Instagram account's stories tray",
+    ),
+    (  # 372
+        'instagram',
+        'InstagramStoriesExtractor',
+        'instagram',
+        'stories',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/s(?:tories/(?:highlights/(\\d+)|([^/?#]+)(?:/(\\d+))?)|/(aGlnaGxpZ2h0[^?#]+)(?:\\?story_media_id=(\\d+))?)',
+        'https://www.instagram.com/stories/USER/',
+        'Extractor for Instagram stories',
+    ),
+    (  # 373
+        'instagram',
+        'InstagramHighlightsExtractor',
+        'instagram',
+        'highlights',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/highlights',
+        'https://www.instagram.com/USER/highlights/',
+        "Extractor for an Instagram user's story highlights",
+    ),
+    (  # 374
+        'instagram',
+        'InstagramFollowersExtractor',
+        'instagram',
+        'followers',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/followers',
+        'https://www.instagram.com/USER/followers/',
+        "Extractor for an Instagram user's followers",
+    ),
+    (  # 375
+        'instagram',
+        'InstagramFollowingExtractor',
+        'instagram',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/following',
+        'https://www.instagram.com/USER/following/',
+        "Extractor for an Instagram user's followed users",
+    ),
+    (  # 376
+        'instagram',
+        'InstagramTagExtractor',
+        'instagram',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/explore/tags/([^/?#]+)',
+        'https://www.instagram.com/explore/tags/TAG/',
+        'Extractor for Instagram tags',
+    ),
+    (  # 377
+        'instagram',
+        'InstagramInfoExtractor',
+        'instagram',
+        'info',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/info',
+        'https://www.instagram.com/USER/info/',
+        "Extractor for an Instagram user's profile data",
+    ),
+    (  # 378
+        'instagram',
+        'InstagramAvatarExtractor',
+        'instagram',
+        'avatar',
+        '',
+        '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/avatar',
+        'https://www.instagram.com/USER/avatar/',
+        "Extractor for an Instagram user's avatar",
+    ),
+    (  # 379
+        'issuu',
+        'IssuuPublicationExtractor',
+        'issuu',
+        'publication',
+        '',
+        '(?:https?://)?issuu\\.com(/[^/?#]+/docs/[^/?#]+)',
+        'https://issuu.com/issuu/docs/TITLE/',
+        'Extractor for a single publication',
+    ),
+    (  # 380
+        'issuu',
+        'IssuuUserExtractor',
+        'issuu',
+        'user',
+        '',
+        '(?:https?://)?issuu\\.com/([^/?#]+)(?:/(\\d*))?$',
+        'https://issuu.com/USER',
+        'Extractor for all publications of a user/publisher',
+    ),
+    (  # 381
+        'itaku',
+        'ItakuGalleryExtractor',
+        'itaku',
+        'gallery',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/gallery(?:/(\\d+))?',
+        'https://itaku.ee/profile/USER/gallery',
+        "Extractor for an itaku user's gallery",
+    ),
+    (  # 382
+        'itaku',
+        'ItakuPostsExtractor',
+        'itaku',
+        'posts',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/posts(?:/(\\d+))?',
+        'https://itaku.ee/profile/USER/posts',
+        "Extractor for an itaku user's posts",
+    ),
+    (  # 383
+        'itaku',
+        'ItakuStarsExtractor',
+        'itaku',
+        'stars',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/stars(?:/(\\d+))?',
+        'https://itaku.ee/profile/USER/stars',
+        "Extractor for an itaku user's starred images",
+    ),
+    (  # 384
+        'itaku',
+        'ItakuFollowingExtractor',
+        'itaku',
+        'following',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/following',
+        'https://itaku.ee/profile/USER/following',
+        None,
+    ),
+    (  # 385
+        'itaku',
+        'ItakuFollowersExtractor',
+        'itaku',
+        'followers',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/followers',
+        'https://itaku.ee/profile/USER/followers',
+        None,
+    ),
+    (  # 386
+        'itaku',
+        'ItakuBookmarksExtractor',
+        'itaku',
+        'bookmarks',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/bookmarks/(image|user)/(\\d+)',
+        'https://itaku.ee/profile/USER/bookmarks/image/12345',
+        'Extractor for an itaku bookmarks folder',
+    ),
+    (  # 387
+        'itaku',
+        'ItakuUserExtractor',
+        'itaku',
+        'user',
+        '',
+        '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/?(?:$|\\?|#)',
+        'https://itaku.ee/profile/USER',
+        'Extractor for itaku user profiles',
+    ),
+    (  # 388
+        'itaku',
+        'ItakuImageExtractor',
+        'itaku',
+        'image',
+        '',
+        '(?:https?://)?itaku\\.ee/images/(\\d+)',
+        'https://itaku.ee/images/12345',
+        None,
+    ),
+    (  # 389
+        'itaku',
+        'ItakuPostExtractor',
+        'itaku',
+        'post',
+        '',
+        '(?:https?://)?itaku\\.ee/posts/(\\d+)',
+        'https://itaku.ee/posts/12345',
+        None,
+    ),
+    (  # 390
+        'itaku',
+        'ItakuSearchExtractor',
+        'itaku',
+        'search',
+        '',
+        '(?:https?://)?itaku\\.ee/home/images/?\\?([^#]+)',
+        'https://itaku.ee/home/images?tags=SEARCH',
+        None,
+    ),
+    (  # 391
+        'itchio',
+        'ItchioGameExtractor',
+        'itchio',
+        'game',
+        '',
+        '(?:https?://)?(\\w+)\\.itch\\.io/([\\w-]+)',
+        'https://USER.itch.io/GAME',
+        'Extractor for itch.io games',
+    ),
+    (  # 392
+        'iwara',
+        'IwaraUserExtractor',
+        'iwara',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/?$',
+        'https://www.iwara.tv/profile/USERNAME',
+        'Extractor for iwara.tv profile pages',
+    ),
+    (  # 393
+        'iwara',
+        'IwaraUserImagesExtractor',
+        'iwara',
+        'user-images',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/images(?:\\?([^#]+))?',
+        'https://www.iwara.tv/profile/USERNAME/images',
+        None,
+    ),
+    (  # 394
+        'iwara',
+        'IwaraUserVideosExtractor',
+        'iwara',
+        'user-videos',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/videos(?:\\?([^#]+))?',
+        'https://www.iwara.tv/profile/USERNAME/videos',
+        None,
+    ),
+    (  # 395
+        'iwara',
+        'IwaraUserPlaylistsExtractor',
+        'iwara',
+        'user-playlists',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/playlists(?:\\?([^#]+))?',
+        'https://www.iwara.tv/profile/USERNAME/playlists',
+        None,
+    ),
+    (  # 396
+        'iwara',
+        'IwaraFollowingExtractor',
+        'iwara',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/following',
+        'https://www.iwara.tv/profile/USERNAME/following',
+        None,
+    ),
+    (  # 397
+        'iwara',
+        'IwaraFollowersExtractor',
+        'iwara',
+        'followers',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/followers',
+        'https://www.iwara.tv/profile/USERNAME/followers',
+        None,
+    ),
+    (  # 398
+        'iwara',
+        'IwaraImageExtractor',
+        'iwara',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/image/([^/?#]+)',
+        'https://www.iwara.tv/image/ID',
+        'Extractor for individual iwara.tv image pages',
+    ),
+    (  # 399
+        'iwara',
+        'IwaraVideoExtractor',
+        'iwara',
+        'video',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/video/([^/?#]+)',
+        'https://www.iwara.tv/video/ID',
+        'Extractor for individual iwara.tv videos',
+    ),
+    (  # 400
+        'iwara',
+        'IwaraPlaylistExtractor',
+        'iwara',
+        'playlist',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/playlist/([^/?#]+)',
+        'https://www.iwara.tv/playlist/ID',
+        'Extractor for individual iwara.tv playlist pages',
+    ),
+    (  # 401
+        'iwara',
+        'IwaraFavoriteExtractor',
+        'iwara',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/favorites(?:/(image|video)s)?',
+        'https://www.iwara.tv/favorites/videos',
+        None,
+    ),
+    (  # 402
+        'iwara',
+        'IwaraSearchExtractor',
+        'iwara',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/search\\?([^#]+)',
+        'https://www.iwara.tv/search?query=QUERY&type=TYPE',
+        'Extractor for iwara.tv search pages',
+    ),
+    (  # 403
+        'iwara',
+        'IwaraTagExtractor',
+        'iwara',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?iwara\\.tv/(image|video)s(?:\\?([^#]+))?',
+        'https://www.iwara.tv/videos?tags=TAGS',
+        'Extractor for iwara.tv tag search',
+    ),
+    (  # 404
+        'jschan',
+        'JschanThreadExtractor',
+        '',
+        'thread',
+        'jschan',
+        '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)/thread/(\\d+)\\.html',
+        'https://94chan.org/a/thread/12345.html',
+        'Extractor for jschan threads',
+    ),
+    (  # 405
+        'jschan',
+        'JschanBoardExtractor',
+        '',
+        'board',
+        'jschan',
+        '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)(?:/index\\.html|/catalog\\.html|/\\d+\\.html|/?$)',
+        'https://94chan.org/a/',
+        'Extractor for jschan boards',
+    ),
+    (  # 406
+        'kabeuchi',
+        'KabeuchiUserExtractor',
+        'kabeuchi',
+        'user',
+        '',
+        '(?:https?://)?kabe-uchiroom\\.com/mypage/?\\?id=(\\d+)',
+        'https://kabe-uchiroom.com/mypage/?id=12345',
+        'Extractor for all posts of a user on kabe-uchiroom.com',
+    ),
+    (  # 407
+        'keenspot',
+        'KeenspotComicExtractor',
+        'keenspot',
+        'comic',
+        '',
+        '(?:https?://)?(?!www\\.|forums\\.)([\\w-]+)\\.keenspot\\.com(/.+)?',
+        'http://COMIC.keenspot.com/',
+        'Extractor for webcomics from keenspot.com',
+    ),
+    (  # 408
+        'kemono',
+        'KemonoUserExtractor',
+        'kemono',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)',
+        'https://kemono.cr/SERVICE/user/12345',
+        'Extractor for all posts from a kemono.cr user listing',
+    ),
+    (  # 409
+        'kemono',
+        'KemonoPostsExtractor',
+        'kemono',
+        'posts',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/posts()()(?:/?\\?([^#]+))?',
+        'https://kemono.cr/posts',
+        'Extractor for kemono.cr post listings',
+    ),
+    (  # 410
+        'kemono',
+        'KemonoPostExtractor',
+        'kemono',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)(/revisions?(?:/(\\d*))?)?',
+        'https://kemono.cr/SERVICE/user/12345/post/12345',
+        'Extractor for a single kemono.cr post',
+    ),
+    (  # 411
+        'kemono',
+        'KemonoDiscordExtractor',
+        'kemono',
+        'discord',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)[/#](?:channel/)?(\\d+)',
+        'https://kemono.cr/discord/server/12345/12345',
+        'Extractor for kemono.cr discord servers',
+    ),
+    (  # 412
+        'kemono',
+        'KemonoDiscordServerExtractor',
+        'kemono',
+        'discord-server',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)$',
+        'https://kemono.cr/discord/server/12345',
+        None,
+    ),
+    (  # 413
+        'kemono',
+        'KemonoFavoriteExtractor',
+        'kemono',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(?:account/)?favorites()()(?:/?\\?([^#]+))?',
+        'https://kemono.cr/account/favorites/artists',
+        'Extractor for kemono.cr favorites',
+    ),
+    (  # 414
+        'kemono',
+        'KemonoArtistsExtractor',
+        'kemono',
+        'artists',
+        '',
+        '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/artists(?:\\?([^#]+))?',
+        'https://kemono.cr/artists',
+        'Extractor for kemono artists',
+    ),
+    (  # 415
+        'khinsider',
+        'KhinsiderSoundtrackExtractor',
+        'khinsider',
+        'soundtrack',
+        '',
+        '(?:https?://)?downloads\\.khinsider\\.com/game-soundtracks/album/([^/?#]+)',
+        'https://downloads.khinsider.com/game-soundtracks/album/TITLE',
+        'Extractor for soundtracks from khinsider.com',
+    ),
+    (  # 416
+        'komikcast',
+        'KomikcastChapterExtractor',
+        'komikcast',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/chapter/[^/?#]+/)',
+        'https://komikcast.li/chapter/TITLE/',
+        'Extractor for komikcast manga chapters',
+    ),
+    (  # 417
+        'komikcast',
+        'KomikcastMangaExtractor',
+        'komikcast',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/(?:komik/)?[^/?#]+/?)$',
+        'https://komikcast.li/komik/TITLE',
+        'Extractor for komikcast manga',
+    ),
+    (  # 418
+        'koofr',
+        'KoofrSharedExtractor',
+        'koofr',
+        'shared',
+        '',
+        '(?:https?://)?(?:(?:app\\.)?koofr\\.(?:net|eu)/links/([\\w-]+)|k00\\.fr/(\\w+))',
+        'https://app.koofr.net/links/UUID',
+        'Base class for koofr extractors',
+    ),
+    (  # 419
+        'leakgallery',
+        'LeakgalleryUserExtractor',
+        'leakgallery',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?leakgallery\\.com/(?!trending-medias|most-liked|random/medias)([^/?#]+)(?:/(Photos|Videos|All))?(?:/(MostRecent|MostViewed|MostLiked))?/?$',
+        'https://leakgallery.com/creator',
+        'Extractor for profile posts on leakgallery.com',
+    ),
+    (  # 420
+        'leakgallery',
+        'LeakgalleryTrendingExtractor',
+        'leakgallery',
+        'trending',
+        '',
+        '(?:https?://)?(?:www\\.)?leakgallery\\.com/trending-medias(?:/([\\w-]+))?',
+        'https://leakgallery.com/trending-medias/Week',
+        'Extractor for trending posts on leakgallery.com',
+    ),
+    (  # 421
+        'leakgallery',
+        'LeakgalleryMostlikedExtractor',
+        'leakgallery',
+        'mostliked',
+        '',
+        '(?:https?://)?(?:www\\.)?leakgallery\\.com/most-liked',
+        'https://leakgallery.com/most-liked',
+        'Extractor for most liked posts on leakgallery.com',
+    ),
+    (  # 422
+        'leakgallery',
+        'LeakgalleryPostExtractor',
+        'leakgallery',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?leakgallery\\.com/([^/?#]+)/(\\d+)',
+        'https://leakgallery.com/CREATOR/12345',
+        'Extractor for individual posts on leakgallery.com',
+    ),
+    (  # 423
+        'lensdump',
+        'LensdumpAlbumExtractor',
+        'lensdump',
+        'album',
+        '',
+        '(?:https?://)?lensdump\\.com/a/(\\w+)(?:/?\\?([^#]+))?',
+        'https://lensdump.com/a/ID',
+        None,
+    ),
+    (  # 424
+        'lensdump',
+        'LensdumpAlbumsExtractor',
+        'lensdump',
+        'albums',
+        '',
+        '(?:https?://)?lensdump\\.com/(?![ai]/)([^/?#]+)(?:/?\\?([^#]+))?',
+        'https://lensdump.com/USER',
+        'Extractor for album list from lensdump.com',
+    ),
+    (  # 425
+        'lensdump',
+        'LensdumpImageExtractor',
+        'lensdump',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:i\\d?\\.)?lensdump\\.com|\\w\\.l3n\\.co)/(?:i/)?(\\w+)',
+        'https://lensdump.com/i/ID',
+        'Extractor for individual images on lensdump.com',
+    ),
+    (  # 426
+        'lexica',
+        'LexicaSearchExtractor',
+        'lexica',
+        'search',
+        '',
+        '(?:https?://)?lexica\\.art/?\\?q=([^&#]+)',
+        'https://lexica.art/?q=QUERY',
+        'Extractor for lexica.art search results',
+    ),
+    (  # 427
+        'lightroom',
+        'LightroomGalleryExtractor',
+        'lightroom',
+        'gallery',
+        '',
+        '(?:https?://)?lightroom\\.adobe\\.com/shares/([0-9a-f]+)',
+        'https://lightroom.adobe.com/shares/0123456789abcdef',
+        'Extractor for an image gallery on lightroom.adobe.com',
+    ),
+    (  # 428
+        'livedoor',
+        'LivedoorBlogExtractor',
+        'livedoor',
+        'blog',
+        '',
+        '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/?(?:$|[?#])',
+        'http://blog.livedoor.jp/USER/',
+        "Extractor for a user's blog on blog.livedoor.jp",
+    ),
+    (  # 429
+        'livedoor',
+        'LivedoorPostExtractor',
+        'livedoor',
+        'post',
+        '',
+        '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/archives/(\\d+)',
+        'http://blog.livedoor.jp/USER/archives/12345.html',
+        'Extractor for images from a blog post on blog.livedoor.jp',
+    ),
+    (  # 430
+        'lofter',
+        'LofterPostExtractor',
+        'lofter',
+        'post',
+        '',
+        '(?:https?://)?[\\w-]+\\.lofter\\.com/post/([0-9a-f]+)_([0-9a-f]+)',
+        'https://BLOG.lofter.com/post/12345678_90abcdef',
+        'Extractor for a lofter post',
+    ),
+    (  # 431
+        'lofter',
+        'LofterBlogPostsExtractor',
+        'lofter',
+        'blog-posts',
+        '',
+        '(?:https?://)?(?:www\\.lofter\\.com/front/blog/home-page/([\\w-]+)|([\\w-]+)\\.lofter\\.com)/?(?:$|\\?|#)',
+        'https://BLOG.lofter.com/',
+        "Extractor for a lofter blog's posts",
+    ),
+    (  # 432
+        'luscious',
+        'LusciousAlbumExtractor',
+        'luscious',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/(?:albums|pictures/c/[^/?#]+/album)/[^/?#]+_(\\d+)',
+        'https://luscious.net/albums/TITLE_12345/',
+        'Extractor for image albums from luscious.net',
+    ),
+    (  # 433
+        'luscious',
+        'LusciousSearchExtractor',
+        'luscious',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/albums/list/?(?:\\?([^#]+))?',
+        'https://luscious.net/albums/list/?tagged=TAG',
+        'Extractor for album searches on luscious.net',
+    ),
+    (  # 434
+        'lynxchan',
+        'LynxchanThreadExtractor',
+        '',
+        'thread',
+        'lynxchan',
+        '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)/res/(\\d+)',
+        'https://endchan.org/a/res/12345.html',
+        'Extractor for LynxChan threads',
+    ),
+    (  # 435
+        'lynxchan',
+        'LynxchanBoardExtractor',
+        '',
+        'board',
+        'lynxchan',
+        '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)',
+        'https://endchan.org/a/',
+        'Extractor for LynxChan boards',
+    ),
+    (  # 436
+        'madokami',
+        'MadokamiMangaExtractor',
+        'madokami',
+        'manga',
+        '',
+        '(?:https?://)?manga\\.madokami\\.al/Manga/(\\w/\\w{2}/\\w{4}/.+)',
+        'https://manga.madokami.al/Manga/A/AB/ABCD/ABCDE_TITLE',
+        'Extractor for madokami manga',
+    ),
+    (  # 437
+        'mangadex',
+        'MangadexCoversExtractor',
+        'mangadex',
+        'covers',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)(?:/[^/?#]+)?\\?tab=art',
+        'https://mangadex.org/title/01234567-89ab-cdef-0123-456789abcdef?tab=art',
+        'Extractor for mangadex manga covers',
+    ),
+    (  # 438
+        'mangadex',
+        'MangadexChapterExtractor',
+        'mangadex',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/chapter/([0-9a-f-]+)',
+        'https://mangadex.org/chapter/01234567-89ab-cdef-0123-456789abcdef',
+        'Extractor for manga-chapters from mangadex.org',
+    ),
+    (  # 439
+        'mangadex',
+        'MangadexMangaExtractor',
+        'mangadex',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)',
+        'https://mangadex.org/title/01234567-89ab-cdef-0123-456789abcdef',
+        'Extractor for manga from mangadex.org',
+    ),
+    (  # 440
+        'mangadex',
+        'MangadexFeedExtractor',
+        'mangadex',
+        'feed',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/feed$()',
+        'https://mangadex.org/title/feed',
+        'Extractor for chapters from your Updates Feed',
+    ),
+    (  # 441
+        'mangadex',
+        'MangadexFollowingExtractor',
+        'mangadex',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/follows(?:\\?([^#]+))?$',
+        'https://mangadex.org/title/follows',
+        'Extractor for followed manga from your Library',
+    ),
+    (  # 442
+        'mangadex',
+        'MangadexListExtractor',
+        'mangadex',
+        'list',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/list/([0-9a-f-]+)(?:/[^/?#]*)?(?:\\?tab=(\\w+))?',
+        'https://mangadex.org/list/01234567-89ab-cdef-0123-456789abcdef/NAME',
+        'Extractor for mangadex MDLists',
+    ),
+    (  # 443
+        'mangadex',
+        'MangadexAuthorExtractor',
+        'mangadex',
+        'author',
+        '',
+        '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/author/([0-9a-f-]+)',
+        'https://mangadex.org/author/01234567-89ab-cdef-0123-456789abcdef/NAME',
+        'Extractor for mangadex authors',
+    ),
+    (  # 444
+        'mangafire',
+        'MangafireChapterExtractor',
+        'mangafire',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?mangafire\\.to/read/([\\w-]+\\.(\\w+))/([\\w-]+)/((chapter|volume)-\\d+(?:\\D.*)?)',
+        'https://mangafire.to/read/MANGA.ID/LANG/chapter-123',
+        'Extractor for mangafire manga chapters',
+    ),
+    (  # 445
+        'mangafire',
+        'MangafireMangaExtractor',
+        'mangafire',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?mangafire\\.to/manga/([\\w-]+)\\.(\\w+)',
+        'https://mangafire.to/manga/MANGA.ID',
+        'Extractor for mangafire manga',
+    ),
+    (  # 446
+        'mangafox',
+        'MangafoxChapterExtractor',
+        'mangafox',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+/((?:v([^/?#]+)/)?c(\\d+)([^/?#]*)))',
+        'https://fanfox.net/manga/TITLE/v01/c001/1.html',
+        'Extractor for manga chapters from fanfox.net',
+    ),
+    (  # 447
+        'mangafox',
+        'MangafoxMangaExtractor',
+        'mangafox',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+)/?$',
+        'https://fanfox.net/manga/TITLE',
+        'Extractor for manga from fanfox.net',
+    ),
+    (  # 448
+        'mangahere',
+        'MangahereChapterExtractor',
+        'mangahere',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co]/manga/([^/]+(?:/v0*(\\d+))?/c([^/?#]+))',
+        'https://www.mangahere.cc/manga/TITLE/c001/1.html',
+        'Extractor for manga-chapters from mangahere.cc',
+    ),
+    (  # 449
+        'mangahere',
+        'MangahereMangaExtractor',
+        'mangahere',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co](/manga/[^/?#]+/?)(?:#.*)?$',
+        'https://www.mangahere.cc/manga/TITLE',
+        'Extractor for manga from mangahere.cc',
+    ),
+    (  # 450
+        'manganelo',
+        'ManganeloChapterExtractor',
+        '',
+        'chapter',
+        'manganelo',
+        '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+/chapter-[^/?#]+)',
+        'https://www.mangakakalot.gg/manga/MANGA_NAME/chapter-123',
+        'Extractor for manganelo manga chapters',
+    ),
+    (  # 451
+        'manganelo',
+        'ManganeloMangaExtractor',
+        '',
+        'manga',
+        'manganelo',
+        '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+)$',
+        'https://www.mangakakalot.gg/manga/MANGA_NAME',
+        'Extractor for manganelo manga',
+    ),
+    (  # 452
+        'manganelo',
+        'ManganeloBookmarkExtractor',
+        '',
+        'bookmark',
+        'manganelo',
+        '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))/bookmark',
+        'https://www.mangakakalot.gg/bookmark',
+        'Extractor for manganelo bookmarks',
+    ),
+    (  # 453
+        'mangapark',
+        'MangaparkChapterExtractor',
+        'mangapark',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title/[^/?#]+/|comic/\\d+/[^/?#]+/[^/?#]+-i)(\\d+)',
+        'https://mangapark.net/title/MANGA/12345-en-ch.01',
+        'Extractor for manga-chapters from mangapark.net',
+    ),
+    (  # 454
+        'mangapark',
+        'MangaparkMangaExtractor',
+        'mangapark',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title|comic)/(\\d+)(?:[/-][^/?#]*)?/?$',
+        'https://mangapark.net/title/12345-MANGA',
+        'Extractor for manga from mangapark.net',
+    ),
+    (  # 455
+        'mangaread',
+        'MangareadChapterExtractor',
+        'mangaread',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+/[^/?#]+)',
+        'https://www.mangaread.org/manga/MANGA/chapter-01/',
+        'Extractor for manga-chapters from mangaread.org',
+    ),
+    (  # 456
+        'mangaread',
+        'MangareadMangaExtractor',
+        'mangaread',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+)/?$',
+        'https://www.mangaread.org/manga/MANGA',
+        'Extractor for manga from mangaread.org',
+    ),
+    (  # 457
+        'mangareader',
+        'MangareaderChapterExtractor',
+        'mangareader',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?mangareader\\.to/read/([\\w-]+-\\d+)/([^/?#]+)/(chapter|volume)-(\\d+[^/?#]*)',
+        'https://mangareader.to/read/MANGA-123/LANG/chapter-123',
+        'Extractor for mangareader manga chapters',
+    ),
+    (  # 458
+        'mangareader',
+        'MangareaderMangaExtractor',
+        'mangareader',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?mangareader\\.to/([\\w-]+-\\d+)',
+        'https://mangareader.to/MANGA-123',
+        'Extractor for mangareader manga',
+    ),
+    (  # 459
+        'mangataro',
+        'MangataroChapterExtractor',
+        'mangataro',
+        'chapter',
+        '',
+        '(?:https?://)?mangataro\\.org(/read/([^/?#]+)/(?:[^/?#]*-)?(\\d+))',
+        'https://mangataro.org/read/MANGA/ch123-12345',
+        'Extractor for mangataro manga chapters',
+    ),
+    (  # 460
+        'mangataro',
+        'MangataroMangaExtractor',
+        'mangataro',
+        'manga',
+        '',
+        '(?:https?://)?mangataro\\.org(/manga/([^/?#]+))',
+        'https://mangataro.org/manga/MANGA',
+        'Extractor for mangataro manga',
+    ),
+    (  # 461
+        'mangoxo',
+        'MangoxoAlbumExtractor',
+        'mangoxo',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?mangoxo\\.com/album/(\\w+)',
+        'https://www.mangoxo.com/album/ID',
+        'Extractor for albums on mangoxo.com',
+    ),
+    (  # 462
+        'mangoxo',
+        'MangoxoChannelExtractor',
+        'mangoxo',
+        'channel',
+        '',
+        '(?:https?://)?(?:www\\.)?mangoxo\\.com/(\\w+)/album',
+        'https://www.mangoxo.com/USER/album',
+        'Extractor for all albums on a mangoxo channel',
+    ),
+    (  # 463
+        'misskey',
+        'MisskeyUserExtractor',
+        '',
+        'user',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/?$',
+        'https://misskey.io/@USER',
+        'Extractor for all images of a Misskey user',
+    ),
+    (  # 464
+        'misskey',
+        'MisskeyNotesExtractor',
+        '',
+        'notes',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/notes',
+        'https://misskey.io/@USER/notes',
+        "Extractor for a Misskey user's notes",
+    ),
+    (  # 465
+        'misskey',
+        'MisskeyInfoExtractor',
+        '',
+        'info',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/info',
+        'https://misskey.io/@USER/info',
+        "Extractor for a Misskey user's profile data",
+    ),
+    (  # 466
+        'misskey',
+        'MisskeyAvatarExtractor',
+        '',
+        'avatar',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/avatar',
+        'https://misskey.io/@USER/avatar',
+        "Extractor for a Misskey user's avatar",
+    ),
+    (  # 467
+        'misskey',
+        'MisskeyBackgroundExtractor',
+        '',
+        'background',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/ba(?:nner|ckground)',
+        'https://misskey.io/@USER/banner',
+        "Extractor for a Misskey user's banner image",
+    ),
+    (  # 468
+        'misskey',
+        'MisskeyFollowingExtractor',
+        '',
+        'following',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/following',
+        'https://misskey.io/@USER/following',
+        'Extractor for followed Misskey users',
+    ),
+    (  # 469
+        'misskey',
+        'MisskeyNoteExtractor',
+        '',
+        'note',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/notes/(\\w+)',
+        'https://misskey.io/notes/98765',
+        'Extractor for images from a Note',
+    ),
+    (  # 470
+        'misskey',
+        'MisskeyFavoriteExtractor',
+        '',
+        'favorite',
+        'misskey',
+        '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/(?:my|api/i)/favorites',
+        'https://misskey.io/my/favorites',
+        'Extractor for favorited notes',
+    ),
+    (  # 471
+        'motherless',
+        'MotherlessMediaExtractor',
+        'motherless',
+        'media',
+        '',
+        '(?:https?://)?motherless\\.com/((?:g/[^/?#]+/|G[IV]?[A-Z0-9]+/)?(?!G)[A-Z0-9]+)',
+        'https://motherless.com/ABC123',
+        'Extractor for a single image/video from motherless.com',
+    ),
+    (  # 472
+        'motherless',
+        'MotherlessGalleryExtractor',
+        'motherless',
+        'gallery',
+        '',
+        '(?:https?://)?motherless\\.com/G([IVG])?([A-Z0-9]+)/?$',
+        'https://motherless.com/GABC123',
+        'Extractor for a motherless.com gallery',
+    ),
+    (  # 473
+        'motherless',
+        'MotherlessGroupExtractor',
+        'motherless',
+        'group',
+        '',
+        '(?:https?://)?motherless\\.com/g([iv]?)/?([a-z0-9_]+)/?$',
+        'https://motherless.com/g/abc123',
+        None,
+    ),
+    (  # 474
+        'myhentaigallery',
+        'MyhentaigalleryGalleryExtractor',
+        'myhentaigallery',
+        'gallery',
+        '',
+        '(?:https?://)?myhentaigallery\\.com/g(?:allery/(?:thumbnails|show))?/(\\d+)',
+        'https://myhentaigallery.com/g/12345',
+        'Extractor for image galleries from myhentaigallery.com',
+    ),
+    (  # 475
+        'myhentaigallery',
+        'MyhentaigalleryTagExtractor',
+        'myhentaigallery',
+        'tag',
+        '',
+        '(?:https?://)?myhentaigallery\\.com(/g/(artist|category|group|parody)/(\\d+).*)',
+        'https://myhentaigallery.com/g/category/123',
+        'Extractor for myhentaigallery tag searches',
+    ),
+    (  # 476
+        'myportfolio',
+        'MyportfolioGalleryExtractor',
+        'myportfolio',
+        'gallery',
+        '',
+        '(?:myportfolio:(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+\\.myportfolio\\.com))(/[^/?#]+)?',
+        'https://USER.myportfolio.com/TITLE',
+        'Extractor for an image gallery on www.myportfolio.com',
+    ),
+    (  # 477
+        'naverblog',
+        'NaverBlogPostExtractor',
+        'naver-blog',
+        'post',
+        '',
+        '(?:https?://)?blog\\.naver\\.com/(?:PostView\\.n(?:aver|hn)\\?blogId=(\\w+)&logNo=(\\d+)|(\\w+)/(\\d+)/?$)',
+        'https://blog.naver.com/BLOGID/12345',
+        'Extractor for blog posts on blog.naver.com',
+    ),
+    (  # 478
+        'naverblog',
+        'NaverBlogBlogExtractor',
+        'naver-blog',
+        'blog',
+        '',
+        '(?:https?://)?blog\\.naver\\.com/(?:PostList\\.n(?:aver|hn)\\?(?:[^&#]+&)*blogId=([^&#]+)|(\\w+)/?$)',
+        'https://blog.naver.com/BLOGID',
+        "Extractor for a user's blog on blog.naver.com",
+    ),
+    (  # 479
+        'naverchzzk',
+        'NaverChzzkCommentExtractor',
+        'naver-chzzk',
+        'comment',
+        '',
+        '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community/detail/(\\d+)',
+        'https://chzzk.naver.com/0123456789abcdef/community/detail/12345',
+        'Extractor for individual comment from chzzk.naver.com',
+    ),
+    (  # 480
+        'naverchzzk',
+        'NaverChzzkCommunityExtractor',
+        'naver-chzzk',
+        'community',
+        '',
+        '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community',
+        'https://chzzk.naver.com/0123456789abcdef/community',
+        'Extractor for comments from chzzk.naver.com',
+    ),
+    (  # 481
+        'naverwebtoon',
+        'NaverWebtoonEpisodeExtractor',
+        'naver-webtoon',
+        'episode',
+        '',
+        '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/detail(?:\\.nhn)?\\?([^#]+)',
+        'https://comic.naver.com/webtoon/detail?titleId=12345&no=1',
+        None,
+    ),
+    (  # 482
+        'naverwebtoon',
+        'NaverWebtoonComicExtractor',
+        'naver-webtoon',
+        'comic',
+        '',
+        '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/list(?:\\.nhn)?\\?([^#]+)',
+        'https://comic.naver.com/webtoon/list?titleId=12345',
+        None,
+    ),
+    (  # 483
+        'nekohouse',
+        'NekohousePostExtractor',
+        'nekohouse',
+        'post',
+        '',
+        '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)',
+        'https://nekohouse.su/SERVICE/user/12345/post/12345',
+        None,
+    ),
+    (  # 484
+        'nekohouse',
+        'NekohouseUserExtractor',
+        'nekohouse',
+        'user',
+        '',
+        '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)',
+        'https://nekohouse.su/SERVICE/user/12345',
+        None,
+    ),
+    (  # 485
+        'newgrounds',
+        'NewgroundsImageExtractor',
+        'newgrounds',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?newgrounds\\.com/art/view/([^/?#]+)/[^/?#]+|art\\.ngfiles\\.com/images/\\d+/\\d+_([^_]+)_([^.]+))',
+        'https://www.newgrounds.com/art/view/USER/TITLE',
+        'Extractor for a single image from newgrounds.com',
+    ),
+    (  # 486
+        'newgrounds',
+        'NewgroundsMediaExtractor',
+        'newgrounds',
+        'media',
+        '',
+        '(?:https?://)?(?:www\\.)?newgrounds\\.com(/(?:portal/view|audio/listen)/\\d+)',
+        'https://www.newgrounds.com/portal/view/12345',
+        'Extractor for a media file from newgrounds.com',
+    ),
+    (  # 487
+        'newgrounds',
+        'NewgroundsArtExtractor',
+        'newgrounds',
+        'art',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/art(?:(?:/page/|/?\\?page=)(\\d+))?/?$',
+        'https://USER.newgrounds.com/art',
+        'Extractor for all images of a newgrounds user',
+    ),
+    (  # 488
+        'newgrounds',
+        'NewgroundsAudioExtractor',
+        'newgrounds',
+        'audio',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/audio(?:(?:/page/|/?\\?page=)(\\d+))?/?$',
+        'https://USER.newgrounds.com/audio',
+        'Extractor for all audio submissions of a newgrounds user',
+    ),
+    (  # 489
+        'newgrounds',
+        'NewgroundsMoviesExtractor',
+        'newgrounds',
+        'movies',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/movies(?:(?:/page/|/?\\?page=)(\\d+))?/?$',
+        'https://USER.newgrounds.com/movies',
+        'Extractor for all movies of a newgrounds user',
+    ),
+    (  # 490
+        'newgrounds',
+        'NewgroundsGamesExtractor',
+        'newgrounds',
+        'games',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/games(?:(?:/page/|/?\\?page=)(\\d+))?/?$',
+        'https://USER.newgrounds.com/games',
+        "Extractor for a newgrounds user's games",
+    ),
+    (  # 491
+        'newgrounds',
+        'NewgroundsUserExtractor',
+        'newgrounds',
+        'user',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/?$',
+        'https://USER.newgrounds.com',
+        'Extractor for a newgrounds user profile',
+    ),
+    (  # 492
+        'newgrounds',
+        'NewgroundsFavoriteExtractor',
+        'newgrounds',
+        'favorite',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites(?!/following)(?:/(art|audio|movies)(?:(?:/page/|/?\\?page=)(\\d+))?)?',
+        'https://USER.newgrounds.com/favorites',
+        'Extractor for posts favorited by a newgrounds user',
+    ),
+    (  # 493
+        'newgrounds',
+        'NewgroundsFollowingExtractor',
+        'newgrounds',
+        'following',
+        '',
+        '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites/(following)(?:(?:/page/|/?\\?page=)(\\d+))?',
+        'https://USER.newgrounds.com/favorites/following',
+        "Extractor for a newgrounds user's favorited users",
+    ),
+    (  # 494
+        'newgrounds',
+        'NewgroundsSearchExtractor',
+        'newgrounds',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?newgrounds\\.com/search/conduct/([^/?#]+)/?\\?([^#]+)',
+        'https://www.newgrounds.com/search/conduct/art?terms=QUERY',
+        'Extractor for newgrounds.com search reesults',
+    ),
+    (  # 495
+        'nhentai',
+        'NhentaiGalleryExtractor',
+        'nhentai',
+        'gallery',
+        '',
+        '(?:https?://)?nhentai\\.net/g/(\\d+)',
+        'https://nhentai.net/g/12345/',
+        'Extractor for image galleries from nhentai.net',
+    ),
+    (  # 496
+        'nhentai',
+        'NhentaiTagExtractor',
+        'nhentai',
+        'tag',
+        '',
+        '(?:https?://)?nhentai\\.net(/(?:artist|category|character|group|language|parody|tag)/[^/?#]+(?:/popular[^/?#]*)?/?)(?:\\?([^#]+))?',
+        'https://nhentai.net/tag/TAG/',
+        'Extractor for nhentai tag searches',
+    ),
+    (  # 497
+        'nhentai',
+        'NhentaiSearchExtractor',
+        'nhentai',
+        'search',
+        '',
+        '(?:https?://)?nhentai\\.net(/search/?)\\?([^#]+)',
+        'https://nhentai.net/search/?q=QUERY',
+        'Extractor for nhentai search results',
+    ),
+    (  # 498
+        'nhentai',
+        'NhentaiFavoriteExtractor',
+        'nhentai',
+        'favorite',
+        '',
+        '(?:https?://)?nhentai\\.net(/favorites/?)(?:\\?([^#]+))?',
+        'https://nhentai.net/favorites/',
+        'Extractor for nhentai favorites',
+    ),
+    (  # 499
+        'nijie',
+        'NijieUserExtractor',
+        '',
+        'user',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members\\.php\\?id=(\\d+)',
+        'https://nijie.info/members.php?id=12345',
+        'Extractor for nijie user profiles',
+    ),
+    (  # 500
+        'nijie',
+        'NijieIllustrationExtractor',
+        '',
+        'illustration',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_illust\\.php\\?id=(\\d+)',
+        'https://nijie.info/members_illust.php?id=12345',
+        'Extractor for all illustrations of a nijie-user',
+    ),
+    (  # 501
+        'nijie',
+        'NijieDoujinExtractor',
+        '',
+        'doujin',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_dojin\\.php\\?id=(\\d+)',
+        'https://nijie.info/members_dojin.php?id=12345',
+        'Extractor for doujin entries of a nijie user',
+    ),
+    (  # 502
+        'nijie',
+        'NijieFavoriteExtractor',
+        '',
+        'favorite',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/user_like_illust_view\\.php\\?id=(\\d+)',
+        'https://nijie.info/user_like_illust_view.php?id=12345',
+        'Extractor for all favorites/bookmarks of a nijie user',
+    ),
+    (  # 503
+        'nijie',
+        'NijieNuitaExtractor',
+        '',
+        'nuita',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/history_nuita\\.php\\?id=(\\d+)',
+        'https://nijie.info/history_nuita.php?id=12345',
+        "Extractor for a nijie user's 抜いた list",
+    ),
+    (  # 504
+        'nijie',
+        'NijieFeedExtractor',
+        '',
+        'feed',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_user_view\\.php',
+        'https://nijie.info/like_user_view.php',
+        'Extractor for nijie liked user feed',
+    ),
+    (  # 505
+        'nijie',
+        'NijieFollowedExtractor',
+        '',
+        'followed',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_my\\.php',
+        'https://nijie.info/like_my.php',
+        'Extractor for followed nijie users',
+    ),
+    (  # 506
+        'nijie',
+        'NijieImageExtractor',
+        '',
+        'image',
+        'Nijie',
+        '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/view(?:_popup)?\\.php\\?id=(\\d+)',
+        'https://nijie.info/view.php?id=12345',
+        'Extractor for a nijie work/image',
+    ),
+    (  # 507
+        'nitter',
+        'NitterTweetsExtractor',
+        '',
+        'tweets',
+        'nitter',
+        '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)(?:/tweets)?(?:$|\\?|#)',
+        'https://nitter.net/USER',
+        None,
+    ),
+    (  # 508
+        'nitter',
+        'NitterRepliesExtractor',
+        '',
+        'replies',
+        'nitter',
+        '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/with_replies',
+        'https://nitter.net/USER/with_replies',
+        None,
+    ),
+    (  # 509
+        'nitter',
+        'NitterMediaExtractor',
+        '',
+        'media',
+        'nitter',
+        '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/media',
+        'https://nitter.net/USER/media',
+        None,
+    ),
+    (  # 510
+        'nitter',
+        'NitterSearchExtractor',
+        '',
+        'search',
+        'nitter',
+        '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/search',
+        'https://nitter.net/USER/search',
+        None,
+    ),
+    (  # 511
+        'nitter',
+        'NitterTweetExtractor',
+        '',
+        'tweet',
+        'nitter',
+        '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i/web|[^/?#]+)/status/(\\d+())',
+        'https://nitter.net/USER/status/12345',
+        'Extractor for nitter tweets',
+    ),
+    (  # 512
+        'nozomi',
+        'NozomiPostExtractor',
+        'nozomi',
+        'post',
+        '',
+        '(?:https?://)?nozomi\\.la/post/(\\d+)',
+        'https://nozomi.la/post/12345.html',
+        'Extractor for individual posts on nozomi.la',
+    ),
+    (  # 513
+        'nozomi',
+        'NozomiIndexExtractor',
+        'nozomi',
+        'index',
+        '',
+        '(?:https?://)?nozomi\\.la/(?:(index(?:-Popular)?)-(\\d+)\\.html)?(?:$|#|\\?)',
+        'https://nozomi.la/index-1.html',
+        'Extractor for the nozomi.la index',
+    ),
+    (  # 514
+        'nozomi',
+        'NozomiTagExtractor',
+        'nozomi',
+        'tag',
+        '',
+        '(?:https?://)?nozomi\\.la/tag/([^/?#]+)-(\\d+)\\.',
+        'https://nozomi.la/tag/TAG-1.html',
+        'Extractor for posts from tag searches on nozomi.la',
+    ),
+    (  # 515
+        'nozomi',
+        'NozomiSearchExtractor',
+        'nozomi',
+        'search',
+        '',
+        '(?:https?://)?nozomi\\.la/search\\.html\\?q=([^&#]+)',
+        'https://nozomi.la/search.html?q=QUERY',
+        'Extractor for search results on nozomi.la',
+    ),
+    (  # 516
+        'nsfwalbum',
+        'NsfwalbumAlbumExtractor',
+        'nsfwalbum',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?nsfwalbum\\.com(/album/(\\d+))',
+        'https://nsfwalbum.com/album/12345',
+        'Extractor for image albums on nsfwalbum.com',
+    ),
+    (  # 517
+        'nudostar',
+        'NudostarModelExtractor',
+        'nudostar',
+        'model',
+        '',
+        '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/?)$',
+        'https://nudostar.tv/models/MODEL/',
+        'Extractor for NudoStar models',
+    ),
+    (  # 518
+        'nudostar',
+        'NudostarImageExtractor',
+        'nudostar',
+        'image',
+        '',
+        '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/(\\d+)/)',
+        'https://nudostar.tv/models/MODEL/123/',
+        'Extractor for NudoStar images',
+    ),
+    (  # 519
+        'okporn',
+        'OkpornGalleryExtractor',
+        'okporn',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?ok\\.porn/albums/(\\d+)',
+        'https://ok.porn/albums/12345/',
+        'Extractor for image galleries from ok.porn',
+    ),
+    (  # 520
+        'paheal',
+        'PahealTagExtractor',
+        'paheal',
+        'tag',
+        'shimmie2',
+        '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/list/([^/?#]+)',
+        'https://rule34.paheal.net/post/list/TAG/1',
+        'Extractor for images from rule34.paheal.net by search-tags',
+    ),
+    (  # 521
+        'paheal',
+        'PahealPostExtractor',
+        'paheal',
+        'post',
+        'shimmie2',
+        '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/view/(\\d+)',
+        'https://rule34.paheal.net/post/view/12345',
+        'Extractor for single images from rule34.paheal.net',
+    ),
+    (  # 522
+        'patreon',
+        'PatreonCollectionExtractor',
+        'patreon',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?patreon\\.com/collection/(\\d+)',
+        'https://www.patreon.com/collection/12345',
+        'Extractor for a patreon collection',
+    ),
+    (  # 523
+        'patreon',
+        'PatreonCreatorExtractor',
+        'patreon',
+        'creator',
+        '',
+        '(?:https?://)?(?:www\\.)?patreon\\.com/(?!(?:home|create|login|signup|search|posts|messages)(?:$|[/?#]))(?:profile/creators|(?:cw?/)?([^/?#]+)(?:/posts)?)/?(?:\\?([^#]+))?',
+        'https://www.patreon.com/c/USER',
+        "Extractor for a creator's works",
+    ),
+    (  # 524
+        'patreon',
+        'PatreonUserExtractor',
+        'patreon',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?patreon\\.com/home$',
+        'https://www.patreon.com/home',
+        'Extractor for media from creators supported by you',
+    ),
+    (  # 525
+        'patreon',
+        'PatreonPostExtractor',
+        'patreon',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?patreon\\.com/posts/([^/?#]+)',
+        'https://www.patreon.com/posts/TITLE-12345',
+        'Extractor for media from a single post',
+    ),
+    (  # 526
+        'pexels',
+        'PexelsCollectionExtractor',
+        'pexels',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?pexels\\.com/collections/((?:[^/?#]*-)?(\\w+))',
+        'https://www.pexels.com/collections/SLUG-a1b2c3/',
+        'Extractor for a pexels.com collection',
+    ),
+    (  # 527
+        'pexels',
+        'PexelsSearchExtractor',
+        'pexels',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?pexels\\.com/search/([^/?#]+)',
+        'https://www.pexels.com/search/QUERY/',
+        'Extractor for pexels.com search results',
+    ),
+    (  # 528
+        'pexels',
+        'PexelsUserExtractor',
+        'pexels',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?pexels\\.com/(@(?:(?:[^/?#]*-)?(\\d+)|[^/?#]+))',
+        'https://www.pexels.com/@USER-12345/',
+        'Extractor for pexels.com user galleries',
+    ),
+    (  # 529
+        'pexels',
+        'PexelsImageExtractor',
+        'pexels',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?pexels\\.com/photo/((?:[^/?#]*-)?\\d+)',
+        'https://www.pexels.com/photo/SLUG-12345/',
+        None,
+    ),
+    (  # 530
+        'philomena',
+        'PhilomenaPostExtractor',
+        '',
+        'post',
+        'philomena',
+        '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:images/)?(\\d+)',
+        'https://derpibooru.org/images/12345',
+        'Extractor for single posts on a Philomena booru',
+    ),
+    (  # 531
+        'philomena',
+        'PhilomenaSearchExtractor',
+        '',
+        'search',
+        'philomena',
+        '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:search/?\\?([^#]+)|tags/([^/?#]+))',
+        'https://derpibooru.org/search?q=QUERY',
+        'Extractor for Philomena search results',
+    ),
+    (  # 532
+        'philomena',
+        'PhilomenaGalleryExtractor',
+        '',
+        'gallery',
+        'philomena',
+        '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/galleries/(\\d+)',
+        'https://derpibooru.org/galleries/12345',
+        'Extractor for Philomena galleries',
+    ),
+    (  # 533
+        'photovogue',
+        'PhotovogueUserExtractor',
+        'photovogue',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?vogue\\.com/photovogue/photographers/(\\d+)',
+        'https://www.vogue.com/photovogue/photographers/12345',
+        None,
+    ),
+    (  # 534
+        'picarto',
+        'PicartoGalleryExtractor',
+        'picarto',
+        'gallery',
+        '',
+        '(?:https?://)?picarto\\.tv/([^/?#]+)/gallery',
+        'https://picarto.tv/USER/gallery/TITLE/',
+        'Extractor for picarto galleries',
+    ),
+    (  # 535
+        'picazor',
+        'PicazorUserExtractor',
+        'picazor',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?picazor\\.com/[a-z]{2}/([^/?#]+)',
+        'https://picazor.com/en/USERNAME',
+        'Extractor for picazor users',
+    ),
+    (  # 536
+        'pictoa',
+        'PictoaImageExtractor',
+        'pictoa',
+        'image',
+        '',
+        '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+)/(\\d+)',
+        'https://www.pictoa.com/albums/NAME-12345/12345.html',
+        'Extractor for single images from pictoa.com',
+    ),
+    (  # 537
+        'pictoa',
+        'PictoaAlbumExtractor',
+        'pictoa',
+        'album',
+        '',
+        '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+).html',
+        'https://www.pictoa.com/albums/NAME-12345.html',
+        'Extractor for image albums from pictoa.com',
+    ),
+    (  # 538
+        'piczel',
+        'PiczelUserExtractor',
+        'piczel',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/([^/?#]+)/?$',
+        'https://piczel.tv/gallery/USER',
+        "Extractor for all images from a user's gallery",
+    ),
+    (  # 539
+        'piczel',
+        'PiczelFolderExtractor',
+        'piczel',
+        'folder',
+        '',
+        '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/(?!image/)[^/?#]+/(\\d+)',
+        'https://piczel.tv/gallery/USER/12345',
+        "Extractor for images inside a user's folder",
+    ),
+    (  # 540
+        'piczel',
+        'PiczelImageExtractor',
+        'piczel',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/image/(\\d+)',
+        'https://piczel.tv/gallery/image/12345',
+        'Extractor for individual images',
+    ),
+    (  # 541
+        'pillowfort',
+        'PillowfortPostExtractor',
+        'pillowfort',
+        'post',
+        '',
+        '(?:https?://)?www\\.pillowfort\\.social/posts/(\\d+)',
+        'https://www.pillowfort.social/posts/12345',
+        'Extractor for a single pillowfort post',
+    ),
+    (  # 542
+        'pillowfort',
+        'PillowfortUserExtractor',
+        'pillowfort',
+        'user',
+        '',
+        '(?:https?://)?www\\.pillowfort\\.social/(?!posts/)([^/?#]+(?:/tagged/[^/?#]+)?)',
+        'https://www.pillowfort.social/USER',
+        'Extractor for all posts of a pillowfort user',
+    ),
+    (  # 543
+        'pinterest',
+        'PinterestUserExtractor',
+        'pinterest',
+        'user',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)(?:/_saved)?/?$',
+        'https://www.pinterest.com/USER/',
+        "Extractor for a user's boards",
+    ),
+    (  # 544
+        'pinterest',
+        'PinterestAllpinsExtractor',
+        'pinterest',
+        'allpins',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/pins/?$',
+        'https://www.pinterest.com/USER/pins/',
+        "Extractor for a user's 'All Pins' feed",
+    ),
+    (  # 545
+        'pinterest',
+        'PinterestCreatedExtractor',
+        'pinterest',
+        'created',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/_created/?$',
+        'https://www.pinterest.com/USER/_created/',
+        "Extractor for a user's created pins",
+    ),
+    (  # 546
+        'pinterest',
+        'PinterestSectionExtractor',
+        'pinterest',
+        'section',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/([^/?#]+)',
+        'https://www.pinterest.com/USER/BOARD/SECTION',
+        'Extractor for board sections on pinterest.com',
+    ),
+    (  # 547
+        'pinterest',
+        'PinterestSearchExtractor',
+        'pinterest',
+        'search',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/search/pins/?\\?q=([^&#]+)',
+        'https://www.pinterest.com/search/pins/?q=QUERY',
+        'Extractor for Pinterest search results',
+    ),
+    (  # 548
+        'pinterest',
+        'PinterestPinExtractor',
+        'pinterest',
+        'pin',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+)(?!.*#related$)',
+        'https://www.pinterest.com/pin/12345/',
+        'Extractor for images from a single pin from pinterest.com',
+    ),
+    (  # 549
+        'pinterest',
+        'PinterestBoardExtractor',
+        'pinterest',
+        'board',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?(?!.*#related$)',
+        'https://www.pinterest.com/USER/BOARD/',
+        'Extractor for images from a board from pinterest.com',
+    ),
+    (  # 550
+        'pinterest',
+        'PinterestRelatedPinExtractor',
+        'pinterest',
+        'related-pin',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+).*#related$',
+        'https://www.pinterest.com/pin/12345/#related',
+        'Extractor for related pins of another pin from pinterest.com',
+    ),
+    (  # 551
+        'pinterest',
+        'PinterestRelatedBoardExtractor',
+        'pinterest',
+        'related-board',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?#related$',
+        'https://www.pinterest.com/USER/BOARD/#related',
+        'Extractor for related pins of a board from pinterest.com',
+    ),
+    (  # 552
+        'pinterest',
+        'PinterestPinitExtractor',
+        'pinterest',
+        'pinit',
+        '',
+        '(?:https?://)?pin\\.it/([^/?#]+)',
+        'https://pin.it/abcde',
+        'Extractor for images from a pin.it URL',
+    ),
+    (  # 553
+        'pixeldrain',
+        'PixeldrainFileExtractor',
+        'pixeldrain',
+        'file',
+        '',
+        '(?:https?://)?pixeldrain\\.com/(?:u|api/file)/(\\w+)',
+        'https://pixeldrain.com/u/abcdefgh',
+        'Extractor for pixeldrain files',
+    ),
+    (  # 554
+        'pixeldrain',
+        'PixeldrainAlbumExtractor',
+        'pixeldrain',
+        'album',
+        '',
+        '(?:https?://)?pixeldrain\\.com/(?:l|api/list)/(\\w+)(?:#item=(\\d+))?',
+        'https://pixeldrain.com/l/abcdefgh',
+        'Extractor for pixeldrain albums',
+    ),
+    (  # 555
+        'pixeldrain',
+        'PixeldrainFolderExtractor',
+        'pixeldrain',
+        'folder',
+        '',
+        '(?:https?://)?pixeldrain\\.com/(?:d|api/filesystem)/([^?]+)',
+        'https://pixeldrain.com/d/abcdefgh',
+        'Extractor for pixeldrain filesystem files and directories',
+    ),
+    (  # 556
+        'pixiv',
+        'PixivUserExtractor',
+        'pixiv',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?u(?:sers)?/|member\\.php\\?id=|(?:mypage\\.php)?#id=)(\\d+)(?:$|[?#])',
+        'https://www.pixiv.net/en/users/12345',
+        'Extractor for a pixiv user profile',
+    ),
+    (  # 557
+        'pixiv',
+        'PixivArtworksExtractor',
+        'pixiv',
+        'artworks',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(?:artworks|illustrations|manga)(?:/([^/?#]+))?/?(?:$|[?#])|member_illust\\.php\\?id=(\\d+)(?:&([^#]+))?)',
+        'https://www.pixiv.net/en/users/12345/artworks',
+        'Extractor for artworks of a pixiv user',
+    ),
+    (  # 558
+        'pixiv',
+        'PixivAvatarExtractor',
+        'pixiv',
+        'avatar',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/avatar',
+        'https://www.pixiv.net/en/users/12345/avatar',
+        'Extractor for pixiv avatars',
+    ),
+    (  # 559
+        'pixiv',
+        'PixivBackgroundExtractor',
+        'pixiv',
+        'background',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/background',
+        'https://www.pixiv.net/en/users/12345/background',
+        'Extractor for pixiv background banners',
+    ),
+    (  # 560
+        'pixiv',
+        'PixivMeExtractor',
+        'pixiv',
+        'me',
+        '',
+        '(?:https?://)?pixiv\\.me/([^/?#]+)',
+        'https://pixiv.me/USER',
+        'Extractor for pixiv.me URLs',
+    ),
+    (  # 561
+        'pixiv',
+        'PixivWorkExtractor',
+        'pixiv',
+        'work',
+        '',
+        '(?:https?://)?(?:(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?artworks/|member_illust\\.php\\?(?:[^&]+&)*illust_id=)(\\d+)|(?:i(?:\\d+\\.pixiv|\\.pximg)\\.net/(?:(?:.*/)?img-[^/]+/img/\\d{4}(?:/\\d\\d){5}|img\\d+/img/[^/]+)|img\\d*\\.pixiv\\.net/img/[^/]+|(?:www\\.)?pixiv\\.net/i)/(\\d+))',
+        'https://www.pixiv.net/artworks/12345',
+        'Extractor for a single pixiv work/illustration',
+    ),
+    (  # 562
+        'pixiv',
+        'PixivUnlistedExtractor',
+        'pixiv',
+        'unlisted',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?artworks/unlisted/(\\w+)',
+        'https://www.pixiv.net/en/artworks/unlisted/a1b2c3d4e5f6g7h8i9j0',
+        'Extractor for a unlisted pixiv illustrations',
+    ),
+    (  # 563
+        'pixiv',
+        'PixivFavoriteExtractor',
+        'pixiv',
+        'favorite',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(bookmarks/artworks|following)(?:/([^/?#]+))?|bookmark\\.php)(?:\\?([^#]*))?',
+        'https://www.pixiv.net/en/users/12345/bookmarks/artworks',
+        'Extractor for all favorites/bookmarks of a pixiv user',
+    ),
+    (  # 564
+        'pixiv',
+        'PixivRankingExtractor',
+        'pixiv',
+        'ranking',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/ranking\\.php(?:\\?([^#]*))?',
+        'https://www.pixiv.net/ranking.php',
+        'Extractor for pixiv ranking pages',
+    ),
+    (  # 565
+        'pixiv',
+        'PixivSearchExtractor',
+        'pixiv',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?tags/([^/?#]+)(?:/[^/?#]+)?/?|search\\.php)(?:\\?([^#]+))?',
+        'https://www.pixiv.net/en/tags/TAG',
+        'Extractor for pixiv search results',
+    ),
+    (  # 566
+        'pixiv',
+        'PixivFollowExtractor',
+        'pixiv',
+        'follow',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/bookmark_new_illust\\.php',
+        'https://www.pixiv.net/bookmark_new_illust.php',
+        'Extractor for new illustrations from your followed artists',
+    ),
+    (  # 567
+        'pixiv',
+        'PixivPixivisionExtractor',
+        'pixiv',
+        'pixivision',
+        '',
+        '(?:https?://)?(?:www\\.)?pixivision\\.net/(?:en/)?a/(\\d+)',
+        'https://www.pixivision.net/en/a/12345',
+        'Extractor for illustrations from a pixivision article',
+    ),
+    (  # 568
+        'pixiv',
+        'PixivSeriesExtractor',
+        'pixiv',
+        'series',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/user/(\\d+)/series/(\\d+)',
+        'https://www.pixiv.net/user/12345/series/12345',
+        'Extractor for illustrations from a Pixiv series',
+    ),
+    (  # 569
+        'pixiv',
+        'PixivSketchExtractor',
+        'pixiv',
+        'sketch',
+        '',
+        '(?:https?://)?sketch\\.pixiv\\.net/@([^/?#]+)',
+        'https://sketch.pixiv.net/@USER',
+        'Extractor for user pages on sketch.pixiv.net',
+    ),
+    (  # 570
+        'pixiv',
+        'PixivNovelNovelExtractor',
+        'pixiv-novel',
+        'novel',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/n(?:ovel/show\\.php\\?id=|/)(\\d+)',
+        'https://www.pixiv.net/novel/show.php?id=12345',
+        'Extractor for pixiv novels',
+    ),
+    (  # 571
+        'pixiv',
+        'PixivNovelUserExtractor',
+        'pixiv-novel',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/novels',
+        'https://www.pixiv.net/en/users/12345/novels',
+        "Extractor for pixiv users' novels",
+    ),
+    (  # 572
+        'pixiv',
+        'PixivNovelSeriesExtractor',
+        'pixiv-novel',
+        'series',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/novel/series/(\\d+)',
+        'https://www.pixiv.net/novel/series/12345',
+        'Extractor for pixiv novel series',
+    ),
+    (  # 573
+        'pixiv',
+        'PixivNovelBookmarkExtractor',
+        'pixiv-novel',
+        'bookmark',
+        '',
+        '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/bookmarks/novels(?:/([^/?#]+))?(?:/?\\?([^#]+))?',
+        'https://www.pixiv.net/en/users/12345/bookmarks/novels',
+        'Extractor for bookmarked pixiv novels',
+    ),
+    (  # 574
+        'pixnet',
+        'PixnetImageExtractor',
+        'pixnet',
+        'image',
+        '',
+        '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/photo/(\\d+)',
+        'https://USER.pixnet.net/album/photo/12345',
+        'Extractor for a single photo from pixnet.net',
+    ),
+    (  # 575
+        'pixnet',
+        'PixnetSetExtractor',
+        'pixnet',
+        'set',
+        '',
+        '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/set/(\\d+)',
+        'https://USER.pixnet.net/album/set/12345',
+        'Extractor for images from a pixnet set',
+    ),
+    (  # 576
+        'pixnet',
+        'PixnetFolderExtractor',
+        'pixnet',
+        'folder',
+        '',
+        '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/folder/(\\d+)',
+        'https://USER.pixnet.net/album/folder/12345',
+        'Extractor for all sets in a pixnet folder',
+    ),
+    (  # 577
+        'pixnet',
+        'PixnetUserExtractor',
+        'pixnet',
+        'user',
+        '',
+        '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net()(?:/blog|/album(?:/list)?)?/?(?:$|[?#])',
+        'https://USER.pixnet.net/',
+        'Extractor for all sets and folders of a pixnet user',
+    ),
+    (  # 578
+        'plurk',
+        'PlurkTimelineExtractor',
+        'plurk',
+        'timeline',
+        '',
+        '(?:https?://)?(?:www\\.)?plurk\\.com/(?!p/)(\\w+)/?(?:$|[?#])',
+        'https://www.plurk.com/USER',
+        'Extractor for URLs from all posts in a Plurk timeline',
+    ),
+    (  # 579
+        'plurk',
+        'PlurkPostExtractor',
+        'plurk',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?plurk\\.com/p/(\\w+)',
+        'https://www.plurk.com/p/12345',
+        'Extractor for URLs from a Plurk post',
+    ),
+    (  # 580
+        'poipiku',
+        'PoipikuUserExtractor',
+        'poipiku',
+        'user',
+        '',
+        '(?:https?://)?poipiku\\.com/(?:IllustListPcV\\.jsp\\?PG=(\\d+)&ID=)?(\\d+)/?(?:$|[?&#])',
+        'https://poipiku.com/12345/',
+        'Extractor for posts from a poipiku user',
+    ),
+    (  # 581
+        'poipiku',
+        'PoipikuPostExtractor',
+        'poipiku',
+        'post',
+        '',
+        '(?:https?://)?poipiku\\.com/(\\d+)/(\\d+)',
+        'https://poipiku.com/12345/12345.html',
+        'Extractor for a poipiku post',
+    ),
+    (  # 582
+        'poringa',
+        'PoringaPostExtractor',
+        'poringa',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?poringa\\.net/posts/imagenes/(\\d+)',
+        'http://www.poringa.net/posts/imagenes/12345/TITLE.html',
+        'Extractor for posts on poringa.net',
+    ),
+    (  # 583
+        'poringa',
+        'PoringaUserExtractor',
+        'poringa',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?poringa\\.net/(\\w+)$',
+        'http://www.poringa.net/USER',
+        None,
+    ),
+    (  # 584
+        'poringa',
+        'PoringaSearchExtractor',
+        'poringa',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?poringa\\.net/buscar/\\?&?q=([^&#]+)',
+        'http://www.poringa.net/buscar/?q=QUERY',
+        None,
+    ),
+    (  # 585
+        'pornhub',
+        'PornhubGalleryExtractor',
+        'pornhub',
+        'gallery',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/album/(\\d+)',
+        'https://www.pornhub.com/album/12345',
+        'Extractor for image galleries on pornhub.com',
+    ),
+    (  # 586
+        'pornhub',
+        'PornhubGifExtractor',
+        'pornhub',
+        'gif',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/gif/(\\d+)',
+        'https://www.pornhub.com/gif/12345',
+        'Extractor for pornhub.com gifs',
+    ),
+    (  # 587
+        'pornhub',
+        'PornhubUserExtractor',
+        'pornhub',
+        'user',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/?$',
+        'https://www.pornhub.com/model/USER',
+        'Extractor for a pornhub user',
+    ),
+    (  # 588
+        'pornhub',
+        'PornhubPhotosExtractor',
+        'pornhub',
+        'photos',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(photos(?:/[^/?#]+)?)',
+        'https://www.pornhub.com/model/USER/photos',
+        'Extractor for all galleries of a pornhub user',
+    ),
+    (  # 589
+        'pornhub',
+        'PornhubGifsExtractor',
+        'pornhub',
+        'gifs',
+        '',
+        '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(gifs(?:/[^/?#]+)?)',
+        'https://www.pornhub.com/model/USER/gifs',
+        "Extractor for a pornhub user's gifs",
+    ),
+    (  # 590
+        'pornpics',
+        'PornpicsGalleryExtractor',
+        'pornpics',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/galleries/((?:[^/?#]+-)?(\\d+))',
+        'https://www.pornpics.com/galleries/TITLE-12345/',
+        'Extractor for pornpics galleries',
+    ),
+    (  # 591
+        'pornpics',
+        'PornpicsTagExtractor',
+        'pornpics',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/tags/([^/?#]+)',
+        'https://www.pornpics.com/tags/TAGS/',
+        'Extractor for galleries from pornpics tag searches',
+    ),
+    (  # 592
+        'pornpics',
+        'PornpicsSearchExtractor',
+        'pornpics',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(?:\\?q=|pornstars/|channels/)([^/&#]+)',
+        'https://www.pornpics.com/?q=QUERY',
+        'Extractor for galleries from pornpics search results',
+    ),
+    (  # 593
+        'pornpics',
+        'PornpicsListingExtractor',
+        'pornpics',
+        'listing',
+        '',
+        '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(popular|recent|rating|likes|views|comments)/?$',
+        'https://www.pornpics.com/popular/',
+        "Extractor for galleries from pornpics listing pages\n\n    These pages (popular, recent, etc.) don't support JSON pagination\n    and use single quotes in HTML, unlike category pages.\n    ",
+    ),
+    (  # 594
+        'pornpics',
+        'PornpicsCategoryExtractor',
+        'pornpics',
+        'category',
+        '',
+        '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/([^/?#]+)/?$',
+        'https://www.pornpics.com/ass/',
+        'Extractor for galleries from pornpics categories',
+    ),
+    (  # 595
+        'pornstarstube',
+        'PornstarstubeGalleryExtractor',
+        'pornstarstube',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?pornstars\\.tube/albums/(\\d+)(?:/([\\w-]+))?',
+        'https://pornstars.tube/albums/12345/SLUG/',
+        'Extractor for image galleries from pornstars.tube',
+    ),
+    (  # 596
+        'postmill',
+        'PostmillPostExtractor',
+        '',
+        'post',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))/f/(\\w+)/(\\d+)',
+        'https://raddle.me/f/FORUM/123/TITLE',
+        'Extractor for a single submission URL',
+    ),
+    (  # 597
+        'postmill',
+        'PostmillShortURLExtractor',
+        '',
+        'shorturl',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/\\d+)$',
+        'https://raddle.me/123',
+        'Extractor for short submission URLs',
+    ),
+    (  # 598
+        'postmill',
+        'PostmillHomeExtractor',
+        '',
+        'home',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/(?:featured|subscribed|all)?)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$',
+        'https://raddle.me/',
+        'Extractor for the home page',
+    ),
+    (  # 599
+        'postmill',
+        'PostmillForumExtractor',
+        '',
+        'forum',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/f/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$',
+        'https://raddle.me/f/FORUM',
+        'Extractor for submissions on a forum',
+    ),
+    (  # 600
+        'postmill',
+        'PostmillUserSubmissionsExtractor',
+        '',
+        'usersubmissions',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/user/\\w+/submissions)()(?:\\?([^#]+))?$',
+        'https://raddle.me/user/USER/submissions',
+        'Extractor for submissions made by a user',
+    ),
+    (  # 601
+        'postmill',
+        'PostmillTagExtractor',
+        '',
+        'tag',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/tag/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$',
+        'https://raddle.me/tag/TAG',
+        'Extractor for submissions on a forum with a specific tag',
+    ),
+    (  # 602
+        'postmill',
+        'PostmillSearchExtractor',
+        '',
+        'search',
+        'postmill',
+        '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/search)()\\?(q=[^#]+)$',
+        'https://raddle.me/search?q=QUERY',
+        'Extractor for search results',
+    ),
+    (  # 603
+        'rawkuma',
+        'RawkumaChapterExtractor',
+        'rawkuma',
+        'chapter',
+        '',
+        '(?:https?://)?rawkuma\\.(?:net|com)(/manga/[^/?#]+/chapter-\\d+(?:.\\d+)?\\.(\\d+))',
+        'https://rawkuma.net/manga/7TITLE/chapter-123.321',
+        'Extractor for manga chapters from rawkuma.net',
+    ),
+    (  # 604
+        'rawkuma',
+        'RawkumaMangaExtractor',
+        'rawkuma',
+        'manga',
+        '',
+        '(?:https?://)?rawkuma\\.(?:net|com)/manga/([^/?#]+)',
+        'https://rawkuma.net/manga/TITLE/',
+        'Extractor for manga from rawkuma.net',
+    ),
+    (  # 605
+        'reactor',
+        'ReactorTagExtractor',
+        '',
+        'tag',
+        'reactor',
+        '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/tag/([^/?#]+)(?:/[^/?#]+)?',
+        'http://reactor.cc/tag/TAG',
+        'Extractor for tag searches on *reactor.cc sites',
+    ),
+    (  # 606
+        'reactor',
+        'ReactorSearchExtractor',
+        '',
+        'search',
+        'reactor',
+        '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/search(?:/|\\?q=)([^/?#]+)',
+        'http://reactor.cc/search?q=QUERY',
+        'Extractor for search results on *reactor.cc sites',
+    ),
+    (  # 607
+        'reactor',
+        'ReactorUserExtractor',
+        '',
+        'user',
+        'reactor',
+        '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/user/([^/?#]+)',
+        'http://reactor.cc/user/USER',
+        'Extractor for all posts of a user on *reactor.cc sites',
+    ),
+    (  # 608
+        'reactor',
+        'ReactorPostExtractor',
+        '',
+        'post',
+        'reactor',
+        '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/post/(\\d+)',
+        'http://reactor.cc/post/12345',
+        'Extractor for single posts on *reactor.cc sites',
+    ),
+    (  # 609
+        'readcomiconline',
+        'ReadcomiconlineIssueExtractor',
+        'readcomiconline',
+        'issue',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/[^/?#]+\\?)([^#]+)',
+        'https://readcomiconline.li/Comic/TITLE/Issue-123?id=12345',
+        'Extractor for comic-issues from readcomiconline.li',
+    ),
+    (  # 610
+        'readcomiconline',
+        'ReadcomiconlineComicExtractor',
+        'readcomiconline',
+        'comic',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/?)$',
+        'https://readcomiconline.li/Comic/TITLE',
+        'Extractor for comics from readcomiconline.li',
+    ),
+    (  # 611
+        'realbooru',
+        'RealbooruTagExtractor',
+        'realbooru',
+        'tag',
+        'booru',
+        '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=list&tags=([^&#]*)',
+        'https://realbooru.com/index.php?page=post&s=list&tags=TAG',
+        None,
+    ),
+    (  # 612
+        'realbooru',
+        'RealbooruFavoriteExtractor',
+        'realbooru',
+        'favorite',
+        'booru',
+        '(?:https?://)?realbooru\\.com/index\\.php\\?page=favorites&s=view&id=(\\d+)',
+        'https://realbooru.com/index.php?page=favorites&s=view&id=12345',
+        None,
+    ),
+    (  # 613
+        'realbooru',
+        'RealbooruPoolExtractor',
+        'realbooru',
+        'pool',
+        'booru',
+        '(?:https?://)?realbooru\\.com/index\\.php\\?page=pool&s=show&id=(\\d+)',
+        'https://realbooru.com/index.php?page=pool&s=show&id=12345',
+        None,
+    ),
+    (  # 614
+        'realbooru',
+        'RealbooruPostExtractor',
+        'realbooru',
+        'post',
+        'booru',
+        '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=view&id=(\\d+)',
+        'https://realbooru.com/index.php?page=post&s=view&id=12345',
+        None,
+    ),
+    (  # 615
+        'reddit',
+        'RedditSubredditExtractor',
+        'reddit',
+        'subreddit',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?reddit\\.com(/r/[^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)',
+        'https://www.reddit.com/r/SUBREDDIT/',
+        'Extractor for URLs from subreddits on reddit.com',
+    ),
+    (  # 616
+        'reddit',
+        'RedditHomeExtractor',
+        'reddit',
+        'home',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?reddit\\.com((?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)',
+        'https://www.reddit.com/',
+        'Extractor for submissions from your home feed on reddit.com',
+    ),
+    (  # 617
+        'reddit',
+        'RedditUserExtractor',
+        'reddit',
+        'user',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?reddit\\.com/u(?:ser)?/([^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?$',
+        'https://www.reddit.com/user/USER/',
+        'Extractor for URLs from posts by a reddit user',
+    ),
+    (  # 618
+        'reddit',
+        'RedditSubmissionExtractor',
+        'reddit',
+        'submission',
+        '',
+        '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(?:(?:r|u|user)/[^/?#]+/)?comments|gallery)|redd\\.it)/([a-z0-9]+)',
+        'https://www.reddit.com/r/SUBREDDIT/comments/id/',
+        'Extractor for URLs from a submission on reddit.com',
+    ),
+    (  # 619
+        'reddit',
+        'RedditImageExtractor',
+        'reddit',
+        'image',
+        '',
+        '(?:https?://)?((?:i|preview)\\.redd\\.it|i\\.reddituploads\\.com)/([^/?#]+)(\\?[^#]*)?',
+        'https://i.redd.it/NAME.EXT',
+        'Extractor for reddit-hosted images',
+    ),
+    (  # 620
+        'reddit',
+        'RedditRedirectExtractor',
+        'reddit',
+        'redirect',
+        '',
+        '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(r|u|user)/([^/?#]+)))/s/([a-zA-Z0-9]{10})',
+        'https://www.reddit.com/r/SUBREDDIT/s/abc456GHIJ',
+        'Extractor for personalized share URLs produced by the mobile app',
+    ),
+    (  # 621
+        'redgifs',
+        'RedgifsUserExtractor',
+        'redgifs',
+        'user',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/users/([^/?#]+)/?(?:\\?([^#]+))?$',
+        'https://www.redgifs.com/users/USER',
+        'Extractor for redgifs user profiles',
+    ),
+    (  # 622
+        'redgifs',
+        'RedgifsCollectionExtractor',
+        'redgifs',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/([^/?#]+)',
+        'https://www.redgifs.com/users/USER/collections/ID',
+        'Extractor for an individual user collection',
+    ),
+    (  # 623
+        'redgifs',
+        'RedgifsCollectionsExtractor',
+        'redgifs',
+        'collections',
+        '',
+        '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/?$',
+        'https://www.redgifs.com/users/USER/collections',
+        'Extractor for redgifs user collections',
+    ),
+    (  # 624
+        'redgifs',
+        'RedgifsNichesExtractor',
+        'redgifs',
+        'niches',
+        '',
+        '(?:https?://)?(?:www\\.)?redgifs\\.com/niches/([^/?#]+)/?(?:\\?([^#]+))?$',
+        'https://www.redgifs.com/niches/NAME',
+        'Extractor for redgifs niches',
+    ),
+    (  # 625
+        'redgifs',
+        'RedgifsSearchExtractor',
+        'redgifs',
+        'search',
+        '',
+        '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/(?:gifs/([^/?#]+)|search(?:/gifs)?()|browse)(?:/?\\?([^#]+))?',
+        'https://www.redgifs.com/gifs/TAG',
+        'Extractor for redgifs search results',
+    ),
+    (  # 626
+        'redgifs',
+        'RedgifsImageExtractor',
+        'redgifs',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:\\w+\\.)?redgifs\\.com/(?:watch|ifr)|(?:\\w+\\.)?gfycat\\.com(?:/gifs/detail|/\\w+)?|(?:www\\.)?gifdeliverynetwork\\.com|i\\.redgifs\\.com/i)/([A-Za-z0-9]+)',
+        'https://redgifs.com/watch/ID',
+        'Extractor for individual gifs from redgifs.com',
+    ),
+    (  # 627
+        'rule34us',
+        'Rule34usTagExtractor',
+        'rule34us',
+        'tag',
+        'booru',
+        '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/index&q=([^&#]*)',
+        'https://rule34.us/index.php?r=posts/index&q=TAG',
+        None,
+    ),
+    (  # 628
+        'rule34us',
+        'Rule34usPostExtractor',
+        'rule34us',
+        'post',
+        'booru',
+        '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/view&id=(\\d+)',
+        'https://rule34.us/index.php?r=posts/view&id=12345',
+        None,
+    ),
+    (  # 629
+        'rule34vault',
+        'Rule34vaultPostExtractor',
+        'rule34vault',
+        'post',
+        'booru',
+        '(?:https?://)?rule34vault\\.com/post/(\\d+)',
+        'https://rule34vault.com/post/12345',
+        None,
+    ),
+    (  # 630
+        'rule34vault',
+        'Rule34vaultPlaylistExtractor',
+        'rule34vault',
+        'playlist',
+        'booru',
+        '(?:https?://)?rule34vault\\.com/playlists/view/(\\d+)',
+        'https://rule34vault.com/playlists/view/12345',
+        None,
+    ),
+    (  # 631
+        'rule34vault',
+        'Rule34vaultTagExtractor',
+        'rule34vault',
+        'tag',
+        'booru',
+        '(?:https?://)?rule34vault\\.com/(?!p(?:ost|laylists)/)([^/?#]+)',
+        'https://rule34vault.com/TAG',
+        None,
+    ),
+    (  # 632
+        'rule34xyz',
+        'Rule34xyzPostExtractor',
+        'rule34xyz',
+        'post',
+        'booru',
+        '(?:https?://)?rule34\\.xyz/post/(\\d+)',
+        'https://rule34.xyz/post/12345',
+        None,
+    ),
+    (  # 633
+        'rule34xyz',
+        'Rule34xyzPlaylistExtractor',
+        'rule34xyz',
+        'playlist',
+        'booru',
+        '(?:https?://)?rule34\\.xyz/playlists/view/(\\d+)',
+        'https://rule34.xyz/playlists/view/12345',
+        None,
+    ),
+    (  # 634
+        'rule34xyz',
+        'Rule34xyzTagExtractor',
+        'rule34xyz',
+        'tag',
+        'booru',
+        '(?:https?://)?rule34\\.xyz/([^/?#]+)$',
+        'https://rule34.xyz/TAG',
+        None,
+    ),
+    (  # 635
+        's3ndpics',
+        'S3ndpicsPostExtractor',
+        's3ndpics',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?s3nd\\.pics/post/([0-9a-f]+)',
+        'https://s3nd.pics/post/0123456789abcdef01234567',
+        None,
+    ),
+    (  # 636
+        's3ndpics',
+        'S3ndpicsUserExtractor',
+        's3ndpics',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?s3nd\\.pics/user/(\\w+)',
+        'https://s3nd.pics/user/USER',
+        None,
+    ),
+    (  # 637
+        's3ndpics',
+        'S3ndpicsSearchExtractor',
+        's3ndpics',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?s3nd\\.pics/search/?\\?([^#]+)',
+        'https://s3nd.pics/search?QUERY',
+        None,
+    ),
+    (  # 638
+        'saint',
+        'SaintAlbumExtractor',
+        'saint',
+        'album',
+        'lolisafe',
+        '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)/a/([^/?#]+)',
+        'https://saint2.su/a/ID',
+        'Extractor for saint albums',
+    ),
+    (  # 639
+        'saint',
+        'SaintMediaExtractor',
+        'saint',
+        'media',
+        'lolisafe',
+        '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)(/(embe)?d/([^/?#]+))',
+        'https://saint2.su/embed/ID',
+        'Extractor for saint media links',
+    ),
+    (  # 640
+        'sankaku',
+        'SankakuPostExtractor',
+        'sankaku',
+        'post',
+        '',
+        'https?://(?:www\\.)?(idolcomplex\\.com|sankaku\\.app)/posts/(\\w+)',
+        None,
+        '\n    Специальный экстрактор для отдельных постов Sankaku/IdolComplex.\n    Использует /fu API для получения прямой ссылки.\n    Должен стоять ПЕРВЫМ в файле.\n    ',
+    ),
+    (  # 641
+        'sankakucomplex',
+        'SankakucomplexArticleExtractor',
+        'sankakucomplex',
+        'article',
+        '',
+        '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/(\\d\\d\\d\\d/\\d\\d/\\d\\d/[^/?#]+)',
+        'https://news.sankakucomplex.com/1970/01/01/TITLE',
+        'Extractor for articles on news.sankakucomplex.com',
+    ),
+    (  # 642
+        'sankakucomplex',
+        'SankakucomplexTagExtractor',
+        'sankakucomplex',
+        'tag',
+        '',
+        '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/((?:tag|category|author)/[^/?#]+)',
+        'https://news.sankakucomplex.com/tag/TAG/',
+        'Extractor for sankakucomplex blog articles by tag or author',
+    ),
+    (  # 643
+        'schalenetwork',
+        'SchalenetworkGalleryExtractor',
+        'schalenetwork',
+        'gallery',
+        '',
+        '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:g|reader)/(\\d+)/(\\w+)',
+        'https://niyaniya.moe/g/12345/67890abcde/',
+        'Extractor for schale.network galleries',
+    ),
+    (  # 644
+        'schalenetwork',
+        'SchalenetworkSearchExtractor',
+        'schalenetwork',
+        'search',
+        '',
+        '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$',
+        'https://niyaniya.moe/browse?s=QUERY',
+        'Extractor for schale.network search results',
+    ),
+    (  # 645
+        'schalenetwork',
+        'SchalenetworkFavoriteExtractor',
+        'schalenetwork',
+        'favorite',
+        '',
+        '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/favorites(?:\\?([^#]*))?',
+        'https://niyaniya.moe/favorites',
+        'Extractor for schale.network favorites',
+    ),
+    (  # 646
+        'scrolller',
+        'ScrolllerSubredditExtractor',
+        'scrolller',
+        'subreddit',
+        '',
+        '(?:https?://)?(?:www\\.)?scrolller\\.com(/r/[^/?#]+)(?:/?\\?([^#]+))?',
+        'https://scrolller.com/r/SUBREDDIT',
+        'Extractor for media from a scrolller subreddit',
+    ),
+    (  # 647
+        'scrolller',
+        'ScrolllerFollowingExtractor',
+        'scrolller',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?scrolller\\.com/following',
+        'https://scrolller.com/following',
+        'Extractor for followed scrolller subreddits',
+    ),
+    (  # 648
+        'scrolller',
+        'ScrolllerPostExtractor',
+        'scrolller',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?scrolller\\.com/(?!r/|following$)([^/?#]+)',
+        'https://scrolller.com/TITLE-SLUG-a1b2c3d4f5',
+        'Extractor for media from a single scrolller post',
+    ),
+    (  # 649
+        'seiga',
+        'SeigaUserExtractor',
+        'seiga',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|(?:sp\\.)?seiga\\.)?nicovideo\\.jp/user/illust/(\\d+)(?:\\?(?:[^&]+&)*sort=([^&#]+))?',
+        'https://seiga.nicovideo.jp/user/illust/12345',
+        'Extractor for images of a user from seiga.nicovideo.jp',
+    ),
+    (  # 650
+        'seiga',
+        'SeigaImageExtractor',
+        'seiga',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:seiga\\.|www\\.)?nicovideo\\.jp/(?:seiga/im|image/source/)|sp\\.seiga\\.nicovideo\\.jp/seiga/#!/im|lohas\\.nicoseiga\\.jp/(?:thumb|(?:priv|o)/[^/]+/\\d+)/)(\\d+)',
+        'https://seiga.nicovideo.jp/seiga/im12345',
+        'Extractor for single images from seiga.nicovideo.jp',
+    ),
+    (  # 651
+        'senmanga',
+        'SenmangaChapterExtractor',
+        'senmanga',
+        'chapter',
+        '',
+        '(?:https?://)?raw\\.senmanga\\.com(/[^/?#]+/[^/?#]+)',
+        'https://raw.senmanga.com/MANGA/CHAPTER',
+        'Extractor for manga chapters from raw.senmanga.com',
+    ),
+    (  # 652
+        'sexcom',
+        'SexcomPinExtractor',
+        'sexcom',
+        'pin',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/(?:\\w\\w/(?:pic|gif|video)s|pin)/\\d+/?)(?!.*#related$)',
+        'https://www.sex.com/pin/12345-TITLE/',
+        'Extractor for a pinned image or video on www.sex.com',
+    ),
+    (  # 653
+        'sexcom',
+        'SexcomRelatedPinExtractor',
+        'sexcom',
+        'related-pin',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/pin/(\\d+)/?).*#related$',
+        'https://www.sex.com/pin/12345#related',
+        'Extractor for related pins on www.sex.com',
+    ),
+    (  # 654
+        'sexcom',
+        'SexcomPinsExtractor',
+        'sexcom',
+        'pins',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/pins/',
+        'https://www.sex.com/user/USER/pins/',
+        "Extractor for a user's pins on www.sex.com",
+    ),
+    (  # 655
+        'sexcom',
+        'SexcomLikesExtractor',
+        'sexcom',
+        'likes',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/likes/',
+        'https://www.sex.com/user/USER/likes/',
+        "Extractor for a user's liked pins on www.sex.com",
+    ),
+    (  # 656
+        'sexcom',
+        'SexcomBoardExtractor',
+        'sexcom',
+        'board',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/(?!(?:following|pins|repins|likes)/)([^/?#]+)',
+        'https://www.sex.com/user/USER/BOARD/',
+        'Extractor for pins from a board on www.sex.com',
+    ),
+    (  # 657
+        'sexcom',
+        'SexcomFeedExtractor',
+        'sexcom',
+        'feed',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/feed',
+        'https://www.sex.com/feed/',
+        "Extractor for pins from your account's main feed on www.sex.com",
+    ),
+    (  # 658
+        'sexcom',
+        'SexcomSearchExtractor',
+        'sexcom',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/(?:(pic|gif|video)s(?:\\?(search=[^#]+)$|/([^/?#]*))|search/(pic|gif|video)s)/?(?:\\?([^#]+))?',
+        'https://www.sex.com/search/pics?query=QUERY',
+        'Extractor for search results on www.sex.com',
+    ),
+    (  # 659
+        'shimmie2',
+        'Shimmie2TagExtractor',
+        '',
+        'tag',
+        'shimmie2',
+        '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/list/([^/?#]+)(?:/(\\d+))?',
+        'https://vidya.pics/post/list/TAG/1',
+        'Extractor for shimmie2 posts by tag search',
+    ),
+    (  # 660
+        'shimmie2',
+        'Shimmie2PostExtractor',
+        '',
+        'post',
+        'shimmie2',
+        '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/view/(\\d+)',
+        'https://vidya.pics/post/view/12345',
+        'Extractor for single shimmie2 posts',
+    ),
+    (  # 661
+        'simplyhentai',
+        'SimplyhentaiGalleryExtractor',
+        'simplyhentai',
+        'gallery',
+        '',
+        '(?:https?://)?(?!videos\\.)([\\w-]+\\.)?simply-hentai\\.com(?!/(?:album|gifs?|images?|series)(?:/|$))((?:/(?!(?:page|all-pages)(?:/|\\.|$))[^/?#]+)+)',
+        'https://www.simply-hentai.com/TITLE',
+        'Extractor for image galleries from simply-hentai.com',
+    ),
+    (  # 662
+        'simplyhentai',
+        'SimplyhentaiImageExtractor',
+        'simplyhentai',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?(simply-hentai\\.com/(image|gif)/[^/?#]+)',
+        'https://www.simply-hentai.com/image/NAME',
+        'Extractor for individual images from simply-hentai.com',
+    ),
+    (  # 663
+        'simplyhentai',
+        'SimplyhentaiVideoExtractor',
+        'simplyhentai',
+        'video',
+        '',
+        '(?:https?://)?(videos\\.simply-hentai\\.com/[^/?#]+)',
+        'https://videos.simply-hentai.com/TITLE',
+        'Extractor for hentai videos from simply-hentai.com',
+    ),
+    (  # 664
+        'sizebooru',
+        'SizebooruPostExtractor',
+        'sizebooru',
+        'post',
+        'booru',
+        '(?:https?://)?(?:www\\.)?sizebooru\\.com/Details/(\\d+)',
+        'https://sizebooru.com/Details/12345',
+        'Extractor for sizebooru posts',
+    ),
+    (  # 665
+        'sizebooru',
+        'SizebooruTagExtractor',
+        'sizebooru',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?sizebooru\\.com/Search/([^/?#]+)',
+        'https://sizebooru.com/Search/TAG',
+        'Extractor for sizebooru tag searches',
+    ),
+    (  # 666
+        'sizebooru',
+        'SizebooruGalleryExtractor',
+        'sizebooru',
+        'gallery',
+        'booru',
+        '(?:https?://)?(?:www\\.)?sizebooru\\.com/Galleries/List/(\\d+)',
+        'https://sizebooru.com/Galleries/List/123',
+        'Extractor for sizebooru galleries',
+    ),
+    (  # 667
+        'sizebooru',
+        'SizebooruUserExtractor',
+        'sizebooru',
+        'user',
+        'booru',
+        '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Uploads/([^/?#]+)',
+        'https://sizebooru.com/Profile/Uploads/USER',
+        "Extractor for a sizebooru user's uploads",
+    ),
+    (  # 668
+        'sizebooru',
+        'SizebooruFavoriteExtractor',
+        'sizebooru',
+        'favorite',
+        'booru',
+        '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Favorites/([^/?#]+)',
+        'https://sizebooru.com/Profile/Favorites/USER',
+        "Extractor for a sizebooru user's favorites",
+    ),
+    (  # 669
+        'skeb',
+        'SkebPostExtractor',
+        'skeb',
+        'post',
+        '',
+        '(?:https?://)?skeb\\.jp/@([^/?#]+)/works/(\\d+)',
+        'https://skeb.jp/@USER/works/123',
+        'Extractor for a single skeb post',
+    ),
+    (  # 670
+        'skeb',
+        'SkebWorksExtractor',
+        'skeb',
+        'works',
+        '',
+        '(?:https?://)?skeb\\.jp/@([^/?#]+)/works',
+        'https://skeb.jp/@USER/works',
+        "Extractor for a skeb user's works",
+    ),
+    (  # 671
+        'skeb',
+        'SkebSentrequestsExtractor',
+        'skeb',
+        'sentrequests',
+        '',
+        '(?:https?://)?skeb\\.jp/@([^/?#]+)/sent[ _-]?requests',
+        'https://skeb.jp/@USER/sentrequests',
+        "Extractor for a skeb user's sent requests",
+    ),
+    (  # 672
+        'skeb',
+        'SkebUserExtractor',
+        'skeb',
+        'user',
+        '',
+        '(?:https?://)?skeb\\.jp/@([^/?#]+)/?$',
+        'https://skeb.jp/@USER',
+        'Extractor for a skeb user profile',
+    ),
+    (  # 673
+        'skeb',
+        'SkebSearchExtractor',
+        'skeb',
+        'search',
+        '',
+        '(?:https?://)?skeb\\.jp/search\\?q=([^&#]+)',
+        'https://skeb.jp/search?q=QUERY',
+        'Extractor for skeb search results',
+    ),
+    (  # 674
+        'skeb',
+        'SkebFollowingExtractor',
+        'skeb',
+        'following',
+        '',
+        '(?:https?://)?skeb\\.jp/@([^/?#]+)/following_creators',
+        'https://skeb.jp/@USER/following_creators',
+        'Extractor for all creators followed by a skeb user',
+    ),
+    (  # 675
+        'skeb',
+        'SkebFollowingUsersExtractor',
+        'skeb',
+        'following-users',
+        '',
+        '(?:https?://)?skeb\\.jp/following_users',
+        'https://skeb.jp/following_users',
+        'Extractor for your followed users',
+    ),
+    (  # 676
+        'slickpic',
+        'SlickpicAlbumExtractor',
+        'slickpic',
+        'album',
+        '',
+        '(?:https?://)?([\\w-]+)\\.slickpic\\.com/albums/([^/?#]+)',
+        'https://USER.slickpic.com/albums/TITLE/',
+        'Extractor for albums on slickpic.com',
+    ),
+    (  # 677
+        'slickpic',
+        'SlickpicUserExtractor',
+        'slickpic',
+        'user',
+        '',
+        '(?:https?://)?([\\w-]+)\\.slickpic\\.com(?:/gallery)?/?(?:$|[?#])',
+        'https://USER.slickpic.com/',
+        None,
+    ),
+    (  # 678
+        'slideshare',
+        'SlidesharePresentationExtractor',
+        'slideshare',
+        'presentation',
+        '',
+        '(?:https?://)?(?:www\\.)?slideshare\\.net/(?:mobile/)?([^/?#]+)/([^/?#]+)',
+        'https://www.slideshare.net/USER/PRESENTATION',
+        'Extractor for images from a presentation on slideshare.net',
+    ),
+    (  # 679
+        'smugmug',
+        'SmugmugAlbumExtractor',
+        'smugmug',
+        'album',
+        '',
+        'smugmug:album:([^:]+)$',
+        'smugmug:album:ID',
+        'Extractor for smugmug albums',
+    ),
+    (  # 680
+        'smugmug',
+        'SmugmugImageExtractor',
+        'smugmug',
+        'image',
+        '',
+        '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)(?:/[^/?#]+)+/i-([^/?#-]+)',
+        'https://USER.smugmug.com/PATH/i-ID',
+        'Extractor for individual smugmug images',
+    ),
+    (  # 681
+        'smugmug',
+        'SmugmugPathExtractor',
+        'smugmug',
+        'path',
+        '',
+        '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)((?:/[^/?#a-fh-mo-z][^/?#]*)*)/?$',
+        'https://USER.smugmug.com/PATH',
+        'Extractor for smugmug albums from URL paths and users',
+    ),
+    (  # 682
+        'soundgasm',
+        'SoundgasmAudioExtractor',
+        'soundgasm',
+        'audio',
+        '',
+        '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/([^/?#]+)',
+        'https://soundgasm.net/u/USER/TITLE',
+        'Extractor for audio clips from soundgasm.net',
+    ),
+    (  # 683
+        'soundgasm',
+        'SoundgasmUserExtractor',
+        'soundgasm',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/?$',
+        'https://soundgasm.net/u/USER',
+        'Extractor for all sounds from a soundgasm user',
+    ),
+    (  # 684
+        'speakerdeck',
+        'SpeakerdeckPresentationExtractor',
+        'speakerdeck',
+        'presentation',
+        '',
+        '(?:https?://)?(?:www\\.)?speakerdeck\\.com/([^/?#]+)/([^/?#]+)',
+        'https://speakerdeck.com/USER/PRESENTATION',
+        'Extractor for images from a presentation on speakerdeck.com',
+    ),
+    (  # 685
+        'steamgriddb',
+        'SteamgriddbAssetExtractor',
+        'steamgriddb',
+        'asset',
+        '',
+        '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(grid|hero|logo|icon)/(\\d+)',
+        'https://www.steamgriddb.com/grid/1234',
+        'Extractor for a single asset',
+    ),
+    (  # 686
+        'steamgriddb',
+        'SteamgriddbGridsExtractor',
+        'steamgriddb',
+        'grids',
+        '',
+        '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/grids(?:/(\\d+))?',
+        'https://www.steamgriddb.com/game/1234/grids',
+        None,
+    ),
+    (  # 687
+        'steamgriddb',
+        'SteamgriddbHeroesExtractor',
+        'steamgriddb',
+        'heroes',
+        '',
+        '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/heroes(?:/(\\d+))?',
+        'https://www.steamgriddb.com/game/1234/heroes',
+        None,
+    ),
+    (  # 688
+        'steamgriddb',
+        'SteamgriddbLogosExtractor',
+        'steamgriddb',
+        'logos',
+        '',
+        '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/logos(?:/(\\d+))?',
+        'https://www.steamgriddb.com/game/1234/logos',
+        None,
+    ),
+    (  # 689
+        'steamgriddb',
+        'SteamgriddbIconsExtractor',
+        'steamgriddb',
+        'icons',
+        '',
+        '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/icons(?:/(\\d+))?',
+        'https://www.steamgriddb.com/game/1234/icons',
+        None,
+    ),
+    (  # 690
+        'subscribestar',
+        'SubscribestarUserExtractor',
+        'subscribestar',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/(?!posts/)([^/?#]+)(?:\\?([^#]+))?',
+        'https://www.subscribestar.com/USER',
+        'Extractor for media from a subscribestar user',
+    ),
+    (  # 691
+        'subscribestar',
+        'SubscribestarPostExtractor',
+        'subscribestar',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/posts/(\\d+)',
+        'https://www.subscribestar.com/posts/12345',
+        'Extractor for media from a single subscribestar post',
+    ),
+    (  # 692
+        'sxypix',
+        'SxypixGalleryExtractor',
+        'sxypix',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?sxypix\\.com(/w/(\\w+))',
+        'https://sxypix.com/w/2bbaf1b24a5863d0e73436619bbaa7ee',
+        'Extractor for image galleries from sxypix.com',
+    ),
+    (  # 693
+        'szurubooru',
+        'SzurubooruTagExtractor',
+        '',
+        'tag',
+        'szurubooru',
+        '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/posts(?:/query=([^/?#]*))?',
+        'https://booru.bcbnsfw.space/posts/query=TAG',
+        None,
+    ),
+    (  # 694
+        'szurubooru',
+        'SzurubooruPostExtractor',
+        '',
+        'post',
+        'szurubooru',
+        '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/post/(\\d+)',
+        'https://booru.bcbnsfw.space/post/12345',
+        None,
+    ),
+    (  # 695
+        'tapas',
+        'TapasEpisodeExtractor',
+        'tapas',
+        'episode',
+        '',
+        '(?:https?://)?tapas\\.io/episode/(\\d+)',
+        'https://tapas.io/episode/12345',
+        None,
+    ),
+    (  # 696
+        'tapas',
+        'TapasSeriesExtractor',
+        'tapas',
+        'series',
+        '',
+        '(?:https?://)?tapas\\.io/series/([^/?#]+)',
+        'https://tapas.io/series/TITLE',
+        None,
+    ),
+    (  # 697
+        'tapas',
+        'TapasCreatorExtractor',
+        'tapas',
+        'creator',
+        '',
+        '(?:https?://)?tapas\\.io/(?!series|episode)([^/?#]+)',
+        'https://tapas.io/CREATOR',
+        None,
+    ),
+    (  # 698
+        'tcbscans',
+        'TcbscansChapterExtractor',
+        'tcbscans',
+        'chapter',
+        '',
+        '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/chapters/\\d+/[^/?#]+)',
+        'https://tcbscans.me/chapters/12345/MANGA-chapter-123',
+        None,
+    ),
+    (  # 699
+        'tcbscans',
+        'TcbscansMangaExtractor',
+        'tcbscans',
+        'manga',
+        '',
+        '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/mangas/\\d+/[^/?#]+)',
+        'https://tcbscans.me/mangas/123/MANGA',
+        None,
+    ),
+    (  # 700
+        'telegraph',
+        'TelegraphGalleryExtractor',
+        'telegraph',
+        'gallery',
+        '',
+        '(?:https?://)(?:www\\.)??telegra\\.ph(/[^/?#]+)',
+        'https://telegra.ph/TITLE',
+        'Extractor for articles from telegra.ph',
+    ),
+    (  # 701
+        'tenor',
+        'TenorImageExtractor',
+        'tenor',
+        'image',
+        '',
+        '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?view/(?:[^/?#]*-)?(\\d+)',
+        'https://tenor.com/view/SLUG-1234567890',
+        None,
+    ),
+    (  # 702
+        'tenor',
+        'TenorSearchExtractor',
+        'tenor',
+        'search',
+        '',
+        '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?search/([^/?#]+)',
+        'https://tenor.com/search/QUERY',
+        None,
+    ),
+    (  # 703
+        'tenor',
+        'TenorUserExtractor',
+        'tenor',
+        'user',
+        '',
+        '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?(?:users|official)/([^/?#]+)',
+        'https://tenor.com/users/USER',
+        None,
+    ),
+    (  # 704
+        'thehentaiworld',
+        'ThehentaiworldTagExtractor',
+        'thehentaiworld',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?thehentaiworld\\.com/tag/([^/?#]+)',
+        'https://thehentaiworld.com/tag/TAG/',
+        None,
+    ),
+    (  # 705
+        'thehentaiworld',
+        'ThehentaiworldPostExtractor',
+        'thehentaiworld',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?thehentaiworld\\.com(/(?:video|(?:[\\w-]+-)?hentai-image)s/([^/?#]+))',
+        'https://thehentaiworld.com/hentai-images/SLUG/',
+        None,
+    ),
+    (  # 706
+        'tiktok',
+        'TiktokPostExtractor',
+        'tiktok',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/(?:@([\\w_.-]*)|share)/(?:phot|vide)o/(\\d+)',
+        'https://www.tiktok.com/@USER/photo/1234567890',
+        'Extract a single video or photo TikTok link',
+    ),
+    (  # 707
+        'tiktok',
+        'TiktokVmpostExtractor',
+        'tiktok',
+        'vmpost',
+        '',
+        '(?:https?://)?(?:(?:v[mt]\\.)?tiktok\\.com|(?:www\\.)?tiktok\\.com/t)/(?!@)([^/?#]+)',
+        'https://vm.tiktok.com/1a2B3c4E5',
+        'Extract a single video or photo TikTok VM link',
+    ),
+    (  # 708
+        'tiktok',
+        'TiktokUserExtractor',
+        'tiktok',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/?(?:$|\\?|#)',
+        'https://www.tiktok.com/@USER',
+        'Extractor for a TikTok user profile',
+    ),
+    (  # 709
+        'tiktok',
+        'TiktokAvatarExtractor',
+        'tiktok',
+        'avatar',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/avatar',
+        'https://www.tiktok.com/@USER/avatar',
+        None,
+    ),
+    (  # 710
+        'tiktok',
+        'TiktokPostsExtractor',
+        'tiktok',
+        'posts',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/posts',
+        'https://www.tiktok.com/@USER/posts',
+        None,
+    ),
+    (  # 711
+        'tiktok',
+        'TiktokRepostsExtractor',
+        'tiktok',
+        'reposts',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/reposts',
+        'https://www.tiktok.com/@USER/reposts',
+        None,
+    ),
+    (  # 712
+        'tiktok',
+        'TiktokStoriesExtractor',
+        'tiktok',
+        'stories',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/stories',
+        'https://www.tiktok.com/@USER/stories',
+        None,
+    ),
+    (  # 713
+        'tiktok',
+        'TiktokLikesExtractor',
+        'tiktok',
+        'likes',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/like[sd]',
+        'https://www.tiktok.com/@USER/liked',
+        None,
+    ),
+    (  # 714
+        'tiktok',
+        'TiktokSavedExtractor',
+        'tiktok',
+        'saved',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/saved',
+        'https://www.tiktok.com/@USER/saved',
+        None,
+    ),
+    (  # 715
+        'tiktok',
+        'TiktokFollowingExtractor',
+        'tiktok',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.)?tiktokv?\\.com/following',
+        'https://www.tiktok.com/following',
+        'Extract all of the stories of all of the users you follow',
+    ),
+    (  # 716
+        'tmohentai',
+        'TmohentaiGalleryExtractor',
+        'tmohentai',
+        'gallery',
+        '',
+        '(?:https?://)?tmohentai\\.com/(?:contents|reader)/(\\w+)',
+        'https://tmohentai.com/contents/12345a67b89c0',
+        None,
+    ),
+    (  # 717
+        'toyhouse',
+        'ToyhouseArtExtractor',
+        'toyhouse',
+        'art',
+        '',
+        '(?:https?://)?(?:www\\.)?toyhou\\.se/([^/?#]+)/art',
+        'https://www.toyhou.se/USER/art',
+        'Extractor for artworks of a toyhouse user',
+    ),
+    (  # 718
+        'toyhouse',
+        'ToyhouseImageExtractor',
+        'toyhouse',
+        'image',
+        '',
+        '(?:https?://)?(?:(?:www\\.)?toyhou\\.se/~images|f\\d+\\.toyhou\\.se/file/[^/?#]+/(?:image|watermark)s)/(\\d+)',
+        'https://toyhou.se/~images/12345',
+        'Extractor for individual toyhouse images',
+    ),
+    (  # 719
+        'tsumino',
+        'TsuminoGalleryExtractor',
+        'tsumino',
+        'gallery',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:entry|Book/Info|Read/(?:Index|View))/(\\d+)',
+        'https://www.tsumino.com/entry/12345',
+        'Extractor for image galleries on tsumino.com',
+    ),
+    (  # 720
+        'tsumino',
+        'TsuminoSearchExtractor',
+        'tsumino',
+        'search',
+        '',
+        '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:Books/?)?#(.+)',
+        'https://www.tsumino.com/Books#QUERY',
+        'Extractor for search results on tsumino.com',
+    ),
+    (  # 721
+        'tumblr',
+        'TumblrUserExtractor',
+        'tumblr',
+        'user',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/page/\\d+|/archive)?/?$',
+        'https://www.tumblr.com/BLOG',
+        "Extractor for a Tumblr user's posts",
+    ),
+    (  # 722
+        'tumblr',
+        'TumblrPostExtractor',
+        'tumblr',
+        'post',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/(?:post/|image/)?(\\d+)',
+        'https://www.tumblr.com/BLOG/12345',
+        'Extractor for a single Tumblr post',
+    ),
+    (  # 723
+        'tumblr',
+        'TumblrTagExtractor',
+        'tumblr',
+        'tag',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/archive)?/tagged/([^/?#]+)',
+        'https://www.tumblr.com/BLOG/tagged/TAG',
+        "Extractor for Tumblr user's posts by tag",
+    ),
+    (  # 724
+        'tumblr',
+        'TumblrDayExtractor',
+        'tumblr',
+        'day',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/day/(\\d\\d\\d\\d/\\d\\d/\\d\\d)',
+        'https://www.tumblr.com/BLOG/day/1970/01/01',
+        "Extractor for Tumblr user's posts by day",
+    ),
+    (  # 725
+        'tumblr',
+        'TumblrLikesExtractor',
+        'tumblr',
+        'likes',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/likes',
+        'https://www.tumblr.com/BLOG/likes',
+        "Extractor for a Tumblr user's liked posts",
+    ),
+    (  # 726
+        'tumblr',
+        'TumblrFollowingExtractor',
+        'tumblr',
+        'following',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/following',
+        'https://www.tumblr.com/BLOG/following',
+        "Extractor for a Tumblr user's followed blogs",
+    ),
+    (  # 727
+        'tumblr',
+        'TumblrFollowersExtractor',
+        'tumblr',
+        'followers',
+        '',
+        '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/followers',
+        'https://www.tumblr.com/BLOG/followers',
+        "Extractor for a Tumblr user's followers",
+    ),
+    (  # 728
+        'tumblr',
+        'TumblrSearchExtractor',
+        'tumblr',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.)?tumblr\\.com/search/([^/?#]+)(?:/([^/?#]+)(?:/([^/?#]+))?)?(?:/?\\?([^#]+))?',
+        'https://www.tumblr.com/search/QUERY',
+        'Extractor for a Tumblr search',
+    ),
+    (  # 729
+        'tumblrgallery',
+        'TumblrgalleryTumblrblogExtractor',
+        'tumblrgallery',
+        'tumblrblog',
+        '',
+        '(?:https?://)?tumblrgallery\\.xyz(/tumblrblog/gallery/(\\d+)\\.html)',
+        'https://tumblrgallery.xyz/tumblrblog/gallery/12345.html',
+        'Extractor for Tumblrblog on tumblrgallery.xyz',
+    ),
+    (  # 730
+        'tumblrgallery',
+        'TumblrgalleryPostExtractor',
+        'tumblrgallery',
+        'post',
+        '',
+        '(?:https?://)?tumblrgallery\\.xyz(/post/(\\d+)\\.html)',
+        'https://tumblrgallery.xyz/post/12345.html',
+        'Extractor for Posts on tumblrgallery.xyz',
+    ),
+    (  # 731
+        'tumblrgallery',
+        'TumblrgallerySearchExtractor',
+        'tumblrgallery',
+        'search',
+        '',
+        '(?:https?://)?tumblrgallery\\.xyz(/s\\.php\\?q=([^&#]+))',
+        'https://tumblrgallery.xyz/s.php?q=QUERY',
+        'Extractor for Search result on tumblrgallery.xyz',
+    ),
+    (  # 732
+        'tungsten',
+        'TungstenPostExtractor',
+        'tungsten',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?tungsten\\.run/post/(\\w+)',
+        'https://tungsten.run/post/AbCdEfGhIjKlMnOp',
+        None,
+    ),
+    (  # 733
+        'tungsten',
+        'TungstenModelExtractor',
+        'tungsten',
+        'model',
+        '',
+        '(?:https?://)?(?:www\\.)?tungsten\\.run/model/(\\w+)(?:/?\\?model_version=(\\w+))?',
+        'https://tungsten.run/model/AbCdEfGhIjKlM',
+        None,
+    ),
+    (  # 734
+        'tungsten',
+        'TungstenUserExtractor',
+        'tungsten',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?tungsten\\.run/user/([^/?#]+)(?:/posts)?/?(?:\\?([^#]+))?',
+        'https://tungsten.run/user/USER',
+        None,
+    ),
+    (  # 735
+        'twibooru',
+        'TwibooruPostExtractor',
+        'twibooru',
+        'post',
+        'philomena',
+        '(?:https?://)?(?:www\\.)?twibooru\\.org/(\\d+)',
+        'https://twibooru.org/12345',
+        'Extractor for single twibooru posts',
+    ),
+    (  # 736
+        'twibooru',
+        'TwibooruSearchExtractor',
+        'twibooru',
+        'search',
+        'philomena',
+        '(?:https?://)?(?:www\\.)?twibooru\\.org/(?:search/?\\?([^#]+)|tags/([^/?#]+))',
+        'https://twibooru.org/search?q=TAG',
+        'Extractor for twibooru search results',
+    ),
+    (  # 737
+        'twibooru',
+        'TwibooruGalleryExtractor',
+        'twibooru',
+        'gallery',
+        'philomena',
+        '(?:https?://)?(?:www\\.)?twibooru\\.org/galleries/(\\d+)',
+        'https://twibooru.org/galleries/12345',
+        'Extractor for twibooru galleries',
+    ),
+    (  # 738
+        'twitter',
+        'TwitterHomeExtractor',
+        'twitter',
+        'home',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/home(?:/fo(?:llowing|r[-_ ]?you()))?/?$',
+        'https://x.com/home',
+        'Extractor for Twitter home timelines',
+    ),
+    (  # 739
+        'twitter',
+        'TwitterNotificationsExtractor',
+        'twitter',
+        'notifications',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:notifications|i/timeline())',
+        'https://x.com/notifications',
+        'Extractor for Twitter notifications timelines',
+    ),
+    (  # 740
+        'twitter',
+        'TwitterSearchExtractor',
+        'twitter',
+        'search',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/search/?\\?(?:[^&#]+&)*q=([^&#]+)',
+        'https://x.com/search?q=QUERY',
+        'Extractor for Twitter search results',
+    ),
+    (  # 741
+        'twitter',
+        'TwitterHashtagExtractor',
+        'twitter',
+        'hashtag',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/hashtag/([^/?#]+)',
+        'https://x.com/hashtag/NAME',
+        'Extractor for Twitter hashtags',
+    ),
+    (  # 742
+        'twitter',
+        'TwitterUserExtractor',
+        'twitter',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:([^/?#]+)/?(?:$|\\?|#)|i(?:/user/|ntent/user\\?user_id=)(\\d+))',
+        'https://x.com/USER',
+        'Extractor for a Twitter user',
+    ),
+    (  # 743
+        'twitter',
+        'TwitterTimelineExtractor',
+        'twitter',
+        'timeline',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/timeline(?!\\w)',
+        'https://x.com/USER/timeline',
+        'Extractor for a Twitter user timeline',
+    ),
+    (  # 744
+        'twitter',
+        'TwitterTweetsExtractor',
+        'twitter',
+        'tweets',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/tweets(?!\\w)',
+        'https://x.com/USER/tweets',
+        "Extractor for Tweets from a user's Tweets timeline",
+    ),
+    (  # 745
+        'twitter',
+        'TwitterRepliesExtractor',
+        'twitter',
+        'replies',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/with_replies(?!\\w)',
+        'https://x.com/USER/with_replies',
+        "Extractor for Tweets from a user's timeline including replies",
+    ),
+    (  # 746
+        'twitter',
+        'TwitterHighlightsExtractor',
+        'twitter',
+        'highlights',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/highlights(?!\\w)',
+        'https://x.com/USER/highlights',
+        "Extractor for Tweets from a user's highlights timeline",
+    ),
+    (  # 747
+        'twitter',
+        'TwitterMediaExtractor',
+        'twitter',
+        'media',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/media(?!\\w)',
+        'https://x.com/USER/media',
+        "Extractor for Tweets from a user's Media timeline",
+    ),
+    (  # 748
+        'twitter',
+        'TwitterLikesExtractor',
+        'twitter',
+        'likes',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/likes(?!\\w)',
+        'https://x.com/USER/likes',
+        'Extractor for liked tweets',
+    ),
+    (  # 749
+        'twitter',
+        'TwitterBookmarkExtractor',
+        'twitter',
+        'bookmark',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/bookmarks()',
+        'https://x.com/i/bookmarks',
+        'Extractor for bookmarked tweets',
+    ),
+    (  # 750
+        'twitter',
+        'TwitterListExtractor',
+        'twitter',
+        'list',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/?$',
+        'https://x.com/i/lists/12345',
+        'Extractor for Twitter lists',
+    ),
+    (  # 751
+        'twitter',
+        'TwitterListMembersExtractor',
+        'twitter',
+        'list-members',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/members',
+        'https://x.com/i/lists/12345/members',
+        'Extractor for members of a Twitter list',
+    ),
+    (  # 752
+        'twitter',
+        'TwitterFollowingExtractor',
+        'twitter',
+        'following',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/following(?!\\w)',
+        'https://x.com/USER/following',
+        'Extractor for followed users',
+    ),
+    (  # 753
+        'twitter',
+        'TwitterFollowersExtractor',
+        'twitter',
+        'followers',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/followers(?!\\w)',
+        'https://x.com/USER/followers',
+        "Extractor for a user's followers",
+    ),
+    (  # 754
+        'twitter',
+        'TwitterCommunityExtractor',
+        'twitter',
+        'community',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/communities/(\\d+)',
+        'https://x.com/i/communities/12345',
+        'Extractor for a Twitter community',
+    ),
+    (  # 755
+        'twitter',
+        'TwitterCommunitiesExtractor',
+        'twitter',
+        'communities',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/communities/?$',
+        'https://x.com/i/communities',
+        'Extractor for followed Twitter communities',
+    ),
+    (  # 756
+        'twitter',
+        'TwitterEventExtractor',
+        'twitter',
+        'event',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/events/(\\d+)',
+        'https://x.com/i/events/12345',
+        'Extractor for Tweets from a Twitter Event',
+    ),
+    (  # 757
+        'twitter',
+        'TwitterTweetExtractor',
+        'twitter',
+        'tweet',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+|i/web)/status/(\\d+)/?(?:$|\\?|#|photo/|video/)',
+        'https://x.com/USER/status/12345',
+        'Extractor for individual tweets',
+    ),
+    (  # 758
+        'twitter',
+        'TwitterQuotesExtractor',
+        'twitter',
+        'quotes',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:[^/?#]+|i/web)/status/(\\d+)/quotes',
+        'https://x.com/USER/status/12345/quotes',
+        'Extractor for quotes of a Tweet',
+    ),
+    (  # 759
+        'twitter',
+        'TwitterInfoExtractor',
+        'twitter',
+        'info',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/info',
+        'https://x.com/USER/info',
+        "Extractor for a user's profile data",
+    ),
+    (  # 760
+        'twitter',
+        'TwitterAvatarExtractor',
+        'twitter',
+        'avatar',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/photo',
+        'https://x.com/USER/photo',
+        None,
+    ),
+    (  # 761
+        'twitter',
+        'TwitterBackgroundExtractor',
+        'twitter',
+        'background',
+        '',
+        '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/header_photo',
+        'https://x.com/USER/header_photo',
+        None,
+    ),
+    (  # 762
+        'twitter',
+        'TwitterImageExtractor',
+        'twitter',
+        'image',
+        '',
+        'https?://pbs\\.twimg\\.com/media/([\\w-]+)(?:\\?format=|\\.)(\\w+)',
+        'https://pbs.twimg.com/media/ABCDE?format=jpg&name=orig',
+        None,
+    ),
+    (  # 763
+        'urlgalleries',
+        'UrlgalleriesGalleryExtractor',
+        'urlgalleries',
+        'gallery',
+        '',
+        '(?:https?://)()(?:(\\w+)\\.)?urlgalleries\\.net/(?:b/([^/?#]+)/)?(?:[\\w-]+-)?(\\d+)',
+        'https://urlgalleries.net/b/BLOG/gallery-12345/TITLE',
+        'Base class for Urlgalleries extractors',
+    ),
+    (  # 764
+        'unsplash',
+        'UnsplashImageExtractor',
+        'unsplash',
+        'image',
+        '',
+        '(?:https?://)?unsplash\\.com/photos/([^/?#]+)',
+        'https://unsplash.com/photos/ID',
+        'Extractor for a single unsplash photo',
+    ),
+    (  # 765
+        'unsplash',
+        'UnsplashUserExtractor',
+        'unsplash',
+        'user',
+        '',
+        '(?:https?://)?unsplash\\.com/@(\\w+)/?$',
+        'https://unsplash.com/@USER',
+        'Extractor for all photos of an unsplash user',
+    ),
+    (  # 766
+        'unsplash',
+        'UnsplashFavoriteExtractor',
+        'unsplash',
+        'favorite',
+        '',
+        '(?:https?://)?unsplash\\.com/@(\\w+)/likes',
+        'https://unsplash.com/@USER/likes',
+        'Extractor for all likes of an unsplash user',
+    ),
+    (  # 767
+        'unsplash',
+        'UnsplashCollectionExtractor',
+        'unsplash',
+        'collection',
+        '',
+        '(?:https?://)?unsplash\\.com/collections/([^/?#]+)(?:/([^/?#]+))?',
+        'https://unsplash.com/collections/12345/TITLE',
+        'Extractor for an unsplash collection',
+    ),
+    (  # 768
+        'unsplash',
+        'UnsplashSearchExtractor',
+        'unsplash',
+        'search',
+        '',
+        '(?:https?://)?unsplash\\.com/s/photos/([^/?#]+)(?:\\?([^#]+))?',
+        'https://unsplash.com/s/photos/QUERY',
+        'Extractor for unsplash search results',
+    ),
+    (  # 769
+        'uploadir',
+        'UploadirFileExtractor',
+        'uploadir',
+        'file',
+        '',
+        '(?:https?://)?uploadir\\.com/(?:user/)?u(?:ploads)?/([^/?#]+)',
+        'https://uploadir.com/u/ID',
+        'Extractor for uploadir files',
+    ),
+    (  # 770
+        'urlshortener',
+        'UrlshortenerLinkExtractor',
+        '',
+        'link',
+        'urlshortener',
+        '(?:urlshortener:(https?://[^/?#]+)|(?:https?://)?(?:bit\\.ly()|t\\.co()))(/[^/?#]+)',
+        'https://bit.ly/abcde',
+        'Extractor for general-purpose URL shorteners',
+    ),
+    (  # 771
+        'vanillarock',
+        'VanillarockPostExtractor',
+        'vanillarock',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?!category/|tag/)[^/?#]+)/?$',
+        'https://vanilla-rock.com/TITLE',
+        'Extractor for blogposts on vanilla-rock.com',
+    ),
+    (  # 772
+        'vanillarock',
+        'VanillarockTagExtractor',
+        'vanillarock',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?:tag|category)/[^?#]+)',
+        'https://vanilla-rock.com/tag/TAG',
+        'Extractor for vanillarock blog posts by tag or category',
+    ),
+    (  # 773
+        'vichan',
+        'VichanThreadExtractor',
+        '',
+        'thread',
+        'vichan',
+        '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)/res/(\\d+)',
+        'https://8kun.top/a/res/12345.html',
+        'Extractor for vichan threads',
+    ),
+    (  # 774
+        'vichan',
+        'VichanBoardExtractor',
+        '',
+        'board',
+        'vichan',
+        '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)',
+        'https://8kun.top/a/',
+        'Extractor for vichan boards',
+    ),
+    (  # 775
+        'vipergirls',
+        'VipergirlsThreadExtractor',
+        'vipergirls',
+        'thread',
+        '',
+        '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?(/page\\d+)?(?:$|#|\\?(?!p=))',
+        'https://vipergirls.to/threads/12345-TITLE',
+        'Extractor for vipergirls threads',
+    ),
+    (  # 776
+        'vipergirls',
+        'VipergirlsPostExtractor',
+        'vipergirls',
+        'post',
+        '',
+        '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?\\?p=\\d+[^#]*#post(\\d+)',
+        'https://vipergirls.to/threads/12345-TITLE?p=23456#post23456',
+        'Extractor for vipergirls posts',
+    ),
+    (  # 777
+        'vk',
+        'VkPhotosExtractor',
+        'vk',
+        'photos',
+        '',
+        '(?:https://)?(?:www\\.|m\\.)?vk\\.com/(?:(?:albums|photos|id)(-?\\d+)|(?!(?:album|tag|wall)-?\\d+_?)([^/?#]+))',
+        'https://vk.com/id12345',
+        'Extractor for photos from a vk user',
+    ),
+    (  # 778
+        'vk',
+        'VkAlbumExtractor',
+        'vk',
+        'album',
+        '',
+        '(?:https://)?(?:www\\.|m\\.)?vk\\.com/album(-?\\d+)_(\\d+)$',
+        'https://vk.com/album12345_00',
+        'Extractor for a vk album',
+    ),
+    (  # 779
+        'vk',
+        'VkTaggedExtractor',
+        'vk',
+        'tagged',
+        '',
+        '(?:https://)?(?:www\\.|m\\.)?vk\\.com/tag(-?\\d+)$',
+        'https://vk.com/tag12345',
+        'Extractor for a vk tagged photos',
+    ),
+    (  # 780
+        'vk',
+        'VkWallPostExtractor',
+        'vk',
+        'wall-post',
+        '',
+        '(?:https://)?(?:www\\.|m\\.)?vk\\.com/wall(-?\\d+)_(\\d+)',
+        'https://vk.com/wall12345_123',
+        'Extractor for a vk wall post',
+    ),
+    (  # 781
+        'vsco',
+        'VscoUserExtractor',
+        'vsco',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/?$',
+        'https://vsco.co/USER',
+        'Extractor for a vsco user profile',
+    ),
+    (  # 782
+        'vsco',
+        'VscoGalleryExtractor',
+        'vsco',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/(?:gallery|images)',
+        'https://vsco.co/USER/gallery',
+        "Extractor for a vsco user's gallery",
+    ),
+    (  # 783
+        'vsco',
+        'VscoCollectionExtractor',
+        'vsco',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/collection',
+        'https://vsco.co/USER/collection/1',
+        'Extractor for images from a collection on vsco.co',
+    ),
+    (  # 784
+        'vsco',
+        'VscoSpaceExtractor',
+        'vsco',
+        'space',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/spaces/([^/?#]+)',
+        'https://vsco.co/spaces/a1b2c3d4e5f',
+        'Extractor for a vsco.co space',
+    ),
+    (  # 785
+        'vsco',
+        'VscoSpacesExtractor',
+        'vsco',
+        'spaces',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/spaces',
+        'https://vsco.co/USER/spaces',
+        "Extractor for a vsco.co user's spaces",
+    ),
+    (  # 786
+        'vsco',
+        'VscoAvatarExtractor',
+        'vsco',
+        'avatar',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/avatar',
+        'https://vsco.co/USER/avatar',
+        'Extractor for vsco.co user avatars',
+    ),
+    (  # 787
+        'vsco',
+        'VscoImageExtractor',
+        'vsco',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/media/([0-9a-fA-F]+)',
+        'https://vsco.co/USER/media/0123456789abcdef',
+        'Extractor for individual images on vsco.co',
+    ),
+    (  # 788
+        'vsco',
+        'VscoVideoExtractor',
+        'vsco',
+        'video',
+        '',
+        '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/video/([^/?#]+)',
+        'https://vsco.co/USER/video/012345678-9abc-def0',
+        'Extractor for vsco.co videos links',
+    ),
+    (  # 789
+        'wallhaven',
+        'WallhavenSearchExtractor',
+        'wallhaven',
+        'search',
+        '',
+        '(?:https?://)?wallhaven\\.cc/search(?:/?\\?([^#]+))?',
+        'https://wallhaven.cc/search?q=QUERY',
+        'Extractor for search results on wallhaven.cc',
+    ),
+    (  # 790
+        'wallhaven',
+        'WallhavenCollectionExtractor',
+        'wallhaven',
+        'collection',
+        '',
+        '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/(\\d+)',
+        'https://wallhaven.cc/user/USER/favorites/12345',
+        'Extractor for a collection on wallhaven.cc',
+    ),
+    (  # 791
+        'wallhaven',
+        'WallhavenUserExtractor',
+        'wallhaven',
+        'user',
+        '',
+        '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/?$',
+        'https://wallhaven.cc/user/USER',
+        'Extractor for a wallhaven user',
+    ),
+    (  # 792
+        'wallhaven',
+        'WallhavenCollectionsExtractor',
+        'wallhaven',
+        'collections',
+        '',
+        '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/?$',
+        'https://wallhaven.cc/user/USER/favorites',
+        'Extractor for all collections of a wallhaven user',
+    ),
+    (  # 793
+        'wallhaven',
+        'WallhavenUploadsExtractor',
+        'wallhaven',
+        'uploads',
+        '',
+        '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/uploads',
+        'https://wallhaven.cc/user/USER/uploads',
+        'Extractor for all uploads of a wallhaven user',
+    ),
+    (  # 794
+        'wallhaven',
+        'WallhavenImageExtractor',
+        'wallhaven',
+        'image',
+        '',
+        '(?:https?://)?(?:wallhaven\\.cc/w/|whvn\\.cc/|w\\.wallhaven\\.cc/[a-z]+/\\w\\w/wallhaven-)(\\w+)',
+        'https://wallhaven.cc/w/ID',
+        'Extractor for individual wallpaper on wallhaven.cc',
+    ),
+    (  # 795
+        'wallpapercave',
+        'WallpapercaveImageExtractor',
+        'wallpapercave',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?wallpapercave\\.com/',
+        'https://wallpapercave.com/w/wp12345',
+        'Extractor for images on wallpapercave.com',
+    ),
+    (  # 796
+        'warosu',
+        'WarosuThreadExtractor',
+        'warosu',
+        'thread',
+        '',
+        '(?:https?://)?(?:www\\.)?warosu\\.org/([^/]+)/thread/(\\d+)',
+        'https://warosu.org/a/thread/12345',
+        'Extractor for threads on warosu.org',
+    ),
+    (  # 797
+        'weasyl',
+        'WeasylSubmissionExtractor',
+        'weasyl',
+        'submission',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/(?:~[\\w~-]+/submissions|submission|view)/(\\d+)',
+        'https://www.weasyl.com/~USER/submissions/12345/TITLE',
+        None,
+    ),
+    (  # 798
+        'weasyl',
+        'WeasylSubmissionsExtractor',
+        'weasyl',
+        'submissions',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/(?:~|submissions/)([\\w~-]+)/?$',
+        'https://www.weasyl.com/submissions/USER',
+        None,
+    ),
+    (  # 799
+        'weasyl',
+        'WeasylFolderExtractor',
+        'weasyl',
+        'folder',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/submissions/([\\w~-]+)\\?folderid=(\\d+)',
+        'https://www.weasyl.com/submissions/USER?folderid=12345',
+        None,
+    ),
+    (  # 800
+        'weasyl',
+        'WeasylJournalExtractor',
+        'weasyl',
+        'journal',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/journal/(\\d+)',
+        'https://www.weasyl.com/journal/12345',
+        None,
+    ),
+    (  # 801
+        'weasyl',
+        'WeasylJournalsExtractor',
+        'weasyl',
+        'journals',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/journals/([\\w~-]+)',
+        'https://www.weasyl.com/journals/USER',
+        None,
+    ),
+    (  # 802
+        'weasyl',
+        'WeasylFavoriteExtractor',
+        'weasyl',
+        'favorite',
+        '',
+        '(?:https://)?(?:www\\.)?weasyl.com/favorites(?:\\?userid=(\\d+)|/([^/?#]+))',
+        'https://www.weasyl.com/favorites?userid=12345',
+        None,
+    ),
+    (  # 803
+        'webmshare',
+        'WebmshareVideoExtractor',
+        'webmshare',
+        'video',
+        '',
+        '(?:https?://)?(?:s\\d+\\.)?webmshare\\.com/(?:play/|download-webm/)?(\\w{3,})',
+        'https://webmshare.com/_ID_',
+        'Extractor for webmshare videos',
+    ),
+    (  # 804
+        'webtoons',
+        'WebtoonsEpisodeExtractor',
+        'webtoons',
+        'episode',
+        '',
+        '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+)/[^/?#]+)/viewer\\?([^#\'\\"]+)',
+        'https://www.webtoons.com/en/GENRE/TITLE/NAME/viewer?title_no=123&episode_no=12345',
+        'Extractor for an episode on webtoons.com',
+    ),
+    (  # 805
+        'webtoons',
+        'WebtoonsComicExtractor',
+        'webtoons',
+        'comic',
+        '',
+        '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+))/list\\?([^#]+)',
+        'https://www.webtoons.com/en/GENRE/TITLE/list?title_no=123',
+        'Extractor for an entire comic on webtoons.com',
+    ),
+    (  # 806
+        'webtoons',
+        'WebtoonsArtistExtractor',
+        'webtoons',
+        'artist',
+        '',
+        '(?:https?://)?(?:www\\.)?webtoons\\.com/p/community/([^/?#]+)/u/([^/?#]+)',
+        'https://www.webtoons.com/p/community/LANG/u/ARTIST',
+        'Extractor for webtoons.com artists',
+    ),
+    (  # 807
+        'weebcentral',
+        'WeebcentralChapterExtractor',
+        'weebcentral',
+        'chapter',
+        '',
+        '(?:https?://)?(?:www\\.)?weebcentral\\.com(/chapters/(\\w+))',
+        'https://weebcentral.com/chapters/01JHABCDEFGHIJKLMNOPQRSTUV',
+        'Extractor for manga chapters from weebcentral.com',
+    ),
+    (  # 808
+        'weebcentral',
+        'WeebcentralMangaExtractor',
+        'weebcentral',
+        'manga',
+        '',
+        '(?:https?://)?(?:www\\.)?weebcentral\\.com/series/(\\w+)',
+        'https://weebcentral.com/series/01J7ABCDEFGHIJKLMNOPQRSTUV/TITLE',
+        'Extractor for manga from weebcentral.com',
+    ),
+    (  # 809
+        'weebdex',
+        'WeebdexChapterExtractor',
+        'weebdex',
+        'chapter',
+        '',
+        '(?:https?://)?weebdex\\.org/chapter/(\\w+)',
+        'https://weebdex.org/chapter/ID/PAGE',
+        'Extractor for weebdex manga chapters',
+    ),
+    (  # 810
+        'weebdex',
+        'WeebdexMangaExtractor',
+        'weebdex',
+        'manga',
+        '',
+        '(?:https?://)?weebdex\\.org/title/(\\w+)',
+        'https://weebdex.org/title/ID/SLUG',
+        'Extractor for weebdex manga',
+    ),
+    (  # 811
+        'weibo',
+        'WeiboUserExtractor',
+        'weibo',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?(?:$|#)',
+        'https://weibo.com/USER',
+        'Extractor for weibo user profiles',
+    ),
+    (  # 812
+        'weibo',
+        'WeiboHomeExtractor',
+        'weibo',
+        'home',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=home',
+        'https://weibo.com/USER?tabtype=home',
+        "Extractor for weibo 'home' listings",
+    ),
+    (  # 813
+        'weibo',
+        'WeiboFeedExtractor',
+        'weibo',
+        'feed',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=feed',
+        'https://weibo.com/USER?tabtype=feed',
+        'Extractor for weibo user feeds',
+    ),
+    (  # 814
+        'weibo',
+        'WeiboVideosExtractor',
+        'weibo',
+        'videos',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=video',
+        'https://weibo.com/USER?tabtype=video',
+        "Extractor for weibo 'video' listings",
+    ),
+    (  # 815
+        'weibo',
+        'WeiboNewvideoExtractor',
+        'weibo',
+        'newvideo',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=newVideo',
+        'https://weibo.com/USER?tabtype=newVideo',
+        "Extractor for weibo 'newVideo' listings",
+    ),
+    (  # 816
+        'weibo',
+        'WeiboArticleExtractor',
+        'weibo',
+        'article',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=article',
+        'https://weibo.com/USER?tabtype=article',
+        "Extractor for weibo 'article' listings",
+    ),
+    (  # 817
+        'weibo',
+        'WeiboAlbumExtractor',
+        'weibo',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=album(?:[:_-]([^&#]+))?',
+        'https://weibo.com/USER?tabtype=album',
+        "Extractor for weibo 'album' listings",
+    ),
+    (  # 818
+        'weibo',
+        'WeiboStatusExtractor',
+        'weibo',
+        'status',
+        '',
+        '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(detail|status|\\d+)/(\\w+)',
+        'https://weibo.com/detail/12345',
+        'Extractor for a weibo status',
+    ),
+    (  # 819
+        'whyp',
+        'WhypAudioExtractor',
+        'whyp',
+        'audio',
+        '',
+        '(?:https?://)?(?:www\\.)?whyp\\.it/tracks/(\\d+)',
+        'https://whyp.it/tracks/12345/SLUG',
+        None,
+    ),
+    (  # 820
+        'whyp',
+        'WhypUserExtractor',
+        'whyp',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?whyp\\.it/users/(\\d+)',
+        'https://whyp.it/users/123/NAME',
+        None,
+    ),
+    (  # 821
+        'whyp',
+        'WhypCollectionExtractor',
+        'whyp',
+        'collection',
+        '',
+        '(?:https?://)?(?:www\\.)?whyp\\.it/collections/(\\d+)',
+        'https://whyp.it/collections/123/NAME',
+        None,
+    ),
+    (  # 822
+        'wikiart',
+        'WikiartArtistExtractor',
+        'wikiart',
+        'artist',
+        '',
+        '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!\\w+-by-)([\\w-]+)/?$',
+        'https://www.wikiart.org/en/ARTIST',
+        "Extractor for an artist's paintings on wikiart.org",
+    ),
+    (  # 823
+        'wikiart',
+        'WikiartImageExtractor',
+        'wikiart',
+        'image',
+        '',
+        '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!(?:paintings|artists)-by-)([\\w-]+)/([\\w-]+)',
+        'https://www.wikiart.org/en/ARTIST/TITLE',
+        'Extractor for individual paintings on wikiart.org',
+    ),
+    (  # 824
+        'wikiart',
+        'WikiartArtworksExtractor',
+        'wikiart',
+        'artworks',
+        '',
+        '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/paintings-by-([\\w-]+)/([\\w-]+)',
+        'https://www.wikiart.org/en/paintings-by-GROUP/TYPE',
+        'Extractor for artwork collections on wikiart.org',
+    ),
+    (  # 825
+        'wikiart',
+        'WikiartArtistsExtractor',
+        'wikiart',
+        'artists',
+        '',
+        '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/artists-by-([\\w-]+)/([\\w-]+)',
+        'https://www.wikiart.org/en/artists-by-GROUP/TYPE',
+        'Extractor for artist collections on wikiart.org',
+    ),
+    (  # 826
+        'wikifeet',
+        'WikifeetGalleryExtractor',
+        'wikifeet',
+        'gallery',
+        '',
+        '(?:https?://)(?:(?:www\\.)?wikifeetx?|men\\.wikifeet)\\.com/([^/?#]+)',
+        'https://www.wikifeet.com/CELEB',
+        'Extractor for image galleries from wikifeet.com',
+    ),
+    (  # 827
+        'wikimedia',
+        'WikimediaArticleExtractor',
+        '',
+        'article',
+        'wikimedia',
+        '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/(?!static/)([^?#]+)',
+        'https://en.wikipedia.org/wiki/TITLE',
+        'Extractor for wikimedia articles',
+    ),
+    (  # 828
+        'wikimedia',
+        'WikimediaWikiExtractor',
+        '',
+        'wiki',
+        'wikimedia',
+        '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/?$',
+        'https://en.wikipedia.org/',
+        'Extractor for all files on a MediaWiki instance',
+    ),
+    (  # 829
+        'xasiat',
+        'XasiatAlbumExtractor',
+        'xasiat',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/(\\d+)/[^/?#]+)',
+        'https://www.xasiat.com/albums/12345/TITLE/',
+        None,
+    ),
+    (  # 830
+        'xasiat',
+        'XasiatTagExtractor',
+        'xasiat',
+        'tag',
+        '',
+        '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/tags/[^/?#]+)',
+        'https://www.xasiat.com/albums/tags/TAG/',
+        None,
+    ),
+    (  # 831
+        'xasiat',
+        'XasiatCategoryExtractor',
+        'xasiat',
+        'category',
+        '',
+        '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/categories/[^/?#]+)',
+        'https://www.xasiat.com/albums/categories/CATEGORY/',
+        None,
+    ),
+    (  # 832
+        'xasiat',
+        'XasiatModelExtractor',
+        'xasiat',
+        'model',
+        '',
+        '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/models/[^/?#]+)',
+        'https://www.xasiat.com/albums/models/MODEL/',
+        None,
+    ),
+    (  # 833
+        'xenforo',
+        'XenforoPostExtractor',
+        '',
+        'post',
+        'xenforo',
+        '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\.moe/forum()))(/(?:index\\.php\\?)?threads/[^/?#]+/#?post-|/posts/)(\\d+)',
+        'https://simpcity.cr/threads/TITLE.12345/post-54321',
+        None,
+    ),
+    (  # 834
+        'xenforo',
+        'XenforoThreadExtractor',
+        '',
+        'thread',
+        'xenforo',
+        '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\.moe/forum()))(/(?:index\\.php\\?)?threads/(?:[^/?#]+\\.)?\\d+)(?:/page-(\\d+))?',
+        'https://simpcity.cr/threads/TITLE.12345/',
+        None,
+    ),
+    (  # 835
+        'xenforo',
+        'XenforoForumExtractor',
+        '',
+        'forum',
+        'xenforo',
+        '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()|(?:www\\.)?allthefallen\\.moe/forum()))(/(?:index\\.php\\?)?forums/(?:[^/?#]+\\.)?[^/?#]+)(?:/page-(\\d+))?',
+        'https://simpcity.cr/forums/TITLE.123/',
+        None,
+    ),
+    (  # 836
+        'xfolio',
+        'XfolioWorkExtractor',
+        'xfolio',
+        'work',
+        '',
+        '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/works/(\\d+)',
+        'https://xfolio.jp/portfolio/USER/works/12345',
+        None,
+    ),
+    (  # 837
+        'xfolio',
+        'XfolioUserExtractor',
+        'xfolio',
+        'user',
+        '',
+        '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)(?:/works)?/?(?:$|\\?|#)',
+        'https://xfolio.jp/portfolio/USER',
+        None,
+    ),
+    (  # 838
+        'xfolio',
+        'XfolioSeriesExtractor',
+        'xfolio',
+        'series',
+        '',
+        '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/series/(\\d+)',
+        'https://xfolio.jp/portfolio/USER/series/12345',
+        None,
+    ),
+    (  # 839
+        'xhamster',
+        'XhamsterGalleryExtractor',
+        'xhamster',
+        'gallery',
+        '',
+        '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))(/photos/gallery/[^/?#]+)',
+        'https://xhamster.com/photos/gallery/12345',
+        'Extractor for image galleries on xhamster.com',
+    ),
+    (  # 840
+        'xhamster',
+        'XhamsterUserExtractor',
+        'xhamster',
+        'user',
+        '',
+        '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))/users/([^/?#]+)(?:/photos)?/?(?:$|[?#])',
+        'https://xhamster.com/users/USER/photos',
+        'Extractor for all galleries of an xhamster user',
+    ),
+    (  # 841
+        'xvideos',
+        'XvideosGalleryExtractor',
+        'xvideos',
+        'gallery',
+        '',
+        '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/photos/(\\d+)',
+        'https://www.xvideos.com/profiles/USER/photos/12345',
+        'Extractor for user profile galleries on xvideos.com',
+    ),
+    (  # 842
+        'xvideos',
+        'XvideosUserExtractor',
+        'xvideos',
+        'user',
+        '',
+        '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/?(?:#.*)?$',
+        'https://www.xvideos.com/profiles/USER',
+        'Extractor for user profiles on xvideos.com',
+    ),
+    (  # 843
+        'yiffverse',
+        'YiffversePostExtractor',
+        'yiffverse',
+        'post',
+        'booru',
+        '(?:https?://)?(?:www\\.)?yiffverse\\.com/post/(\\d+)',
+        'https://yiffverse.com/post/12345',
+        None,
+    ),
+    (  # 844
+        'yiffverse',
+        'YiffversePlaylistExtractor',
+        'yiffverse',
+        'playlist',
+        'booru',
+        '(?:https?://)?(?:www\\.)?yiffverse\\.com/playlist/(\\d+)',
+        'https://yiffverse.com/playlist/12345',
+        None,
+    ),
+    (  # 845
+        'yiffverse',
+        'YiffverseTagExtractor',
+        'yiffverse',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?yiffverse\\.com/(?:tag/([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)',
+        'https://yiffverse.com/tag/TAG',
+        None,
+    ),
+    (  # 846
+        'yourlesbians',
+        'YourlesbiansAlbumExtractor',
+        'yourlesbians',
+        'album',
+        '',
+        '(?:https?://)?(?:www\\.)?yourlesbians\\.com(/album/([^/?#]+)/?)',
+        'https://yourlesbians.com/album/SLUG/',
+        None,
+    ),
+    (  # 847
+        'zerochan',
+        'ZerochanTagExtractor',
+        'zerochan',
+        'tag',
+        'booru',
+        '(?:https?://)?(?:www\\.)?zerochan\\.net/(?!\\d+$)([^/?#]+)/?(?:\\?([^#]+))?',
+        'https://www.zerochan.net/TAG',
+        None,
+    ),
+    (  # 848
+        'zerochan',
+        'ZerochanImageExtractor',
+        'zerochan',
+        'image',
+        'booru',
+        '(?:https?://)?(?:www\\.)?zerochan\\.net/(\\d+)',
+        'https://www.zerochan.net/12345',
+        None,
+    ),
+    (  # 849
+        'moebooru',
+        'MoebooruTagExtractor',
+        '',
+        'tag',
+        'moebooru',
+        '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post\\?(?:[^&#]*&)*tags=([^&#]*)',
+        'https://yande.re/post?tags=TAG',
+        None,
+    ),
+    (  # 850
+        'moebooru',
+        'MoebooruPoolExtractor',
+        '',
+        'pool',
+        'moebooru',
+        '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/pool/show/(\\d+)',
+        'https://yande.re/pool/show/12345',
+        None,
+    ),
+    (  # 851
+        'moebooru',
+        'MoebooruPostExtractor',
+        '',
+        'post',
+        'moebooru',
+        '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/show/(\\d+)',
+        'https://yande.re/post/show/12345',
+        None,
+    ),
+    (  # 852
+        'moebooru',
+        'MoebooruPopularExtractor',
+        '',
+        'popular',
+        'moebooru',
+        '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/popular_(by_(?:day|week|month)|recent)(?:\\?([^#]*))?',
+        'https://yande.re/post/popular_by_month?year=YYYY&month=MM',
+        None,
+    ),
+    (  # 853
+        'foolfuuka',
+        'FoolfuukaThreadExtractor',
+        '',
+        'thread',
+        'foolfuuka',
+        '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/thread/(\\d+)',
+        'https://archived.moe/a/thread/12345/',
+        'Base extractor for threads on FoolFuuka based boards/archives',
+    ),
+    (  # 854
+        'foolfuuka',
+        'FoolfuukaBoardExtractor',
+        '',
+        'board',
+        'foolfuuka',
+        '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)(?:/(?:page/)?(\\d*))?$',
+        'https://archived.moe/a/',
+        'Base extractor for FoolFuuka based boards/archives',
+    ),
+    (  # 855
+        'foolfuuka',
+        'FoolfuukaSearchExtractor',
+        '',
+        'search',
+        'foolfuuka',
+        '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/search((?:/[^/?#]+/[^/?#]+)+)',
+        'https://archived.moe/_/search/text/QUERY/',
+        'Base extractor for search results on FoolFuuka based boards/archives',
+    ),
+    (  # 856
+        'foolfuuka',
+        'FoolfuukaGalleryExtractor',
+        '',
+        'gallery',
+        'foolfuuka',
+        '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/gallery(?:/(\\d+))?',
+        'https://archived.moe/a/gallery',
+        'Base extractor for FoolFuuka galleries',
+    ),
+    (  # 857
+        'foolslide',
+        'FoolslideChapterExtractor',
+        '',
+        'chapter',
+        'foolslide',
+        '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/read/[^/?#]+/[a-z-]+/\\d+/\\d+(?:/\\d+)?)',
+        'https://read.powermanga.org/read/MANGA/en/0/123/',
+        'Base class for chapter extractors for FoOlSlide based sites',
+    ),
+    (  # 858
+        'foolslide',
+        'FoolslideMangaExtractor',
+        '',
+        'manga',
+        'foolslide',
+        '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/series/[^/?#]+)',
+        'https://read.powermanga.org/series/MANGA/',
+        'Base class for manga extractors for FoOlSlide based sites',
+    ),
+    (  # 859
+        'mastodon',
+        'MastodonUserExtractor',
+        '',
+        'user',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)(?:/media)?/?$',
+        'https://mastodon.social/@USER',
+        'Extractor for all images of an account/user',
+    ),
+    (  # 860
+        'mastodon',
+        'MastodonBookmarkExtractor',
+        '',
+        'bookmark',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/bookmarks',
+        'https://mastodon.social/bookmarks',
+        'Extractor for mastodon bookmarks',
+    ),
+    (  # 861
+        'mastodon',
+        'MastodonFavoriteExtractor',
+        '',
+        'favorite',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/favourites',
+        'https://mastodon.social/favourites',
+        'Extractor for mastodon favorites',
+    ),
+    (  # 862
+        'mastodon',
+        'MastodonListExtractor',
+        '',
+        'list',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/lists/(\\w+)',
+        'https://mastodon.social/lists/12345',
+        'Extractor for mastodon lists',
+    ),
+    (  # 863
+        'mastodon',
+        'MastodonHashtagExtractor',
+        '',
+        'hashtag',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/tags/(\\w+)',
+        'https://mastodon.social/tags/NAME',
+        'Extractor for mastodon hashtags',
+    ),
+    (  # 864
+        'mastodon',
+        'MastodonFollowingExtractor',
+        '',
+        'following',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)/following',
+        'https://mastodon.social/@USER/following',
+        'Extractor for followed mastodon users',
+    ),
+    (  # 865
+        'mastodon',
+        'MastodonStatusExtractor',
+        '',
+        'status',
+        'mastodon',
+        '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@[^/?#]+|(?:users/[^/?#]+/)?(?:statuses|notice|objects()))/(?!following)([^/?#]+)',
+        'https://mastodon.social/@USER/12345',
+        'Extractor for images from a status',
+    ),
+    (  # 866
+        'shopify',
+        'ShopifyCollectionExtractor',
+        '',
+        'collection',
+        'shopify',
+        '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))(/collections/[\\w-]+)/?(?:$|[?#])',
+        'https://www.fashionnova.com/collections/TITLE',
+        'Base class for collection extractors for Shopify based sites',
+    ),
+    (  # 867
+        'shopify',
+        'ShopifyProductExtractor',
+        '',
+        'product',
+        'shopify',
+        '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))((?:/collections/[\\w-]+)?/products/[\\w-]+)',
+        'https://www.fashionnova.com/collections/TITLE/products/NAME',
+        'Base class for product extractors for Shopify based sites',
+    ),
+    (  # 868
+        'lolisafe',
+        'LolisafeAlbumExtractor',
+        '',
+        'album',
+        'lolisafe',
+        '(?:lolisafe:(https?://[^/?#]+)|(?:https?://)?(?:))/a/([^/?#]+)',
+        'https://xbunkr.com/a/ID',
+        None,
+    ),
+    (  # 869
+        'imagehosts',
+        'ImxtoImageExtractor',
+        'imxto',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?((?:imx\\.to|img\\.yt)/(?:i/|img-)(\\w+)(\\.html)?)',
+        'https://imx.to/i/ID',
+        'Extractor for single images from imx.to',
+    ),
+    (  # 870
+        'imagehosts',
+        'ImxtoGalleryExtractor',
+        'imxto',
+        'gallery',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?(imx\\.to/g/([^/?#]+))',
+        'https://imx.to/g/ID',
+        'Extractor for image galleries from imx.to',
+    ),
+    (  # 871
+        'imagehosts',
+        'AcidimgImageExtractor',
+        'acidimg',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?acidimg\\.cc/img-([a-z0-9]+)\\.html)',
+        'https://acidimg.cc/img-abc123.html',
+        'Extractor for single images from acidimg.cc',
+    ),
+    (  # 872
+        'imagehosts',
+        'ImagevenueImageExtractor',
+        'imagevenue',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www|img\\d+)\\.imagevenue\\.com/([A-Z0-9]{8,10}|view/.*|img\\.php\\?.*))',
+        'https://www.imagevenue.com/ME123456789',
+        'Extractor for single images from imagevenue.com',
+    ),
+    (  # 873
+        'imagehosts',
+        'ImagetwistImageExtractor',
+        'imagetwist',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/([a-z0-9]{12}))',
+        'https://imagetwist.com/123456abcdef/NAME.EXT',
+        'Extractor for single images from imagetwist.com',
+    ),
+    (  # 874
+        'imagehosts',
+        'ImagetwistGalleryExtractor',
+        'imagetwist',
+        'gallery',
+        'imagehost',
+        '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/(p/[^/?#]+/\\d+))',
+        'https://imagetwist.com/p/USER/12345/NAME',
+        'Extractor for galleries from imagetwist.com',
+    ),
+    (  # 875
+        'imagehosts',
+        'ImgadultImageExtractor',
+        'imgadult',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?imgadult\\.com/img-([0-9a-f]+)\\.html)',
+        'https://imgadult.com/img-0123456789abc.html',
+        'Extractor for single images from imgadult.com',
+    ),
+    (  # 876
+        'imagehosts',
+        'ImgspiceImageExtractor',
+        'imgspice',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?imgspice\\.com/([^/?#]+))',
+        'https://imgspice.com/ID/NAME.EXT.html',
+        'Extractor for single images from imgspice.com',
+    ),
+    (  # 877
+        'imagehosts',
+        'PixhostImageExtractor',
+        'pixhost',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/show/\\d+/(\\d+)_[^/?#]+)',
+        'https://pixhost.to/show/123/12345_NAME.EXT',
+        'Extractor for single images from pixhost.to',
+    ),
+    (  # 878
+        'imagehosts',
+        'PixhostGalleryExtractor',
+        'pixhost',
+        'gallery',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/gallery/([^/?#]+))',
+        'https://pixhost.to/gallery/ID',
+        'Extractor for image galleries from pixhost.to',
+    ),
+    (  # 879
+        'imagehosts',
+        'PostimgImageExtractor',
+        'postimg',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/(?!gallery/)(?:image/)?([^/?#]+)/?)',
+        'https://postimg.cc/ID',
+        'Extractor for single images from postimages.org',
+    ),
+    (  # 880
+        'imagehosts',
+        'PostimgGalleryExtractor',
+        'postimg',
+        'gallery',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/gallery/([^/?#]+))',
+        'https://postimg.cc/gallery/ID',
+        'Extractor for images galleries from postimages.org',
+    ),
+    (  # 881
+        'imagehosts',
+        'TurboimagehostImageExtractor',
+        'turboimagehost',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?turboimagehost\\.com/p/(\\d+)/[^/?#]+\\.html)',
+        'https://www.turboimagehost.com/p/12345/NAME.EXT.html',
+        'Extractor for single images from www.turboimagehost.com',
+    ),
+    (  # 882
+        'imagehosts',
+        'TurboimagehostGalleryExtractor',
+        'turboimagehost',
+        'gallery',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?turboimagehost\\.com/album/(\\d+)/([^/?#]*))',
+        'https://www.turboimagehost.com/album/12345/GALLERY_NAME',
+        'Extractor for image galleries from turboimagehost.com',
+    ),
+    (  # 883
+        'imagehosts',
+        'ViprImageExtractor',
+        'vipr',
+        'image',
+        'imagehost',
+        '(?:https?://)?(vipr\\.im/(\\w+))',
+        'https://vipr.im/abc123.html',
+        'Extractor for single images from vipr.im',
+    ),
+    (  # 884
+        'imagehosts',
+        'ImgclickImageExtractor',
+        'imgclick',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?imgclick\\.net/([^/?#]+))',
+        'http://imgclick.net/abc123/NAME.EXT.html',
+        'Extractor for single images from imgclick.net',
+    ),
+    (  # 885
+        'imagehosts',
+        'FappicImageExtractor',
+        'fappic',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.|img\\d+\\.)?fappic\\.com/(?:i/\\d+/())?(\\w{10,})(?:/|\\.)\\w+',
+        'https://fappic.com/abcde12345/NAME.EXT',
+        'Extractor for single images from fappic.com',
+    ),
+    (  # 886
+        'imagehosts',
+        'PicstateImageExtractor',
+        'picstate',
+        'image',
+        'imagehost',
+        '(?:https?://)?((?:www\\.)?picstate\\.com/view/full/([^/?#]+))',
+        'https://picstate.com/view/full/123',
+        'Extractor for single images from picstate.com',
+    ),
+    (  # 887
+        'imagehosts',
+        'ImgdriveImageExtractor',
+        'imgdrive',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?(img(drive|taxi|wallet)\\.(?:com|net)/img-(\\w+)\\.html)',
+        'https://imgdrive.net/img-0123456789abc.html',
+        'Extractor for single images from imgdrive.net',
+    ),
+    (  # 888
+        'imagehosts',
+        'SilverpicImageExtractor',
+        'silverpic',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?silverpic\\.(?:net|com)(/([a-z0-9]{10,})/[\\S]+\\.html)',
+        'https://silverpic.net/a1b2c3d4f5g6/NAME.EXT.html',
+        'Extractor for single images from silverpic.com',
+    ),
+    (  # 889
+        'imagehosts',
+        'ImgpvImageExtractor',
+        'imgpv',
+        'image',
+        'imagehost',
+        '(?:https?://)?(?:www\\.)?imgpv\\.com(/([a-z0-9]{10,})/[\\S]+\\.html)',
+        'https://www.imgpv.com/a1b2c3d4f5g6/NAME.EXT.html',
+        'Extractor for imgpv.com images',
+    ),
+    (  # 890
+        'directlink',
+        'DirectlinkExtractor',
+        'directlink',
+        '',
+        '',
+        '(?i)https?://(?P<domain>[^/?#]+)/(?P<path>[^?#]+\\.(?:jpe?g|jpe|png|gif|bmp|svg|web[mp]|avif|heic|psd|mp4|m4v|mov|mkv|og[gmv]|wav|mp3|opus|zip|rar|7z|pdf|swf))(?:\\?(?P<query>[^#]*))?(?:#(?P<fragment>.*))?$',
+        'https://en.wikipedia.org/static/images/project-logos/enwiki.png',
+        'Extractor for direct links to images and other media files',
+    ),
+    (  # 891
+        'recursive',
+        'RecursiveExtractor',
+        'recursive',
+        '',
+        '',
+        'r(?:ecursive)?:',
+        'recursive:https://pastebin.com/raw/FLwrCYsT',
+        'Extractor that fetches URLs from a remote or local source',
+    ),
+    (  # 892
+        'oauth',
+        'OAuthFlickr',
+        'oauth',
+        'flickr',
+        '',
+        'oauth:flickr$',
+        'oauth:flickr',
+        None,
+    ),
+    (  # 893
+        'oauth',
+        'OAuthSmugmug',
+        'oauth',
+        'smugmug',
+        '',
+        'oauth:smugmug$',
+        'oauth:smugmug',
+        None,
+    ),
+    (  # 894
+        'oauth',
+        'OAuthTumblr',
+        'oauth',
+        'tumblr',
+        '',
+        'oauth:tumblr$',
+        'oauth:tumblr',
+        None,
+    ),
+    (  # 895
+        'oauth',
+        'OAuthDeviantart',
+        'oauth',
+        'deviantart',
+        '',
+        'oauth:deviantart$',
+        'oauth:deviantart',
+        None,
+    ),
+    (  # 896
+        'oauth',
+        'OAuthReddit',
+        'oauth',
+        'reddit',
+        '',
+        'oauth:reddit$',
+        'oauth:reddit',
+        None,
+    ),
+    (  # 897
+        'oauth',
+        'OAuthMastodon',
+        'oauth',
+        'mastodon',
+        '',
+        'oauth:mastodon:(?:https?://)?([^/?#]+)',
+        'oauth:mastodon:mastodon.social',
+        None,
+    ),
+    (  # 898
+        'oauth',
+        'OAuthPixiv',
+        'oauth',
+        'pixiv',
+        '',
+        'oauth:pixiv$',
+        'oauth:pixiv',
+        None,
+    ),
+    (  # 899
+        'noop',
+        'NoopExtractor',
+        'noop',
+        '',
+        '',
+        '(?i)noo?p$',
+        'noop',
+        None,
+    ),
+    (  # 900
+        'ytdl',
+        'YoutubeDLExtractor',
+        'ytdl',
+        '',
+        '',
+        None,
+        'ytdl:https://www.youtube.com/watch?v=abcdefghijk',
+        'Generic extractor for youtube-dl supported URLs',
+    ),
+    (  # 901
+        'generic',
+        'GenericExtractor',
+        'generic',
+        '',
+        '',
+        None,
+        'generic:https://www.nongnu.org/lzip/',
+        'Extractor for images in a generic web page.',
+    ),
+)
+
+DOMAINS = {
+    '2ch.hk': (0, 1,),
+    '2ch.life': (0, 1,),
+    '2ch.org': (0, 1,),
+    '2ch.su': (0, 1,),
+    '2chan.net': (2,),
+    '2chen': (3, 4,),
+    '2chen.club': (3, 4,),
+    '2chen.moe': (3, 4,),
+    '35photo.pro': (5, 6, 7, 8,),
+    '4archive.org': (15, 16,),
+    '4chanarchives.com': (17, 18,),
+    '4plebs.org': (853, 854, 855, 856,),
+    '500px.com': (19, 20, 21, 22,),
+    '8chan.cc': (23, 24,),
+    '8chan.moe': (23, 24,),
+    '8chan.se': (23, 24,),
+    '8kun.top': (773, 774,),
+    '8muses.com': (25,),
+    '94chan.org': (404, 405,),
+    'acidimg.cc': (871,),
+    'adultdvdempire.com': (26,),
+    'adultempire.com': (26,),
+    'agn.ph': (27, 28,),
+    'ahottie.top': (29, 30, 31,),
+    'aibooru.download': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'aibooru.online': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'allgirl.booru.org': (277, 278, 279,),
+    'allthefallen.moe': (833, 834, 835,),
+    'anchira.to': (643, 644, 645,),
+    'ao3.com': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'ao3.net': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'ao3.org': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'app': (84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99,),
+    'arca.live': (41, 42, 43,),
+    'arch.b4k.co': (853, 854, 855, 856,),
+    'arch.b4k.dev': (853, 854, 855, 856,),
+    'architizer.com': (44, 45,),
+    'archive.palanq.win': (853, 854, 855, 856,),
+    'archived.moe': (853, 854, 855, 856,),
+    'archiveofourown.com': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'archiveofourown.net': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'archiveofourown.org': (32, 33, 34, 35, 36, 37, 38, 39, 40,),
+    'archiveofsins.com': (853, 854, 855, 856,),
+    'archives.bulbagarden.net': (827, 828,),
+    'are.na': (46,),
+    'art.ngfiles.com': (485,),
+    'artstation.com': (47, 48, 49, 50, 51, 52, 53, 54, 55, 56,),
+    'artstn.co': (55,),
+    'aryion.com': (57, 58, 59, 60, 61, 62,),
+    'audiochan.com': (63, 64, 65, 66,),
+    'azurlane.koumakan.jp': (827, 828,),
+    'baraag.net': (859, 860, 861, 862, 863, 864, 865,),
+    'bato.to': (67, 68,),
+    'bbc.co.uk': (69, 70,),
+    'bbw-chan.link': (434, 435,),
+    'bbw-chan.nl': (434, 435,),
+    'behance.net': (71, 72, 73,),
+    'behoimi.org': (9, 10, 11, 12,),
+    'bellazon.com': (74, 75, 76,),
+    'bit.ly': (770,),
+    'blog.livedoor.jp': (428, 429,),
+    'blog.naver.com': (477, 478,),
+    'blogger': (80, 81, 82, 83,),
+    'blogspot.com': (80, 81, 82, 83,),
+    'boards.4chan.org': (13, 14,),
+    'boards.4channel.org': (13, 14,),
+    'boards.fireden.net': (853, 854, 855, 856,),
+    'boards.guro.cx': (773, 774,),
+    'booru.allthefallen.moe': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'booru.bcbnsfw.space': (693, 694,),
+    'booru.borvar.art': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'booru.cavemanon.xyz': (659, 660,),
+    'boosty.to': (100, 101, 102, 103, 104, 105,),
+    'booth.pm': (106, 107,),
+    'bulbapedia.bulbagarden.net': (827, 828,),
+    'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion': (596, 597, 598, 599, 600, 601, 602,),
+    'catbox.moe': (110,),
+    'cfake.com': (112, 113, 114, 115,),
+    'chelseacrew.com': (866, 867,),
+    'chevereto': (116, 117, 118, 119, 120,),
+    'church': (116, 117, 118, 119, 120,),
+    'chzzk.naver.com': (479, 480,),
+    'ci-en.dlsite.com': (121, 122, 123, 124,),
+    'ci-en.net': (121, 122, 123, 124,),
+    'civitai.com': (125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142,),
+    'co.llection.pics': (659, 660,),
+    'com': (67, 68, 316, 317, 318, 416, 417, 738, 739, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 839, 840,),
+    'comedywildlifephoto.com': (143,),
+    'comic.naver.com': (481, 482,),
+    'comick.io': (144, 145, 146,),
+    'comicpark.com': (453, 454,),
+    'comicpark.io': (453, 454,),
+    'comicpark.me': (453, 454,),
+    'comicpark.net': (453, 454,),
+    'comicpark.org': (453, 454,),
+    'comicpark.to': (453, 454,),
+    'comicvine.gamespot.com': (147,),
+    'commons.wikimedia.org': (827, 828,),
+    'cosplay.paheal.net': (520, 521,),
+    'cr': (116, 117, 118, 119, 120, 638, 639,),
+    'cyberdrop.cr': (148, 149,),
+    'cyberdrop.me': (148, 149,),
+    'cyberdrop.to': (148, 149,),
+    'cyberfile.me': (150, 151, 152,),
+    'cz': (416, 417,),
+    'danbooru': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'danbooru.donmai.us': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'dandadan.net': (162, 163,),
+    'danke.moe': (164, 165,),
+    'de.catbox.moe': (111,),
+    'derpibooru.org': (530, 531, 532,),
+    'desi': (839, 840,),
+    'desktopography.net': (166, 167, 168,),
+    'desuarchive.org': (853, 854, 855, 856,),
+    'deviantart.com': (169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182, 183, 185, 186,),
+    'discord.com': (187, 188, 189, 190, 191, 192,),
+    'donmai.moe': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'downloads.khinsider.com': (415,),
+    'drawfriends.booru.org': (277, 278, 279,),
+    'dto.to': (67, 68,),
+    'dynasty-scans.com': (193, 194, 195, 196, 197,),
+    'e621': (198, 199, 200, 201, 202, 203, 204,),
+    'e621.anthro.fr': (205,),
+    'e621.cc': (198, 199, 200, 201, 202, 203, 204, 205,),
+    'e621.net': (198, 199, 200, 201, 202, 203, 204,),
+    'e6ai.net': (198, 199, 200, 201, 202, 203, 204,),
+    'e926.net': (198, 199, 200, 201, 202, 203, 204,),
+    'endchan.gg': (434, 435,),
+    'endchan.net': (434, 435,),
+    'endchan.org': (434, 435,),
+    'eporner.com': (206,),
+    'erome.com': (207, 208, 209,),
+    'everia.club': (210, 211, 212, 213, 214,),
+    'facebook.com': (218, 219, 220, 221, 222, 223, 224, 225,),
+    'fanbox.cc': (226, 227, 228, 229,),
+    'fandom.com': (827, 828,),
+    'fanfox.net': (446, 447,),
+    'fansly.com': (231, 232, 233, 234, 235, 236,),
+    'fantia.jp': (237, 238,),
+    'fapachi.com': (242, 243,),
+    'fapello.com': (239, 240, 241,),
+    'fapello.su': (239, 240, 241,),
+    'fappic.com': (885,),
+    'fashionnova.com': (866, 867,),
+    'fav.me': (182,),
+    'fikfap.com': (244, 245,),
+    'files.catbox.moe': (111,),
+    'fish': (116, 117, 118, 119, 120,),
+    'fishing': (116, 117, 118, 119, 120,),
+    'fitnakedgirls.com': (246, 247, 248, 249, 250,),
+    'flic.kr': (251,),
+    'flickr.com': (251, 252, 253, 254, 255, 256, 257,),
+    'foolfuuka': (853, 854, 855, 856,),
+    'fto.to': (67, 68,),
+    'furbooru.org': (530, 531, 532,),
+    'furry34.com': (267, 268, 269,),
+    'fuskator.com': (270, 271,),
+    'fxdeviantart.com': (169, 170, 171, 172, 173, 175, 176, 177, 178, 182, 183, 185, 186,),
+    'gelbooru.com': (272, 273, 274, 275, 276,),
+    'gelbooru_v01': (277, 278, 279,),
+    'gelbooru_v02': (280, 281, 282, 283,),
+    'gfycat.com': (626,),
+    'gifdeliverynetwork.com': (626,),
+    'girlsreleased.com': (284, 285, 286,),
+    'girlswithmuscle.com': (287, 288,),
+    'gofile.io': (289,),
+    'hateblo.jp': (290, 292, 293,),
+    'hatenablog': (290, 292, 293,),
+    'hatenablog.com': (290, 292, 293,),
+    'hatenablog.jp': (290, 292, 293,),
+    'hatenadiary.com': (290, 292, 293,),
+    'hdoujin.net': (294, 295, 296,),
+    'hdoujin.org': (294, 295, 296,),
+    'hentai-cosplay-xxx.com': (299,),
+    'hentai-cosplay.com': (299,),
+    'hentai-cosplays-xxx.com': (299,),
+    'hentai-cosplays.com': (299,),
+    'hentai-foundry.com': (300, 301, 302, 303, 304, 305, 306, 307, 308, 309,),
+    'hentai-img-xxx.com': (299,),
+    'hentai-img.com': (299,),
+    'hentai2read.com': (297, 298,),
+    'hentaicosplays': (299,),
+    'hentaienvy.com': (353, 354, 355,),
+    'hentaiera.com': (353, 354, 355,),
+    'hentaifox.com': (353, 354, 355,),
+    'hentaihand.com': (310, 311,),
+    'hentaihere.com': (312, 313,),
+    'hentainexus.com': (314, 315,),
+    'hentairox.com': (353, 354, 355,),
+    'hentaizap.com': (353, 354, 355,),
+    'hijiribe.donmai.us': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'hitomi.la': (319, 320, 321, 322,),
+    'horne.red': (499, 500, 501, 502, 503, 504, 505, 506,),
+    'hoshino.one': (643, 644, 645,),
+    'hotleak.vip': (323, 324, 325, 326,),
+    'hto.to': (67, 68,),
+    'hypnohub.net': (280, 281, 282, 283,),
+    'i.pximg.net': (561,),
+    'i.redd.it': (619,),
+    'i.reddituploads.com': (619,),
+    'ibb.co': (335, 336,),
+    'idolcomplex.com': (640,),
+    'illusioncards.booru.org': (277, 278, 279,),
+    'imagebam.com': (327, 328,),
+    'imagefap.com': (331, 332, 333, 334,),
+    'imagehaha.com': (873, 874,),
+    'imagepond.net': (116, 117, 118, 119, 120,),
+    'imagetwist.com': (873, 874,),
+    'imagevenue.com': (872,),
+    'img.yt': (869,),
+    'imgadult.com': (875,),
+    'imgbox.com': (338, 339,),
+    'imgchest.com': (329, 330,),
+    'imgclick.net': (884,),
+    'imgdrive.com': (887,),
+    'imgdrive.net': (887,),
+    'imglike.com': (116, 117, 118, 119, 120,),
+    'imgpile.com': (340, 341,),
+    'imgpv.com': (889,),
+    'imgspice.com': (876,),
+    'imgtaxi.com': (887,),
+    'imgtaxi.net': (887,),
+    'imgth.com': (342,),
+    'imgur.com': (343, 344, 345, 346, 347, 348, 349, 350, 351, 352,),
+    'imgur.io': (343, 344, 345, 346, 347, 348, 349, 350, 351, 352,),
+    'imgwallet.com': (887,),
+    'imgwallet.net': (887,),
+    'imhentai': (353, 354, 355,),
+    'imhentai.xxx': (353, 354, 355,),
+    'imx.to': (869, 870,),
+    'info': (316, 317, 318,),
+    'inkbunny.net': (356, 357, 358, 359, 360, 361, 362,),
+    'instagram.com': (363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378,),
+    'issuu.com': (379, 380,),
+    'itaku.ee': (381, 382, 383, 384, 385, 386, 387, 388, 389, 390,),
+    'itch.io': (391,),
+    'iwara.tv': (392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403,),
+    'jschan': (404, 405,),
+    'jto.to': (67, 68,),
+    'k00.fr': (418,),
+    'kabe-uchiroom.com': (406,),
+    'koharu.to': (643, 644, 645,),
+    'kohlchan.net': (434, 435,),
+    'konachan.com': (849, 850, 851, 852,),
+    'konachan.net': (849, 850, 851, 852,),
+    'koofr.eu': (418,),
+    'koofr.net': (418,),
+    'l3n.co': (425,),
+    'la': (416, 417,),
+    'leakgallery.com': (419, 420, 421, 422,),
+    'lensdump.com': (423, 424, 425,),
+    'lesbian.energy': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'li': (416, 417,),
+    'lightroom.adobe.com': (427,),
+    'litter.catbox.moe': (111,),
+    'lofter.com': (430,),
+    'lohas.nicoseiga.jp': (650,),
+    'lol': (416, 417,),
+    'lolibooru.moe': (849, 850, 851, 852,),
+    'loungeunderwear.com': (866, 867,),
+    'luscious.net': (432, 433,),
+    'lynxchan': (434, 435,),
+    'main.bsky.dev': (84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99,),
+    'manga.madokami.al': (436,),
+    'mangadex.cc': (437, 438, 439, 440, 441, 442, 443,),
+    'mangadex.org': (437, 438, 439, 440, 441, 442, 443,),
+    'mangafire.to': (444, 445,),
+    'mangafox.me': (446, 447,),
+    'mangakakalot.gg': (450, 451, 452,),
+    'manganato.gg': (450, 451, 452,),
+    'manganelo': (450, 451, 452,),
+    'mangapark.com': (453, 454,),
+    'mangapark.io': (453, 454,),
+    'mangapark.me': (453, 454,),
+    'mangapark.net': (453, 454,),
+    'mangapark.org': (453, 454,),
+    'mangapark.to': (453, 454,),
+    'mangaread.org': (455, 456,),
+    'mangareader.to': (457, 458,),
+    'mangataro.org': (459, 460,),
+    'mangoxo.com': (461, 462,),
+    'mariowiki.com': (827, 828,),
+    'mastodon': (859, 860, 861, 862, 863, 864, 865,),
+    'mastodon.social': (859, 860, 861, 862, 863, 864, 865,),
+    'me': (416, 417,),
+    'mediawiki.org': (827, 828,),
+    'michaels.com.au': (866, 867,),
+    'misskey': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'misskey.art': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'misskey.design': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'misskey.io': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'modcloth.com': (866, 867,),
+    'moe': (416, 417,),
+    'moebooru': (849, 850, 851, 852,),
+    'motherless.com': (471, 472, 473,),
+    'mpark.to': (453, 454,),
+    'mto.to': (67, 68,),
+    'myhentaigallery.com': (474, 475,),
+    'natomanga.com': (450, 451, 452,),
+    'nekohouse.su': (483, 484,),
+    'nelomanga.net': (450, 451, 452,),
+    'net': (67, 68, 258, 259, 260, 261, 262, 263, 264, 265, 266, 316, 317, 318,),
+    'newgrounds.com': (485, 486, 487, 488, 489, 490, 491, 492, 493, 494,),
+    'news.sankakucomplex.com': (641, 642,),
+    'nhentai.net': (495, 496, 497, 498,),
+    'nicovideo.jp': (649, 650,),
+    'nijie': (499, 500, 501, 502, 503, 504, 505, 506,),
+    'nijie.info': (499, 500, 501, 502, 503, 504, 505, 506,),
+    'niyaniya.moe': (643, 644, 645,),
+    'noop': (899,),
+    'nop': (899,),
+    'noz.rip': (659, 660,),
+    'nozomi.la': (512, 513, 514, 515,),
+    'nsfwalbum.com': (516,),
+    'nudostar.com': (833, 834, 835,),
+    'oauth': (892, 893, 894, 895, 896, 898,),
+    'ohpolly.com': (866, 867,),
+    'ok.porn': (519,),
+    'omgmiamiswimwear.com': (866, 867,),
+    'one': (839, 840,),
+    'onepiecechapters.com': (698, 699,),
+    'onepiecechapters.me': (698, 699,),
+    'org': (67, 68, 215, 216, 217,),
+    'parkmanga.com': (453, 454,),
+    'parkmanga.net': (453, 454,),
+    'parkmanga.org': (453, 454,),
+    'patreon.com': (522, 523, 524, 525,),
+    'pawoo.net': (859, 860, 861, 862, 863, 864, 865,),
+    'pbs.twimg.com': (762,),
+    'pet': (116, 117, 118, 119, 120,),
+    'pexels.com': (526, 527, 528, 529,),
+    'philomena': (530, 531, 532,),
+    'phixiv.net': (556, 557, 558, 559, 561, 562, 563, 564, 565, 566, 568, 570, 571, 572, 573,),
+    'picarto.tv': (534,),
+    'picazor.com': (535,),
+    'picstate.com': (886,),
+    'pictoa.com': (536, 537,),
+    'pictoa.com.de': (536, 537,),
+    'piczel.tv': (538, 539, 540,),
+    'pidgi.net': (827, 828,),
+    'pin.it': (552,),
+    'pinupgirlclothing.com': (866, 867,),
+    'pixeldrain.com': (553, 554, 555,),
+    'pixhost.org': (877, 878,),
+    'pixhost.to': (877, 878,),
+    'pixiv.me': (560,),
+    'pixiv.net': (230, 556, 557, 558, 559, 561, 562, 563, 564, 565, 566, 568, 570, 571, 572, 573,),
+    'pixivision.net': (567,),
+    'pixxxels.cc': (879, 880,),
+    'pixxxels.org': (879, 880,),
+    'pk': (638, 639,),
+    'plurk.com': (578, 579,),
+    'poipiku.com': (580, 581,),
+    'ponybooru.org': (530, 531, 532,),
+    'poringa.net': (582, 583, 584,),
+    'porn-image-xxx.com': (299,),
+    'porn-image.com': (299,),
+    'porn-images-xxx.com': (299,),
+    'porn-images.com': (299,),
+    'pornhub.com': (585, 586, 587, 588, 589,),
+    'pornpics.com': (590, 591, 592, 593, 594,),
+    'pornstars.tube': (595,),
+    'postimages.cc': (879, 880,),
+    'postimages.org': (879, 880,),
+    'postimg.cc': (879, 880,),
+    'postimg.org': (879, 880,),
+    'postmill': (596, 597, 598, 599, 600, 601, 602,),
+    'preview.redd.it': (619,),
+    'raddle.me': (596, 597, 598, 599, 600, 601, 602,),
+    'raidlondon.com': (866, 867,),
+    'raw.senmanga.com': (651,),
+    'rawkuma.com': (603, 604,),
+    'rawkuma.net': (603, 604,),
+    'rbt.asia': (853, 854, 855, 856,),
+    'readcomiconline.li': (609, 610,),
+    'readcomiconline.to': (609, 610,),
+    'readpark.com': (453, 454,),
+    'readpark.io': (453, 454,),
+    'readpark.me': (453, 454,),
+    'readpark.net': (453, 454,),
+    'readpark.org': (453, 454,),
+    'readpark.to': (453, 454,),
+    'realbooru.com': (611, 612, 613, 614,),
+    'rebeccablacktech.com': (853, 854, 855, 856,),
+    'redd.it': (618,),
+    'reddit.com': (615, 617, 618, 620,),
+    'redgifs.com': (621, 622, 623, 624, 625, 626,),
+    'rule34.paheal.net': (520, 521,),
+    'rule34.us': (627, 628,),
+    'rule34.xxx': (280, 281, 282, 283,),
+    'rule34.xyz': (632, 633, 634,),
+    'rule34hentai.net': (659, 660,),
+    'rule34vault.com': (629, 630, 631,),
+    'rule63.paheal.net': (520, 521,),
+    's3nd.pics': (635, 636, 637,),
+    'safebooru.donmai.us': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'safebooru.org': (280, 281, 282, 283,),
+    'sakugabooru.com': (849, 850, 851, 852,),
+    'sankaku.app': (640,),
+    'schan.help': (3, 4,),
+    'scrolller.com': (646, 647, 648,),
+    'seia.to': (643, 644, 645,),
+    'sex.com': (652, 653, 654, 655, 656, 657, 658,),
+    'shimmie2': (659, 660,),
+    'shopify': (866, 867,),
+    'shupogaki.moe': (643, 644, 645,),
+    'silverpic.com': (888,),
+    'silverpic.net': (888,),
+    'simpcity.cr': (833, 834, 835,),
+    'simpcity.su': (833, 834, 835,),
+    'simply-hentai.com': (662,),
+    'site': (416, 417,),
+    'sizebooru.com': (664, 665, 666, 667, 668,),
+    'skeb.jp': (669, 670, 671, 672, 673, 674, 675,),
+    'sketch.pixiv.net': (569,),
+    'slickpic.com': (676,),
+    'slideshare.net': (678,),
+    'smuglo.li': (773, 774,),
+    'smugloli.net': (773, 774,),
+    'snootbooru.com': (693, 694,),
+    'sonohara.donmai.us': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'soundgasm.net': (682, 683,),
+    'soybooru.com': (659, 660,),
+    'space.bilibili.com': (78, 79,),
+    'speakerdeck.com': (684,),
+    'species.wikimedia.org': (827, 828,),
+    'sta.sh': (174,),
+    'staticflickr.com': (251,),
+    'steamgriddb.com': (685, 686, 687, 688, 689,),
+    'sturdychan.help': (3, 4,),
+    'su': (116, 117, 118, 119, 120, 638, 639,),
+    'subscribestar.adult': (690, 691,),
+    'subscribestar.com': (690, 691,),
+    'sushi.ski': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'sxypix.com': (692,),
+    'szurubooru': (693, 694,),
+    't.co': (770,),
+    'tapas.io': (695, 696, 697,),
+    'tbib.org': (280, 281, 282, 283,),
+    'tcb-backup.bihar-mirchi.com': (698, 699,),
+    'tcb-backup.bihar-mirchi.me': (698, 699,),
+    'tcbscans.com': (698, 699,),
+    'tcbscans.me': (698, 699,),
+    'telegra.ph': (700,),
+    'tenor.com': (701, 702, 703,),
+    'the-collection.booru.org': (277, 278, 279,),
+    'thebarchive.com': (853, 854, 855, 856,),
+    'thehentaiworld.com': (704, 705,),
+    'tiktok.com': (706, 707, 708, 709, 710, 711, 712, 713, 714, 715,),
+    'tiktokv.com': (706, 708, 709, 710, 711, 712, 713, 714, 715,),
+    'tmohentai.com': (716,),
+    'to': (638, 639,),
+    'top': (316, 317, 318,),
+    'toyhou.se': (717, 718,),
+    'tsumino.com': (719, 720,),
+    'tumblr': (721, 722, 723, 724, 725, 726, 727,),
+    'tumblr.com': (721, 722, 723, 724, 725, 726, 727, 728,),
+    'tumblrgallery.xyz': (729, 730, 731,),
+    'tungsten.run': (732, 733, 734,),
+    'turboimagehost.com': (881, 882,),
+    'twibooru.org': (735, 736, 737,),
+    'unique-vintage.com': (866, 867,),
+    'unsplash.com': (764, 765, 766, 767, 768,),
+    'uploadir.com': (769,),
+    'urlgalleries.net': (763,),
+    'urlshortener': (770,),
+    'vanilla-rock.com': (771, 772,),
+    'vichan': (773, 774,),
+    'videos.simply-hentai.com': (663,),
+    'vidya.pics': (659, 660,),
+    'vidyart2.booru.org': (277, 278, 279,),
+    'vipergirls.to': (775, 776,),
+    'vipr.im': (883,),
+    'visuabusters.com': (693, 694,),
+    'vk.com': (777, 778, 779, 780,),
+    'vogue.com': (533,),
+    'vsco.co': (781, 782, 783, 784, 785, 786, 787, 788,),
+    'wallhaven.cc': (789, 790, 791, 792, 793, 794,),
+    'wallpapercave.com': (795,),
+    'warosu.org': (796,),
+    'webmshare.com': (803,),
+    'webtoons.com': (804, 805, 806,),
+    'weebcentral.com': (807, 808,),
+    'weebdex.org': (809, 810,),
+    'weibo.cn': (811, 812, 813, 814, 815, 816, 817, 818,),
+    'weibo.com': (811, 812, 813, 814, 815, 816, 817, 818,),
+    'whvn.cc': (794,),
+    'whyp.it': (819, 820, 821,),
+    'wiki.gg': (827, 828,),
+    'wikiart.org': (822, 823, 824, 825,),
+    'wikibooks.org': (827, 828,),
+    'wikidata.org': (827, 828,),
+    'wikifeet.com': (826,),
+    'wikifeetx.com': (826,),
+    'wikimedia': (827, 828,),
+    'wikinews.org': (827, 828,),
+    'wikipedia.org': (827, 828,),
+    'wikiquote.org': (827, 828,),
+    'wikisource.org': (827, 828,),
+    'wikiversity.org': (827, 828,),
+    'wikivoyage.org': (827, 828,),
+    'wiktionary.org': (827, 828,),
+    'windsorstore.com': (866, 867,),
+    'wto.to': (67, 68,),
+    'www.deviantart.com': (179, 184,),
+    'www.pillowfort.social': (541, 542,),
+    'www.sankakucomplex.com': (641, 642,),
+    'xasiat.com': (829, 830, 831, 832,),
+    'xbooru.com': (280, 281, 282, 283,),
+    'xenforo': (833, 834, 835,),
+    'xfolio.jp': (836, 837, 838,),
+    'xhamster.porncache.net': (839, 840,),
+    'xvideos.com': (841, 842,),
+    'yande.re': (849, 850, 851, 852,),
+    'yiffverse.com': (843, 844, 845,),
+    'yourlesbians.com': (846,),
+    'zerochan.net': (847, 848,),
+}
+
+FALLBACK = (77, 108, 109, 291, 337, 407, 408, 409, 410, 411, 412, 413, 414, 426, 431, 448, 449, 476, 507, 508, 509, 510, 511, 517, 518, 543, 544, 545, 546, 547, 548, 549, 550, 551, 574, 575, 576, 577, 605, 606, 607, 608, 616, 661, 677, 679, 680, 681, 797, 798, 799, 800, 801, 802, 857, 858, 868, 890, 891, 897, 900, 901,)
+
+BASECATEGORIES = {
+    '2chen': (3, 4,),
+    'Danbooru': (153, 154, 155, 156, 157, 158, 159, 160, 161,),
+    'E621': (198, 199, 200, 201, 202, 203, 204,),
+    'IMHentai': (353, 354, 355,),
+    'Nijie': (499, 500, 501, 502, 503, 504, 505, 506,),
+    'blogger': (80, 81, 82, 83,),
+    'booru': (9, 10, 11, 12, 27, 28, 267, 268, 269, 272, 273, 274, 275, 611, 612, 613, 614, 627, 628, 629, 630, 631, 632, 633, 634, 664, 665, 666, 667, 668, 843, 844, 845, 847, 848,),
+    'chevereto': (116, 117, 118, 119, 120,),
+    'foolfuuka': (853, 854, 855, 856,),
+    'foolslide': (857, 858,),
+    'gelbooru_v01': (277, 278, 279,),
+    'gelbooru_v02': (280, 281, 282, 283,),
+    'hentaicosplays': (299,),
+    'jschan': (404, 405,),
+    'lolisafe': (108, 109, 148, 149, 638, 639, 868,),
+    'lynxchan': (434, 435,),
+    'manganelo': (450, 451, 452,),
+    'mastodon': (859, 860, 861, 862, 863, 864, 865,),
+    'misskey': (463, 464, 465, 466, 467, 468, 469, 470,),
+    'moebooru': (849, 850, 851, 852,),
+    'nitter': (507, 508, 509, 510, 511,),
+    'philomena': (530, 531, 532, 735, 736, 737,),
+    'postmill': (596, 597, 598, 599, 600, 601, 602,),
+    'reactor': (605, 606, 607, 608,),
+    'shimmie2': (659, 660,),
+    'shopify': (866, 867,),
+    'szurubooru': (693, 694,),
+    'urlshortener': (770,),
+    'vichan': (773, 774,),
+    'wikimedia': (827, 828,),
+    'xenforo': (833, 834, 835,),
+}
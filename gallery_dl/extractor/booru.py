@@ -34,7 +34,7 @@ class BooruExtractor(BaseExtractor):
             else:
                 self._file_url = operator.itemgetter(url_key)
 
-        for post in self.posts():
+        for post in self._prefetch(self.posts()):
             try:
                 url = self._file_url(post)
                 if url[0] == "/":
@@ -45,6 +45,9 @@ class BooruExtractor(BaseExtractor):
                                  "(md5: %s)", post.get("id"), post.get("md5"))
                 continue
 
+            if self._archive_stop(post, data):
+                return
+
             if fetch_html:
                 html = self._html(post)
                 if tags:
@@ -22,7 +22,7 @@ import threading
 from xml.etree import ElementTree
 from requests.adapters import HTTPAdapter
 from .message import Message
-from .. import config, output, text, util, dt, cache, exception
+from .. import config, output, text, util, dt, cache, exception, ratelimit
 urllib3 = requests.packages.urllib3
 
 
@@ -49,7 +49,6 @@ class Extractor():
     request_interval = 0.0
     request_interval_min = 0.0
     request_interval_429 = 60.0
-    request_timestamp = 0.0
 
     def __init__(self, match):
         self.log = logging.getLogger(self.category)
@@ -176,11 +175,13 @@ class Extractor():
         response = challenge = None
         tries = 1
 
-        if self._interval and interval:
-            seconds = (self._interval() -
-                       (time.time() - Extractor.request_timestamp))
-            if seconds > 0.0:
+        bucket = ratelimit.bucket(self._ratelimit_key(url))
+        if interval:
+            interval = self._interval() if self._interval else 0.0
+            if (seconds := bucket.acquire(interval)) > 0.0:
                 self.sleep(seconds, "request")
+        else:
+            interval = None
 
         while True:
             try:
@@ -215,6 +216,7 @@ class Extractor():
                 ):
                     if encoding:
                         response.encoding = encoding
+                    bucket.success()
                     return response
                 if notfound and code == 404:
                     self.status |= exception.NotFoundError.code
@@ -234,8 +236,8 @@ class Extractor():
                     break
 
             finally:
-                if interval:
-                    Extractor.request_timestamp = time.time()
+                if interval is not None:
+                    bucket.release(interval)
 
             self.log.debug("%s (%s/%s)", msg, tries, retries+1)
             if tries > retries:
@@ -248,8 +250,13 @@ class Extractor():
                     seconds = s
             if code == 429 and self._interval_429:
                 s = self._interval_429()
+                if self._adaptive_429 and \
+                        (retry_after := ratelimit.retry_after(response)):
+                    s = retry_after
                 if seconds < s:
                     seconds = s
+                if self._adaptive_429:
+                    bucket.backoff(seconds)
                 self.wait(seconds=seconds, reason="429 Too Many Requests")
             else:
                 self.sleep(seconds, "retry")
@@ -310,6 +317,10 @@ class Extractor():
             raise
 
     _handle_429 = util.false
+    _checkpoint = _checkpoint_key = _checkpoint_first = None
+    _checkpoint_defer = None
+    _archive_check = None
+    _archive_limit = _archive_count = 0
 
     def wait(self, seconds=None, until=None, adjust=1.0,
              reason="rate limit"):
@@ -400,6 +411,12 @@ class Extractor():
         self._interval_429 = util.build_duration_func(
             self.config("sleep-429", self.request_interval_429),
         )
+        self._adaptive_429 = self.config("sleep-429-adaptive", True)
+        self._ratelimit_key = ratelimit.build_key_func(
+            self.config("sleep-request-scope"), self.category)
+
+        if checkpoint := self.config("checkpoint"):
+            self._checkpoint = "resume" if checkpoint is True else checkpoint
 
         if self._retries < 0:
             self._retries = float("inf")
@@ -698,6 +715,132 @@ class Extractor():
             text.extr(page, " id='__NEXT_DATA__' type='application/json'>",
                       "</script>"))
 
+    def _prefetch(self, iterable, depth=None):
+        """Iterate over 'iterable' in a background thread
+
+        Fetches up to 'depth' items ahead of the calling thread and
+        re-raises exceptions, including StopExtraction, in the latter.
+        Requests made in the background thread still adhere to
+        'sleep-request' intervals.
+        Checkpoints saved in the background thread get saved
+        once the calling thread reaches their position.
+        """
+        if depth is None:
+            depth = self.config("prefetch", 0)
+        if not depth or depth < 0:
+            return iterable
+        return _prefetch(iterable, depth, self)
+
+    def _checkpoint_load(self):
+        """Return the cursor saved by an interrupted earlier run"""
+        if not self._checkpoint:
+            return None
+        state = self._checkpoint_state()
+        if cursor := state.get("cursor"):
+            self.log.info("Resuming from checkpoint '%s'", cursor)
+            self._checkpoint_first = state.get("first")
+        return cursor
+
+    def _checkpoint_save(self, cursor):
+        """Save 'cursor' as position to resume from
+
+        A 'cursor' value of None marks the end of pagination.
+        """
+        if not self._checkpoint:
+            return
+        if (defer := self._checkpoint_defer) is not None and \
+                defer[0] == threading.get_ident():
+            defer[1]((None, cursor))
+            return
+        state = self._checkpoint_state()
+        update = {"cursor": cursor}
+
+        if self._checkpoint == "stop" and self._checkpoint_first is not None:
+            if cursor is None:
+                update["last"] = self._checkpoint_first
+                self._checkpoint_first = None
+            else:
+                update["first"] = self._checkpoint_first
+        self._checkpoint_update(state, update)
+
+    def _checkpoint_clear(self):
+        """Discard the position saved by a run that stopped early"""
+        if self._checkpoint:
+            self._checkpoint_first = None
+            self._checkpoint_update(
+                self._checkpoint_state(), {"cursor": None})
+
+    def _checkpoint_seen(self, item_id):
+        """Return True if 'item_id' was reached by an earlier run
+
+        Only applicable to results ordered from newest to oldest.
+        """
+        if self._checkpoint != "stop":
+            return False
+
+        if (last := self._checkpoint_state().get("last")) is not None:
+            try:
+                seen = int(item_id) <= int(last)
+            except (TypeError, ValueError):
+                seen = item_id == last
+            if seen:
+                self.log.info("Reached last item of the previous run (%s)",
+                              last)
+                self._checkpoint_save(None)
+                return True
+
+        if self._checkpoint_first is None:
+            self._checkpoint_first = item_id
+        return False
+
+    def _archive_stop(self, post, data=None):
+        """Return True if pagination should stop at 'post'
+
+        Checks 'post', updated with 'data', against the download archive
+        before any of its files get extracted and returns True after
+        'archive-stop' consecutive posts were found in it.
+        Not to be called for posts without files.
+        """
+        if self._archive_check is None:
+            return False
+
+        kwdict = post.copy()
+        if data:
+            kwdict.update(data)
+        if not self._archive_check(kwdict):
+            self._archive_count = 0
+            return False
+
+        self._archive_count += 1
+        if self._archive_count < self._archive_limit:
+            return False
+        self.log.info("Stopping after %s consecutive archived posts",
+                      self._archive_count)
+        return True
+
+    def _checkpoint_state(self):
+        if self._checkpoint_key is None:
+            self._checkpoint_key = key = \
+                f"{self.category}_{self.subcategory}_{self.url}"
+            self._checkpoint_data = _checkpoint_cache(key).copy()
+        return self._checkpoint_data
+
+    def _checkpoint_update(self, state, update):
+        if update.get("cursor") is None:
+            update["first"] = None
+        changed = False
+        for key, value in update.items():
+            if value is None:
+                if state.pop(key, None) is not None:
+                    changed = True
+            elif state.get(key) != value:
+                state[key] = value
+                changed = True
+
+        if changed:
+            self.log.debug("Checkpoint: %s", state)
+            _checkpoint_cache.update(self._checkpoint_key, state.copy())
+
     def _cache(self, func, maxage, keyarg=None):
         #  return cache.DatabaseCacheDecorator(func, maxage, keyarg)
         return cache.DatabaseCacheDecorator(func, keyarg, maxage)
@@ -948,33 +1091,9 @@ class AsynchronousMixin():
 
     def __iter__(self):
         self.initialize()
-
-        messages = queue.Queue(5)
-        thread = threading.Thread(
-            target=self.async_items,
-            args=(messages,),
-            daemon=True,
-        )
-
-        thread.start()
-        while True:
-            msg = messages.get()
-            if msg is None:
-                thread.join()
-                return
-            if isinstance(msg, Exception):
-                thread.join()
-                raise msg
-            yield msg
-            messages.task_done()
-
-    def async_items(self, messages):
-        try:
-            for msg in self.items():
-                messages.put(msg)
-        except Exception as exc:
-            messages.put(exc)
-        messages.put(None)
+        if (depth := self.config("prefetch")) is None:
+            depth = 5
+        yield from self._prefetch(self.items(), depth)
 
 
 class BaseExtractor(Extractor):
@@ -1028,7 +1147,10 @@ class RequestsAdapter(HTTPAdapter):
     def __init__(self, ssl_context=None, source_address=None):
         self.ssl_context = ssl_context
         self.source_address = source_address
-        HTTPAdapter.__init__(self)
+        # adapters are shared between all extractors with the same
+        # TLS and source address settings; keep more hosts' pools alive
+        HTTPAdapter.__init__(
+            self, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
@@ -1041,6 +1163,56 @@ class RequestsAdapter(HTTPAdapter):
         return HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
 
 
+def _prefetch(iterable, depth, extr=None):
+    messages = queue.Queue(depth)
+    stop = threading.Event()
+
+    def put(msg):
+        while not stop.is_set():
+            try:
+                messages.put(msg, True, 0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        if extr is not None:
+            # pass checkpoints through the queue
+            extr._checkpoint_defer = (threading.get_ident(), put)
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except Exception as exc:
+            put((False, exc))
+        else:
+            put((False, None))
+        finally:
+            if extr is not None:
+                extr._checkpoint_defer = None
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            ok, item = messages.get()
+            if ok:
+                yield item
+                continue
+            if ok is None:
+                extr._checkpoint_save(item)
+                continue
+            thread.join()
+            if item is not None:
+                raise item
+            return
+    finally:
+        # stop the background thread when
+        # the consumer exits early or raises an exception
+        stop.set()
+
+
 def _build_requests_adapter(
         ssl_options, ssl_ciphers, ssl_ctx, source_address):
 
@@ -1050,6 +1222,16 @@ def _build_requests_adapter(
     except KeyError:
         pass
 
+    with LOCK_ADAPTERS:
+        # another thread might have created this adapter in the meantime
+        if (adapter := CACHE_ADAPTERS.get(key)) is None:
+            adapter = CACHE_ADAPTERS[key] = _create_requests_adapter(
+                ssl_options, ssl_ciphers, ssl_ctx, source_address)
+    return adapter
+
+
+def _create_requests_adapter(
+        ssl_options, ssl_ciphers, ssl_ctx, source_address):
     if ssl_options or ssl_ciphers or ssl_ctx:
         if ssl_ctx is None:
             ssl_context = urllib3.connection.create_urllib3_context(
@@ -1069,9 +1251,12 @@ def _build_requests_adapter(
     else:
         ssl_context = None
 
-    adapter = CACHE_ADAPTERS[key] = RequestsAdapter(
-        ssl_context, source_address)
-    return adapter
+    return RequestsAdapter(ssl_context, source_address)
+
+
+@cache.cache(maxage=365*86400, keyarg=0)
+def _checkpoint_cache(key):
+    return {}
 
 
 @cache.cache(maxage=86400, keyarg=0)
@@ -1118,6 +1303,9 @@ def _browser_useragent(browser):
 
 
 CACHE_ADAPTERS = {}
+LOCK_ADAPTERS = threading.Lock()
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 16
 CACHE_COOKIES = {}
 CATEGORY_MAP = ()
 
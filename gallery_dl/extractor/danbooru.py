@@ -56,7 +56,7 @@ class DanbooruExtractor(BaseExtractor):
             self.includes = includes + ",id"
 
         data = self.metadata()
-        for post in self.posts():
+        for post in self._prefetch(self.posts()):
 
             try:
                 url = post["file_url"]
@@ -67,6 +67,9 @@ class DanbooruExtractor(BaseExtractor):
                     yield Message.Queue, post["source"], post
                 continue
 
+            if self._archive_stop(post, data):
+                return
+
             text.nameext_from_url(url, post)
             post["date"] = dt.parse_iso(post["created_at"])
 
@@ -124,9 +127,12 @@ class DanbooruExtractor(BaseExtractor):
     def _pagination(self, endpoint, params, prefix=None):
         url = self.root + endpoint
         params["limit"] = self.per_page
-        params["page"] = self.page_start
+        cursor = self._checkpoint_load()
+        params["page"] = cursor or self.page_start
+        stop = (prefix == "b" and self._checkpoint == "stop")
 
-        first = True
+        # resumed 'a' pages need reversing as well
+        first = not cursor
         while True:
             posts = self.request_json(url, params=params)
             if isinstance(posts, dict):
@@ -149,10 +155,16 @@ class DanbooruExtractor(BaseExtractor):
                 if prefix == "a" and not first:
                     posts.reverse()
 
-                yield from posts
+                if stop:
+                    for post in posts:
+                        if self._checkpoint_seen(post["id"]):
+                            return
+                        yield post
+                else:
+                    yield from posts
 
             if len(posts) < self.threshold:
-                return
+                return self._checkpoint_save(None)
 
             if prefix:
                 params["page"] = prefix + str(posts[-1]["id"])
@@ -160,6 +172,7 @@ class DanbooruExtractor(BaseExtractor):
                 params["page"] += 1
             else:
                 params["page"] = 2
+            self._checkpoint_save(params["page"])
             first = False
 
     def _ugoira_frames(self, post):
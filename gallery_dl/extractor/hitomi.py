@@ -9,7 +9,7 @@
 """Extractors for https://hitomi.la/"""
 
 from .common import GalleryExtractor, Extractor, Message
-from .nozomi import decode_nozomi
+from .nozomi import decode_nozomi, request_nozomi, search_nozomi
 from ..cache import memcache
 from .. import text, util
 import string
@@ -40,7 +40,7 @@ class HitomiExtractor(Extractor):
             headers = {}
         headers["Origin"] = self.root
         headers["Referer"] = self.root + "/"
-        return decode_nozomi(self.request(url, headers=headers).content)
+        return request_nozomi(self, url, headers)
 
 
 class HitomiGalleryExtractor(HitomiExtractor, GalleryExtractor):
@@ -221,7 +221,6 @@ class HitomiSearchExtractor(HitomiExtractor):
             yield Message.Queue, gallery_url, data
 
     def gallery_ids(self, tags):
-        result = None
         positive = []
         negative = []
 
@@ -231,20 +230,12 @@ class HitomiSearchExtractor(HitomiExtractor):
             else:
                 positive.append(tag)
 
-        for tag in positive:
-            ids = self.load_nozomi(tag)
-            if result is None:
-                result = set(ids)
-            else:
-                result.intersection_update(ids)
-
-        if result is None:
-            #  result = set(self.load_nozomi("index"))
-            result = set(self.load_nozomi("language:all"))
-        for tag in negative:
-            result.difference_update(self.load_nozomi(tag))
-
-        return sorted(result, reverse=True) if result else ()
+        return search_nozomi(
+            map(self.load_nozomi, positive),
+            map(self.load_nozomi, negative),
+            #  lambda: self.load_nozomi("index"),
+            lambda: self.load_nozomi("language:all"),
+        )
 
 
 @memcache(maxage=1800)
@@ -87,6 +87,11 @@ class KemonoExtractor(Extractor):
             post["_http_headers"] = headers
             post["date"] = self._parse_datetime(
                 post.get("published") or post.get("added") or "")
+
+            sources = list(itertools.chain.from_iterable(
+                g(post) for g in generators))
+            if sources and self._archive_stop(post, {"num": 1}):
+                return
             service = post["service"]
             creator_id = post["user"]
 
@@ -127,8 +132,7 @@ class KemonoExtractor(Extractor):
             hashes = set()
             post_archives = post["archives"] = []
 
-            for file in itertools.chain.from_iterable(
-                    g(post) for g in generators):
+            for file in sources:
                 url = file["path"]
 
                 if "\\" in url:
@@ -9,12 +9,83 @@
 """Extractors for https://nozomi.la/"""
 
 from .common import Extractor, Message
+from ..cache import cache
 from .. import text, dt
+import array
+import sys
 
 
 def decode_nozomi(n):
-    for i in range(0, len(n), 4):
-        yield (n[i] << 24) + (n[i+1] << 16) + (n[i+2] << 8) + n[i+3]
+    """Decode a nozomi index of big-endian 32-bit IDs into an array"""
+    ids = array.array(ARRAY_TYPE)
+    ids.frombytes(memoryview(n)[:len(n) & -4])
+    if BYTESWAP:
+        ids.byteswap()
+    return ids
+
+
+def request_nozomi(extr, url, headers=None):
+    """Download and decode the nozomi index at 'url'
+
+    With 'index-cache' enabled, indices get stored in the cache database
+    and only downloaded again when their ETag changed.
+    """
+    if not extr.config("index-cache"):
+        return decode_nozomi(extr.request(url, headers=headers).content)
+
+    etag, ids = _index_cache(url)
+    if etag:
+        if headers is None:
+            headers = {}
+        headers["If-None-Match"] = etag
+
+    response = extr.request(url, headers=headers)
+    if response.status_code == 304:
+        extr.log.debug("Using cached index '%s'", url)
+        return ids
+
+    ids = decode_nozomi(response.content)
+    if etag := response.headers.get("ETag"):
+        _index_cache.update(url, (etag, ids))
+    return ids
+
+
+def search_nozomi(positive, negative, default):
+    """Return IDs in all 'positive' and no 'negative' indices, newest first
+
+    'positive' and 'negative' are iterables of decoded nozomi indices,
+    'default' gets called to load all IDs when 'positive' is empty.
+    """
+    result = None
+
+    for ids in positive:
+        if result is None:
+            result = ids
+            continue
+        # only hash the smaller of both indices
+        if len(ids) < len(result):
+            result, ids = ids, result
+        if not isinstance(result, set):
+            result = set(result)
+        result.intersection_update(ids)
+
+    if result is None:
+        result = default()
+    for ids in negative:
+        if not isinstance(result, set):
+            result = set(result)
+        result.difference_update(ids)
+
+    return sorted(result, reverse=True) if result else ()
+
+
+@cache(maxage=30*86400, keyarg=0)
+def _index_cache(url):
+    return None, None
+
+
+ARRAY_TYPE = "I" if array.array("I").itemsize == 4 else "L"
+BYTESWAP = sys.byteorder == "little"
 
 
 class NozomiExtractor(Extractor):
@@ -162,28 +233,19 @@ class NozomiSearchExtractor(NozomiExtractor):
         return {"search_tags": self.tags}
 
     def posts(self):
-        result = None
         positive = []
         negative = []
 
         def nozomi(path):
             url = f"https://j.{self.domain}/{path}.nozomi"
-            return decode_nozomi(self.request(url).content)
+            return request_nozomi(self, url)
 
         for tag in self.tags:
             (negative if tag[0] == "-" else positive).append(
                 text.quote(tag.replace("/", "")))
 
-        for tag in positive:
-            ids = nozomi("nozomi/" + tag)
-            if result is None:
-                result = set(ids)
-            else:
-                result.intersection_update(ids)
-
-        if result is None:
-            result = set(nozomi("index"))
-        for tag in negative:
-            result.difference_update(nozomi("nozomi/" + tag[1:]))
-
-        return sorted(result, reverse=True) if result else ()
+        return search_nozomi(
+            (nozomi("nozomi/" + tag) for tag in positive),
+            (nozomi("nozomi/" + tag[1:]) for tag in negative),
+            lambda: nozomi("index"),
+        )
@@ -123,6 +123,8 @@ class TwitterExtractor(Extractor):
 
             tdata = self._transform_tweet(tweet)
             tdata.update(metadata)
+            if files and self._archive_stop(tdata, {"num": 1}):
+                return
             tdata["count"] = len(files)
             yield Message.Directory, "", tdata
 
@@ -648,10 +650,13 @@ class TwitterExtractor(Extractor):
             self._update_cursor = util.identity
         elif isinstance(cursor, str):
             return cursor
+        else:
+            return self._checkpoint_load()
 
     def _update_cursor(self, cursor):
         self.log.debug("Cursor: %s", cursor)
         self._cursor = cursor
+        self._checkpoint_save(cursor)
         return cursor
 
     def metadata(self):
@@ -783,6 +788,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
             self.log.debug("Cursor: %s", self._cursor)
         else:
             self._cursor = None
+        self._checkpoint_save(self._cursor)
         return cursor
 
     def tweets(self):
@@ -791,7 +797,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
         cursor = self.config("cursor", True)
         if not cursor:
             self._update_cursor = util.identity
-        elif isinstance(cursor, str):
+        elif isinstance(cursor, str) or (cursor := self._checkpoint_load()):
             self._cursor = cursor
         else:
             cursor = None
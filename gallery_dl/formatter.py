@@ -99,38 +99,98 @@ class StringFormatter():
     - "R<old>/<new>/":
         Replaces all occurrences of <old> with <new>
         Example: {f:R /_/} -> "f_o_o_b_a_r" (if "f" is "f o o b a r")
+
+    Format strings get compiled into a single Python function,
+    with plain key access, conversions, and "?" specifiers inlined.
     """
 
     def __init__(self, format_string, default=NONE, fmt=format):
         self.default = default
         self.format = fmt
-        self.result = []
-        self.fields = []
+        result = []
+        fields = {}
 
         for literal_text, field_name, format_spec, conv in \
                 _string.formatter_parser(format_string):
             if literal_text:
-                self.result.append(literal_text)
+                result.append(literal_text)
             if field_name:
-                self.fields.append((
-                    len(self.result),
-                    self._field_access(field_name, format_spec, conv),
-                ))
-                self.result.append("")
-
-        if len(self.result) == 1:
-            if self.fields:
-                self.format_map = self.fields[0][1]
+                fields[len(result)] = (field_name, format_spec, conv)
+                result.append("")
+
+        if fields:
+            self.format_map = self._compile(result, fields)
+        else:
+            self.format_map = lambda _: format_string
+
+    def _compile(self, result, fields):
+        """Generate a 'format_map' function for all fields and literals"""
+        namespace = {"_default": self.default, "_fmt": self.format}
+        inline = self.format is format
+        lines = ["def format_map(kwdict):"]
+        output = []
+        raw = False
+
+        for index, literal in enumerate(result):
+            if index not in fields:
+                namespace[f"_s{index}"] = literal
+                output.append(f"{{_s{index}}}")
+                continue
+
+            field_name, format_spec, conversion = fields[index]
+            var = f"v{index}"
+            output.append(f"{{{var}}}")
+            key, funcs = (None, None) if "|" in field_name else \
+                parse_field_name(field_name)
+
+            if key is None or funcs or key in _GLOBALS:
+                namespace[f"_f{index}"] = self._field_access(
+                    field_name, format_spec, conversion)
+                lines.append(f"    {var} = _f{index}(kwdict)")
+                continue
+
+            namespace[f"_k{index}"] = key
+            lines.append(f"    {var} = kwdict[_k{index}] "
+                         f"if _k{index} in kwdict else _default")
+
+            if conversion:
+                namespace[f"_c{index}"] = _CONVERSIONS[conversion]
+                lines.append(f"    {var} = _c{index}({var})")
+
+            if not format_spec:
+                if conversion:
+                    pass
+                elif inline:
+                    raw = True  # formatted by the f-string below
+                else:
+                    lines.append(f"    {var} = _fmt({var})")
+            elif inline and format_spec[0] == "?" and \
+                    format_spec.count(_SEPARATOR) == 2 and \
+                    format_spec[-1] == _SEPARATOR:
+                before, after, _ = format_spec.split(_SEPARATOR, 2)
+                namespace[f"_b{index}"] = before[1:]
+                namespace[f"_a{index}"] = after
+                lines.append(f'    {var} = f"{{_b{index}}}{{{var}}}'
+                             f'{{_a{index}}}" if {var} else ""')
+            elif inline and format_spec[0] not in _FORMAT_SPECIFIERS:
+                namespace[f"_p{index}"] = format_spec
+                lines.append(f"    {var} = format({var}, _p{index})")
             else:
-                self.format_map = lambda _: format_string
-            del self.result, self.fields
-
-    def format_map(self, kwdict):
-        """Apply 'kwdict' to the initial format_string and return its result"""
-        result = self.result
-        for index, func in self.fields:
-            result[index] = func(kwdict)
-        return "".join(result)
+                namespace[f"_p{index}"] = _build_format_func(
+                    format_spec, self.format)
+                lines.append(f"    {var} = _p{index}({var})")
+
+        if len(output) == 1:
+            # return a single field's value without converting it to 'str'
+            var = f"v{next(iter(fields))}"
+            lines.append(f"    return format({var})" if raw else
+                         f"    return {var}")
+        else:
+            output = "".join(output)
+            lines.append(f'    return f"{output}"')
+
+        exec(compile("\n".join(lines), "<format_map>", "exec"), namespace)
+        return namespace["format_map"]
 
     def _field_access(self, field_name, format_spec, conversion):
         fmt = self._parse_format_spec(format_spec, conversion)
@@ -8,8 +8,10 @@
 
 import sys
 import errno
+import queue
 import logging
 import functools
+import threading
 import collections
 
 from . import (
@@ -157,6 +159,7 @@ class Job():
         try:
             msg = self.dispatch(extractor)
         except exception.StopExtraction as exc:
+            extractor._checkpoint_clear()
             if exc.depth > 1 and exc.target != extractor.__class__.subcategory:
                 exc.depth -= 1
                 raise
@@ -165,7 +168,10 @@ class Job():
             log.traceback(exc)
             log.error(exc.message)
             self.status |= exc.code
-        except (exception.TerminateExtraction, exception.RestartExtraction):
+        except exception.TerminateExtraction:
+            extractor._checkpoint_clear()
+            raise
+        except exception.RestartExtraction:
             raise
         except exception.GalleryDLException as exc:
             log.error("%s: %s", exc.__class__.__name__, exc)
@@ -187,10 +193,13 @@ class Job():
                       exc.__class__.__name__, exc)
             log.traceback(exc)
             self.status |= 1
-        except BaseException:
+        except BaseException as exc:
+            if isinstance(exc, SystemExit):
+                extractor._checkpoint_clear()
             self.status |= 1
             raise
         else:
+            extractor._checkpoint_clear()
             if msg is None:
                 log.info("No results for %s", extractor.url)
         finally:
@@ -279,8 +288,8 @@ class Job():
     def _prepare_predicates(self, target, skip=True):
         predicates = []
 
-        if self.extractor.config(f"{target}-unique"):
-            predicates.append(util.UniquePredicate())
+        if unique := self.extractor.config(f"{target}-unique"):
+            predicates.append(util.UniquePredicate(unique))
 
         if pfilter := self.extractor.config(f"{target}-filter"):
             try:
@@ -316,6 +325,7 @@ class Job():
 
 class DownloadJob(Job):
     """Download images into appropriate directory/filename locations"""
+    _visited_lock = threading.Lock()
 
     def __init__(self, url, parent=None):
         Job.__init__(self, url, parent)
@@ -324,11 +334,22 @@ class DownloadJob(Job):
         self.archive = None
         self.sleep = None
         self.hooks = ()
+        self.workers = None
+        self.pending = []
+        self.queue_pool = None
         self.downloaders = {}
         self.out = output.select()
-        self.visited = parent.visited if parent else set()
+        if parent:
+            self.visited = parent.visited
+        elif unique := self.extractor.config("queue-unique", True):
+            self.visited = util.build_unique_set(unique)
+        else:
+            self.visited = None
         self._extractor_filter = None
+        self._archive_init = False
+        self._archive_result = None
         self._skipcnt = 0
+        self._lock = util.NullContext()
 
     def handle_url(self, url, kwdict):
         """Download the resource specified in 'url'"""
@@ -340,13 +361,19 @@ class DownloadJob(Job):
         pathfmt.set_filename(kwdict)
 
         if "prepare" in hooks:
-            for callback in hooks["prepare"]:
-                callback(pathfmt)
+            with self._lock:
+                for callback in hooks["prepare"]:
+                    callback(pathfmt)
 
-        if archive is not None and archive.check(kwdict):
-            pathfmt.fix_extension()
-            self.handle_skip()
-            return
+        if archive is not None:
+            result = self._archive_result
+            self._archive_result = None
+            if result is None or "prepare" in hooks:
+                result = archive.check(kwdict)
+            if result:
+                pathfmt.fix_extension()
+                self.handle_skip()
+                return
 
         if pathfmt.extension and not self.metadata_http:
             pathfmt.build_path()
@@ -358,8 +385,9 @@ class DownloadJob(Job):
                 return
 
         if "prepare-after" in hooks:
-            for callback in hooks["prepare-after"]:
-                callback(pathfmt)
+            with self._lock:
+                for callback in hooks["prepare-after"]:
+                    callback(pathfmt)
 
             if kwdict.pop("_file_recheck", False) and pathfmt.exists():
                 if archive is not None and self._archive_write_skip:
@@ -370,41 +398,69 @@ class DownloadJob(Job):
         if self.sleep is not None:
             self.extractor.sleep(self.sleep(), "download")
 
+        if self.workers is None:
+            self.handle_download(url, kwdict, pathfmt)
+        else:
+            self.workers.submit(url, kwdict, pathfmt)
+
+    def handle_download(self, url, kwdict, pathfmt, downloaders=None):
+        """Download 'url' and run post processors for the resulting file"""
+        hooks = self.hooks
+        archive = self.archive
+
         # download from URL
-        if not self.download(url):
+        if not self.download(url, pathfmt, downloaders):
 
             # use fallback URLs if available/enabled
             fallback = kwdict.get("_fallback", ()) if self.fallback else ()
             for num, url in enumerate(fallback, 1):
                 util.remove_file(pathfmt.temppath)
                 self.log.info("Trying fallback URL #%d", num)
-                if self.download(url):
+                if self.download(url, pathfmt, downloaders):
                     break
             else:
                 # download failed
-                self.status |= 4
-                self.log.error("Failed to download %s",
-                               pathfmt.filename or url)
-                if "error" in hooks:
-                    for callback in hooks["error"]:
-                        callback(pathfmt)
+                with self._lock:
+                    self.status |= 4
+                    self.log.error("Failed to download %s",
+                                   pathfmt.filename or url)
+                    if "error" in hooks:
+                        for callback in hooks["error"]:
+                            callback(pathfmt)
                 return
 
         if not pathfmt.temppath:
             if archive is not None and self._archive_write_skip:
                 archive.add(kwdict)
-            self.handle_skip()
+            self.handle_skip(pathfmt)
             return
 
-        # run post processors
-        if "file" in hooks:
-            for callback in hooks["file"]:
-                callback(pathfmt)
+        # post processors share their state between files,
+        # run them one file at a time when using download workers
+        with self._lock:
+            # run post processors
+            if "file" in hooks:
+                for callback in hooks["file"]:
+                    callback(pathfmt)
+
+            # download succeeded
+            pathfmt.finalize()
+            self.out.success(pathfmt.path)
+            self._skipcnt = 0
+
+            if (defer := kwdict.pop("_file_defer", None)) is not None:
+                # a post processor finishes this file in the background
+                # and calls 'handle_after' with its final path
+                defer(self.handle_after)
+            else:
+                self.handle_after(pathfmt)
+
+    def handle_after(self, pathfmt):
+        """Write archive entries and run 'after' post processors"""
+        hooks = self.hooks
+        archive = self.archive
+        kwdict = pathfmt.kwdict
 
-        # download succeeded
-        pathfmt.finalize()
-        self.out.success(pathfmt.path)
-        self._skipcnt = 0
         if archive is not None and self._archive_write_file:
             archive.add(kwdict)
         if "after" in hooks:
@@ -419,6 +475,8 @@ class DownloadJob(Job):
             self.initialize(kwdict)
         else:
             if "post-after" in self.hooks:
+                if self.workers is not None:
+                    self.workers.join()
                 for callback in self.hooks["post-after"]:
                     callback(self.pathfmt)
             if FLAGS.POST is not None:
@@ -429,9 +487,11 @@ class DownloadJob(Job):
                 callback(self.pathfmt)
 
     def handle_queue(self, url, kwdict):
-        if url in self.visited:
-            return
-        self.visited.add(url)
+        if (visited := self.visited) is not None:
+            with self._visited_lock:
+                if url in visited:
+                    return
+                visited.add(url)
 
         if cls := kwdict.get("_extractor"):
             extr = cls.from_url(url)
@@ -465,6 +525,11 @@ class DownloadJob(Job):
                     if kwdict:
                         job.kwdict.update(kwdict)
 
+            if self.queue_pool is None:
+                self.queue_pool = self._build_queue_pool()
+            if self.queue_pool:
+                return self.queue_pool.submit(job, kwdict.copy())
+
             while True:
                 try:
                     if pextr.config("parent-skip"):
@@ -475,24 +540,7 @@ class DownloadJob(Job):
                         status = job.run()
 
                     if status:
-                        self.status |= status
-                        if (status & 95 and   # not FormatError or OSError
-                                "_fallback" in kwdict and self.fallback):
-                            fallback = kwdict["_fallback"] = \
-                                iter(kwdict["_fallback"])
-                            try:
-                                url = next(fallback)
-                            except StopIteration:
-                                pass
-                            else:
-                                pextr.log.info("Downloading fallback URL")
-                                text.nameext_from_url(url, kwdict)
-                                if kwdict["filename"].startswith((
-                                        "HLS", "DASH")):
-                                    kwdict["filename"] = url.rsplit("/", 2)[-2]
-                                if url.startswith("ytdl:"):
-                                    kwdict["extension"] = "mp4"
-                                self.handle_url(url, kwdict)
+                        self.handle_queue_status(status, kwdict)
                     break
                 except exception.RestartExtraction:
                     pass
@@ -500,7 +548,43 @@ class DownloadJob(Job):
         else:
             self._write_unsupported(url)
 
+    def handle_queue_status(self, status, kwdict):
+        """Handle the non-zero exit status of a child job"""
+        self.status |= status
+        if (status & 95 and   # not FormatError or OSError
+                "_fallback" in kwdict and self.fallback):
+            fallback = kwdict["_fallback"] = iter(kwdict["_fallback"])
+            try:
+                url = next(fallback)
+            except StopIteration:
+                pass
+            else:
+                self.extractor.log.info("Downloading fallback URL")
+                text.nameext_from_url(url, kwdict)
+                if kwdict["filename"].startswith(("HLS", "DASH")):
+                    kwdict["filename"] = url.rsplit("/", 2)[-2]
+                if url.startswith("ytdl:"):
+                    kwdict["extension"] = "mp4"
+                self.handle_url(url, kwdict)
+
+    def _build_queue_pool(self):
+        extr = self.extractor
+        if (workers := extr.config("queue-workers")) and workers > 1:
+            if extr.config("parent-skip"):
+                extr.log.debug("Ignoring 'queue-workers' "
+                               "due to 'parent-skip' being enabled")
+            else:
+                return QueueWorkerPool(self, workers)
+        return False
+
     def handle_finalize(self):
+        if self.queue_pool:
+            self.queue_pool.close()
+        if self.workers is not None:
+            self.workers.close()
+        for join in self.pending:
+            join()
+
         if self.archive:
             if not self.status:
                 self.archive.finalize()
@@ -526,70 +610,116 @@ class DownloadJob(Job):
                 for callback in hooks["finalize"]:
                     callback(pathfmt)
 
-    def handle_skip(self):
-        pathfmt = self.pathfmt
-        if "skip" in self.hooks:
-            for callback in self.hooks["skip"]:
-                callback(pathfmt)
-        self.out.skip(pathfmt.path)
+    def handle_skip(self, pathfmt=None):
+        if pathfmt is None:
+            pathfmt = self.pathfmt
+        with self._lock:
+            if "skip" in self.hooks:
+                for callback in self.hooks["skip"]:
+                    callback(pathfmt)
+            self.out.skip(pathfmt.path)
 
-        if self._skipexc is not None:
-            if self._skipftr is None or self._skipftr(pathfmt.kwdict):
-                self._skipcnt += 1
-                if self._skipcnt >= self._skipmax:
-                    raise self._skipexc
+            if self._skipexc is not None:
+                if self._skipftr is None or self._skipftr(pathfmt.kwdict):
+                    self._skipcnt += 1
+                    if self._skipcnt >= self._skipmax:
+                        raise self._skipexc
 
         if self.sleep_skip is not None:
             self.extractor.sleep(self.sleep_skip(), "skip")
 
-    def download(self, url):
-        """Download 'url'"""
-        if downloader := self.get_downloader(url[:url.find(":")]):
-            try:
-                return downloader.download(url, self.pathfmt)
-            except OSError as exc:
-                if exc.errno == errno.ENOSPC:
-                    raise
-                self.log.warning("%s: %s", exc.__class__.__name__, exc)
-                return False
-        self._write_unsupported(url)
-        return False
+    def dispatch(self, messages):
+        extr = self.extractor
+        if extr.config("archive") and extr.config("skip", True):
+            if (limit := extr.config("archive-stop")) and limit > 0:
+                extr._archive_check = self._archive_check_post
+                extr._archive_limit = limit
+            if lookahead := extr.config("archive-lookahead"):
+                messages = self._archive_lookahead(messages, lookahead)
+
+        msg = Job.dispatch(self, messages)
+        if self.queue_pool:
+            self.queue_pool.join()
+        if self.workers is not None:
+            self.workers.join()
+        return msg
 
-    def get_downloader(self, scheme):
-        """Return a downloader suitable for 'scheme'"""
-        try:
-            return self.downloaders[scheme]
-        except KeyError:
-            pass
+    def _archive_lookahead(self, messages, size):
+        """Check archive IDs of the next 'size' messages in one batch"""
+        messages = iter(messages)
+
+        # wait for delayed initialization
+        for msg in messages:
+            yield msg
+            if self.pathfmt is not None:
+                break
+        if self.archive is None:
+            yield from messages
+            return
 
-        cls = downloader.find(scheme)
-        if cls and config.get(("downloader", cls.scheme), "enabled", True):
-            instance = cls(self)
-        else:
-            instance = None
-            self.log.error("'%s:' URLs are not supported/enabled", scheme)
+        buffer = []
+        for msg, url, kwdict in messages:
+            # extractors may reuse and modify 'kwdict' for later messages
+            buffer.append((msg, url, kwdict.copy()))
+            if len(buffer) >= size:
+                self._archive_check_many(buffer)
+                yield from buffer
+                buffer = []
+
+        if buffer:
+            self._archive_check_many(buffer)
+            yield from buffer
+
+    def _archive_check_many(self, messages):
+        extension_map = self.pathfmt.extension_map
+        originals = []
+        kwdicts = []
 
-        if cls and cls.scheme == "http":
-            self.downloaders["http"] = self.downloaders["https"] = instance
-        else:
-            self.downloaders[scheme] = instance
-        return instance
+        for msg, url, kwdict in messages:
+            if msg == Message.Url:
+                data = kwdict.copy()
+                if self.metadata_url:
+                    data[self.metadata_url] = url
+                self.update_kwdict(data)
+                ext = data.get("extension")
+                data["extension"] = extension_map(ext, ext)
+                originals.append((kwdict, ext))
+                kwdicts.append(data)
+
+        if not kwdicts:
+            return
+        results = self.archive.check_many(kwdicts)
 
-    def initialize(self, kwdict=None):
-        """Delayed initialization of PathFormat, etc."""
-        extr = self.extractor
-        cfg = extr.config
+        # let update_kwdict() and handle_url() reuse
+        # updated metadata, archive key, and result
+        for (kwdict, ext), data, result in zip(originals, kwdicts, results):
+            data["extension"] = ext
+            kwdict["_archive_lookahead"] = (data, result)
 
-        pathfmt = self.pathfmt = path.PathFormat(extr)
-        if kwdict is not None:
-            pathfmt.set_directory(kwdict)
+    def update_kwdict(self, kwdict):
+        if (lookahead := kwdict.pop("_archive_lookahead", None)) is None:
+            return Job.update_kwdict(self, kwdict)
 
-        self.sleep = util.build_duration_func(cfg("sleep"))
-        self.sleep_skip = util.build_duration_func(cfg("sleep-skip"))
-        self.fallback = cfg("fallback", True)
-        if not cfg("download", True):
-            # monkey-patch method to do nothing and always return True
-            self.download = pathfmt.fix_extension
+        data, self._archive_result = lookahead
+        kwdict.update(data)
+        if self.metadata_http:
+            kwdict.pop(self.metadata_http, None)
+
+    def _archive_check_post(self, kwdict):
+        """Check a post's 'kwdict' against the download archive"""
+        self.update_kwdict(kwdict)
+        if not self._archive_init:
+            # open archive before delayed initialization
+            self._init_archive(kwdict)
+        if self.archive is None:
+            return False
+        return self.archive.check(kwdict)
+
+    def _init_archive(self, kwdict=None):
+        """Open the download archive"""
+        self._archive_init = True
+        extr = self.extractor
+        cfg = extr.config
 
         if archive_path := cfg("archive"):
             archive_table = cfg("archive-table")
@@ -610,6 +740,7 @@ class DownloadJob(Job):
                     cfg("archive-mode"),
                     cfg("archive-pragma"),
                     kwdict,
+                    bloom=cfg("archive-bloom"),
                 )
             except Exception as exc:
                 extr.log.warning(
@@ -630,6 +761,79 @@ class DownloadJob(Job):
                     self._archive_write_skip = ("skip" in events)
                     self._archive_write_after = ("after" in events)
 
+    def download(self, url, pathfmt=None, downloaders=None):
+        """Download 'url'"""
+        if pathfmt is None:
+            pathfmt = self.pathfmt
+        if downloader := self.get_downloader(
+                url[:url.find(":")], downloaders):
+            try:
+                return downloader.download(url, pathfmt)
+            except OSError as exc:
+                if exc.errno == errno.ENOSPC:
+                    raise
+                self.log.warning("%s: %s", exc.__class__.__name__, exc)
+                return False
+        self._write_unsupported(url)
+        return False
+
+    def _download_noop(self, url, pathfmt=None, downloaders=None):
+        if pathfmt is None:
+            pathfmt = self.pathfmt
+        return pathfmt.fix_extension()
+
+    def get_downloader(self, scheme, downloaders=None):
+        """Return a downloader suitable for 'scheme'"""
+        if downloaders is None:
+            downloaders = self.downloaders
+        try:
+            return downloaders[scheme]
+        except KeyError:
+            pass
+
+        cls = downloader.find(scheme)
+        if cls and config.get(("downloader", cls.scheme), "enabled", True):
+            instance = cls(self)
+        else:
+            instance = None
+            self.log.error("'%s:' URLs are not supported/enabled", scheme)
+
+        if cls and cls.scheme == "http":
+            downloaders["http"] = downloaders["https"] = instance
+        else:
+            downloaders[scheme] = instance
+        return instance
+
+    def initialize(self, kwdict=None):
+        """Delayed initialization of PathFormat, etc."""
+        extr = self.extractor
+        cfg = extr.config
+
+        pathfmt = self.pathfmt = path.PathFormat(extr)
+        if kwdict is not None:
+            pathfmt.set_directory(kwdict)
+
+        self.sleep = util.build_duration_func(cfg("sleep"))
+        self.sleep_skip = util.build_duration_func(cfg("sleep-skip"))
+        self.fallback = cfg("fallback", True)
+        if not cfg("download", True):
+            # monkey-patch method to do nothing and always return True
+            self.download = self._download_noop
+        elif (workers := cfg("download-workers")) and workers > 1:
+            self.workers = DownloadWorkerPool(self, workers)
+            self._lock = threading.RLock()
+
+        if not self._archive_init:
+            self._init_archive(kwdict)
+        if self.archive is not None and self.workers is not None:
+            # serialize archive access from download threads
+            lock = threading.Lock()
+            arch = self.archive
+            arch.add = functools.partial(_call_locked, lock, arch.add)
+            arch.check = functools.partial(_call_locked, lock, arch.check)
+            arch.check_many = functools.partial(
+                _call_locked, lock, arch.check_many)
+
         if skip := cfg("skip", True):
             self._skipexc = None
             if skip == "enumerate":
@@ -726,6 +930,13 @@ class DownloadJob(Job):
 
             if pp_list:
                 extr.log.debug("Active postprocessor modules: %s", pp_list)
+                if self.workers is not None:
+                    if unsafe := [pp for pp in pp_list if not pp.threadsafe]:
+                        extr.log.warning(
+                            "Disabling 'download-workers' (unsupported by "
+                            "%s)", ", ".join(map(repr, unsafe)))
+                        self.workers.close()
+                        self.workers = None
                 if "init" in self.hooks:
                     for callback in self.hooks["init"]:
                         callback(pathfmt)
@@ -762,6 +973,166 @@ def _call_hook_condition(callback, condition, pathfmt):
         callback(pathfmt)
 
 
+def _call_locked(lock, func, *args):
+    with lock:
+        return func(*args)
+
+
+class DownloadWorkerPool():
+    """Run file downloads of a DownloadJob in a pool of threads"""
+
+    def __init__(self, job, num):
+        self.job = job
+        self.exc = None
+        self.queue = queue.Queue(num * 2)
+        self.threads = [
+            threading.Thread(target=self._run, daemon=True)
+            for _ in range(num)
+        ]
+        for thread in self.threads:
+            thread.start()
+        job.extractor.log.debug("Using %d download workers", num)
+
+    def submit(self, url, kwdict, pathfmt):
+        """Schedule download of 'url' into a copy of 'pathfmt'"""
+        self._raise()
+        pathfmt = pathfmt.copy()
+        pathfmt.kwdict = kwdict = kwdict.copy()
+        self.queue.put((url, kwdict, pathfmt))
+
+    def join(self):
+        """Wait for all scheduled downloads to finish"""
+        self.queue.join()
+        self._raise()
+
+    def close(self):
+        """Finish all scheduled downloads and stop all threads"""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = ()
+
+        if (exc := self.exc) is not None:
+            self.exc = None
+            if not isinstance(exc, exception.ControlException):
+                self.job.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.job.status |= 1
+
+    def _raise(self):
+        if (exc := self.exc) is not None:
+            self.exc = None
+            raise exc
+
+    def _run(self):
+        handle = self.job.handle_download
+        downloaders = {}
+
+        while (item := self.queue.get()) is not None:
+            try:
+                handle(*item, downloaders)
+            except BaseException as exc:
+                if self.exc is None:
+                    self.exc = exc
+            finally:
+                self.queue.task_done()
+        self.queue.task_done()
+
+
+class QueueWorkerPool():
+    """Run child jobs of a DownloadJob in a pool of threads
+
+    Results get processed in the same order their jobs were submitted in.
+    """
+
+    def __init__(self, job, num):
+        self.job = job
+        self.limit = num * 2
+        self.closed = False
+        self.queue = queue.Queue()
+        self.pending = collections.deque()
+        self.threads = [
+            threading.Thread(target=self._run, daemon=True)
+            for _ in range(num)
+        ]
+        for thread in self.threads:
+            thread.start()
+        job.extractor.log.debug("Using %d queue workers", num)
+
+    def submit(self, job, kwdict):
+        """Schedule 'job' to run in a worker thread"""
+        self._collect(self.limit)
+
+        # children of parallel jobs run sequentially
+        job.queue_pool = False
+        entry = QueueWorkerEntry(job, kwdict)
+        self.pending.append(entry)
+        self.queue.put(entry)
+
+    def join(self):
+        """Wait for all scheduled jobs to finish and process their results"""
+        self._collect(0)
+
+    def close(self):
+        """Finish all scheduled jobs and stop all threads"""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = ()
+
+        while self.pending:
+            try:
+                self._collect(0)
+            except exception.ControlException:
+                pass
+            except BaseException as exc:
+                self.job.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.job.status |= 1
+
+    def _collect(self, limit):
+        """Process results of finished jobs until at most 'limit' remain"""
+        pending = self.pending
+        while pending and (len(pending) > limit or pending[0].done.is_set()):
+            entry = pending.popleft()
+            entry.done.wait()
+            if entry.exc is not None:
+                # do not start any further jobs
+                self.closed = True
+                raise entry.exc
+            if entry.status:
+                self.job.handle_queue_status(entry.status, entry.kwdict)
+
+    def _run(self):
+        while (entry := self.queue.get()) is not None:
+            if self.closed:
+                entry.done.set()
+                continue
+            try:
+                while True:
+                    try:
+                        entry.status = entry.job.run()
+                        break
+                    except exception.RestartExtraction:
+                        pass
+            except BaseException as exc:
+                entry.exc = exc
+            finally:
+                entry.done.set()
+
+
+class QueueWorkerEntry():
+    """Child job of a QueueWorkerPool and its results"""
+    __slots__ = ("job", "kwdict", "status", "exc", "done")
+
+    def __init__(self, job, kwdict):
+        self.job = job
+        self.kwdict = kwdict
+        self.status = 0
+        self.exc = None
+        self.done = threading.Event()
+
+
 class SimulationJob(DownloadJob):
     """Simulate the extraction process without downloading anything"""
 
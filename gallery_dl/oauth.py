@@ -124,8 +124,11 @@ class OAuth1API():
 
         if api_key and api_secret and token and token_secret:
             self.log.debug("Using %s OAuth1.0 authentication", key_type)
-            self.session = OAuth1Session(
+            self.session = session = OAuth1Session(
                 api_key, api_secret, token, token_secret)
+            # reuse the extractor's (shared) connection pools
+            for prefix, adapter in extractor.session.adapters.items():
+                session.mount(prefix, adapter)
             self.api_key = None
         else:
             self.log.debug("Using %s api_key authentication", key_type)
@@ -338,6 +338,12 @@ def build_parser():
         help=("Download URLs found in FILE. "
               "Delete them after they were downloaded successfully."),
     )
+    input.add_argument(
+        "--jobs",
+        dest="jobs", metavar="N", type=int, action=ConfigAction,
+        help=("Process up to N input URLs in parallel, "
+              "one per extractor category at a time"),
+    )
     input.add_argument(
         "--no-input",
         dest="input", nargs=0, action=ConfigConstAction, const=False,
@@ -9,6 +9,8 @@
 """Filesystem path handling"""
 
 import os
+import sys
+import copy
 import shutil
 import functools
 from . import util, formatter, exception
@@ -82,6 +84,13 @@ class PathFormat():
         self.realpath = ""
         self.temppath = ""
 
+        if config("path-cache"):
+            self._listings = {}
+            self._lstat = self._lstat_cached
+        else:
+            self._listings = None
+            self._lstat = os.lstat
+
         extension_map = config("extension-map")
         if extension_map is None:
             extension_map = EXTENSION_MAP
@@ -146,22 +155,41 @@ class PathFormat():
     def __str__(self):
         return self.realpath
 
+    def copy(self):
+        """Return an independent copy of this PathFormat"""
+        pathfmt = copy.copy(self)
+        # rebind monkey-patched methods to the new object
+        for name, value in self.__dict__.items():
+            if getattr(value, "__self__", None) is self:
+                setattr(pathfmt, name, getattr(pathfmt, value.__name__))
+        return pathfmt
+
     def open(self, mode="wb"):
         """Open file and return a corresponding file object"""
-        try:
-            return open(self.temppath, mode)
-        except FileNotFoundError:
-            if "r" in mode:
-                # '.part' file no longer exists
-                return util.NullContext()
-            os.makedirs(self.realdirectory)
-            return open(self.temppath, mode)
+        fp = None
+        if mode != "rb" and "_file_open" in self.kwdict:
+            # let a post processor provide its own file object
+            fp = self.kwdict["_file_open"](self, mode)
+
+        if fp is None:
+            try:
+                fp = open(self.temppath, mode)
+            except FileNotFoundError:
+                if "r" in mode:
+                    # '.part' file no longer exists
+                    return util.NullContext()
+                os.makedirs(self.realdirectory)
+                fp = open(self.temppath, mode)
+
+        if mode != "rb" and "_file_wrapper" in self.kwdict:
+            return self.kwdict["_file_wrapper"](fp, mode)
+        return fp
 
     def exists(self):
         """Return True if the file exists on disk"""
         if self.extension:
             try:
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
+                self._lstat(self.realpath)  # raises OSError if not existing
                 return self.check_file()
             except OSError:
                 pass
@@ -177,13 +205,57 @@ class PathFormat():
                 prefix = format(num) + "."
                 self.kwdict["extension"] = prefix + self.extension
                 self.build_path()
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
+                self._lstat(self.realpath)  # raises OSError if not existing
                 num += 1
         except OSError:
             pass
         self.prefix = prefix
         return False
 
+    def _lstat_cached(self, path):
+        """Check 'path' against a cached listing of its directory"""
+        directory = self.realdirectory
+        name = path[len(directory):]
+        if not path.startswith(directory) or os.sep in name or \
+                os.altsep and os.altsep in name:
+            return os.lstat(path)
+
+        fold, names = self._listing(directory)
+        if (name.casefold() if fold else name) not in names:
+            raise FileNotFoundError(path)
+
+    def _listing(self, directory):
+        """Return cached names of all entries in 'directory'"""
+        try:
+            return self._listings[directory]
+        except KeyError:
+            pass
+
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+
+        if _case_insensitive(directory, names):
+            listing = (True, {name.casefold() for name in names})
+        else:
+            listing = (False, names)
+        self._listings[directory] = listing
+        return listing
+
+    def _listing_add(self):
+        """Add the current file to its cached directory listing"""
+        if listing := self._listings.get(self.realdirectory):
+            fold, names = listing
+            name = self.realpath[len(self.realdirectory):]
+            names.add(name.casefold() if fold else name)
+
+    def invalidate(self):
+        """Discard all cached directory listings"""
+        if self._listings:
+            self._listings.clear()
+
     def set_directory(self, kwdict):
         """Build directory path and create it if necessary"""
         self.kwdict = kwdict
@@ -205,6 +277,8 @@ class PathFormat():
 
         if WINDOWS and self.extended:
             directory = self._extended_path(directory)
+        if self._listings and directory != self.realdirectory:
+            self._listings.clear()
         self.realdirectory = directory
 
     def _extended_path(self, path):
@@ -345,9 +419,12 @@ class PathFormat():
 
     def finalize(self):
         """Move tempfile to its target location"""
+        # links to other files keep their metadata
+        linked = self.kwdict.pop("_file_linked", False)
+
         if self.delete:
             self.delete = False
-            os.unlink(self.temppath)
+            util.remove_file(self.temppath)
             return
 
         if self.temppath != self.realpath:
@@ -376,7 +453,26 @@ class PathFormat():
                     os.unlink(self.temppath)
                 break
 
-        self.set_mtime()
+        if self._listings:
+            self._listing_add()
+        if not linked:
+            self.set_mtime()
+
+
+def _case_insensitive(directory, names):
+    """Return True if 'directory' is on a case-insensitive filesystem"""
+    for name in names:
+        swapped = name.swapcase()
+        if swapped == name:
+            continue
+        if swapped in names:
+            return False
+        try:
+            return os.path.samestat(
+                os.lstat(directory + name), os.lstat(directory + swapped))
+        except OSError:
+            return False
+    return WINDOWS or sys.platform == "darwin"
 
 
 def _build_convertfunc(func, conv):
@@ -13,6 +13,7 @@ from .. import archive
 
 class PostProcessor():
     """Base class for postprocessors"""
+    threadsafe = True
 
     def __init__(self, job):
         self.name = self.__class__.__name__[:-2].lower()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Store files with identical content only once"""
+
+from .common import PostProcessor
+from .. import text, util
+import threading
+import hashlib
+import sqlite3
+import mmap
+import os
+
+
+class DedupPP(PostProcessor):
+
+    def __init__(self, job, options):
+        PostProcessor.__init__(self, job)
+
+        path = options.get("path")
+        if not path:
+            raise ValueError("Option 'path' is required")
+        path = util.expand_path(path)
+
+        action = options.get("action") or "hardlink"
+        try:
+            self._link = getattr(self, "_link_" + action)
+        except AttributeError:
+            raise ValueError(f"Invalid action '{action}'")
+        self.action = action
+
+        self.algorithm = options.get("hash") or "sha256"
+        hashlib.new(self.algorithm)  # raise ValueError when unsupported
+
+        self.head = text.parse_bytes(options.get("head") or 0)
+        self.head_key = f"{self.head}:" if self.head else None
+
+        self.lock = threading.Lock()
+        self.connection = con = sqlite3.connect(
+            path, timeout=60, check_same_thread=False,
+            isolation_level=None)
+        con.execute("CREATE TABLE IF NOT EXISTS files ("
+                    "hash TEXT, "
+                    "size INTEGER, "
+                    "head TEXT, "
+                    "path TEXT, "
+                    "PRIMARY KEY (hash, path)) WITHOUT ROWID")
+        con.execute("CREATE INDEX IF NOT EXISTS files_size_head "
+                    "ON files (size, head)")
+
+        hooks = {"file": self.run}
+        if self.head:
+            hooks["prepare-after"] = self.prepare
+        job.register_hooks(hooks, options)
+        job.register_hooks({"finalize": self.finalize})
+
+    def prepare(self, pathfmt):
+        pathfmt.kwdict["_http_duplicate"] = (self.head, self.check_head)
+
+    def check_head(self, pathfmt, size, head):
+        """Handle a download whose first bytes match a stored file"""
+        key = self._head_key(head[:self.head])
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path FROM files WHERE size=? AND head=?",
+                (size, key)).fetchall()
+
+        if path := self._existing(rows, size, pathfmt.realpath):
+            if self._deduplicate(pathfmt, path):
+                if pathfmt.temppath:
+                    # skip hashing the already linked file
+                    pathfmt.kwdict["_dedup_path"] = path
+                return True
+        return False
+
+    def run(self, pathfmt):
+        kwdict = pathfmt.kwdict
+        if kwdict.pop("_dedup_path", None):
+            return
+
+        try:
+            digest, size, head = self._hash(pathfmt.temppath)
+        except OSError as exc:
+            return self.log.warning("Unable to hash '%s' (%s: %s)",
+                                    pathfmt.temppath,
+                                    exc.__class__.__name__, exc)
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path FROM files WHERE hash=? AND size=?",
+                (digest, size)).fetchall()
+
+        if path := self._existing(rows, size, pathfmt.realpath):
+            if self._deduplicate(pathfmt, path):
+                return
+
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (digest, size, head, os.path.abspath(pathfmt.realpath)))
+
+    def _existing(self, rows, size, realpath):
+        """Return the path of a stored file that still exists"""
+        realpath = os.path.abspath(realpath)
+        for path, in rows:
+            if path == realpath:
+                continue
+            try:
+                if os.stat(path).st_size == size:
+                    return path
+            except OSError:
+                pass
+            with self.lock:
+                self.connection.execute(
+                    "DELETE FROM files WHERE path=?", (path,))
+        return None
+
+    def _deduplicate(self, pathfmt, path):
+        if self.action == "skip":
+            self.log.info("Skipping '%s' (duplicate of '%s')",
+                          pathfmt.filename, path)
+            if os.path.exists(pathfmt.temppath):
+                pathfmt.delete = True
+            else:
+                pathfmt.temppath = ""
+            return True
+
+        # replace the downloaded file with a link to 'path'
+        # and let PathFormat.finalize() move it to its target location
+        temppath = pathfmt.temppath
+        tmp = temppath + ".dedup"
+        try:
+            os.makedirs(os.path.dirname(temppath) or ".", exist_ok=True)
+            util.remove_file(tmp)
+            self._link(path, tmp)
+            os.replace(tmp, temppath)
+        except Exception as exc:
+            util.remove_file(tmp)
+            self.log.warning("Unable to %s '%s' to '%s' (%s: %s)",
+                             self.action, path, pathfmt.filename,
+                             exc.__class__.__name__, exc)
+            return False
+
+        self.log.info("'%s' -> '%s' (%s)",
+                      pathfmt.filename, path, self.action)
+        if self.action != "reflink":
+            # do not modify the stored file through its link
+            pathfmt.kwdict["_file_linked"] = True
+        return True
+
+    def finalize(self, _):
+        self.connection.close()
+
+    def _link_hardlink(self, src, dst):
+        os.link(src, dst)
+
+    def _link_symlink(self, src, dst):
+        os.symlink(src, dst)
+
+    def _link_reflink(self, src, dst):
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+    _link_skip = None
+
+    def _hash(self, path):
+        """Return hash digest, size, and head key of the file at 'path'"""
+        h = hashlib.new(self.algorithm)
+        with open(path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            head = self._head_key(fp.read(self.head)) if self.head else None
+            try:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty file or no mmap support
+                fp.seek(0)
+                while data := fp.read(65536):
+                    h.update(data)
+            else:
+                with data:
+                    h.update(data)
+        return h.hexdigest(), size, head
+
+    def _head_key(self, data):
+        return self.head_key + hashlib.new(self.algorithm, data).hexdigest()
+
+
+FICLONE = 0x40049409
+
+__postprocessor__ = DedupPP
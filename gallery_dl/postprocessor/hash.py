@@ -9,7 +9,9 @@
 """Compute file hash digests"""
 
 from .common import PostProcessor
+import threading
 import hashlib
+import mmap
 
 
 class HashPP(PostProcessor):
@@ -19,6 +21,7 @@ class HashPP(PostProcessor):
 
         self.chunk_size = options.get("chunk-size", 32768)
         self.filename = options.get("filename")
+        self.local = threading.local()
 
         hashes = options.get("hashes")
         if isinstance(hashes, dict):
@@ -38,22 +41,26 @@ class HashPP(PostProcessor):
             events = ("file",)
         elif isinstance(events, str):
             events = events.split(",")
-        job.register_hooks({event: self.run for event in events}, options)
+        hooks = {event: self.run for event in events}
 
-    def run(self, pathfmt):
-        hashes = [
-            (key, hashlib.new(name))
-            for key, name in self.hashes
-        ]
+        if options.get("inline"):
+            hooks["prepare-after"] = self.prepare
+        job.register_hooks(hooks, options)
 
-        size = self.chunk_size
-        with self._open(pathfmt) as fp:
-            while True:
-                data = fp.read(size)
-                if not data:
-                    break
-                for _, h in hashes:
-                    h.update(data)
+    def prepare(self, pathfmt):
+        pathfmt.kwdict["_file_wrapper"] = HashInline(self.hashes)
+
+    def run(self, pathfmt):
+        inline = pathfmt.kwdict.pop("_file_wrapper", None)
+        if isinstance(inline, HashInline) and inline.valid:
+            hashes = inline.hashes
+        else:
+            hashes = [
+                (key, hashlib.new(name))
+                for key, name in self.hashes
+            ]
+            with self._open(pathfmt) as fp:
+                self._update(fp, hashes)
 
         for key, h in hashes:
             pathfmt.kwdict[key] = h.hexdigest()
@@ -61,6 +68,28 @@ class HashPP(PostProcessor):
         if self.filename:
             pathfmt.build_path()
 
+    def _update(self, fp, hashes):
+        try:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for _, h in hashes:
+                    h.update(data)
+            return
+        except (ValueError, OSError):
+            # empty file or no mmap support
+            pass
+
+        # reuse one read buffer per thread
+        try:
+            view = self.local.view
+        except AttributeError:
+            view = self.local.view = memoryview(bytearray(self.chunk_size))
+
+        fp.seek(0)
+        while size := fp.readinto(view):
+            data = view[:size]
+            for _, h in hashes:
+                h.update(data)
+
     def _open(self, pathfmt):
         try:
             return open(pathfmt.temppath, "rb")
@@ -68,4 +97,63 @@ class HashPP(PostProcessor):
             return open(pathfmt.realpath, "rb")
 
 
+class HashInline():
+    """Compute hash digests while a file is being written"""
+    __slots__ = ("names", "hashes", "valid")
+
+    def __init__(self, hashes):
+        self.names = hashes
+        self.hashes = None
+        self.valid = False
+
+    def __call__(self, fp, mode):
+        # only files written sequentially from the start can be hashed
+        self.valid = "w" in mode
+        self.hashes = [
+            (key, hashlib.new(name))
+            for key, name in self.names
+        ]
+        return HashWriter(fp, self)
+
+
+class HashWriter():
+    """File object wrapper passing all written data to HashInline"""
+
+    def __init__(self, fp, inline):
+        self.fp = fp
+        self.inline = inline
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.fp.close()
+
+    def __getattr__(self, name):
+        return getattr(self.fp, name)
+
+    def write(self, data):
+        if self.inline.valid:
+            for _, h in self.inline.hashes:
+                h.update(data)
+        size = self.fp.write(data)
+        self.position += size
+        return size
+
+    def seek(self, offset, whence=0):
+        position = self.fp.seek(offset, whence)
+        if position != self.position:
+            self.inline.valid = False
+        return position
+
+    def read(self, size=-1):
+        self.inline.valid = False
+        return self.fp.read(size)
+
+    def truncate(self, size=None):
+        self.inline.valid = False
+        return self.fp.truncate(size)
+
+
 __postprocessor__ = HashPP
@@ -49,6 +49,7 @@ class RenamePP(PostProcessor):
             name_new = self._new(pathfmt)
             path_new = pathfmt.realdirectory + name_new
             self._rename(path_old, name_old, path_new, name_new)
+            pathfmt.invalidate()
 
     def rename_to_skip(self, pathfmt):
         name_old = self._old(pathfmt)
@@ -59,6 +60,7 @@ class RenamePP(PostProcessor):
             pathfmt.path = pathfmt.directory + name_new
             pathfmt.realpath = path_new = pathfmt.realdirectory + name_new
             self._rename(path_old, name_old, path_new, name_new)
+            pathfmt.invalidate()
 
     def rename_to_pafter(self, pathfmt):
         pathfmt.filename = name_new = self._new(pathfmt)
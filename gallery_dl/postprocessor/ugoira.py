@@ -10,10 +10,15 @@
 
 from .common import PostProcessor
 from .. import util, output
+import collections
 import subprocess
+import threading
+import functools
 import tempfile
 import zipfile
 import shutil
+import queue
+import copy
 import os
 
 try:
@@ -26,6 +31,8 @@ except ImportError:
 
 
 class UgoiraPP(PostProcessor):
+    # prepare() stores per-file state used by the following 'file' hook
+    threadsafe = False
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -104,6 +111,29 @@ class UgoiraPP(PostProcessor):
             "after"  : self.convert_from_files,
         }, options)
 
+        if (workers := options.get("workers")) and mode != "archive":
+            self.pool = ConversionPool(self, workers)
+            job.pending.append(self.pool.close)
+            job.hooks["init"].append(functools.partial(
+                self._check_hooks, job.hooks))
+        else:
+            self.pool = None
+
+    def _check_hooks(self, hooks, _):
+        """Warn about post processors not seeing converted files"""
+        names = set()
+        for callback in hooks.get("file", ()):
+            if isinstance(callback, functools.partial):
+                callback = callback.args[0]
+            pp = getattr(callback, "__self__", None)
+            if pp is not self and isinstance(pp, PostProcessor):
+                names.add(pp.name)
+        if names:
+            self.log.warning(
+                "'workers': '%s' post processors get the original ZIP "
+                "archive instead of the converted file",
+                "', '".join(sorted(names)))
+
     def prepare(self, pathfmt):
         self._convert_zip = self._convert_files = False
         if "_ugoira_frame_data" not in pathfmt.kwdict:
@@ -114,6 +144,7 @@ class UgoiraPP(PostProcessor):
         index = pathfmt.kwdict.get("_ugoira_frame_index")
         if index is None:
             self._convert_zip = True
+            self._source_ext = pathfmt.extension
             if self.delete:
                 pathfmt.set_extension(self.extension)
                 pathfmt.build_path()
@@ -137,21 +168,12 @@ class UgoiraPP(PostProcessor):
         self._zip_source = True
         self._zip_ext = ext = pathfmt.extension
 
+        if self.pool is not None:
+            return self.convert_from_zip_async(pathfmt)
+
         with self._tempdir() as tempdir:
-            if tempdir:
-                try:
-                    with zipfile.ZipFile(pathfmt.temppath) as zfile:
-                        zfile.extractall(tempdir)
-                except FileNotFoundError:
-                    pathfmt.realpath = pathfmt.temppath
-                    return
-                except Exception as exc:
-                    pathfmt.realpath = pathfmt.temppath
-                    self.log.error(
-                        "%s: Unable to extract frames from %s (%s: %s)",
-                        pathfmt.kwdict.get("id"), pathfmt.filename,
-                        exc.__class__.__name__, exc)
-                    return self.log.traceback(exc)
+            if tempdir and not self._extract(pathfmt, tempdir):
+                return
 
             if self.convert(pathfmt, tempdir):
                 if self.delete:
@@ -161,6 +183,45 @@ class UgoiraPP(PostProcessor):
                     pathfmt.set_extension(ext)
                     pathfmt.build_path()
 
+    def convert_from_zip_async(self, pathfmt):
+        """Extract frames and convert them in a background thread"""
+        tempdir = tempfile.mkdtemp()
+        if not self._extract(pathfmt, tempdir):
+            return shutil.rmtree(tempdir, ignore_errors=True)
+
+        target = pathfmt.copy()
+        target.kwdict = pathfmt.kwdict.copy()
+        target.set_extension(self.extension)
+        target.build_path()
+
+        if self.skip and target.exists():
+            shutil.rmtree(tempdir, ignore_errors=True)
+            if self.delete:
+                pathfmt.delete = True
+            return
+
+        # store the original ZIP archive until its conversion succeeded
+        if pathfmt.extension != self._source_ext:
+            pathfmt.set_extension(self._source_ext)
+            pathfmt.build_path()
+
+        task = copy.copy(self)
+        for name, value in self.__dict__.items():
+            if getattr(value, "__self__", None) is self:
+                setattr(task, name, getattr(task, value.__name__))
+        task._frames = [frame.copy() for frame in self._frames]
+        task.mtime = False
+
+        source = pathfmt.copy()
+        source.kwdict = target.kwdict
+        entry = ConversionEntry(
+            task, target, tempdir, pathfmt.kwdict, source)
+        self.pool.submit(entry)
+
+        # delay archive entries and 'after' post processors
+        # until the conversion finished
+        pathfmt.kwdict["_file_defer"] = entry.callbacks.append
+
     def convert_from_files(self, pathfmt):
         if not self._convert_files:
             return
@@ -191,6 +252,23 @@ class UgoiraPP(PostProcessor):
                     for frame in self._files:
                         util.remove_file(frame["path"])
 
+    def finish(self, entry):
+        """Handle the result of a background conversion"""
+        if entry.result:
+            pathfmt = entry.pathfmt
+            if self.mtime and (mtime := (entry.kwdict.get("_mtime_meta") or
+                                         entry.kwdict.get("_mtime_http"))):
+                util.set_mtime(pathfmt.realpath, mtime)
+            if self.delete:
+                util.remove_file(entry.source.realpath)
+        else:
+            pathfmt = entry.source
+            self.log.warning("%s: Keeping %s",
+                             entry.kwdict.get("id"), pathfmt.realpath)
+
+        for callback in entry.callbacks:
+            callback(pathfmt)
+
     def convert(self, pathfmt, tempdir):
         pathfmt.set_extension(self.extension)
         pathfmt.build_path()
@@ -303,6 +381,23 @@ class UgoiraPP(PostProcessor):
             raise ValueError()
         return retcode
 
+    def _extract(self, pathfmt, tempdir):
+        try:
+            with zipfile.ZipFile(pathfmt.temppath) as zfile:
+                zfile.extractall(tempdir)
+        except FileNotFoundError:
+            pathfmt.realpath = pathfmt.temppath
+        except Exception as exc:
+            pathfmt.realpath = pathfmt.temppath
+            self.log.error(
+                "%s: Unable to extract frames from %s (%s: %s)",
+                pathfmt.kwdict.get("id"), pathfmt.filename,
+                exc.__class__.__name__, exc)
+            self.log.traceback(exc)
+        else:
+            return True
+        return False
+
     def _copy_file(self, src, dst):
         shutil.copyfile(src, dst)
 
@@ -430,4 +525,79 @@ class UgoiraPP(PostProcessor):
         return True
 
 
+class ConversionPool():
+    """Run Ugoira conversions in a pool of threads
+
+    Results get processed in the same order their conversions were
+    submitted in.
+    """
+
+    def __init__(self, pp, num):
+        self.pp = pp
+        self.limit = num * 2
+        self.queue = queue.Queue()
+        self.pending = collections.deque()
+        self.threads = [
+            threading.Thread(target=self._run, daemon=True)
+            for _ in range(num)
+        ]
+        for thread in self.threads:
+            thread.start()
+        pp.log.debug("Using %d conversion workers", num)
+
+    def submit(self, entry):
+        """Schedule the conversion of 'entry'"""
+        self._collect(self.limit)
+        self.pending.append(entry)
+        self.queue.put(entry)
+
+    def close(self, _=None):
+        """Finish all scheduled conversions and stop all threads"""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = ()
+        self._collect(0)
+
+    def _collect(self, limit):
+        """Process finished conversions until at most 'limit' remain"""
+        pending = self.pending
+        while pending and (len(pending) > limit or pending[0].done.is_set()):
+            entry = pending.popleft()
+            entry.done.wait()
+            self.pp.finish(entry)
+
+    def _run(self):
+        while (entry := self.queue.get()) is not None:
+            try:
+                entry.result = entry.task.convert_to_animation(
+                    entry.pathfmt, entry.tempdir)
+            except Exception as exc:
+                self.pp.log.error("%s: %s", exc.__class__.__name__, exc)
+            finally:
+                shutil.rmtree(entry.tempdir, ignore_errors=True)
+                entry.done.set()
+
+
+class ConversionEntry():
+    """Ugoira conversion of a ConversionPool and its result
+
+    'callbacks' get called with the PathFormat of the converted file,
+    or of the original ZIP archive if its conversion failed.
+    """
+    __slots__ = ("task", "pathfmt", "tempdir", "kwdict", "source",
+                 "callbacks", "result", "done")
+
+    def __init__(self, task, pathfmt, tempdir, kwdict, source):
+        self.task = task
+        self.pathfmt = pathfmt
+        self.tempdir = tempdir
+        self.kwdict = kwdict
+        self.source = source
+        self.callbacks = []
+        self.result = None
+        self.done = threading.Event()
+
+
 __postprocessor__ = UgoiraPP
@@ -11,7 +11,16 @@
 from .common import PostProcessor
 from .. import util
 import zipfile
+import time
+import sys
 import os
+import io
+
+# 'stream' mode manipulates ZipFile internals
+# ('_writing', '_lock', 'start_dir', '_write_end_record')
+# only verified to behave as expected for these Python versions
+STREAM_SUPPORTED = (sys.version_info < (3, 15) and
+                    hasattr(zipfile.ZipFile, "_write_end_record"))
 
 
 class ZipPP(PostProcessor):
@@ -40,10 +49,36 @@ class ZipPP(PostProcessor):
         self.args = (self.path + ext, "a",
                      self.COMPRESSION_ALGORITHMS[algorithm], True)
 
-        job.register_hooks({
-            "file": (self.write_safe if options.get("mode") == "safe" else
-                     self.write_fast),
-        }, options)
+        self.pending = None
+        self.flush_time = 0.0
+        flush = options.get("flush", 10.0)
+        self.flush_interval = None if flush is None or flush is False else \
+            float(flush)
+
+        mode = options.get("mode")
+        if mode == "stream":
+            if not STREAM_SUPPORTED:
+                self.log.warning("'stream' mode is not supported on "
+                                 "Python %s; falling back to 'fast' mode",
+                                 sys.version.partition(" ")[0])
+                mode = "fast"
+            elif not self.delete:
+                self.log.warning("'keep-files' is enabled; "
+                                 "falling back to 'fast' mode")
+                mode = "fast"
+
+        if mode == "stream":
+            # archive entries get opened from download worker threads
+            self.threadsafe = False
+            hooks = {
+                "prepare-after": self.prepare,
+                "file"         : self.write_stream,
+                "error"        : self.rollback,
+            }
+        else:
+            hooks = {"file": (self.write_safe if mode == "safe" else
+                              self.write_fast)}
+        job.register_hooks(hooks, options)
         job.hooks["finalize"].append(self.finalize)
 
     def open(self):
@@ -73,6 +108,73 @@ class ZipPP(PostProcessor):
         with self.open() as zfile:
             self.write(pathfmt, zfile)
 
+    def prepare(self, pathfmt):
+        pathfmt.kwdict["_file_open"] = self.open_entry
+
+    def open_entry(self, pathfmt, mode):
+        """Return a file object writing directly into a new archive entry"""
+        self.rollback()
+
+        if "w" not in mode or "b" not in mode:
+            # resume partial downloads as usual
+            return None
+        if self.zfile is None:
+            self.zfile = self.open()
+        zfile = self.zfile
+        if zfile._writing or pathfmt.filename in zfile.NameToInfo:
+            return None
+
+        zinfo = zipfile.ZipInfo(pathfmt.filename, time.localtime()[:6])
+        zinfo.compress_type = zfile.compression
+        zinfo.external_attr = 0o644 << 16
+        fp = zfile.open(zinfo, "w", force_zip64=True)
+        self.pending = zinfo
+        return ZipEntryWriter(fp)
+
+    def write_stream(self, pathfmt):
+        pathfmt.kwdict.pop("_file_open", None)
+        if self.pending is None:
+            # file was not streamed into the archive
+            return self.write_fast(pathfmt)
+
+        self.pending = None
+        if self.files:
+            self.write_extra(pathfmt, self.zfile, self.files)
+            self.files = None
+        pathfmt.delete = True
+
+        if self.flush_interval is not None:
+            now = time.monotonic()
+            if now >= self.flush_time:
+                self.flush_time = now + self.flush_interval
+                self.flush()
+
+    def rollback(self, pathfmt=None):
+        """Remove an uncommitted entry from the archive"""
+        zinfo = self.pending
+        if zinfo is None:
+            return
+        self.pending = None
+
+        zfile = self.zfile
+        with zfile._lock:
+            zfile.filelist.remove(zinfo)
+            zfile.NameToInfo.pop(zinfo.filename, None)
+            zfile.start_dir = zinfo.header_offset
+            zfile.fp.seek(zinfo.header_offset)
+            zfile.fp.truncate()
+        if self.flush_interval is not None:
+            self.flush()
+        self.log.debug("Removed incomplete entry '%s' from %s",
+                       zinfo.filename, zfile.filename)
+
+    def flush(self):
+        """Write the central directory, making the archive readable"""
+        zfile = self.zfile
+        with zfile._lock:
+            zfile.fp.seek(zfile.start_dir)
+            zfile._write_end_record()
+
     def write_extra(self, pathfmt, zfile, files):
         for path in map(util.expand_path, files):
             if not os.path.isabs(path):
@@ -90,6 +192,7 @@ class ZipPP(PostProcessor):
 
     def finalize(self, pathfmt):
         if self.zfile:
+            self.rollback()
             self.zfile.close()
 
         if self.delete:
@@ -100,4 +203,41 @@ class ZipPP(PostProcessor):
                 util.remove_file(self.zfile.filename)
 
 
+class ZipEntryWriter():
+    """Sequential file object for a ZIP archive entry"""
+    __slots__ = ("fp", "position")
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.fp.close()
+
+    def write(self, data):
+        size = self.fp.write(data)
+        self.position += size
+        return size
+
+    def tell(self):
+        return self.position
+
+    def seekable(self):
+        return False
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.fp.close()
+
+    def _unsupported(self, *args):
+        raise io.UnsupportedOperation("ZIP archive entries are write-only")
+
+    read = seek = truncate = _unsupported
+
+
 __postprocessor__ = ZipPP
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Request rate limits shared between extractors, downloaders, and threads"""
+
+import time
+import threading
+from email.utils import parsedate_to_datetime
+
+PENALTY_MIN = 1.0
+PENALTY_MAX = 60.0
+
+_buckets = {}
+_lock = threading.Lock()
+
+
+def bucket(key):
+    """Return the process-wide Bucket for 'key'"""
+    try:
+        return _buckets[key]
+    except KeyError:
+        pass
+    with _lock:
+        if (bkt := _buckets.get(key)) is None:
+            _buckets[key] = bkt = Bucket()
+        return bkt
+
+
+def clear():
+    """Remove all Buckets"""
+    with _lock:
+        _buckets.clear()
+
+
+def host(url):
+    """Return the bucket key for the host name of 'url'"""
+    netloc = url.partition("://")[2] or url
+    netloc = netloc.partition("/")[0].rpartition("@")[2]
+    if netloc[:1] == "[":  # IPv6
+        return netloc[:netloc.find("]")+1].lower()
+    return netloc.partition(":")[0].lower()
+
+
+def build_key_func(scope, category):
+    """Return a function that maps a URL to its bucket key"""
+    if not scope or scope == "category":
+        return lambda _, key=category: key
+    if scope == "host":
+        return host
+    if scope == "global":
+        scope = ""
+    return lambda _, key=f"#{scope}": key
+
+
+def retry_after(response):
+    """Return the number of seconds from a 'Retry-After' header or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+
+    if value.isdecimal():
+        return float(value)
+    try:
+        seconds = parsedate_to_datetime(value).timestamp() - time.time()
+    except Exception:
+        return None
+    return seconds if seconds > 0.0 else 0.0
+
+
+class Bucket():
+    """Single-token bucket with adaptive backoff
+
+    The token gets refilled 'interval' seconds after the previous
+    request has finished. After a '429 Too Many Requests' response,
+    all requests are blocked for the given duration and an additional
+    'penalty' interval is applied, which decays with each success.
+    """
+    __slots__ = ("lock", "ready", "until", "penalty")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ready = 0.0    # earliest start time for the next request
+        self.until = 0.0    # no requests before this time
+        self.penalty = 0.0  # additional interval learned from 429 responses
+
+    def acquire(self, interval=0.0):
+        """Take the token and return the seconds to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            start = self.ready
+            if start < self.until:
+                start = self.until
+            if start < now:
+                start = now
+            self.ready = start + interval + self.penalty
+            return start - now
+
+    def release(self, interval=0.0):
+        """Start refilling the token after a request has finished"""
+        with self.lock:
+            ready = time.monotonic() + interval + self.penalty
+            if self.ready < ready:
+                self.ready = ready
+
+    def backoff(self, seconds):
+        """Block requests for 'seconds' and increase the penalty interval"""
+        with self.lock:
+            until = time.monotonic() + seconds
+            if self.until < until:
+                self.until = until
+            penalty = self.penalty * 2.0
+            self.penalty = (
+                PENALTY_MIN if penalty < PENALTY_MIN else
+                PENALTY_MAX if penalty > PENALTY_MAX else penalty)
+
+    def success(self):
+        """Decrease the penalty interval"""
+        if self.penalty:
+            with self.lock:
+                penalty = self.penalty * 0.75
+                self.penalty = penalty if penalty >= 0.1 else 0.0
@@ -11,7 +11,9 @@
 import os
 import sys
 import json
+import math
 import time
+import array
 import random
 import getpass
 import hashlib
@@ -671,6 +673,151 @@ class CustomNone():
     __repr__ = __str__
 
 
+class BloomFilter():
+    """Space-efficient probabilistic set without false negatives"""
+    __slots__ = ("capacity", "size", "hashes", "bits")
+
+    def __init__(self, capacity, error_rate=0.01, bits=None):
+        if capacity < 1024:
+            capacity = 1024
+        size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+
+        self.capacity = capacity
+        self.size = size = (size + 7) & ~7
+        self.hashes = max(round(size / capacity * math.log(2)), 1)
+        self.bits = bytearray(size >> 3) if bits is None else bits
+
+    def __contains__(self, value):
+        bits = self.bits
+        for index in self._indices(value):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def add(self, value):
+        bits = self.bits
+        for index in self._indices(value):
+            bits[index >> 3] |= 1 << (index & 7)
+
+    def _indices(self, value):
+        # Kirsch-Mitzenmacher double hashing
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+
+class ScalableBloomFilter():
+    """BloomFilter that grows with the number of its elements
+
+    Each additional filter has twice the capacity and half the error rate
+    of the previous one, which keeps the overall false positive rate below
+    two times the initial 'error_rate'.
+    """
+    __slots__ = ("filters", "error_rate", "count", "limit")
+
+    def __init__(self, capacity=65536, error_rate=0.0005):
+        self.filters = [BloomFilter(capacity, error_rate)]
+        self.error_rate = error_rate
+        self.count = 0
+        self.limit = self.filters[0].capacity
+
+    def __contains__(self, value):
+        for bloom in self.filters:
+            if value in bloom:
+                return True
+        return False
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        if self.count >= self.limit:
+            self.error_rate *= 0.5
+            self.filters.append(BloomFilter(
+                self.filters[-1].capacity * 2, self.error_rate))
+            self.limit += self.filters[-1].capacity
+        self.filters[-1].add(value)
+        self.count += 1
+
+
+class CompactSet():
+    """Set of strings storing only their 64-bit hash digests
+
+    Digests are kept in an open-addressing hash table of unsigned 64-bit
+    integers, using about 16 to 32 bytes per element. Distinct values
+    with colliding digests are treated as equal.
+    """
+    __slots__ = ("table", "mask", "count")
+
+    def __init__(self, capacity=1024):
+        size = 8
+        while size < capacity * 2:
+            size <<= 1
+        self.table = array.array("Q", bytes(size * 8))
+        self.mask = size - 1
+        self.count = 0
+
+    def __contains__(self, value):
+        digest = self._digest(value)
+        table = self.table
+        mask = self.mask
+        index = digest & mask
+        while entry := table[index]:
+            if entry == digest:
+                return True
+            index = (index + 1) & mask
+        return False
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        if self._insert(self.table, self.mask, self._digest(value)):
+            self.count += 1
+            if self.count * 2 > self.mask:
+                self._grow()
+
+    def _grow(self):
+        size = (self.mask + 1) * 2
+        table = array.array("Q", bytes(size * 8))
+        mask = size - 1
+        for digest in self.table:
+            if digest:
+                self._insert(table, mask, digest)
+        self.table = table
+        self.mask = mask
+
+    def _insert(self, table, mask, digest):
+        index = digest & mask
+        while entry := table[index]:
+            if entry == digest:
+                return False
+            index = (index + 1) & mask
+        table[index] = digest
+        return True
+
+    def _digest(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1  # 0 marks empty slots
+
+
+def build_unique_set(mode=True):
+    """Return a set-like container for detecting duplicate URLs
+
+    'mode' selects how URLs get stored:
+    - "compact": 64-bit digests (CompactSet)
+    - "bloom"  : probabilistic (ScalableBloomFilter)
+    - otherwise: as is (set)
+    """
+    if mode == "compact":
+        return CompactSet()
+    if mode == "bloom":
+        return ScalableBloomFilter()
+    return set()
+
+
 class Flags():
 
     def __init__(self):
@@ -1044,8 +1191,8 @@ class RangePredicate():
 
 class UniquePredicate():
     """Predicate; True if given URL has not been encountered before"""
-    def __init__(self):
-        self.urls = set()
+    def __init__(self, mode=True):
+        self.urls = build_unique_set(mode)
 
     def __call__(self, url, _):
         if url.startswith("text:"):
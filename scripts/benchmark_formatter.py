@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Compare compiled format strings with the previous implementation"""
+
+import util  # noqa F401
+import _string
+import timeit
+import sys
+
+from gallery_dl import formatter, dt
+
+FORMAT_STRINGS = (
+    "{category}_{id}_{num}_{title}.{extension}",
+    "{id}{num:?_//}.{extension}",
+    "{title[:8]}_{date:%Y-%m-%d}.{extension!l}",
+)
+
+KWDICT = {
+    "category" : "test",
+    "id"       : 12345,
+    "num"      : 1,
+    "title"    : "foo bar baz",
+    "date"     : dt.datetime(2010, 1, 1),
+    "extension": "JPG",
+}
+
+
+class LegacyFormatter(formatter.StringFormatter):
+    """Fill and join a list of per-field results"""
+
+    def __init__(self, format_string, default=formatter.NONE, fmt=format):
+        self.default = default
+        self.format = fmt
+        self.result = []
+        self.fields = []
+
+        for literal_text, field_name, format_spec, conv in \
+                _string.formatter_parser(format_string):
+            if literal_text:
+                self.result.append(literal_text)
+            if field_name:
+                self.fields.append((
+                    len(self.result),
+                    self._field_access(field_name, format_spec, conv),
+                ))
+                self.result.append("")
+
+    def format_map(self, kwdict):
+        result = self.result
+        for index, func in self.fields:
+            result[index] = func(kwdict)
+        return "".join(result)
+
+
+def run(func, number, repeat):
+    return min(timeit.repeat(
+        lambda: func(KWDICT), number=number, repeat=repeat)) / number
+
+
+def main(number=20000, repeat=5):
+    for format_string in FORMAT_STRINGS:
+        new = formatter.parse(format_string).format_map
+        old = LegacyFormatter(format_string).format_map
+        if new(KWDICT) != old(KWDICT):
+            sys.exit(f"Results differ for '{format_string}'")
+
+        t_new = run(new, number, repeat)
+        t_old = run(old, number, repeat)
+        print(f"{format_string}\n"
+              f"    previous: {t_old * 1e6:6.3f} µs\n"
+              f"    compiled: {t_new * 1e6:6.3f} µs "
+              f"({t_old / t_new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
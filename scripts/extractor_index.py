@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Generate the extractor registry and its index by domain name"""
+
+import sys
+import collections
+
+import util
+from gallery_dl import config, extractor
+from gallery_dl.extractor.common import BaseExtractor
+
+try:
+    from re import _parser as sre_parse, _constants as c
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants as c
+
+
+WILDCARD = "\0"  # any sequence of characters without '/'
+UNSAFE = "\1"    # any sequence of characters, including '/'
+LIMIT = 4096
+
+REPEAT = {c.MAX_REPEAT, c.MIN_REPEAT}
+if hasattr(c, "POSSESSIVE_REPEAT"):
+    REPEAT.add(c.POSSESSIVE_REPEAT)
+CATEGORIES_SLASH = {c.CATEGORY_NOT_DIGIT, c.CATEGORY_NOT_WORD,
+                    c.CATEGORY_NOT_SPACE}
+SLASH = ord("/")
+
+# config options that make extractor patterns match more URLs
+CONFIG = (
+    ("generic", "enabled", True),
+    ("ytdl"   , "enabled", True),
+    ("bunkr"  , "tlds"   , True),
+)
+
+
+def domain_keys(pattern):
+    """Return the set of index keys for a regex pattern
+
+    Every URL matched by 'pattern' contains one of these keys
+    as (domain name suffix of) one of its authority components.
+    Return None if there is no such set.
+    """
+    if not isinstance(pattern, str):
+        pattern = pattern.pattern
+
+    try:
+        strings = _expand(sre_parse.parse(pattern), [""])
+    except ValueError:
+        return None
+
+    keys = set()
+    for string in strings:
+        if not _complete(string) or UNSAFE in string:
+            return None
+
+        for name in extractor._index_names(string):
+            if WILDCARD in name:
+                name = name.rpartition(WILDCARD)[2].partition(".")[2]
+            if name:
+                keys.add(name)
+                break
+        else:
+            return None
+
+    # drop keys already covered by one of their domain name suffixes
+    return {
+        key for key in keys
+        if not any(key.endswith("." + other) for other in keys)
+    }
+
+
+def _complete(string):
+    """Return True if 'string' contains a URL's complete authority"""
+    if UNSAFE in string:
+        return True
+    if (match := extractor._index_scheme(string)):
+        return "/" in string[match.end():]
+    # '/' might still be part of an unfinished 'scheme://'
+    return "/" in string and not (
+        string[-1] == "/" and string[-2:-1] == ":" or
+        string[-1] == ":")
+
+
+def _expand(items, prefixes):
+    """Expand all literal prefixes of parsed regex 'items'"""
+    for op, av in items:
+        results = []
+        for prefix in prefixes:
+            if _complete(prefix):
+                results.append(prefix)
+            else:
+                results.extend(_expand_item(op, av, prefix))
+        if len(results) > LIMIT:
+            raise ValueError("Too many expansions")
+        prefixes = results
+    return prefixes
+
+
+def _expand_item(op, av, prefix):
+    if op is c.LITERAL:
+        return (prefix + chr(av),)
+    if op is c.SUBPATTERN:
+        return _expand(av[-1], [prefix])
+    if op is c.BRANCH:
+        return [
+            result
+            for branch in av[1]
+            for result in _expand(branch, [prefix])
+        ]
+    if op in REPEAT:
+        low, high, item = av
+        if high == 1:
+            results = _expand(item, [prefix])
+            if not low:
+                results.append(prefix)
+            return results
+        if not high:
+            return (prefix,)
+        return (prefix + (UNSAFE if _slash(item) else WILDCARD),)
+    if op is c.IN and len(av) == 1 and av[0][0] is c.LITERAL:
+        return (prefix + chr(av[0][1]),)
+    if op is c.AT:
+        if av is c.AT_END or av is c.AT_END_STRING:
+            # no further characters
+            return (prefix + "/",)
+        return (prefix,)
+    if op is c.ASSERT or op is c.ASSERT_NOT:
+        return (prefix,)
+    return (prefix + (UNSAFE if _slash(((op, av),)) else WILDCARD),)
+
+
+def _slash(items):
+    """Return True if parsed regex 'items' could match a '/'"""
+    for op, av in items:
+        if op is c.LITERAL:
+            if av == SLASH:
+                return True
+        elif op is c.NOT_LITERAL:
+            if av != SLASH:
+                return True
+        elif op is c.IN:
+            if _slash_in(av):
+                return True
+        elif op is c.CATEGORY:
+            if av in CATEGORIES_SLASH:
+                return True
+        elif op is c.SUBPATTERN:
+            if _slash(av[-1]):
+                return True
+        elif op is c.BRANCH:
+            if any(_slash(branch) for branch in av[1]):
+                return True
+        elif op in REPEAT:
+            if _slash(av[2]):
+                return True
+        elif op is c.AT or op is c.ASSERT or op is c.ASSERT_NOT:
+            pass
+        else:
+            return True
+    return False
+
+
+def _slash_in(items):
+    negate = False
+    contains = False
+    for op, av in items:
+        if op is c.NEGATE:
+            negate = True
+        elif op is c.LITERAL:
+            contains |= (av == SLASH)
+        elif op is c.RANGE:
+            contains |= (av[0] <= SLASH <= av[1])
+        elif op is c.CATEGORY:
+            contains |= (av in CATEGORIES_SLASH)
+        elif not negate:
+            contains = True
+    return contains != negate
+
+
+def build_index():
+    classes = []
+    domains = collections.defaultdict(list)
+    fallback = []
+    basecategories = collections.defaultdict(list)
+
+    dynamic = {module for module, _, _ in CONFIG}
+
+    for index, cls in enumerate(extractor._list_classes()):
+        module = cls.__module__.rpartition(".")[2]
+        classes.append((
+            module,
+            cls.__name__,
+            cls.category,
+            cls.subcategory,
+            cls.basecategory,
+            None if module in dynamic else cls.pattern.pattern,
+            getattr(cls, "example", None),
+            cls.__doc__,
+        ))
+
+        if issubclass(cls, BaseExtractor) and cls.basecategory:
+            basecategories[cls.basecategory].append(index)
+
+        if keys := domain_keys(cls.pattern):
+            for key in keys:
+                domains[key].append(index)
+        else:
+            fallback.append(index)
+
+    return classes, domains, fallback, basecategories
+
+
+def generate_output(fp, classes, domains, fallback, basecategories):
+    write = fp.write
+    write("""\
+# -*- coding: utf-8 -*-
+
+# This file is generated by scripts/extractor_index.py - do not edit
+
+\"\"\"Registry of extractor classes and their index by domain name\"\"\"
+
+MODULES = (
+""")
+    for module in extractor.modules:
+        write(f"    {module!r},\n")
+
+    write(""")
+
+# module, name, category, subcategory, basecategory, pattern, example, doc
+CLASSES = (
+""")
+    for index, row in enumerate(classes):
+        write(f"    (  # {index}\n")
+        for value in row:
+            write(f"        {value!r},\n")
+        write("    ),\n")
+
+    write("""\
+)
+
+DOMAINS = {
+""")
+    for key in sorted(domains):
+        write(f"    {key!r}: {_tuple(domains[key])},\n")
+
+    write(f"""\
+}}
+
+FALLBACK = {_tuple(fallback)}
+
+BASECATEGORIES = {{
+""")
+    for base in sorted(basecategories):
+        write(f"    {base!r}: {_tuple(basecategories[base])},\n")
+    write("}\n")
+
+
+def _tuple(indices):
+    return f"({', '.join(map(str, indices))},)" if indices else "()"
+
+
+def main():
+    for module, key, value in CONFIG:
+        config.set(("extractor", module), key, value)
+
+    index = build_index()
+    path = util.path("gallery_dl", "extractor", "_index.py")
+    with util.lazy(path) as fp:
+        generate_output(fp, *index)
+
+    classes, domains, fallback, _ = index
+    sys.stdout.write(f"{len(classes)} classes, {len(domains)} domains, "
+                     f"{len(fallback)} fallback\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import sqlite3
+import threading
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import archive  # noqa E402
+
+
+class TestDownloadArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "archive.sqlite3")
+
+    def tearDown(self):
+        archive._blooms.clear()
+        self.dir.cleanup()
+
+    def _connect(self, mode=None):
+        return archive.connect(self.path, "test", "{id}", mode=mode)
+
+    def _entries(self):
+        with sqlite3.connect(self.path) as con:
+            return sorted(
+                row[0] for row in con.execute("SELECT entry FROM archive"))
+
+    def test_file(self):
+        arch = self._connect()
+        self.assertIsInstance(arch, archive.DownloadArchive)
+
+        self.assertFalse(arch.check({"id": 1}))
+        arch.add({"id": 1})
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertEqual(self._entries(), ["test1"])
+        arch.close()
+
+    def test_memory(self):
+        arch = self._connect("memory")
+        self.assertIsInstance(arch, archive.DownloadArchiveMemory)
+
+        arch.add({"id": 1})
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertEqual(self._entries(), [])
+
+        arch.finalize()
+        arch.close()
+        self.assertEqual(self._entries(), ["test1"])
+
+    def test_check_many(self):
+        arch = self._connect()
+        arch.add({"id": 2})
+        arch.add({"id": 4})
+
+        kwdicts = [{"id": i} for i in range(1, 6)]
+        with patch.object(arch, "cursor", wraps=arch.cursor) as cursor:
+            self.assertEqual(
+                arch.check_many(kwdicts),
+                [False, True, False, True, False])
+            self.assertEqual(cursor.execute.call_count, 1)
+
+            self.assertEqual(kwdicts[2]["_archive_key"], "test3")
+            self.assertFalse(arch.check({"id": 3}))
+            self.assertTrue(arch.check({"id": 4}))
+            self.assertEqual(cursor.execute.call_count, 1)
+
+            arch.check({"id": 4})
+            self.assertEqual(cursor.execute.call_count, 2)
+        arch.close()
+
+    def test_check_many_add(self):
+        arch = self._connect()
+        kwdicts = [{"id": 1}, {"id": 2}]
+        self.assertEqual(arch.check_many(kwdicts), [False, False])
+
+        # entries added after a batched lookup are not reported as new
+        arch.add(kwdicts[0])
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 2}))
+        arch.close()
+
+    def test_check_many_memory(self):
+        arch = self._connect("memory")
+        arch.add({"id": 2})
+
+        self.assertEqual(
+            arch.check_many([{"id": 1}, {"id": 2}]),
+            [False, True])
+        arch.close()
+
+    def test_buffer(self):
+        arch = self._connect("buffer:3")
+        self.assertIsInstance(arch, archive.DownloadArchiveBuffer)
+        self.assertEqual(arch.size, 3)
+        self.assertEqual(arch.interval, 10.0)
+
+        arch.add({"id": 1})
+        arch.add({"id": 2})
+        self.assertTrue(arch.check({"id": 2}))
+        self.assertFalse(arch.check({"id": 3}))
+        self.assertEqual(self._entries(), [])
+
+        arch.add({"id": 3})
+        self.assertEqual(self._entries(), ["test1", "test2", "test3"])
+        self.assertFalse(arch.keys)
+
+        arch.add({"id": 4})
+        self.assertEqual(len(self._entries()), 3)
+        arch.close()
+        self.assertEqual(len(self._entries()), 4)
+
+    def test_buffer_interval(self):
+        arch = self._connect("buffer:100:5")
+        self.assertEqual(arch.interval, 5.0)
+
+        arch.add({"id": 1})
+        self.assertEqual(self._entries(), [])
+
+        with patch("time.monotonic") as mono:
+            mono.return_value = arch.flush_time
+            arch.add({"id": 2})
+        self.assertEqual(self._entries(), ["test1", "test2"])
+        arch.close()
+
+    def test_shared_connection(self):
+        arch1 = self._connect()
+        arch1.add({"id": 1})
+
+        with patch.object(archive.DownloadArchive, "_connect") as connect, \
+                patch.object(archive.DownloadArchive,
+                             "_create_table") as create:
+            arch2 = self._connect("memory")
+            arch3 = archive.connect(self.path, "test", "{id}", table="other")
+        self.assertEqual(connect.call_count, 0)
+        self.assertEqual(create.call_count, 1)
+
+        self.assertIs(arch2.connection, arch1.connection)
+        self.assertIs(arch3.connection, arch1.connection)
+        self.assertEqual(arch1.shared.refs, 3)
+        self.assertTrue(arch2.check({"id": 1}))
+
+        arch1.close()
+        arch1.close()
+        self.assertEqual(arch2.shared.refs, 2)
+        arch2.add({"id": 2})
+        arch2.finalize()
+        arch2.close()
+        self.assertIn(arch3.shared.key, archive._connections)
+        self.assertEqual(self._entries(), ["test1", "test2"])
+
+        arch3.close()
+        self.assertFalse(archive._connections)
+
+        # ':memory:' archives are never shared
+        arch1 = archive.connect(":memory:", "test", "{id}")
+        arch2 = archive.connect(":memory:", "test", "{id}")
+        self.assertIsNot(arch1.connection, arch2.connection)
+        self.assertFalse(archive._connections)
+        arch1.close()
+        arch2.close()
+
+    def test_shared_transaction(self):
+        arch1 = self._connect()
+        arch2 = self._connect()
+        self.assertIs(arch1.shared, arch2.shared)
+        thread = threading.Thread(target=arch2.add, args=({"id": 2},))
+
+        # another archive's transaction gets rolled back
+        with arch1.shared.lock:
+            arch1.cursor.execute("BEGIN")
+            arch1.cursor.execute(arch1._stmt_insert, ("test1",))
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            arch1.cursor.execute("ROLLBACK")
+        thread.join()
+
+        self.assertEqual(list(arch1.entries()), ["test2"])
+        arch1.close()
+        arch2.close()
+
+    def test_bloom(self):
+        arch = self._connect()
+        arch.add({"id": 1})
+        arch.close()
+
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        self.assertIsInstance(arch, archive.DownloadArchiveBloom)
+        self.assertEqual(arch.path, self.path + ".bloom")
+        self.assertIn("test1", arch.bloom)
+
+        with patch.object(arch.archive, "check") as check:
+            check.return_value = True
+            self.assertFalse(arch.check({"id": 2}))
+            self.assertEqual(check.call_count, 0)
+            self.assertTrue(arch.check({"id": 1}))
+            self.assertEqual(check.call_count, 1)
+
+        arch.add({"id": 2})
+        self.assertTrue(arch.check({"id": 2}))
+        self.assertEqual(
+            arch.check_many([{"id": 1}, {"id": 2}, {"id": 3}]),
+            [True, True, False])
+        arch.close()
+        self.assertEqual(self._entries(), ["test1", "test2"])
+
+        # load stored filter
+        with patch.object(archive.DownloadArchiveBloom, "_build") as build:
+            arch = archive.connect(
+                self.path, "test", "{id}", mode="memory", bloom=True)
+            self.assertEqual(build.call_count, 0)
+            self.assertIn("test2", arch.bloom)
+            arch.add({"id": 3})
+            arch.finalize()
+            arch.close()
+        self.assertEqual(len(self._entries()), 3)
+
+    def test_bloom_outdated(self):
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        arch.add({"id": 1})
+        arch.close()
+
+        # modify archive without updating its filter
+        arch = self._connect()
+        arch.add({"id": 2})
+        arch.close()
+
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        self.assertTrue(arch.modified)
+        self.assertTrue(arch.check({"id": 2}))
+        arch.close()
+
+    def test_bloom_shared(self):
+        arch1 = archive.connect(self.path, "test", "{id}", bloom=True)
+        arch1.add({"id": 1})
+
+        with patch.object(archive.DownloadArchiveBloom, "_load") as load, \
+                patch.object(archive.DownloadArchiveBloom, "_build") as build:
+            arch2 = archive.connect(self.path, "test", "{id}", bloom=True)
+            self.assertIs(arch2.bloom, arch1.bloom)
+            arch2.add({"id": 2})
+            self.assertTrue(arch1.check({"id": 2}))
+            arch1.close()
+            arch2.close()
+            self.assertEqual(arch2.state.count, 2)
+
+            # later jobs reuse the filter without reloading it
+            arch3 = archive.connect(self.path, "test", "{id}", bloom=True)
+            self.assertTrue(arch3.check({"id": 1}))
+            arch3.close()
+        self.assertEqual(load.call_count, 0)
+        self.assertEqual(build.call_count, 0)
+
+    def test_bloom_modified(self):
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        arch.add({"id": 1})
+        arch.close()
+        self.assertTrue(os.path.exists(arch.path))
+
+        # another process adds an entry while this one re-adds an old one
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        with sqlite3.connect(self.path) as con:
+            con.execute("INSERT INTO archive VALUES ('test2')")
+        arch.add({"id": 1})
+        arch.add({"id": 3})
+        arch.close()
+        self.assertFalse(os.path.exists(arch.path))
+
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        self.assertIn("test2", arch.bloom)
+        self.assertTrue(arch.check({"id": 2}))
+        arch.close()
+
+    def test_bloom_count(self):
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        arch.add({"id": 1})
+        arch.close()
+
+        # later jobs in the same process do not count entries again
+        with patch.object(archive.DownloadArchive, "count") as count:
+            arch = archive.connect(self.path, "test", "{id}", bloom=True)
+            self.assertTrue(arch.check({"id": 1}))
+            arch.add({"id": 2})
+            arch.close()
+            arch = archive.connect(self.path, "test", "{id}", bloom=True)
+            arch.close()
+        self.assertEqual(count.call_count, 0)
+        self.assertEqual(arch.state.count, 2)
+
+        # unless the archive file got modified in the meantime
+        con = sqlite3.connect(self.path)
+        with con:
+            con.execute("INSERT INTO archive VALUES ('test3')")
+        con.close()
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        self.assertTrue(arch.check({"id": 3}))
+        arch.close()
+        self.assertEqual(arch.state.count, 3)
+
+    def test_bloom_false_positive(self):
+        arch = archive.connect(self.path, "test", "{id}", bloom=True)
+        arch.add({"id": 1})
+        arch.bloom.add("test2")
+        arch.bloom.add("test3")
+
+        self.assertFalse(arch.check({"id": 2}))
+        self.assertEqual(arch.check_many([{"id": 1}, {"id": 3}]),
+                         [True, False])
+        arch.add({"id": 1})
+        arch.add({"id": 2})
+        arch.add({"id": 3})
+        arch.close()
+        self.assertEqual(arch.state.count, 3)
+        self.assertEqual(len(self._entries()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
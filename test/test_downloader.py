@@ -12,6 +12,7 @@ import sys
 import unittest
 from unittest.mock import Mock, MagicMock, patch
 
+import io
 import re
 import logging
 import os.path
@@ -22,7 +23,8 @@ import http.server
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import downloader, extractor, output, config, path  # noqa E402
-from gallery_dl.downloader.http import MIME_TYPES, SIGNATURE_CHECKS # noqa E402
+from gallery_dl.downloader.http import (  # noqa E402
+    MIME_TYPES, SIGNATURE_CHECKS, HttpWriter)
 
 
 class MockDownloaderModule(Mock):
@@ -132,10 +134,12 @@ class TestDownloaderConfig(unittest.TestCase):
         self.assertEqual(dl.maxsize, None)
         self.assertEqual(dl.mtime, True)
         self.assertEqual(dl.rate, None)
+        self.assertEqual(dl.write_buffer, 0)
         self.assertEqual(dl.part, True)
         self.assertEqual(dl.partdir, None)
 
         self.assertIs(dl.interval_429, extr._interval_429)
+        self.assertIs(dl.adaptive_429, extr._adaptive_429)
         self.assertIs(dl.retry_codes, extr._retry_codes)
         self.assertIs(dl.retries, extr._retries)
         self.assertIs(dl.timeout, extr._timeout)
@@ -259,6 +263,7 @@ class TestHTTPDownloader(TestDownloaderBase):
 
     def tearDown(self):
         self.downloader.minsize = self.downloader.maxsize = None
+        self.downloader.segments = False
 
     def test_http_download(self):
         self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
@@ -298,6 +303,125 @@ class TestHTTPDownloader(TestDownloaderBase):
         self.assertTrue(success)
         self.assertEqual(pathfmt.temppath, "")
 
+    def test_http_segmented(self):
+        dl = self.downloader
+        dl.segments = 4
+        dl.segment_size = 1000
+
+        with patch.object(dl, "_download_segment",
+                          wraps=dl._download_segment) as segment:
+            self._run_test("~SEG", None, DATA["~SEG"], "bin", "bin")
+        self.assertEqual(segment.call_count, 4)
+        self.assertEqual(
+            [call.args[0].end for call in segment.call_args_list],
+            [2560, 5120, 7680, 10240])
+
+        # resume partial download without segments
+        pathfmt = self._prepare_destination(None, extension="bin")
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath + ".part", "wb") as fp:
+            fp.write(DATA["~SEG"][:500])
+        with patch.object(dl, "_download_segment") as segment:
+            self.assertTrue(dl.download(f"{self.address}/~SEG", pathfmt))
+        self.assertEqual(segment.call_count, 0)
+        with pathfmt.open("rb") as fp:
+            self.assertEqual(fp.read(), DATA["~SEG"])
+
+    def test_http_segment_bounds(self):
+        dl = self.downloader
+        dl.segments = 3
+        dl.segment_size = 100
+        response = Mock(headers={"Accept-Ranges": "bytes"})
+
+        self.assertEqual(
+            dl._segment_bounds(response, 1000),
+            [(0, 334), (334, 668), (668, 1000)])
+        self.assertEqual(
+            dl._segment_bounds(response, 250),
+            [(0, 125), (125, 250)])
+        self.assertIsNone(dl._segment_bounds(response, 150))
+        self.assertIsNone(dl._segment_bounds(response, None))
+
+        response.headers["Content-Encoding"] = "gzip"
+        self.assertIsNone(dl._segment_bounds(response, 1000))
+
+        response.headers = {}
+        self.assertIsNone(dl._segment_bounds(response, 1000))
+
+    def test_http_write_buffer(self):
+        dl = self.downloader
+        with patch.object(dl, "receive", wraps=dl.receive) as receive:
+            self._run_test("png", None, DATA["png"], "png", "png")
+        self.assertNotIsInstance(
+            receive.call_args.args[0], HttpWriter)
+
+        dl.write_buffer = 16
+        try:
+            with patch.object(dl, "receive", wraps=dl.receive) as receive:
+                self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
+            self.assertIsInstance(
+                receive.call_args.args[0], HttpWriter)
+
+            # a write error must not hide the original exception
+            fp = Mock()
+            fp.write.side_effect = OSError("disk full")
+
+            def receive(fp, content, bytes_total, bytes_start):
+                fp.write(b"foo")
+                raise ConnectionError("reset")
+
+            with patch.object(dl, "receive", receive), \
+                    self.assertRaises(ConnectionError):
+                dl._receive_buffered(fp, None, 3, 0)
+        finally:
+            dl.write_buffer = 0
+
+    def test_http_writer(self):
+        fp = io.BytesIO()
+        writer = HttpWriter(fp, 2)
+        for i in range(100):
+            writer.write(bytes((i,)) * 10)
+        writer.close()
+        self.assertEqual(fp.getvalue(), b"".join(
+            bytes((i,)) * 10 for i in range(100)))
+
+        fp = Mock()
+        fp.write.side_effect = OSError("disk full")
+        writer = HttpWriter(fp, 2)
+        writer.write(b"foo")
+        with self.assertRaises(OSError):
+            for _ in range(10):
+                writer.write(b"bar")
+            writer.close()
+
+    def test_http_duplicate(self):
+        url = f"{self.address}/~SEG"
+        heads = []
+
+        def duplicate(pathfmt, size, head):
+            heads.append((size, head))
+            return result
+
+        # not a duplicate
+        result = False
+        pathfmt = self._prepare_destination(None, extension="bin")
+        pathfmt.kwdict["_http_duplicate"] = (1000, duplicate)
+        self.assertTrue(self.downloader.download(url, pathfmt))
+        self.assertEqual(heads[0][0], len(DATA["~SEG"]))
+        self.assertGreaterEqual(len(heads[0][1]), 1000)
+        self.assertTrue(DATA["~SEG"].startswith(heads[0][1]))
+        with pathfmt.open("rb") as fp:
+            self.assertEqual(fp.read(), DATA["~SEG"])
+
+        # duplicate; download stops after its first bytes
+        result = True
+        pathfmt = self._prepare_destination(None, extension="bin")
+        pathfmt.kwdict["_http_duplicate"] = (1000, duplicate)
+        with patch.object(self.downloader, "receive") as receive:
+            self.assertTrue(self.downloader.download(url, pathfmt))
+        self.assertEqual(receive.call_count, 0)
+        self.assertEqual(len(heads), 2)
+
     def test_http_empty(self):
         url = f"{self.address}/~NUL"
         pathfmt = self._prepare_destination(None, extension=None)
@@ -335,17 +459,19 @@ class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(self.path.encode())
             return
 
-        headers = {"Content-Length": len(output)}
+        headers = {"Content-Length": len(output), "Accept-Ranges": "bytes"}
 
         if "Range" in self.headers:
             status = 206
 
-            match = re.match(r"bytes=(\d+)-", self.headers["Range"])
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers["Range"])
             start = int(match[1])
+            end = int(match[2]) + 1 if match[2] else len(output)
 
+            headers["Content-Length"] = end - start
             headers["Content-Range"] = \
-                f"bytes {start}-{len(output) - 1}/{len(output)}"
-            output = output[start:]
+                f"bytes {start}-{end - 1}/{len(output)}"
+            output = output[start:end]
         else:
             status = 200
 
@@ -415,7 +541,7 @@ SAMPLES = {
 }
 
 
-DATA = {}
+DATA = {"~SEG": bytes(range(256)) * 40}
 
 for ext, content in SAMPLES:
     if ext not in DATA:
@@ -14,10 +14,12 @@ from unittest.mock import patch
 
 import time
 import string
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import extractor, util, dt, config  # noqa E402
-from gallery_dl.extractor import mastodon  # noqa E402
+from gallery_dl import extractor, util, dt, config, exception, job  # noqa
+from gallery_dl import oauth  # noqa E402
+from gallery_dl.extractor import mastodon, nozomi, common  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 from gallery_dl.extractor.directlink import DirectlinkExtractor  # noqa E402
 
@@ -54,6 +56,7 @@ class TestExtractorModule(unittest.TestCase):
 
     def setUp(self):
         extractor._cache.clear()
+        extractor._extra.clear()
         extractor._module_iter = extractor._modules_internal()
         extractor._list_classes = _list_classes
 
@@ -86,6 +89,58 @@ class TestExtractorModule(unittest.TestCase):
         self.assertEqual(classes[0], FakeExtractor)
         self.assertIsInstance(extractor.find(uri), FakeExtractor)
 
+    def test_index(self):
+        from gallery_dl.extractor import _index
+        self.assertEqual(tuple(extractor.modules), _index.MODULES)
+
+        msg = "outdated extractor registry - run scripts/extractor_index.py"
+        classes = list(extractor._list_classes())
+        self.assertEqual(len(classes), len(_index.CLASSES), msg)
+
+        for cls, row in zip(classes, _index.CLASSES):
+            module, name, category, subcategory, basecategory, \
+                pattern, example, doc = row
+            self.assertEqual(cls.__module__, "gallery_dl.extractor." + module)
+            self.assertEqual(cls.__name__, name, msg)
+            self.assertEqual(cls.category, category, msg)
+            self.assertEqual(cls.subcategory, subcategory, msg)
+            self.assertEqual(cls.basecategory, basecategory, msg)
+            if pattern is not None:
+                self.assertEqual(cls.pattern.pattern, pattern, msg)
+            self.assertEqual(getattr(cls, "example", None), example, msg)
+            self.assertEqual(cls.__doc__, doc, msg)
+
+    def test_index_find(self):
+        index = extractor._index_init()
+        classes = list(extractor._list_classes())
+
+        for cls in classes:
+            url = getattr(cls, "example", None)
+            if not url or cls.category == "ytdl":
+                continue
+            for expected in classes:
+                if expected.pattern.match(url):
+                    break
+            else:
+                expected = None
+            extr = extractor._index_find(url, index)
+            self.assertIs(extr.__class__ if extr else None, expected, url)
+
+    def test_registry(self):
+        infos = extractor.registry()
+        classes = extractor.extractors()
+        self.assertEqual(len(infos), len(classes))
+
+        for info, cls in zip(infos, classes):
+            self.assertIsInstance(info, extractor.ExtractorInfo)
+            self.assertEqual(info.__name__, cls.__name__)
+            self.assertEqual(info.__doc__, cls.__doc__)
+            self.assertEqual(info.category, cls.category)
+            self.assertEqual(info.subcategory, cls.subcategory)
+
+        extractor.add(FakeExtractor)
+        self.assertIn(FakeExtractor, extractor.registry())
+
     def test_from_url(self):
         for uri in self.VALID_URIS:
             cls = extractor.find(uri).__class__
@@ -261,6 +316,343 @@ class TestExtractorWait(unittest.TestCase):
         return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
 
 
+class TestExtractorPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        config.clear()
+        self.extr = FakeExtractor.from_url("fake:")
+        self.threads = []
+
+    def tearDown(self):
+        config.clear()
+
+    def _items(self, num, exc=None):
+        self.threads.append(threading.current_thread())
+        yield from range(num)
+        if exc is not None:
+            raise exc
+
+    def test_prefetch_disabled(self):
+        items = self._items(3)
+        self.assertIs(self.extr._prefetch(items), items)
+        self.assertIs(self.extr._prefetch(items, 0), items)
+
+    def test_prefetch(self):
+        config.set((), "prefetch", 2)
+        items = self.extr._prefetch(self._items(10))
+        self.assertEqual(list(items), list(range(10)))
+        self.assertIsNot(self.threads[0], threading.current_thread())
+
+    def test_prefetch_asynchronous(self):
+        class AsyncExtractor(common.AsynchronousMixin, FakeExtractor):
+            def items(extr):
+                return self._items(3)
+
+        # 'null' uses a separate thread, '0' disables it
+        for value, threaded in ((None, True), (0, False)):
+            config.set((), "prefetch", value)
+            self.threads.clear()
+            self.assertEqual(list(AsyncExtractor.from_url("fake:")),
+                             [0, 1, 2])
+            self.assertEqual(
+                self.threads[0] is not threading.current_thread(), threaded)
+
+    def test_prefetch_exception(self):
+        items = self.extr._prefetch(
+            self._items(3, exception.StopExtraction()), 1)
+        results = []
+        with self.assertRaises(exception.StopExtraction):
+            for item in items:
+                results.append(item)
+        self.assertEqual(results, [0, 1, 2])
+
+    def test_prefetch_close(self):
+        items = self.extr._prefetch(self._items(1000), 1)
+        self.assertEqual(next(items), 0)
+        items.close()
+
+        self.threads[0].join(5.0)
+        self.assertFalse(self.threads[0].is_alive())
+
+
+class TestExtractorSession(unittest.TestCase):
+
+    def setUp(self):
+        config.clear()
+
+    def tearDown(self):
+        config.clear()
+
+    def _extractor(self, cls=FakeExtractor, url="fake:"):
+        extr = cls.from_url(url)
+        extr.initialize()
+        return extr
+
+    def _adapter(self, obj):
+        session = getattr(obj, "session", obj)
+        return session.get_adapter("https://example.org/")
+
+    def test_shared_adapter(self):
+        extr1 = self._extractor()
+        extr2 = self._extractor(
+            DirectlinkExtractor, "https://example.org/file.jpg")
+        self.assertIsNot(extr1.session, extr2.session)
+        self.assertIs(self._adapter(extr1), self._adapter(extr2))
+
+        config.set((), "source-address", "127.0.0.2")
+        extr3 = self._extractor()
+        self.assertIsNot(self._adapter(extr3), self._adapter(extr1))
+        self.assertEqual(self._adapter(extr3).source_address,
+                         ("127.0.0.2", 0))
+
+    def test_shared_adapter_threads(self):
+        key = (0, "DEFAULT:!aNULL", None, ("127.0.0.3", 0))
+        adapters = []
+
+        def build():
+            adapters.append(common._build_requests_adapter(*key))
+
+        threads = [threading.Thread(target=build) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, adapters))), 1)
+        self.assertIs(common.CACHE_ADAPTERS[key], adapters[0])
+
+    def test_shared_adapter_oauth1(self):
+        config.set((), "api-key", "key")
+        config.set((), "api-secret", "secret")
+        config.set((), "access-token", "token")
+        config.set((), "access-token-secret", "token-secret")
+
+        extr = self._extractor()
+        api = oauth.OAuth1API(extr)
+        self.assertIsNot(api.session, extr.session)
+        self.assertIs(self._adapter(api.session), self._adapter(extr))
+
+
+class TestExtractorCheckpoint(unittest.TestCase):
+
+    class FakeCache(dict):
+        def __call__(self, key):
+            return self.get(key, {})
+
+        def update(self, key, value):
+            self[key] = value
+
+    def setUp(self):
+        config.clear()
+        self.cache = self.FakeCache()
+        patcher = patch.object(common, "_checkpoint_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        config.clear()
+
+    def _extractor(self, mode):
+        config.set((), "checkpoint", mode)
+        extr = FakeExtractor.from_url("fake:")
+        extr._init_options()
+        return extr
+
+    def test_disabled(self):
+        extr = self._extractor(None)
+        self.assertIsNone(extr._checkpoint_load())
+        extr._checkpoint_save("cursor")
+        self.assertFalse(extr._checkpoint_seen(1))
+        self.assertFalse(self.cache)
+
+    def test_resume(self):
+        extr = self._extractor(True)
+        self.assertEqual(extr._checkpoint, "resume")
+        self.assertIsNone(extr._checkpoint_load())
+        extr._checkpoint_save("b100")
+        extr._checkpoint_save("b50")
+        self.assertEqual(self.cache, {"fake_test_fake:": {"cursor": "b50"}})
+
+        # interrupted run gets resumed
+        extr = self._extractor("resume")
+        self.assertEqual(extr._checkpoint_load(), "b50")
+        self.assertFalse(extr._checkpoint_seen(1))
+
+        # finished runs start from the beginning
+        extr._checkpoint_save(None)
+        extr = self._extractor("resume")
+        self.assertIsNone(extr._checkpoint_load())
+
+    def test_stop(self):
+        extr = self._extractor("stop")
+        self.assertIsNone(extr._checkpoint_load())
+        for post_id in (30, 20, 10):
+            self.assertFalse(extr._checkpoint_seen(post_id))
+        extr._checkpoint_save("cursor")
+        self.assertEqual(self.cache, {"fake_test_fake:": {
+            "cursor": "cursor", "first": 30}})
+        extr._checkpoint_save(None)
+        self.assertEqual(self.cache, {"fake_test_fake:": {"last": 30}})
+
+        # stop at the newest item of the previous run
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen("50"))
+        self.assertFalse(extr._checkpoint_seen(40))
+        self.assertTrue(extr._checkpoint_seen(25))
+        self.assertEqual(self.cache["fake_test_fake:"], {"last": "50"})
+
+        # interrupted runs keep the previous marker
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen(60))
+        extr = self._extractor("stop")
+        self.assertTrue(extr._checkpoint_seen(50))
+        self.assertEqual(self.cache["fake_test_fake:"], {"last": "50"})
+
+    def test_stop_resume(self):
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen(30))
+        extr._checkpoint_save(None)
+
+        # interrupted run
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen(50))
+        self.assertFalse(extr._checkpoint_seen(45))
+        extr._checkpoint_save("b45")
+
+        # resumed run remembers the newest item of the interrupted one
+        extr = self._extractor("stop")
+        self.assertEqual(extr._checkpoint_load(), "b45")
+        self.assertFalse(extr._checkpoint_seen(40))
+        self.assertTrue(extr._checkpoint_seen(30))
+        self.assertEqual(self.cache["fake_test_fake:"], {"last": 50})
+
+    def test_clear(self):
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen(30))
+        extr._checkpoint_save(None)
+        extr = self._extractor("stop")
+        self.assertFalse(extr._checkpoint_seen(50))
+        extr._checkpoint_save("b50")
+
+        # runs stopping early keep the last complete run's marker
+        extr._checkpoint_clear()
+        self.assertEqual(self.cache, {"fake_test_fake:": {"last": 30}})
+
+    def test_prefetch(self):
+        extr = self._extractor("resume")
+
+        def pages():
+            for page in range(1, 6):
+                yield from range(page * 10, page * 10 + 3)
+                extr._checkpoint_save(page + 1)
+            extr._checkpoint_save(None)
+
+        items = extr._prefetch(pages(), 10)
+        for num in range(3):
+            self.assertEqual(next(items), 10 + num)
+        time.sleep(0.1)
+        self.assertFalse(self.cache)
+
+        # saved once the consumer reaches the next page
+        self.assertEqual(next(items), 20)
+        self.assertEqual(self.cache, {"fake_test_fake:": {"cursor": 2}})
+
+        self.assertEqual(len(list(items)), 11)
+        self.assertEqual(self.cache, {"fake_test_fake:": {}})
+
+    def test_job(self):
+        class Extractor(FakeExtractor):
+            def items(self):
+                for page in (1, 2, 3):
+                    self._checkpoint_save(page + 1)
+                    yield Message.Url, f"{self.url}/{page}", {"num": page}
+
+        def run(exc=None):
+            extr = Extractor.from_url("fake:")
+            with patch.object(job.DownloadJob, "handle_url",
+                              side_effect=exc):
+                try:
+                    job.DownloadJob(extr).run()
+                except KeyboardInterrupt:
+                    pass
+
+        config.set((), "checkpoint", "resume")
+
+        run(KeyboardInterrupt)  # interrupted
+        self.assertEqual(self.cache, {"fake_test_fake:": {"cursor": 2}})
+        run(exception.StopExtraction)  # stopped early
+        self.assertEqual(self.cache, {"fake_test_fake:": {}})
+
+        run(ValueError)  # crashed
+        self.assertEqual(self.cache, {"fake_test_fake:": {"cursor": 2}})
+        run()  # finished
+        self.assertEqual(self.cache, {"fake_test_fake:": {}})
+
+
+class TestExtractorNozomi(unittest.TestCase):
+
+    def test_decode(self):
+        ids = nozomi.decode_nozomi(
+            b"\x00\x00\x00\x01\x00\x01\x00\x00\xff\xff\xff\xff\x12")
+        self.assertEqual(list(ids), [1, 65536, 4294967295])
+        self.assertEqual(list(nozomi.decode_nozomi(b"")), [])
+
+    def test_search(self):
+        def ids(*values):
+            return nozomi.decode_nozomi(
+                b"".join(v.to_bytes(4, "big") for v in values))
+
+        search = nozomi.search_nozomi
+        default = ids(1, 2, 3, 4, 5, 6).tolist
+
+        self.assertEqual(search((), (), default), [6, 5, 4, 3, 2, 1])
+        self.assertEqual(search((ids(3, 1, 2),), (), default), [3, 2, 1])
+        self.assertEqual(search(
+            (ids(5, 1, 2, 3, 4), ids(4, 2), ids(2, 4, 6)),
+            (), default), [4, 2])
+        self.assertEqual(search(
+            (), (ids(1, 2), ids(6)), default), [5, 4, 3])
+        self.assertEqual(search(
+            (ids(1, 2, 3),), (ids(2, 7),), default), [3, 1])
+        self.assertEqual(search(
+            (ids(1, 2), ids(3, 4)), (ids(2),), default), ())
+
+    def test_index_cache(self):
+        class Response():
+            def __init__(self, status_code, content=b"", etag=None):
+                self.status_code = status_code
+                self.content = content
+                self.headers = {"ETag": etag} if etag else {}
+
+        extr = FakeExtractor.from_url("fake:")
+        url = "https://n.nozomi.la/index.nozomi"
+        data = b"\x00\x00\x00\x02\x00\x00\x00\x01"
+
+        with patch.object(extr, "request") as request, \
+                patch.object(nozomi, "_index_cache") as index_cache:
+            request.return_value = Response(200, data, '"abc"')
+            index_cache.return_value = (None, None)
+
+            # disabled
+            self.assertEqual(list(nozomi.request_nozomi(extr, url)), [2, 1])
+            self.assertEqual(index_cache.call_count, 0)
+
+            config.set((), "index-cache", True)
+            try:
+                ids = nozomi.request_nozomi(extr, url)
+                self.assertEqual(list(ids), [2, 1])
+                index_cache.update.assert_called_once_with(
+                    url, ('"abc"', ids))
+
+                index_cache.return_value = ('"abc"', ids)
+                request.return_value = Response(304)
+                self.assertIs(nozomi.request_nozomi(extr, url), ids)
+                self.assertEqual(
+                    request.call_args[1]["headers"],
+                    {"If-None-Match": '"abc"'})
+            finally:
+                config.clear()
+
+
 class TextExtractorCommonDateminmax(unittest.TestCase):
 
     def setUp(self):
@@ -672,6 +672,25 @@ def noarg():
         with self.assertRaises(TypeError):
             self.assertEqual(fmt0.format_map(self.kwdict), "")
 
+    def test_compiled(self):
+        self._run_test("{a!l}{name}-{i:>03}", "hello worldName-002")
+        self._run_test("{name!u}{title2:?<//}{title1:?<//}", "NAME<Title")
+        self._run_test("{name!u:?</>/}{n}{title4:?</>/}", "<NAME>None")
+        self._run_test("{a!l:Rl/L/}_{l[1]}_{d[a]}", "heLLo worLd_b_foo")
+        self._run_test("{i}{i!s}{t:?//}", "221262304000")
+        self._run_test("{missing}{missing!u:?a//}_{name}", "fooaFOO_Name",
+                       "foo")
+
+        # single fields return their value as is
+        self._run_test("{i}", "2")
+        self._run_test("{i!s:?//}", "2")
+        self._run_test("{t!d}", datetime.datetime(2010, 1, 1))
+        self._run_test("{i}", 2, None, util.identity)
+        self._run_test("{i}{i}", "22", None, str)
+
+        with self.assertRaises(TypeError):
+            self._run_test("{n!l}{name}", "")
+
     def _run_test(self, format_string, result, default=None, fmt=format):
         fmt = formatter.parse(format_string, default, fmt)
         output = fmt.format_map(self.kwdict)
@@ -10,12 +10,15 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import io
+import time
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import job, config, text  # noqa E402
+from gallery_dl import job, config, text, archive, exception  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 
 
@@ -65,6 +68,296 @@ class TestDownloadJob(TestJob):
         self.assertEqual(func(TestExtractorParent), False)
         self.assertEqual(func(TestExtractorAlt)   , False)
 
+    def test_download_workers(self):
+        def download(self, url, pathfmt=None, downloaders=None):
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            with open(pathfmt.temppath, "w") as fp:
+                fp.write(url)
+            threads.add(id(downloaders))
+            return True
+        threads = set()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "download-workers", 3)
+            config.set((), "archive", ":memory:")
+            config.set((), "archive-format", "{num}")
+
+            extr = TestExtractor.from_url("test:")
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download", download):
+                self.assertEqual(tjob.run(), 0)
+
+            directory = os.path.join(tmpdir, "test_category")
+            self.assertEqual(sorted(os.listdir(directory)), [
+                "test_1.jpg", "test_2.jpg", "test_3.jpg"])
+            with open(os.path.join(directory, "test_2.jpg")) as fp:
+                self.assertEqual(fp.read(), "https://example.org/2.jpg")
+
+        self.assertNotIn(id(None), threads)
+        self.assertIsNone(tjob.workers.exc)
+        self.assertEqual(tjob.workers.threads, ())
+
+    def test_download_workers_postprocessors(self):
+        class TestPP():
+            threadsafe = True
+
+            def __init__(self, job, options):
+                job.register_hooks({"file": self.run}, options)
+
+            def run(self, pathfmt):
+                active.append(pathfmt.kwdict["num"])
+                self.assertEqual(len(active), 1)
+                time.sleep(0.01)
+                files.append(active.pop())
+
+        def download(self, url, pathfmt=None, downloaders=None):
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            with open(pathfmt.temppath, "w") as fp:
+                fp.write(url)
+            return True
+
+        active = []
+        files = []
+        TestPP.assertEqual = self.assertEqual
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "download-workers", 3)
+            config.set((), "postprocessors", [{"name": "test"}])
+
+            # 'file' hooks never run concurrently
+            with patch.object(job.postprocessor, "find") as find:
+                find.return_value = TestPP
+                tjob = self.jobclass(TestExtractor.from_url("test:"))
+                with patch.object(self.jobclass, "download", download):
+                    self.assertEqual(tjob.run(), 0)
+            self.assertIsNotNone(tjob.workers)
+            self.assertEqual(sorted(files), [1, 2, 3])
+
+            # fall back to sequential downloads for unsupported ones
+            TestPP.threadsafe = False
+            with patch.object(job.postprocessor, "find") as find:
+                find.return_value = TestPP
+                tjob = self.jobclass(TestExtractor.from_url("test:"))
+                tjob.initialize()
+            self.assertIsNone(tjob.workers)
+
+    def test_download_defer(self):
+        class TestPP():
+            threadsafe = True
+
+            def __init__(self, job, options):
+                job.register_hooks({
+                    "file" : self.file,
+                    "after": self.after,
+                }, options)
+                job.pending.append(self.join)
+
+            def file(self, pathfmt):
+                pathfmt.kwdict["_file_defer"] = self.deferred.append
+
+            def after(self, pathfmt):
+                events.append(("after", pathfmt.kwdict["num"]))
+
+            def join(self):
+                for callback in self.deferred:
+                    callback(pathfmt)
+                events.append(("join",))
+
+        def download(self, url, pathfmt=None, downloaders=None):
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            with open(pathfmt.temppath, "w") as fp:
+                fp.write(url)
+            return True
+
+        events = []
+        TestPP.deferred = []
+        pathfmt = Mock(kwdict={"num": 9})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "postprocessors", [{"name": "test"}])
+
+            with patch.object(job.postprocessor, "find") as find, \
+                    patch.object(self.jobclass, "download", download):
+                find.return_value = TestPP
+                tjob = self.jobclass(TestExtractor.from_url("test:"))
+                self.assertEqual(tjob.run(), 0)
+
+        # 'after' hooks run once the post processor finished
+        self.assertEqual(events, [("after", 9)] * 3 + [("join",)])
+
+    def test_queue_workers(self):
+        def download(self, url, pathfmt=None, downloaders=None):
+            with lock:
+                urls.append(url)
+                threads.add(threading.get_ident())
+            pathfmt.temppath = ""
+            return not url.endswith("/2.jpg")
+        urls = []
+        threads = set()
+        lock = threading.Lock()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "queue-workers", 3)
+
+            extr = TestExtractorParentMulti.from_url("test:parent-multi")
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download", download):
+                self.assertEqual(tjob.run(), 4)
+
+        self.assertIsInstance(tjob.queue_pool, job.QueueWorkerPool)
+        self.assertFalse(tjob.queue_pool.pending)
+        self.assertEqual(tjob.queue_pool.threads, ())
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(len(urls), 12)
+        self.assertEqual(sorted(set(urls)), [
+            "https://example.org/1.jpg",
+            "https://example.org/2.jpg",
+            "https://example.org/3.jpg",
+            "https://example.org/alt/2.jpg",
+        ])
+
+        # 'parent-skip' requires sequential child jobs
+        config.set((), "parent-skip", True)
+        extr = TestExtractorParentMulti.from_url("test:parent-multi")
+        tjob = self.jobclass(extr)
+        with patch.object(self.jobclass, "download", download):
+            tjob.run()
+        self.assertIs(tjob.queue_pool, False)
+
+    def test_queue_workers_exception(self):
+        with patch.object(TestExtractor, "items") as items:
+            items.side_effect = exception.TerminateExtraction()
+            config.set((), "queue-workers", 2)
+            extr = TestExtractorParentMulti.from_url("test:parent-multi")
+            tjob = self.jobclass(extr)
+            with self.assertRaises(exception.TerminateExtraction):
+                tjob.run()
+        self.assertTrue(tjob.queue_pool.closed)
+        self.assertFalse(tjob.queue_pool.pending)
+
+    def test_archive_lookahead(self):
+        def download(self, url, pathfmt=None, downloaders=None):
+            urls.append(url)
+            pathfmt.temppath = ""
+            return True
+        urls = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-event", "skip")
+            config.set((), "archive-lookahead", 2)
+
+            archive.connect(path, "test_category", "{num}").add({"num": 2})
+
+            extr = TestExtractor.from_url("test:")
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download", download), \
+                    patch.object(archive.DownloadArchive, "check_many",
+                                 autospec=True,
+                                 side_effect=archive.DownloadArchive.
+                                 check_many) as check_many:
+                self.assertEqual(tjob.run(), 0)
+
+        self.assertEqual(urls, [
+            "https://example.org/1.jpg",
+            "https://example.org/3.jpg",
+        ])
+        self.assertEqual(check_many.call_count, 2)
+        self.assertEqual(len(check_many.call_args_list[0][0][1]), 2)
+
+    def test_archive_lookahead_reuse(self):
+        def download(self, url, pathfmt=None, downloaders=None):
+            pathfmt.temppath = ""
+            return True
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-format", "{num}")
+            config.set((), "archive-lookahead", 2)
+
+            archive.connect(path, "test_category", "{num}").add({"num": 2})
+
+            extr = TestExtractor.from_url("test:")
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download", download), \
+                    patch.object(job.Job, "update_kwdict",
+                                 autospec=True,
+                                 side_effect=job.Job.
+                                 update_kwdict) as update, \
+                    patch.object(archive.DownloadArchive, "check",
+                                 autospec=True,
+                                 side_effect=archive.DownloadArchive.
+                                 check) as check:
+                self.assertEqual(tjob.run(), 0)
+
+        self.assertEqual(sum(
+            1 for args, _ in update.call_args_list if "num" in args[1]), 3)
+        self.assertEqual(check.call_count, 0)
+
+    def test_archive_stop(self):
+        def download(self, url, pathfmt=None, downloaders=None):
+            urls.append(url)
+            pathfmt.temppath = ""
+            return True
+        urls = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-event", "skip")
+            config.set((), "archive-stop", 2)
+
+            arch = archive.connect(path, "test_category", "{id}")
+            for post_id in (2, 4, 5, 6):
+                arch.add({"id": post_id})
+            arch.close()
+
+            extr = TestExtractorPosts.from_url("test:posts")
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download", download):
+                self.assertEqual(tjob.run(), 0)
+
+        # post 2 is followed by a new post, post 5 is the second
+        # consecutive archived one and stops extraction
+        self.assertEqual(urls, [
+            "https://example.org/1.jpg",
+            "https://example.org/3.jpg",
+        ])
+        self.assertEqual(extr.posts, [1, 2, 3, 4])
+
+    def test_archive_stop_first(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", path)
+            config.set((), "archive-stop", 2)
+
+            arch = archive.connect(path, "test_category", "{id}")
+            for post_id in (1, 3):
+                arch.add({"id": post_id})
+            arch.close()
+
+            # the first post counts as well,
+            # posts without files do not reset the counter
+            extr = TestExtractorPosts.from_url("test:posts")
+            extr.empty = (2,)
+            tjob = self.jobclass(extr)
+            with patch.object(self.jobclass, "download") as download:
+                self.assertEqual(tjob.run(), 0)
+
+        self.assertEqual(download.call_count, 0)
+        self.assertEqual(extr.posts, [1, 2])
+
 
 class TestKeywordJob(TestJob):
     jobclass = job.KeywordJob
@@ -393,6 +686,30 @@ class TestExtractor(Extractor):
             })
 
 
+class TestExtractorPosts(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_posts"
+    directory_fmt = ("{category}",)
+    filename_fmt = "{id}.{extension}"
+    archive_fmt = "{id}"
+    pattern = r"test:posts$"
+    empty = ()
+
+    def items(self):
+        self.posts = []
+        for post_id in range(1, 8):
+            post = {"id": post_id, "extension": "jpg"}
+            if post_id in self.empty:
+                self.posts.append(post_id)
+                yield Message.Directory, "", post
+                continue
+            if self._archive_stop(post):
+                return
+            self.posts.append(post_id)
+            yield Message.Directory, "", post
+            yield Message.Url, f"https://example.org/{post_id}.jpg", post
+
+
 class TestExtractorParent(Extractor):
     category = "test_category"
     subcategory = "test_subcategory_parent"
@@ -409,6 +726,16 @@ class TestExtractorParent(Extractor):
             }
 
 
+class TestExtractorParentMulti(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_parent_multi"
+    pattern = r"test:parent-multi"
+
+    def items(self):
+        for url in ("test:", "test:child", "test:child", "test:self"):
+            yield Message.Queue, url, {"_extractor": TestExtractor}
+
+
 class TestExtractorException(Extractor):
     category = "test_category"
     subcategory = "test_subcategory_exception"
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+
+import tempfile
+import subprocess
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestMain(unittest.TestCase):
+
+    def _run(self, *args):
+        return subprocess.run(
+            (sys.executable, "-m", "gallery_dl", "--config-ignore") + args,
+            cwd=ROOTDIR, capture_output=True, text=True, timeout=60)
+
+    def test_urls(self):
+        result = self._run("-g", "https://example.org/a.jpg")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "https://example.org/a.jpg\n")
+        self.assertNotIn("Traceback", result.stderr)
+
+    def test_unsupported(self):
+        result = self._run("-g", "https://example.org/")
+        self.assertEqual(result.returncode, 64, result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+
+    def test_input_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.txt")
+            with open(path, "w") as fp:
+                fp.write("https://example.org/a.jpg\n"
+                         "https://example.org/b.png\n")
+
+            result = self._run("-g", "-i", path)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(result.stdout, "https://example.org/a.jpg\n"
+                                            "https://example.org/b.png\n")
+
+            result = self._run("-g", "-I", path)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            with open(path) as fp:
+                self.assertEqual(fp.read(), "# https://example.org/a.jpg\n"
+                                            "# https://example.org/b.png\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
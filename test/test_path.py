@@ -10,6 +10,9 @@
 import os
 import sys
 import unittest
+from unittest.mock import patch
+
+import tempfile
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import path, extractor, config  # noqa E402
@@ -292,6 +295,72 @@ class TestPathOptions(TestPath):
         self.assertEqual(
             pfmt.realdirectory, ". test-テスト-'&>-_:~.txt ./", "custom")
 
+    def test_option_pathcache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "directory", ["{category}"])
+            config.set((), "filename", "{filename}.{extension}")
+            config.set((), "path-cache", True)
+            directory = os.path.join(tmpdir, "test")
+            os.makedirs(directory)
+            open(os.path.join(directory, "a.ext"), "w").close()
+
+            pfmt = self._pfmt(kwdict=True)
+            with patch("os.scandir", wraps=os.scandir) as scandir:
+                for name, exists in (("a", True), ("b", False),
+                                     ("c", False), ("a", True)):
+                    pfmt.set_filename({**KWDICT, "filename": name})
+                    pfmt.build_path()
+                    self.assertEqual(pfmt.exists(), exists, name)
+                self.assertEqual(scandir.call_count, 1)
+
+                # files finalized by gallery-dl get added to the listing
+                pfmt.set_filename({**KWDICT, "filename": "b"})
+                pfmt.build_path()
+                with pfmt.open() as fp:
+                    fp.write(b"")
+                pfmt.finalize()
+                self.assertTrue(pfmt.exists())
+
+                # other changes require an explicit invalidate()
+                open(os.path.join(directory, "c.ext"), "w").close()
+                pfmt.set_filename({**KWDICT, "filename": "c"})
+                pfmt.build_path()
+                self.assertFalse(pfmt.exists())
+                pfmt.invalidate()
+                self.assertTrue(pfmt.exists())
+
+                self.assertEqual(scandir.call_count, 2)
+
+                # new directories get listed on their own
+                pfmt.set_directory({**KWDICT, "category": "other"})
+                pfmt.set_filename(KWDICT)
+                pfmt.build_path()
+                self.assertFalse(pfmt.exists())
+                self.assertEqual(scandir.call_count, 3)
+
+    def test_option_pathcache_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "directory", ["{category}"])
+            config.set((), "filename", "{filename}.{extension}")
+            config.set((), "path-cache", True)
+            os.makedirs(os.path.join(tmpdir, "test"))
+
+            # one Directory message per post for the same directory
+            pfmt = self._pfmt(kwdict=True)
+            with patch("os.scandir", wraps=os.scandir) as scandir:
+                for num in range(10):
+                    pfmt.set_directory(KWDICT)
+                    pfmt.set_filename({**KWDICT, "filename": str(num)})
+                    pfmt.build_path()
+                    self.assertFalse(pfmt.exists())
+                self.assertEqual(scandir.call_count, 1)
+
+                # changing directories drops the old listing
+                pfmt.set_directory({**KWDICT, "category": "other"})
+                self.assertFalse(pfmt._listings)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,9 @@ import unittest
 from unittest.mock import Mock, mock_open, patch, call
 
 import shutil
+import sqlite3
 import logging
+import threading
 import zipfile
 import tempfile
 import collections
@@ -23,6 +25,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import extractor, output, path, util, exception  # noqa E402
 from gallery_dl import postprocessor, config, archive  # noqa E402
 from gallery_dl.postprocessor.common import PostProcessor  # noqa E402
+from gallery_dl.postprocessor import ugoira  # noqa E402
 
 
 class MockPostprocessorModule(Mock):
@@ -38,6 +41,7 @@ class FakeJob():
         self.out = output.NullOutput()
         self.get_logger = logging.getLogger
         self.hooks = collections.defaultdict(list)
+        self.pending = []
 
     def register_hooks(self, hooks, options=None):
         for hook, callback in hooks.items():
@@ -89,6 +93,7 @@ class BasePostprocessorTest(unittest.TestCase):
 
     def tearDown(self):
         self.job.hooks.clear()
+        self.job.pending.clear()
 
     def _create(self, options=None, data=None):
         kwdict = {"category": "test", "filename": "file", "extension": "ext"}
@@ -174,6 +179,111 @@ class ClassifyTest(BasePostprocessorTest):
         self.assertEqual(self.pathfmt.realpath, f"{path}/file.foo")
 
 
+class DedupTest(BasePostprocessorTest):
+
+    def setUp(self):
+        self.db = os.path.join(self.dir.name, "dedup.sqlite3")
+        util.remove_file(self.db)
+
+    def _download(self, name, content=b"Foo Bar\n", events=("file",)):
+        self.pathfmt.set_filename({**self.pathfmt.kwdict, "filename": name})
+        self.pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        with self.pathfmt.open() as fp:
+            fp.write(content)
+        self._trigger(events)
+        self.pathfmt.finalize()
+        return self.pathfmt.realpath
+
+    def test_dedup_options(self):
+        with self.assertRaises(ValueError):
+            self._create()
+        with self.assertRaises(ValueError):
+            self._create({"path": self.db, "action": "foo"})
+        with self.assertRaises(ValueError):
+            self._create({"path": self.db, "hash": "foo"})
+
+        pp = self._create({"path": self.db})
+        self.assertEqual(pp.action, "hardlink")
+        self.assertEqual(pp.algorithm, "sha256")
+        self.assertEqual(pp.head, 0)
+        self.assertNotIn("prepare-after", self.job.hooks)
+
+    def test_dedup_hardlink(self):
+        self._create({"path": self.db})
+
+        path1 = self._download("dedup1")
+        path2 = self._download("dedup2")
+        path3 = self._download("dedup3", b"Other\n")
+
+        self.assertTrue(os.path.samefile(path1, path2))
+        self.assertFalse(os.path.samefile(path1, path3))
+        with open(path2, "rb") as fp:
+            self.assertEqual(fp.read(), b"Foo Bar\n")
+
+        # removed files get dropped from the index
+        os.unlink(path1)
+        os.unlink(path2)
+        path4 = self._download("dedup4")
+        path5 = self._download("dedup5")
+        self.assertTrue(os.path.samefile(path4, path5))
+
+    def test_dedup_mtime(self):
+        pp = self._create({"path": self.db})
+        path1 = self._download("dedup1")
+        mtime = os.stat(path1).st_mtime
+
+        # linked duplicates keep the stored file's mtime
+        self.pathfmt.kwdict["_mtime_meta"] = 1000000000
+        path2 = self._download("dedup2")
+        self.assertTrue(os.path.samefile(path1, path2))
+        self.assertEqual(os.stat(path1).st_mtime, mtime)
+        self.assertNotIn("_file_linked", self.pathfmt.kwdict)
+
+        path3 = self._download("dedup3", b"Other\n")
+        self.assertEqual(os.stat(path3).st_mtime, 1000000000)
+
+        self._trigger(("finalize",))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            pp.connection.execute("SELECT 1")
+
+    def test_dedup_symlink(self):
+        self._create({"path": self.db, "action": "symlink"})
+
+        path1 = self._download("dedup1")
+        path2 = self._download("dedup2")
+        self.assertTrue(os.path.islink(path2))
+        self.assertEqual(os.readlink(path2), os.path.abspath(path1))
+
+    def test_dedup_skip(self):
+        self._create({"path": self.db, "action": "skip"})
+
+        self._download("dedup1")
+        path = self._download("dedup2")
+        self.assertFalse(os.path.exists(path))
+
+    def test_dedup_head(self):
+        pp = self._create({"path": self.db, "head": 4})
+        self.assertEqual(pp.head, 4)
+        path1 = self._download("dedup1")
+
+        self.pathfmt.set_filename({**self.pathfmt.kwdict, "filename": "h"})
+        self.pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        head_size, check = self.pathfmt.kwdict["_http_duplicate"]
+        self.assertEqual(head_size, 4)
+
+        self.assertFalse(check(self.pathfmt, 8, b"Bar "))
+        self.assertFalse(check(self.pathfmt, 9, b"Foo "))
+        self.assertTrue(check(self.pathfmt, 8, b"Foo "))
+        self.assertEqual(self.pathfmt.kwdict["_dedup_path"], path1)
+
+        self._trigger(("file",))
+        self.assertNotIn("_dedup_path", self.pathfmt.kwdict)
+        self.pathfmt.finalize()
+        self.assertTrue(os.path.samefile(path1, self.pathfmt.realpath))
+
+
 class DirectoryTest(BasePostprocessorTest):
 
     def test_default(self):
@@ -460,6 +570,67 @@ class HashTest(BasePostprocessorTest):
             "3e1095b50736c4fd1e2deea152e3c8ecd5993462a747208e4d842659935a1c62",
             kwdict["b"], "sha512")
 
+    def test_inline(self):
+        pp = self._create({"inline": True})
+
+        self._trigger(("prepare-after",))
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo ")
+            fp.write(b"Bar\n")
+
+        with patch.object(pp, "_update") as update:
+            self._trigger(("file",))
+        self.assertEqual(update.call_count, 0)
+
+        kwdict = self.pathfmt.kwdict
+        self.assertNotIn("_file_wrapper", kwdict)
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", kwdict["md5"], "md5")
+        self.assertEqual(
+            "14d3d804494ef4e57d72de63e4cfee761240471a", kwdict["sha1"], "sha1")
+
+    def test_inline_resume(self):
+        pp = self._create({"inline": True})
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo ")
+
+        # resumed downloads get hashed from disk
+        self._trigger(("prepare-after",))
+        with self.pathfmt.open("r+b") as fp:
+            fp.seek(4)
+            fp.write(b"Bar\n")
+
+        with patch.object(pp, "_update", wraps=pp._update) as update:
+            self._trigger(("file",))
+        self.assertEqual(update.call_count, 1)
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_readinto(self):
+        self._create({"chunk-size": 3})
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        with patch("mmap.mmap") as mmap:
+            mmap.side_effect = OSError()
+            self._trigger()
+        self.assertEqual(mmap.call_count, 1)
+
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_empty(self):
+        self._create()
+
+        with self.pathfmt.open():
+            pass
+        self._trigger()
+
+        self.assertEqual(
+            "d41d8cd98f00b204e9800998ecf8427e", self.pathfmt.kwdict["md5"])
+
 
 class MetadataTest(BasePostprocessorTest):
 
@@ -1066,6 +1237,96 @@ class RenameTest(BasePostprocessorTest):
         self.assertEqual(sorted(os.listdir(path)), ["12345.ext", "file.ext"])
 
 
+class UgoiraTest(BasePostprocessorTest):
+
+    def _download(self, frames):
+        pathfmt = self.pathfmt
+        pathfmt.kwdict["_ugoira_frame_data"] = frames
+        self._trigger(("prepare",))
+        self.assertEqual(pathfmt.extension, "webm")
+
+        pathfmt.temppath = pathfmt.realpath + ".part"
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with zipfile.ZipFile(pathfmt.temppath, "w") as zfile:
+            for frame in frames:
+                zfile.writestr(frame["file"], b"")
+        self._trigger(("file",))
+        pathfmt.finalize()
+
+    def _join(self):
+        for join in self.job.pending:
+            join()
+
+    def test_ugoira_workers(self):
+        def _exec(args):
+            with open(args[-1], "w"):
+                pass
+            threads.add(threading.current_thread())
+        threads = set()
+
+        frames = [{"file": f"{i:>06}.jpg", "delay": 100} for i in range(3)]
+        pp = self._create({"workers": 2, "mode": "concat"},
+                          {"extension": "zip"})
+        self.assertIsInstance(pp.pool, ugoira.ConversionPool)
+
+        after = Mock()
+        with patch.object(ugoira.UgoiraPP, "_exec", side_effect=_exec):
+            self._download(frames)
+
+            # original ZIP archive remains until conversion finished
+            zpath = self.pathfmt.realpath
+            self.assertTrue(zpath.endswith("/file.zip"))
+            self.assertTrue(os.path.exists(zpath))
+
+            # 'after' processing waits for the converted file
+            self.pathfmt.kwdict.pop("_file_defer")(after)
+            self._join()
+
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertFalse(os.path.exists(zpath))
+        self.assertTrue(os.path.exists(zpath[:-3] + "webm"))
+        self.assertEqual(len(frames), 3)
+
+        self.assertEqual(after.call_count, 1)
+        pathfmt = after.call_args[0][0]
+        self.assertEqual(pathfmt.realpath, zpath[:-3] + "webm")
+        self.assertEqual(pathfmt.kwdict["extension"], "webm")
+        self.assertNotIn("_file_defer", pathfmt.kwdict)
+
+    def test_ugoira_workers_hooks(self):
+        pp = self._create({"workers": 1}, {"extension": "zip"})
+        with patch.object(pp, "log") as log:
+            self._trigger(("init",))
+            self.assertEqual(log.warning.call_count, 0)
+
+            postprocessor.find("mtime")(self.job, {})
+            self._trigger(("init",))
+            self.assertEqual(log.warning.call_count, 1)
+            self.assertEqual(log.warning.call_args[0][1], "mtime")
+        self._join()
+
+    def test_ugoira_workers_error(self):
+        frames = [{"file": f"{i:>06}.jpg", "delay": 100} for i in range(3)]
+        pp = self._create({"workers": 1, "mode": "concat"},
+                          {"filename": "error", "extension": "zip"})
+
+        after = Mock()
+        with patch.object(ugoira.UgoiraPP, "_exec", side_effect=OSError), \
+                patch.object(pp, "log") as log:
+            self._download(frames)
+            self.pathfmt.kwdict.pop("_file_defer")(after)
+            self._join()
+
+        # fall back to keeping the ZIP archive
+        self.assertEqual(log.error.call_count, 1)
+        self.assertEqual(log.warning.call_count, 1)
+        self.assertTrue(os.path.exists(self.pathfmt.realpath))
+        self.assertTrue(self.pathfmt.realpath.endswith("/error.zip"))
+        self.assertFalse(pp.pool.threads)
+        self.assertEqual(after.call_args[0][0].realpath,
+                         self.pathfmt.realpath)
+
+
 class ZipTest(BasePostprocessorTest):
 
     def test_zip_default(self):
@@ -1176,6 +1437,79 @@ class ZipTest(BasePostprocessorTest):
             self.assertRegex(args[1], r"file\d\.ext")
         self.assertEqual(pp.zfile.close.call_count, 1)
 
+    def test_zip_stream(self):
+        pp = self._create({"mode": "stream", "flush": 0})
+        self.addCleanup(util.remove_file, pp.args[0])
+        self.assertEqual(self.job.hooks["file"][0], pp.write_stream)
+        pathfmt = self.pathfmt
+
+        def download(name, data, event="file"):
+            pathfmt.kwdict["filename"] = name
+            pathfmt.build_path()
+            self._trigger(("prepare-after",))
+            with pathfmt.open("w+b") as fp:
+                self.assertFalse(fp.seekable())
+                fp.write(data)
+                self.assertEqual(fp.tell(), len(data))
+            self._trigger((event,))
+
+        download("file1", b"foo")
+        self.assertFalse(os.path.exists(pathfmt.temppath))
+        self.assertTrue(pathfmt.delete)
+        pathfmt.finalize()
+        with zipfile.ZipFile(pp.args[0]) as zfile:
+            self.assertEqual(zfile.namelist(), ["file1.ext"])
+
+        # failed download
+        download("file2", b"bar", "error")
+        download("file3", b"foobar")
+        self._trigger(("finalize",))
+
+        with zipfile.ZipFile(pp.args[0]) as zfile:
+            self.assertEqual(zfile.namelist(), ["file1.ext", "file3.ext"])
+            self.assertEqual(zfile.read("file3.ext"), b"foobar")
+            self.assertIsNone(zfile.testzip())
+
+    def test_zip_stream_interrupt(self):
+        pp = self._create({"mode": "stream", "flush": 0})
+        self.addCleanup(util.remove_file, pp.args[0])
+        self.assertFalse(pp.threadsafe)
+        pathfmt = self.pathfmt
+
+        pathfmt.kwdict["filename"] = "file1"
+        pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        with pathfmt.open("w+b") as fp:
+            fp.write(b"foo")
+        self._trigger()
+        size = os.path.getsize(pp.args[0])
+
+        # download gets interrupted while writing
+        pathfmt.kwdict["filename"] = "file2"
+        pathfmt.build_path()
+        self._trigger(("prepare-after",))
+        fp = pathfmt.open("w+b")
+        fp.write(b"bar" * 1000)
+        fp.close()
+        self._trigger(("finalize",))
+
+        self.assertEqual(os.path.getsize(pp.args[0]), size)
+        with zipfile.ZipFile(pp.args[0]) as zfile:
+            self.assertEqual(zfile.namelist(), ["file1.ext"])
+            self.assertIsNone(zfile.testzip())
+
+    def test_zip_stream_unsupported(self):
+        with patch("gallery_dl.postprocessor.zip.STREAM_SUPPORTED", False):
+            pp = self._create({"mode": "stream"})
+        self.assertEqual(self.job.hooks["file"][0], pp.write_fast)
+        self.assertFalse(self.job.hooks["prepare-after"])
+        self.assertTrue(pp.threadsafe)
+
+    def test_zip_stream_keep_files(self):
+        pp = self._create({"mode": "stream", "keep-files": True})
+        self.assertEqual(self.job.hooks["file"][0], pp.write_fast)
+        self.assertFalse(self.job.hooks["prepare-after"])
+
 
 if __name__ == "__main__":
     unittest.main()
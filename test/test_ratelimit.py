@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import ratelimit  # noqa E402
+
+
+class FakeResponse():
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class TestRatelimit(unittest.TestCase):
+
+    def setUp(self):
+        ratelimit.clear()
+
+    def tearDown(self):
+        ratelimit.clear()
+
+    def test_bucket(self):
+        bucket = ratelimit.bucket("foo")
+        self.assertIs(ratelimit.bucket("foo"), bucket)
+        self.assertIsNot(ratelimit.bucket("bar"), bucket)
+
+    def test_bucket_threads(self):
+        buckets = []
+        threads = [
+            threading.Thread(
+                target=lambda: buckets.append(ratelimit.bucket("foo")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, buckets))), 1)
+
+    def test_host(self):
+        host = ratelimit.host
+        self.assertEqual(host("https://example.org/path"), "example.org")
+        self.assertEqual(host("http://Example.ORG:8080/"), "example.org")
+        self.assertEqual(host("https://user@example.org"), "example.org")
+        self.assertEqual(host("https://[::1]:8080/path"), "[::1]")
+        self.assertEqual(host("example.org/path"), "example.org")
+
+    def test_key_func(self):
+        url = "https://www.example.org/path"
+        func = ratelimit.build_key_func(None, "cat")
+        self.assertEqual(func(url), "cat")
+        func = ratelimit.build_key_func("category", "cat")
+        self.assertEqual(func(url), "cat")
+        func = ratelimit.build_key_func("host", "cat")
+        self.assertEqual(func(url), "www.example.org")
+        func = ratelimit.build_key_func("global", "cat")
+        self.assertEqual(func(url), "#")
+        func = ratelimit.build_key_func("group", "cat")
+        self.assertEqual(func(url), "#group")
+
+    def test_retry_after(self):
+        retry_after = ratelimit.retry_after
+        self.assertIsNone(retry_after(FakeResponse({})))
+        self.assertIsNone(retry_after(FakeResponse({"Retry-After": "foo"})))
+        self.assertEqual(
+            retry_after(FakeResponse({"Retry-After": "120"})), 120.0)
+        self.assertEqual(retry_after(FakeResponse(
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})), 0.0)
+
+        with patch("time.time") as tm:
+            tm.return_value = 1445412420.0  # 2015-10-21 07:27:00
+            self.assertEqual(retry_after(FakeResponse(
+                {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})), 60.0)
+
+    @patch("time.monotonic")
+    def test_acquire(self, mono):
+        bucket = ratelimit.Bucket()
+
+        mono.return_value = 100.0
+        self.assertEqual(bucket.acquire(2.0), 0.0)
+        self.assertEqual(bucket.acquire(2.0), 2.0)
+        self.assertEqual(bucket.acquire(2.0), 4.0)
+
+        mono.return_value = 110.0
+        self.assertEqual(bucket.acquire(2.0), 0.0)
+        self.assertEqual(bucket.acquire(0.0), 2.0)
+        self.assertEqual(bucket.acquire(0.0), 2.0)
+
+    @patch("time.monotonic")
+    def test_release(self, mono):
+        bucket = ratelimit.Bucket()
+
+        mono.return_value = 100.0
+        self.assertEqual(bucket.acquire(1.0), 0.0)
+
+        # request took 5 seconds
+        mono.return_value = 105.0
+        bucket.release(1.0)
+        self.assertEqual(bucket.acquire(1.0), 1.0)
+
+    @patch("time.monotonic")
+    def test_backoff(self, mono):
+        bucket = ratelimit.Bucket()
+
+        mono.return_value = 100.0
+        bucket.backoff(30.0)
+        self.assertEqual(bucket.penalty, ratelimit.PENALTY_MIN)
+        self.assertEqual(bucket.acquire(), 30.0)
+        self.assertEqual(bucket.acquire(), 31.0)
+
+        bucket.backoff(10.0)
+        self.assertEqual(bucket.until, 130.0)
+        self.assertEqual(bucket.penalty, ratelimit.PENALTY_MIN * 2.0)
+
+        for _ in range(10):
+            bucket.backoff(0.0)
+        self.assertEqual(bucket.penalty, ratelimit.PENALTY_MAX)
+
+        for _ in range(100):
+            bucket.success()
+        self.assertEqual(bucket.penalty, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
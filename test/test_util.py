@@ -145,6 +145,20 @@ class TestPredicate(unittest.TestCase):
         self.assertTrue(pred("text:123", dummy))
         self.assertTrue(pred("text:123", dummy))
 
+    def test_unique_predicate_modes(self):
+        dummy = None
+        for mode, cls in ((True, set),
+                          ("compact", util.CompactSet),
+                          ("bloom", util.ScalableBloomFilter)):
+            pred = util.UniquePredicate(mode)
+            self.assertIsInstance(pred.urls, cls)
+
+            self.assertTrue(pred("1", dummy))
+            self.assertTrue(pred("2", dummy))
+            self.assertFalse(pred("1", dummy))
+            self.assertTrue(pred("text:123", dummy))
+            self.assertTrue(pred("text:123", dummy))
+
     def test_filter_predicate(self):
         url = ""
 
@@ -968,6 +982,58 @@ value = 123
         with response as ctx:
             self.assertIs(response, ctx)
 
+    def test_bloom_filter(self):
+        bloom = util.BloomFilter(1000)
+        self.assertEqual(bloom.capacity, 1024)
+        self.assertEqual(bloom.size % 8, 0)
+        self.assertEqual(len(bloom.bits) * 8, bloom.size)
+
+        values = [f"value{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        for value in values:
+            self.assertIn(value, bloom)
+
+        false_positives = sum(
+            1 for i in range(1000) if f"other{i}" in bloom)
+        self.assertLess(false_positives, 50)
+
+        copy = util.BloomFilter(1000, 0.01, bytearray(bloom.bits))
+        self.assertIn("value1", copy)
+
+    def test_bloom_filter_scalable(self):
+        bloom = util.ScalableBloomFilter(1000, 0.01)
+        values = [f"value{i}" for i in range(5000)]
+        for value in values:
+            bloom.add(value)
+        for value in values:
+            self.assertIn(value, bloom)
+
+        self.assertEqual(len(bloom), 5000)
+        self.assertEqual(len(bloom.filters), 3)
+        self.assertEqual(bloom.filters[2].capacity, 4096)
+        self.assertEqual(bloom.error_rate, 0.0025)
+
+        false_positives = sum(
+            1 for i in range(5000) if f"other{i}" in bloom)
+        self.assertLess(false_positives, 100)
+
+    def test_compact_set(self):
+        cset = util.CompactSet(4)
+        self.assertEqual(len(cset.table), 8)
+
+        values = [f"value{i}" for i in range(1000)]
+        for value in values:
+            cset.add(value)
+        cset.add("value1")
+        self.assertEqual(len(cset), 1000)
+        self.assertEqual(len(cset.table), 2048)
+
+        for value in values:
+            self.assertIn(value, cset)
+        for i in range(1000):
+            self.assertNotIn(f"other{i}", cset)
+
 
 class TestExtractor():
     category = "test_category"